@@ -20,6 +20,9 @@ import typing_inspect
 
 from evidently._pydantic_compat import ModelMetaclass
 from evidently._pydantic_compat import PrivateAttr
+from evidently.calculations.column_statistics import ColumnStatisticsCache
+from evidently.calculations.ranked_interactions import RankedInteractionsCache
+from evidently.calculations.run_cache import RunCache
 from evidently.core import BaseResult
 from evidently.core import ColumnType
 from evidently.core import IncludeTags
@@ -38,6 +41,7 @@ from evidently.pydantic_utils import get_value_fingerprint
 from evidently.utils.data_preprocessing import DataDefinition
 
 if TYPE_CHECKING:
+    from evidently.calculations.classification_performance import PredictionDataCache
     from evidently.features.generated_features import GeneratedFeatures
     from evidently.suite.base_suite import Context
 
@@ -55,6 +59,18 @@ class MetricResult(PolymorphicModel, BaseResult, metaclass=WithFieldsPathMetacla
         is_base_type = True
         alias_required = True
 
+    def merge(self, other: "MetricResult") -> "MetricResult":
+        """Combine with result of the same metric calculated on another part of current data.
+
+        Merged result is the same as result calculated on both parts at once.
+        Reference data is expected to be the same, so reference part of the result is kept as is.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} cannot be merged")
+
+    @classmethod
+    def is_mergeable(cls) -> bool:
+        return cls.merge is not MetricResult.merge
+
 
 class ErrorResult(BaseResult):
     class Config:
@@ -263,6 +279,11 @@ class Metric(WithTestAndMetricDependencies, Generic[TResult], metaclass=WithResu
     def set_context(self, context):
         self._context = context
 
+    def is_mergeable(self) -> bool:
+        """Whether results calculated on parts of current data can be merged, see `MetricResult.merge`"""
+        result_type = type(self).result_type()
+        return isinstance(result_type, type) and issubclass(result_type, MetricResult) and result_type.is_mergeable()
+
     def get_result(self) -> TResult:
         if not hasattr(self, "_context") or self._context is None:
             raise ValueError("No context is set")
@@ -305,6 +326,27 @@ class Metric(WithTestAndMetricDependencies, Generic[TResult], metaclass=WithResu
             options = self._context.options.override(options)
         return options
 
+    def get_column_statistics(self) -> ColumnStatisticsCache:
+        """Column statistics shared between metrics calculated in the same run"""
+        if self._context is None:
+            return ColumnStatisticsCache()
+        return self._context.column_statistics
+
+    def get_run_cache(self) -> RunCache:
+        """Values calculated from data of the run and shared between its metrics"""
+        if self._context is None:
+            return RunCache()
+        return self._context.run_cache
+
+    def get_ranked_interactions_cache(self) -> RankedInteractionsCache:
+        return RankedInteractionsCache(self.get_run_cache())
+
+    def get_prediction_data_cache(self) -> "PredictionDataCache":
+        # classification_performance imports metric results, which import this module
+        from evidently.calculations.classification_performance import PredictionDataCache
+
+        return PredictionDataCache(self.get_run_cache())
+
     def get_field_fingerprint(self, field: str) -> FingerprintPart:
         if field == "options":
             return self.get_options_fingerprint()
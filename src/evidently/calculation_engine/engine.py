@@ -1,4 +1,5 @@
 import abc
+import concurrent.futures
 import dataclasses
 import functools
 import logging
@@ -22,8 +23,12 @@ from evidently.calculation_engine.metric_implementation import MetricImplementat
 from evidently.features.generated_features import FeatureResult
 from evidently.features.generated_features import GeneratedFeatures
 from evidently.options.base import Options
+from evidently.options.execution import ExecutionOptions
 from evidently.pydantic_utils import Fingerprint
 from evidently.utils.data_preprocessing import DataDefinition
+from evidently.utils.profiling import ProfileKind
+from evidently.utils.profiling import ProfileRecord
+from evidently.utils.profiling import profile
 
 if TYPE_CHECKING:
     from evidently.suite.base_suite import Context
@@ -61,21 +66,67 @@ class Engine(Generic[TMetricImplementation, TInputData, TEngineDataType]):
         converted_data = self.convert_input_data(data)
 
         features_list = self.get_additional_features(converted_data.data_definition)
-        features = self.calculate_additional_features(converted_data, features_list, context.options)
+        features: Dict[GeneratedFeatures, FeatureResult] = {}
+        for feature in features_list:
+            with context.profile(ProfileKind.FEATURE, type(feature).__name__, feature):
+                features.update(self.calculate_additional_features(converted_data, [feature], context.options))
         context.set_features(features)
         self.inject_additional_features(converted_data, features)
         context.data = converted_data
+        execution_options = context.options.execution_options
+        if execution_options.parallel:
+            self._execute_metrics_parallel(context, converted_data, execution_options)
+            return
         for metric, calculation in self.get_metric_execution_iterator():
             if calculation not in calculations:
                 logging.debug(f"Executing {type(calculation)}...")
-                try:
-                    calculations[metric] = calculation.calculate(context, converted_data)
-                except BaseException as ex:
-                    calculations[metric] = ErrorResult(exception=ex)
+                with context.profile(ProfileKind.METRIC, type(metric).__name__, metric):
+                    try:
+                        calculations[metric] = calculation.calculate(context, converted_data)
+                    except BaseException as ex:
+                        calculations[metric] = ErrorResult(exception=ex)
             else:
                 logging.debug(f"Using cached result for {type(calculation)}")
             context.metric_results[metric] = calculations[metric]
 
+    def _execute_metrics_parallel(self, context: "Context", data: TInputData, options: ExecutionOptions):
+        """
+        Calculate metrics concurrently in waves: each wave contains metrics whose dependencies
+        are already calculated. Metrics with the same parameters are calculated only once.
+        """
+        execution = self.get_metric_execution_iterator()
+        # metrics with the same parameters share implementation of the first of them
+        calculations: Dict[Metric, TMetricImplementation] = {}
+        for metric, calculation in execution:
+            calculations.setdefault(_calculated_metric(metric, calculation), calculation)
+        results: Dict[Metric, Union[ErrorResult, MetricResult]] = {}
+        executor_cls = (
+            concurrent.futures.ProcessPoolExecutor if options.use_processes else concurrent.futures.ThreadPoolExecutor
+        )
+        with executor_cls(max_workers=options.max_workers) as executor:
+            for wave in _execution_waves(list(calculations.keys())):
+                futures = {}
+                for metric in wave:
+                    logging.debug(f"Executing {type(calculations[metric])}...")
+                    # implementations can be defined locally, so they are recreated in worker process
+                    calculation = None if options.use_processes else calculations[metric]
+                    futures[metric] = executor.submit(_calculate_metric, self, metric, calculation, context, data)
+                for metric, future in futures.items():
+                    try:
+                        results[metric], record = future.result()
+                    except BaseException as ex:
+                        results[metric], record = ErrorResult(exception=ex), None
+                    if record is not None:
+                        context.add_profile_record(record)
+                # make wave results available for dependent metrics
+                for dependant, calculation in execution:
+                    calculated = _calculated_metric(dependant, calculation)
+                    if calculated in futures:
+                        context.metric_results[dependant] = results[calculated]
+        context.metric_results = {
+            metric: results[_calculated_metric(metric, calculation)] for metric, calculation in execution
+        }
+
     @abc.abstractmethod
     def convert_input_data(self, data: GenericInputData) -> TInputData:
         raise NotImplementedError
@@ -165,6 +216,52 @@ def _aggregate_by_parameters(agg: dict, metric: Metric) -> dict:
     return agg
 
 
+def _calculated_metric(metric: Metric, calculation: MetricImplementation) -> Metric:
+    return getattr(calculation, "metric", metric)
+
+
+def _calculate_metric(
+    engine: Engine,
+    metric: Metric,
+    calculation: Optional[MetricImplementation],
+    context: "Context",
+    data: GenericInputData,
+) -> Tuple[Union[ErrorResult, MetricResult], Optional[ProfileRecord]]:
+    if calculation is None:
+        calculation = engine.get_metric_implementation(metric)
+    execution_options = context.options.execution_options
+    with profile(
+        ProfileKind.METRIC,
+        type(metric).__name__,
+        metric.get_fingerprint() if execution_options.profile else None,
+        enabled=execution_options.profile,
+        track_memory=execution_options.profile_memory,
+    ) as record:
+        try:
+            result = calculation.calculate(context, data)
+        except BaseException as ex:
+            result = ErrorResult(exception=ex)
+    return result, record
+
+
+def _execution_waves(metrics: List[Metric]) -> List[List[Metric]]:
+    """Split metrics into ordered groups, so every metric goes after the metrics it depends on."""
+    from evidently.suite.base_suite import _discover_dependencies
+
+    levels: Dict[Metric, int] = {}
+
+    def get_level(metric: Metric) -> int:
+        if metric not in levels:
+            dependencies = [dep for _, dep in _discover_dependencies(metric) if isinstance(dep, Metric)]
+            levels[metric] = max((get_level(dep) + 1 for dep in dependencies), default=0)
+        return levels[metric]
+
+    waves: Dict[int, List[Metric]] = {}
+    for metric in metrics:
+        waves.setdefault(get_level(metric), []).append(metric)
+    return [waves[level] for level in sorted(waves)]
+
+
 _ImplRegistry: Dict[Type, Dict[Type, Type]] = dict()
 
 
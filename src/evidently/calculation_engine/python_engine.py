@@ -15,6 +15,7 @@ from evidently.calculation_engine.engine import Engine
 from evidently.calculation_engine.engine import EngineDatasets
 from evidently.calculation_engine.engine import TInputData
 from evidently.calculation_engine.metric_implementation import MetricImplementation
+from evidently.features.feature_cache import get_feature_cache
 from evidently.features.generated_features import FeatureResult
 from evidently.features.generated_features import GeneratedFeatures
 from evidently.options.base import Options
@@ -57,15 +58,37 @@ class PythonEngine(Engine["PythonMetricImplementation", InputData, pd.DataFrame]
         self, data: TInputData, features: List[GeneratedFeatures], options: Options
     ) -> Dict[GeneratedFeatures, FeatureResult[pd.DataFrame]]:
         result: Dict[GeneratedFeatures, FeatureResult[pd.DataFrame]] = {}
-        for feature in features:
-            current = feature.generate_features_renamed(data.current_data, data.data_definition, options)
-            reference = (
-                feature.generate_features_renamed(data.reference_data, data.data_definition, options)
-                if data.reference_data is not None
-                else None
-            )
-
-            result[feature] = FeatureResult(current, reference)
+        cache = get_feature_cache(options) if len(features) > 0 else None
+
+        def generate(feature: GeneratedFeatures, dataset: pd.DataFrame) -> pd.DataFrame:
+            if cache is None:
+                return feature.generate_features_renamed(dataset, data.data_definition, options)
+            return cache.generate_features(feature, dataset, data.data_definition, options)
+
+        try:
+            for feature in features:
+                input_columns = feature.get_row_input_columns()
+                if data.reference_data is None:
+                    current, reference = generate(feature, data.current_data), None
+                elif input_columns is not None and _same_dtypes(data.current_data, data.reference_data, input_columns):
+                    # values of each row do not depend on other rows, so models run once for both datasets
+                    combined = generate(
+                        feature,
+                        pd.concat(
+                            [data.current_data[input_columns], data.reference_data[input_columns]],
+                            ignore_index=True,
+                        ),
+                    )
+                    current = combined.iloc[: len(data.current_data)].set_axis(data.current_data.index)
+                    reference = combined.iloc[len(data.current_data) :].set_axis(data.reference_data.index)
+                else:
+                    current = generate(feature, data.current_data)
+                    reference = generate(feature, data.reference_data)
+
+                result[feature] = FeatureResult(current, reference)
+        finally:
+            if cache is not None:
+                cache.close()
         return result
 
     def merge_additional_features(
@@ -130,6 +153,13 @@ class PythonEngine(Engine["PythonMetricImplementation", InputData, pd.DataFrame]
         return EngineDatasets(reference=reference, current=current)
 
 
+def _same_dtypes(current: pd.DataFrame, reference: pd.DataFrame, columns: List[str]) -> bool:
+    return all(
+        column in current.columns and column in reference.columns and current[column].dtype == reference[column].dtype
+        for column in columns
+    )
+
+
 class PythonMetricImplementation(Generic[TMetric], MetricImplementation):
     def __init__(self, engine: PythonEngine, metric: TMetric):
         self.engine = engine
@@ -3,6 +3,7 @@ from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 import numpy as np
@@ -14,6 +15,7 @@ from pandas.core.dtypes.common import is_object_dtype
 from pandas.core.dtypes.common import is_string_dtype
 from sklearn import metrics
 
+from evidently.calculations.run_cache import RunCache
 from evidently.metric_results import Boxes
 from evidently.metric_results import ConfusionMatrix
 from evidently.metric_results import DatasetClassificationQuality
@@ -167,12 +169,12 @@ def get_prediction_data(
             pos_preds = data[prediction]
 
         else:
-            pos_preds = data[prediction].apply(lambda x: 1.0 - x)
+            pos_preds = 1.0 - data[prediction]
 
         prediction_probas = pd.DataFrame.from_dict(
             {
                 pos_label: pos_preds,
-                neg_label: pos_preds.apply(lambda x: 1.0 - x),
+                neg_label: 1.0 - pos_preds,
             }
         )
         predictions = threshold_probability_labels(prediction_probas, pos_label, neg_label, threshold)
@@ -187,12 +189,12 @@ def get_prediction_data(
         if prediction in [0, "0"]:
             pos_preds = data[prediction]
         else:
-            pos_preds = data[prediction].apply(lambda x: 1.0 - x)
-        predictions = pos_preds.apply(lambda x: 0 if x >= threshold else 1)
+            pos_preds = 1.0 - data[prediction]
+        predictions = pd.Series(np.where(pos_preds >= threshold, 0, 1), index=pos_preds.index, name=pos_preds.name)
         prediction_probas = pd.DataFrame.from_dict(
             {
                 0: pos_preds,
-                1: pos_preds.apply(lambda x: 1.0 - x),
+                1: 1.0 - pos_preds,
             }
         )
         return PredictionData(
@@ -212,7 +214,7 @@ def get_prediction_data(
         prediction_probas = pd.DataFrame.from_dict(
             {
                 1: data[prediction],
-                0: data[prediction].apply(lambda x: 1.0 - x),
+                0: 1.0 - data[prediction],
             }
         )
         return PredictionData(
@@ -243,24 +245,94 @@ def threshold_probability_labels(
     prediction_probas: pd.DataFrame, pos_label: Union[str, int], neg_label: Union[str, int], threshold: float
 ) -> pd.Series:
     """Get prediction values by probabilities with the threshold apply"""
-    return prediction_probas[pos_label].apply(lambda x: pos_label if x >= threshold else neg_label)
+    pos_probas = prediction_probas[pos_label]
+    # rows with missing probability get neg_label
+    labels = np.array([neg_label, pos_label], dtype=object)[(pos_probas >= threshold).to_numpy(dtype=int)]
+    return pd.Series(labels, index=pos_probas.index, name=pos_probas.name).infer_objects()
+
+
+def _cleanup_data(data: pd.DataFrame, dataset_columns: DatasetColumns) -> pd.DataFrame:
+    target = dataset_columns.utility_columns.target
+    prediction = dataset_columns.utility_columns.prediction
+    subset = []
+    if target is not None:
+        subset.append(target)
+    if prediction is not None and isinstance(prediction, list):
+        subset += prediction
+    if prediction is not None and isinstance(prediction, str):
+        subset.append(prediction)
+    if len(subset) > 0:
+        return data.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how="any", subset=subset)
+    return data
+
+
+class PredictionDataCache:
+    """Prediction data of datasets of a run, kept in the run cache.
+
+    Prediction data is keyed by prediction and target columns and positive label.
+    """
+
+    def __init__(self, cache: Optional[RunCache] = None):
+        self._cache = cache if cache is not None else RunCache()
+
+    def get(
+        self, dataset: str, data: pd.DataFrame, data_columns: DatasetColumns, pos_label: Optional[Union[str, int]]
+    ) -> PredictionData:
+        return self._get(dataset, data, data_columns, pos_label, False)[1]
+
+    def get_cleaned(
+        self, dataset: str, data: pd.DataFrame, data_columns: DatasetColumns, pos_label: Optional[Union[str, int]]
+    ) -> Tuple[pd.DataFrame, PredictionData]:
+        """Data without rows with missing or infinite target or prediction and its prediction data"""
+        return self._get(dataset, data, data_columns, pos_label, True)
+
+    def _get(
+        self,
+        dataset: str,
+        data: pd.DataFrame,
+        data_columns: DatasetColumns,
+        pos_label: Optional[Union[str, int]],
+        cleanup: bool,
+    ) -> Tuple[pd.DataFrame, PredictionData]:
+        prediction = data_columns.utility_columns.prediction
+        key = (
+            "prediction_data",
+            tuple(prediction) if isinstance(prediction, list) else prediction,
+            data_columns.utility_columns.target,
+            pos_label,
+            cleanup,
+        )
+
+        def calculate() -> Tuple[pd.DataFrame, PredictionData]:
+            cleaned = _cleanup_data(data, data_columns) if cleanup else data
+            return cleaned, get_prediction_data(cleaned, data_columns, pos_label)
+
+        return self._cache.get(dataset, key, data, calculate)
 
 
 STEP_SIZE = 0.05
 
 
-def calculate_pr_table(binded):
+def _sort_by_probas(target: Sequence[int], probas: Sequence[float]):
+    """Probas sorted in descending order (equal probas keep order of rows) and cumulative count of target rows"""
+    probas = np.asarray(probas, dtype=float)
+    order = np.argsort(-probas, kind="stable")
+    return probas[order], np.cumsum(np.asarray(target)[order])
+
+
+def calculate_pr_table(target: Sequence[int], probas: Sequence[float]):
+    """Precision and recall of top rows by probability of the class, `target` is 1 for rows of the class"""
     result = []
-    binded.sort(key=lambda item: item[1], reverse=True)
-    data_size = len(binded)
-    target_class_size = sum([x[0] for x in binded])
+    sorted_probas, tp_cumsum = _sort_by_probas(target, probas)
+    data_size = len(sorted_probas)
+    target_class_size = int(tp_cumsum[-1]) if data_size > 0 else 0
     offset = max(round(data_size * STEP_SIZE), 1)
 
     for step in np.arange(offset, data_size + offset, offset):
         count = min(step, data_size)
-        prob = round(binded[min(step, data_size - 1)][1], 2)
+        prob = round(float(sorted_probas[min(step, data_size - 1)]), 2)
         top = round(100.0 * min(step, data_size) / data_size, 1)
-        tp = sum([x[0] for x in binded[: min(step, data_size)]])
+        tp = int(tp_cumsum[count - 1])
         fp = count - tp
         precision = round(100.0 * tp / count, 1)
         recall = round(100.0 * tp / target_class_size, 1)
@@ -268,24 +340,25 @@ def calculate_pr_table(binded):
     return result
 
 
-def calculate_lift_table(binded):
+def calculate_lift_table(target: Sequence[int], probas: Sequence[float]):
+    """Lift of top rows by probability of the class, `target` is 1 for rows of the class"""
     result = []
-    binded.sort(key=lambda item: item[1], reverse=True)
-    data_size = len(binded)
-    target_class_size = sum([x[0] for x in binded])
+    sorted_probas, tp_cumsum = _sort_by_probas(target, probas)
+    data_size = len(sorted_probas)
+    target_class_size = int(tp_cumsum[-1]) if data_size > 0 else 0
     # we don't use declared STEP_SIZE due to specifics
     # of lift metric calculation and visualization
     offset = int(max(np.floor(data_size * 0.01), 1))
 
     for step in np.arange(offset, data_size + 1, offset):
         count = min(step, data_size)
-        prob = round(binded[min(step, data_size - 1)][1], 2)
+        prob = round(float(sorted_probas[min(step, data_size - 1)]), 2)
         top = round(100.0 * min(step, data_size) / data_size)
-        tp = sum([x[0] for x in binded[: min(step, data_size)]])
+        tp = int(tp_cumsum[count - 1])
         fp = count - tp
         precision = round(100.0 * tp / count, 1)
         recall = round(100.0 * tp / target_class_size, 1)
-        f1_score = round(2 / (1 / precision + 1 / recall), 1)
+        f1_score = round(2 / (1 / precision + 1 / recall), 1) if precision > 0 and recall > 0 else 0.0
         lift = round(recall / top, 2)
         if count <= target_class_size:
             max_lift = round(100.0 * count / target_class_size / top, 2)
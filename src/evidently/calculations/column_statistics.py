@@ -0,0 +1,160 @@
+"""Memoized basic column statistics shared between metrics during one run."""
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from evidently.base_metric import ColumnName
+
+T = TypeVar("T")
+
+Bins = Union[int, str, Sequence[float], np.ndarray]
+
+
+def _column_key(column: Union[str, "ColumnName"]) -> Hashable:
+    if isinstance(column, str):
+        return column
+    if column.is_main_dataset():
+        return column.name
+    return column
+
+
+def _bins_key(bins: Bins) -> Hashable:
+    if isinstance(bins, (int, str)):
+        return bins
+    return tuple(np.asarray(bins).tolist())
+
+
+class ColumnStatistics:
+    """Basic statistics of one column, each of them is calculated once and stored in shared storage.
+
+    Returned pandas and numpy objects are copies, so callers are free to modify them.
+    `data` is the column statistics were requested for, or a copy of the derived column
+    (e.g. of finite values) which itself is stored in shared storage.
+    """
+
+    def __init__(
+        self,
+        data: pd.Series,
+        storage: Optional[Dict[Hashable, Any]] = None,
+        key: tuple = (),
+        shared: bool = False,
+    ):
+        self._data = data
+        self._storage: Dict[Hashable, Any] = storage if storage is not None else {}
+        self._key = key
+        self._shared = shared
+
+    @property
+    def data(self) -> pd.Series:
+        return self._data.copy() if self._shared else self._data
+
+    def _get(self, statistic: str, calculate: Callable[[], T], *params: Hashable) -> T:
+        key = self._key + (statistic, params)
+        # concurrent metrics can calculate the same statistic twice, but result is always the same
+        if key not in self._storage:
+            self._storage[key] = calculate()
+        return self._storage[key]
+
+    def finite(self) -> "ColumnStatistics":
+        """Statistics of the column without missing and infinite values"""
+        data = self._get("finite", lambda: self._data.replace([-np.inf, np.inf], np.nan).dropna())
+        return ColumnStatistics(data, self._storage, self._key + ("finite",), shared=True)
+
+    def count(self) -> int:
+        """Number of not missing values"""
+        return self._get("count", lambda: int(self._data.count()))
+
+    def missing_count(self) -> int:
+        return self._get("missing_count", lambda: int(self._data.isnull().sum()))
+
+    def infinite_count(self) -> int:
+        return self._get("infinite_count", lambda: int(np.sum(np.isinf(self._data))))
+
+    def min(self):
+        return self._get("min", self._data.min)
+
+    def max(self):
+        return self._get("max", self._data.max)
+
+    def nunique(self) -> int:
+        return self._get("nunique", lambda: int(self._data.nunique()))
+
+    def unique(self) -> np.ndarray:
+        return np.array(self._get("unique", lambda: self._data.unique()), copy=True)
+
+    def value_counts(self, dropna: bool = True, sort: bool = True) -> pd.Series:
+        return self._get(
+            "value_counts",
+            lambda: self._data.value_counts(dropna=dropna, sort=sort),
+            dropna,
+            sort,
+        ).copy()
+
+    def describe(self) -> pd.Series:
+        return self._get("describe", self._data.describe).copy()
+
+    def histogram(self, bins: Bins = 10, density: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Histogram of finite column values"""
+        hist, edges = self._get(
+            "histogram",
+            lambda: np.histogram(self._data[np.isfinite(self._data)], bins=bins, density=density),
+            _bins_key(bins),
+            density,
+        )
+        return hist.copy(), edges.copy()
+
+
+class ColumnStatisticsCache:
+    """Storage of column statistics for one run.
+
+    Statistics are keyed by dataset, column, statistic and its parameters.
+    """
+
+    def __init__(self):
+        self._storage: Dict[Hashable, Any] = {}
+        self._shared: Dict[str, Tuple[Dict[Hashable, Any], frozenset]] = {}
+
+    def share(self, dataset: str, storage: Dict[Hashable, Any], columns: Iterable[str]):
+        """Keep statistics of given dataset columns in external storage, so they can be reused by other runs.
+
+        Statistics of other columns (e.g. generated features) stay in the storage of the run.
+        """
+        self._shared[dataset] = (storage, frozenset(columns))
+
+    def get(self, dataset: str, column: Union[str, "ColumnName"], data: pd.Series) -> ColumnStatistics:
+        """Statistics of a dataset column.
+
+        Statistics are keyed by dataset and column only, so `data` should be the column as it is in the dataset
+        of the run: statistics of transformed or filtered values should not be requested through the cache.
+        """
+        key = _column_key(column)
+        storage = self._storage
+        shared = self._shared.get(dataset)
+        if shared is not None and isinstance(key, str) and key in shared[1]:
+            storage = shared[0]
+        statistics = ColumnStatistics(data, storage, (dataset, key))
+        if statistics._get("length", lambda: len(data)) != len(data):
+            raise ValueError(f"Column statistics of '{key}' in {dataset} dataset were calculated for other data.")
+        return statistics
+
+    def clear(self, dataset: Optional[str] = None):
+        """Remove statistics of the run, only of given dataset if it is set"""
+        if dataset is None:
+            self._storage.clear()
+            self._shared.clear()
+            return
+        for key in [key for key in self._storage if key[0] == dataset]:
+            del self._storage[key]
@@ -13,7 +13,18 @@ import pandas as pd
 
 from evidently.base_metric import ColumnMetricResult
 from evidently.base_metric import MetricResult
+from evidently.calculations.column_statistics import ColumnStatisticsCache
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
+from evidently.calculations.stattests import StatTest
 from evidently.calculations.stattests import get_stattest
+from evidently.calculations.stattests.registry import StatTestResult
+from evidently.calculations.stattests.registry import get_batch_stattest_impl
+from evidently.calculations.stattests.registry import get_default_stattest
+from evidently.calculations.stattests.registry import get_registered_stattest
+from evidently.calculations.stattests.utils import get_uniform_bin_edges
+from evidently.calculations.stattests.utils import get_unique_count_batch
+from evidently.calculations.stattests.utils import histogram_batch
 from evidently.core import ColumnType
 from evidently.core import IncludeTags
 from evidently.metric_results import DatasetColumns
@@ -86,6 +97,16 @@ class DatasetDrift:
     dataset_drift: bool
 
 
+@dataclass
+class ColumnDriftBatchResult:
+    """Drift of numerical column calculated together with other columns"""
+
+    stattest: StatTest
+    drift_result: StatTestResult
+    current_small_distribution: list
+    reference_small_distribution: list
+
+
 class DatasetDriftMetrics(MetricResult):
     class Config:
         type_alias = "evidently:metric_result:DatasetDriftMetrics"
@@ -110,6 +131,8 @@ def get_one_column_drift(
     agg_data: bool,
     num_correlations: Optional[tuple] = None,
     is_contains_nans: Optional[Tuple[pd.Series, pd.Series]] = None,
+    column_statistics: Optional[ColumnStatisticsCache] = None,
+    batch_result: Optional[ColumnDriftBatchResult] = None,
 ) -> ColumnDataDriftMetrics:
     if column_name not in current_data:
         raise ValueError(f"Cannot find column '{column_name}' in current dataset")
@@ -132,12 +155,16 @@ def get_one_column_drift(
         stattest = options.get_feature_stattest_func(column_name, column_type.value)
 
     threshold = options.get_threshold(column_name, column_type.value)
-    current_column = current_data[column_name]
-    reference_column = reference_data[column_name]
+    if column_statistics is None:
+        column_statistics = ColumnStatisticsCache()
+    current_statistics = column_statistics.get(CURRENT, column_name, current_data[column_name])
+    reference_statistics = column_statistics.get(REFERENCE, column_name, reference_data[column_name])
+    current_column = current_statistics.data
+    reference_column = reference_statistics.data
 
     # clean and check the column in reference dataset
     if is_contains_nans is None or is_contains_nans[1][column_name]:
-        reference_column = reference_column.replace([-np.inf, np.inf], np.nan).dropna()
+        reference_column = reference_statistics.finite().data
 
     if reference_column.empty:
         raise ValueError(
@@ -146,7 +173,7 @@ def get_one_column_drift(
 
     # clean and check the column in current dataset
     if is_contains_nans is None or is_contains_nans[0][column_name]:
-        current_column = current_column.replace([-np.inf, np.inf], np.nan).dropna()
+        current_column = current_statistics.finite().data
 
     if current_column.empty:
         raise ValueError(f"An empty column '{column_name}' was provided for drift calculation in the current dataset.")
@@ -170,8 +197,12 @@ def get_one_column_drift(
         if not pd.api.types.is_numeric_dtype(current_column):
             raise ValueError(f"Column '{column_name}' in current dataset should contain numerical values only.")
 
-    drift_test_function = get_stattest(reference_column, current_column, column_type, stattest)
-    drift_result = drift_test_function(reference_column, current_column, column_type, threshold)
+    if batch_result is not None:
+        drift_test_function = batch_result.stattest
+        drift_result = batch_result.drift_result
+    else:
+        drift_test_function = get_stattest(reference_column, current_column, column_type, stattest)
+        drift_result = drift_test_function(reference_column, current_column, column_type, threshold)
 
     scatter: Optional[Union[ScatterField, ScatterAggField]] = None
     if column_type == ColumnType.Numerical:
@@ -186,23 +217,17 @@ def get_one_column_drift(
 
         current_correlations = num_correlations[0][column_name].to_dict()
         reference_correlations = num_correlations[1][column_name].to_dict()
-        current_nbinsx = options.get_nbinsx(column_name)
-        current_small_distribution = [
-            t.tolist()
-            for t in np.histogram(
-                current_data[column_name][np.isfinite(current_data[column_name])],
-                bins=current_nbinsx,
-                density=True,
-            )
-        ]
-        reference_small_distribution = [
-            t.tolist()
-            for t in np.histogram(
-                reference_data[column_name][np.isfinite(reference_data[column_name])],
-                bins=current_nbinsx,
-                density=True,
-            )
-        ]
+        if batch_result is not None:
+            current_small_distribution = batch_result.current_small_distribution
+            reference_small_distribution = batch_result.reference_small_distribution
+        else:
+            current_nbinsx = options.get_nbinsx(column_name)
+            current_small_distribution = [
+                t.tolist() for t in current_statistics.histogram(bins=current_nbinsx, density=True)
+            ]
+            reference_small_distribution = [
+                t.tolist() for t in reference_statistics.histogram(bins=current_nbinsx, density=True)
+            ]
         datetime_column_name = dataset_columns.utility_columns.date
         if not agg_data:
             current_scatter = {column_name: current_data[column_name]}
@@ -248,8 +273,8 @@ def get_one_column_drift(
             scatter = ScatterField(scatter=current_scatter, x_name=x_name, plot_shape=plot_shape)
 
     elif column_type == ColumnType.Categorical:
-        reference_counts = reference_data[column_name].value_counts(sort=False)
-        current_counts = current_data[column_name].value_counts(sort=False)
+        reference_counts = reference_statistics.value_counts(sort=False)
+        current_counts = current_statistics.value_counts(sort=False)
         keys = set(reference_counts.keys()).union(set(current_counts.keys()))
 
         for key in keys:
@@ -427,6 +452,109 @@ def _get_all_columns_for_drift(dataset_columns: DatasetColumns) -> List[str]:
     return result
 
 
+def _get_batch_dtype(reference_column: pd.Series, current_column: pd.Series) -> Optional[np.dtype]:
+    dtypes = (reference_column.dtype, current_column.dtype)
+    if all(dtype.kind == "i" for dtype in dtypes):
+        return np.dtype(np.int64)
+    if all(dtype.kind == "i" or dtype == np.float64 for dtype in dtypes):
+        return np.dtype(np.float64)
+    return None
+
+
+def _get_small_distributions_batch(data: np.ndarray, nbinsx: int) -> List[list]:
+    bin_edges = np.stack(
+        [
+            get_uniform_bin_edges(first_edge, last_edge, nbinsx)
+            for first_edge, last_edge in zip(data.min(axis=1), data.max(axis=1))
+        ]
+    )
+    counts = histogram_batch(data, bin_edges)
+    densities = counts / np.diff(bin_edges, axis=1) / counts.sum(axis=1, keepdims=True)
+    return [[density.tolist(), edges.tolist()] for density, edges in zip(densities, bin_edges)]
+
+
+def get_numerical_drift_batch(
+    *,
+    current_data: pd.DataFrame,
+    reference_data: pd.DataFrame,
+    columns: List[str],
+    options: DataDriftOptions,
+    dataset_columns: DatasetColumns,
+    is_contains_nans: Tuple[pd.Series, pd.Series],
+) -> Dict[str, ColumnDriftBatchResult]:
+    """Calculate drift of numerical columns together with vectorized stattests.
+
+    Columns with missing or infinite values, of types other than float64 and signed integers,
+    or with stattests without batch implementation are skipped and should be calculated one by one.
+    Results are the same as results of `get_one_column_drift` for each column.
+    """
+    groups: Dict[np.dtype, List[str]] = {}
+    for column_name in columns:
+        if column_name not in current_data or column_name not in reference_data:
+            continue
+        if is_contains_nans[0][column_name] or is_contains_nans[1][column_name]:
+            continue
+        dtype = _get_batch_dtype(reference_data[column_name], current_data[column_name])
+        if dtype is not None and len(current_data) > 0 and len(reference_data) > 0:
+            groups.setdefault(dtype, []).append(column_name)
+
+    result: Dict[str, ColumnDriftBatchResult] = {}
+    for dtype, group_columns in groups.items():
+        # one row per column, so values of each column are contiguous
+        reference_block = np.ascontiguousarray(reference_data[group_columns].to_numpy(dtype=dtype).T)
+        current_block = np.ascontiguousarray(current_data[group_columns].to_numpy(dtype=dtype).T)
+        is_finite = np.isfinite(reference_block).all(axis=1) & np.isfinite(current_block).all(axis=1)
+        n_values: Optional[np.ndarray] = None
+        stattest_rows: Dict[StatTest, List[int]] = {}
+        for idx, column_name in enumerate(group_columns):
+            if not is_finite[idx]:
+                continue
+            stattest_func = None
+            if column_name == dataset_columns.utility_columns.target:
+                stattest_func = options.num_target_stattest_func
+            if not stattest_func:
+                stattest_func = options.get_feature_stattest_func(column_name, ColumnType.Numerical.value)
+            if stattest_func is None:
+                if n_values is None:
+                    n_values = get_unique_count_batch(np.concatenate([reference_block, current_block], axis=1))
+                stattest = get_default_stattest(reference_block.shape[1], n_values[idx], ColumnType.Numerical)
+            else:
+                stattest = get_registered_stattest(stattest_func, ColumnType.Numerical)
+            if get_batch_stattest_impl(stattest) is not None:
+                stattest_rows.setdefault(stattest, []).append(idx)
+
+        for stattest, rows in stattest_rows.items():
+            drift_results = stattest.batch(
+                reference_block[rows],
+                current_block[rows],
+                ColumnType.Numerical,
+                [options.get_threshold(group_columns[idx], ColumnType.Numerical.value) for idx in rows],
+            )
+            nbinsx_rows: Dict[int, List[int]] = {}
+            for idx in rows:
+                nbinsx_rows.setdefault(options.get_nbinsx(group_columns[idx]), []).append(idx)
+            small_distributions = {}
+            for nbinsx, nbinsx_group in nbinsx_rows.items():
+                small_distributions.update(
+                    zip(
+                        nbinsx_group,
+                        zip(
+                            _get_small_distributions_batch(current_block[nbinsx_group], nbinsx),
+                            _get_small_distributions_batch(reference_block[nbinsx_group], nbinsx),
+                        ),
+                    )
+                )
+            for idx, drift_result in zip(rows, drift_results):
+                current_small_distribution, reference_small_distribution = small_distributions[idx]
+                result[group_columns[idx]] = ColumnDriftBatchResult(
+                    stattest=stattest,
+                    drift_result=drift_result,
+                    current_small_distribution=current_small_distribution,
+                    reference_small_distribution=reference_small_distribution,
+                )
+    return result
+
+
 def get_drift_for_columns(
     *,
     current_data: pd.DataFrame,
@@ -436,6 +564,7 @@ def get_drift_for_columns(
     drift_share_threshold: Optional[float] = None,
     columns: Optional[List[str]] = None,
     agg_data: bool,
+    column_statistics: Optional[ColumnStatisticsCache] = None,
 ) -> DatasetDriftMetrics:
     if columns is None:
         # ensure prediction column is a string - add label values for classification tasks
@@ -453,7 +582,13 @@ def get_drift_for_columns(
     # calculate result
     drift_by_columns: Dict[str, ColumnDataDriftMetrics] = {}
 
-    dataset = pd.concat([reference_data, current_data])
+    # only target and prediction types are recognized by data
+    utility_columns = [
+        column_name
+        for column_name in (dataset_columns.utility_columns.target, dataset_columns.utility_columns.prediction)
+        if isinstance(column_name, str) and column_name in columns
+    ]
+    dataset = pd.concat([reference_data[utility_columns], current_data[utility_columns]])
     columns_types = {
         column_name: recognize_column_type_(
             dataset=dataset,
@@ -489,6 +624,15 @@ def get_drift_for_columns(
         reference_correlations,
     )
 
+    batch_results = get_numerical_drift_batch(
+        current_data=current_data,
+        reference_data=reference_data,
+        columns=num_columns,
+        options=data_drift_options,
+        dataset_columns=dataset_columns,
+        is_contains_nans=(is_current_contains_nans, is_reference_contains_nans),
+    )
+
     for column_name in columns:
         drift_by_columns[column_name] = get_one_column_drift(
             current_data=current_data,
@@ -500,6 +644,8 @@ def get_drift_for_columns(
             agg_data=agg_data,
             num_correlations=num_correlations,
             is_contains_nans=(is_current_contains_nans, is_reference_contains_nans),
+            column_statistics=column_statistics,
+            batch_result=batch_results.get(column_name),
         )
 
     dataset_drift = get_dataset_drift(drift_by_columns, drift_share_threshold)
@@ -1,15 +1,23 @@
 from itertools import combinations
+from typing import Dict
+from typing import Optional
 
 import pandas as pd
 
+from evidently.calculations.column_statistics import ColumnStatistics
+
+ColumnsStatistics = Dict[str, ColumnStatistics]
+
 
 def get_number_of_all_pandas_missed_values(dataset: pd.DataFrame) -> int:
     """Calculate the number of missed - nulls by pandas - values in a dataset"""
     return dataset.isnull().sum().sum()
 
 
-def get_number_of_empty_columns(dataset: pd.DataFrame) -> int:
+def get_number_of_empty_columns(dataset: pd.DataFrame, statistics: Optional[ColumnsStatistics] = None) -> int:
     """Calculate the number of empty columns in a dataset"""
+    if statistics is not None:
+        return sum(1 for column in dataset.columns if statistics[column].missing_count() == dataset.shape[0])
     return dataset.isnull().all().sum()
 
 
@@ -52,12 +60,16 @@ def get_number_of_almost_duplicated_columns(dataset: pd.DataFrame, threshold: fl
     return result
 
 
-def get_number_of_constant_columns(dataset: pd.DataFrame) -> int:
+def get_number_of_constant_columns(dataset: pd.DataFrame, statistics: Optional[ColumnsStatistics] = None) -> int:
     """Calculate the number of constant columns in a dataset"""
+    if statistics is not None:
+        return sum(1 for column in dataset.columns if statistics[column].nunique() <= 1)
     return len(dataset.columns[dataset.nunique() <= 1])  # type: ignore
 
 
-def get_number_of_almost_constant_columns(dataset: pd.DataFrame, threshold: float) -> int:
+def get_number_of_almost_constant_columns(
+    dataset: pd.DataFrame, threshold: float, statistics: Optional[ColumnsStatistics] = None
+) -> int:
     """Calculate the number of almost constant columns in a dataset"""
     result = 0
     dataset_row = dataset.shape[0]
@@ -66,7 +78,11 @@ def get_number_of_almost_constant_columns(dataset: pd.DataFrame, threshold: floa
         return 0
 
     for column_name in dataset.columns:
-        score = dataset[column_name].value_counts().max() / dataset.shape[0]
+        if statistics is not None:
+            value_counts = statistics[column_name].value_counts()
+        else:
+            value_counts = dataset[column_name].value_counts()
+        score = value_counts.max() / dataset.shape[0]
 
         if score >= threshold:
             result += 1
@@ -1,6 +1,7 @@
 """Methods for overall dataset quality calculations - rows count, a specific values count, etc."""
 
 import dataclasses
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -10,8 +11,8 @@ from typing import Union
 
 import numpy as np
 import pandas as pd
-from scipy.stats import chi2_contingency
 
+from evidently.calculations.column_statistics import ColumnStatistics
 from evidently.calculations.utils import relabel_data
 from evidently.core import ColumnType
 from evidently.metric_results import ColumnCorrelations
@@ -22,6 +23,8 @@ from evidently.utils.data_preprocessing import DataDefinition
 from evidently.utils.types import ColumnDistribution
 
 MAX_CATEGORIES = 5
+# maximum count of values and of contingency table cells processed at once by Cramér's V calculation
+CONTINGENCY_BLOCK_SIZE = 2**22
 
 
 def get_rows_count(data: Union[pd.DataFrame, pd.Series]) -> int:
@@ -159,10 +162,14 @@ class DataQualityStats:
         raise KeyError(item)
 
 
-def get_features_stats(feature: pd.Series, feature_type: ColumnType) -> FeatureQualityStats:
+def get_features_stats(
+    feature: pd.Series, feature_type: ColumnType, statistics: Optional[ColumnStatistics] = None
+) -> FeatureQualityStats:
     def get_percentage_from_all_values(value: Union[int, float]) -> float:
         return np.round(100 * value / all_values_count, 2)
 
+    if statistics is None:
+        statistics = ColumnStatistics(feature)
     result = FeatureQualityStats(feature_type=feature_type.value)
     all_values_count = feature.shape[0]
 
@@ -170,12 +177,12 @@ def get_features_stats(feature: pd.Series, feature_type: ColumnType) -> FeatureQ
         # we have no data, return default stats for en empty dataset
         return result
     result.number_of_rows = all_values_count
-    result.missing_count = int(feature.isnull().sum())
-    result.count = int(feature.count())
+    result.missing_count = statistics.missing_count()
+    result.count = statistics.count()
     all_values_count = feature.shape[0]
-    value_counts = feature.value_counts(dropna=False)
+    value_counts = statistics.value_counts(dropna=False)
     result.missing_percentage = np.round(100 * result.missing_count / all_values_count, 2)
-    unique_count: int = feature.nunique()
+    unique_count: int = statistics.nunique()
     result.unique_count = unique_count
     result.unique_percentage = get_percentage_from_all_values(unique_count)
     result.most_common_value = value_counts.index[0]
@@ -189,13 +196,14 @@ def get_features_stats(feature: pd.Series, feature_type: ColumnType) -> FeatureQ
         # round most common feature value for numeric features to 1e-5
         if not np.issubdtype(feature, np.number):
             feature = feature.astype(float)
+            statistics = ColumnStatistics(feature)
         if isinstance(result.most_common_value, float):
             result.most_common_value = np.round(result.most_common_value, 5)
-        result.infinite_count = int(np.sum(np.isinf(feature)))
+        result.infinite_count = statistics.infinite_count()
         result.infinite_percentage = get_percentage_from_all_values(result.infinite_count)
-        result.max = np.round(feature.max(), 2)
-        result.min = np.round(feature.min(), 2)
-        common_stats = dict(feature.describe())
+        result.max = np.round(statistics.max(), 2)
+        result.min = np.round(statistics.min(), 2)
+        common_stats = dict(statistics.describe())
         std = common_stats["std"]
         result.std = np.round(std, 2)
         result.mean = np.round(common_stats["mean"], 2)
@@ -323,6 +331,75 @@ def _select_features_for_corr(dataset: pd.DataFrame, data_definition: DataDefini
     return num_for_corr, cat_for_corr
 
 
+def _encode_columns(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode values of each column with integer codes.
+    Args:
+        df: initial data frame.
+    Returns:
+        Codes of values by columns and count of unique values of each column,
+        missing values are coded with the count of unique values of their column.
+    """
+    codes = np.empty(df.shape, dtype=np.int32 if len(df) < np.iinfo(np.int32).max else np.int64, order="F")
+    sizes = np.empty(df.shape[1], dtype=np.int64)
+    for idx in range(df.shape[1]):
+        column_codes, uniques = pd.factorize(df.iloc[:, idx])
+        column_codes[column_codes < 0] = len(uniques)
+        codes[:, idx] = column_codes
+        sizes[idx] = len(uniques)
+    return codes, sizes
+
+
+def _cramer_v_codes(codes: np.ndarray, sizes: np.ndarray, column: int, others: np.ndarray) -> np.ndarray:
+    """Calculate Cramér's V of one encoded column with each of other encoded columns.
+
+    Contingency tables of all pairs are counted with one bincount, rows with missing values in a pair are skipped
+    and only values present in the rest of rows are taken into account, same as for `pd.crosstab`.
+    Args:
+        codes: codes of values by columns from `_encode_columns`.
+        sizes: count of unique values of each column.
+        column: index of the column.
+        others: indexes of other columns.
+    Returns:
+        Value of the Cramér's V for each of other columns, nan if it is not defined.
+    """
+    pairs_count = len(others)
+    # tables have extra row and column for missing values
+    x_size = sizes[column] + 1
+    y_sizes = sizes[others] + 1
+    cells = x_size * y_sizes
+    offsets = np.concatenate([[0], np.cumsum(cells)])
+    if offsets[-1] < np.iinfo(np.int32).max:
+        y_sizes, offsets = y_sizes.astype(codes.dtype), offsets.astype(codes.dtype)
+    cell_codes = codes[:, column][:, np.newaxis] * y_sizes + codes[:, others] + offsets[:-1]
+    observed = np.bincount(cell_codes.ravel(order="K"), minlength=offsets[-1]).astype(float)
+
+    # pair, row and column of each cell of contingency tables
+    cell_pairs = np.repeat(np.arange(pairs_count), cells)
+    cell_offsets = np.arange(offsets[-1]) - offsets[:-1][cell_pairs]
+    cell_rows = cell_offsets // y_sizes[cell_pairs]
+    cell_cols = cell_offsets % y_sizes[cell_pairs]
+    observed[(cell_rows == x_size - 1) | (cell_cols == y_sizes[cell_pairs] - 1)] = 0
+    col_offsets = np.concatenate([[0], np.cumsum(y_sizes)])
+    cell_rows += cell_pairs * x_size
+    cell_cols += col_offsets[:-1][cell_pairs]
+
+    row_sums = np.bincount(cell_rows, weights=observed, minlength=pairs_count * x_size)
+    col_sums = np.bincount(cell_cols, weights=observed, minlength=col_offsets[-1])
+    totals = np.bincount(cell_pairs, weights=observed, minlength=pairs_count)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = row_sums[cell_rows] * col_sums[cell_cols] / totals[cell_pairs]
+        # cells of values absent in a pair have zero expected frequency and are not part of its contingency table
+        chi2 = np.bincount(
+            cell_pairs,
+            weights=np.where(expected > 0, (observed - expected) ** 2 / expected, 0.0),
+            minlength=pairs_count,
+        )
+        n_rows = (row_sums.reshape(pairs_count, x_size) > 0).sum(axis=1)
+        n_cols = np.bincount(np.repeat(np.arange(pairs_count), y_sizes), weights=col_sums > 0, minlength=pairs_count)
+        dof = np.minimum(n_rows, n_cols) - 1
+        return np.where(dof > 0, np.sqrt(chi2 / totals / dof), np.nan)
+
+
 def _cramer_v(x: pd.Series, y: pd.Series) -> float:
     """Calculate Cramér's V: a measure of association between two nominal variables.
     Args:
@@ -331,16 +408,57 @@ def _cramer_v(x: pd.Series, y: pd.Series) -> float:
     Returns:
         Value of the Cramér's V
     """
-    arr = pd.crosstab(x, y).values
-    chi2_stat = chi2_contingency(arr, correction=False)
-    phi2 = chi2_stat[0] / arr.sum()
-    n_rows, n_cols = arr.shape
-    if min(n_cols - 1, n_rows - 1) == 0:
-        value = np.nan
+    codes, sizes = _encode_columns(pd.concat([x, y], axis=1, ignore_index=True))
+    return float(_cramer_v_codes(codes, sizes, 0, np.array([1]))[0])
+
+
+def get_cramer_v_matrix(df: pd.DataFrame, parallel: bool = False, max_workers: Optional[int] = None) -> pd.DataFrame:
+    """Compute Cramér's V of all pairs of columns.
+
+    Columns are encoded once, pairs of each column with previous columns are calculated in blocks
+    limited by CONTINGENCY_BLOCK_SIZE counted values and cells.
+    Args:
+        df: initial data frame.
+        parallel: calculate blocks of pairs concurrently.
+        max_workers: pool size for parallel calculation, `None` lets the executor decide.
+    Returns:
+        Correlation matrix.
+    """
+    columns = df.columns
+    k = df.shape[1]
+    if k <= 1:
+        return pd.DataFrame()
+    codes, sizes = _encode_columns(df)
+    # contingency tables have extra row and column for missing values
+    table_sizes = sizes + 1
+    blocks = []
+    for i in range(1, k):
+        start = 0
+        while start < i:
+            end = start + 1
+            cells = table_sizes[i] * table_sizes[start]
+            while end < i and (end - start + 1) * len(df) <= CONTINGENCY_BLOCK_SIZE:
+                cells += table_sizes[i] * table_sizes[end]
+                if cells > CONTINGENCY_BLOCK_SIZE:
+                    break
+                end += 1
+            blocks.append((i, np.arange(start, end)))
+            start = end
+
+    def calculate(block: Tuple[int, np.ndarray]) -> np.ndarray:
+        return _cramer_v_codes(codes, sizes, *block)
+
+    if parallel and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            values = list(executor.map(calculate, blocks))
     else:
-        value = np.sqrt(phi2 / min(n_cols - 1, n_rows - 1))
+        values = [calculate(block) for block in blocks]
 
-    return value
+    corr_array = np.eye(k)
+    for (i, others), block_values in zip(blocks, values):
+        corr_array[i, others] = block_values
+        corr_array[others, i] = block_values
+    return pd.DataFrame(data=corr_array, columns=columns, index=columns)
 
 
 def get_pairwise_correlation(df, func: Callable[[pd.Series, pd.Series], float]) -> pd.DataFrame:
@@ -368,7 +486,9 @@ def get_pairwise_correlation(df, func: Callable[[pd.Series, pd.Series], float])
         return pd.DataFrame(data=corr_array, columns=columns, index=columns)
 
 
-def _calculate_correlations(df: pd.DataFrame, num_for_corr, cat_for_corr, kind):
+def _calculate_correlations(
+    df: pd.DataFrame, num_for_corr, cat_for_corr, kind, parallel: bool = False, max_workers: Optional[int] = None
+):
     """Calculate correlation matrix depending on the kind parameter
     Args:
         df: initial data frame.
@@ -379,6 +499,8 @@ def _calculate_correlations(df: pd.DataFrame, num_for_corr, cat_for_corr, kind):
             - kendall - Kendall Tau correlation coefficient
             - spearman - Spearman rank correlation
             - cramer_v - Cramer’s V measure of association
+        parallel: calculate pairs of cramer_v correlation matrix concurrently.
+        max_workers: pool size for parallel calculation.
     Returns:
         Correlation matrix.
     """
@@ -389,11 +511,15 @@ def _calculate_correlations(df: pd.DataFrame, num_for_corr, cat_for_corr, kind):
     elif kind == "kendall":
         return df[num_for_corr].corr("kendall")
     elif kind == "cramer_v":
-        return get_pairwise_correlation(df[cat_for_corr], _cramer_v)
+        return get_cramer_v_matrix(df[cat_for_corr], parallel, max_workers)
 
 
 def calculate_correlations(
-    dataset: pd.DataFrame, data_definition: DataDefinition, add_text_columns: Optional[list] = None
+    dataset: pd.DataFrame,
+    data_definition: DataDefinition,
+    add_text_columns: Optional[list] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
 ) -> Dict:
     num_for_corr, cat_for_corr = _select_features_for_corr(dataset, data_definition)
     if add_text_columns is not None:
@@ -401,19 +527,26 @@ def calculate_correlations(
     correlations = {}
 
     for kind in ["pearson", "spearman", "kendall", "cramer_v"]:
-        correlations[kind] = _calculate_correlations(dataset, num_for_corr, cat_for_corr, kind)
+        correlations[kind] = _calculate_correlations(dataset, num_for_corr, cat_for_corr, kind, parallel, max_workers)
 
     return correlations
 
 
+def _cramer_v_with_columns(column: pd.Series, features: pd.DataFrame) -> List[float]:
+    """Calculate Cramér's V of a column with each column of features, the column is encoded once"""
+    if features.shape[1] == 0:
+        return []
+    codes, sizes = _encode_columns(pd.concat([column, features], axis=1, ignore_index=True))
+    return _cramer_v_codes(codes, sizes, 0, np.arange(1, features.shape[1] + 1)).tolist()
+
+
 def calculate_cramer_v_correlation(column_name: str, dataset: pd.DataFrame, columns: List[str]) -> ColumnCorrelations:
     result_x = []
     result_y = []
 
     if not dataset[column_name].empty:
-        for correlation_columns_name in columns:
-            result_x.append(correlation_columns_name)
-            result_y.append(_cramer_v(dataset[column_name], dataset[correlation_columns_name]))
+        result_x = list(columns)
+        result_y = _cramer_v_with_columns(dataset[column_name], dataset[columns])
 
     return ColumnCorrelations(
         column_name=column_name,
@@ -431,12 +564,8 @@ def calculate_category_correlation(
     if column.empty or features.empty:
         return []
 
-    result_x = []
-    result_y = []
-
-    for feature_name in features.columns:
-        result_x.append(feature_name)
-        result_y.append(_cramer_v(column, features[feature_name]))
+    result_x = list(features.columns)
+    result_y = _cramer_v_with_columns(column, features)
 
     return [
         ColumnCorrelations(
@@ -0,0 +1,136 @@
+"""Recommendations ranked within users, shared between recommender system metrics during one run."""
+
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from evidently.calculations.run_cache import RunCache
+from evidently.pipeline.column_mapping import RecomType
+
+
+class RankedInteractions:
+    """Rows of one dataset with rank of each recommended item among recommendations of its user.
+
+    Users and items are kept as integer codes of `users` and `items` indexes, arrays follow row order of the dataset.
+    """
+
+    def __init__(
+        self,
+        index: pd.Index,
+        user_codes: np.ndarray,
+        users: pd.Index,
+        item_codes: Optional[np.ndarray],
+        items: Optional[pd.Index],
+        ranks: np.ndarray,
+        target: Optional[np.ndarray],
+    ):
+        self.index = index
+        self.user_codes = user_codes
+        self.users = users
+        self.item_codes = item_codes
+        self.items = items
+        self.ranks = ranks
+        self.target = target
+        self._top_k: Dict[Any, np.ndarray] = {}
+
+    @classmethod
+    def from_data(
+        cls,
+        data: pd.DataFrame,
+        user_id: str,
+        item_id: Optional[str],
+        prediction_name: str,
+        target_name: Optional[str],
+        recommendations_type: RecomType,
+    ) -> "RankedInteractions":
+        user_codes, users = pd.factorize(data[user_id])
+        item_codes: Optional[np.ndarray] = None
+        items: Optional[pd.Index] = None
+        if item_id is not None:
+            item_codes, items = pd.factorize(data[item_id])
+        predictions = data[prediction_name]
+        if recommendations_type == RecomType.SCORE:
+            # same as groupby(user_id)[prediction_name].transform("rank", ascending=False), rows without user stay nan
+            ranks = predictions.groupby(user_codes).rank(ascending=False).to_numpy(dtype=float)
+            ranks[user_codes < 0] = np.nan
+        else:
+            ranks = predictions.to_numpy()
+        return cls(
+            index=data.index,
+            user_codes=_compact(user_codes),
+            users=users,
+            item_codes=None if item_codes is None else _compact(item_codes),
+            items=items,
+            ranks=ranks,
+            target=None if target_name is None else data[target_name].to_numpy(),
+        )
+
+    def user_values(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """User of each row, of rows selected by `mask` if it is set"""
+        codes = self.user_codes if mask is None else self.user_codes[mask]
+        if (codes < 0).any():
+            return self.users.take(codes, allow_fill=True, fill_value=np.nan).to_numpy()
+        return self.users.take(codes).to_numpy()
+
+    def map_items(self, mapping: Union[Dict, pd.Series], mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Value of `mapping` for item of each row, of rows selected by `mask` if it is set.
+
+        Mapping is applied once per unique item, rows with unknown items get nan.
+        """
+        if self.items is None or self.item_codes is None:
+            raise ValueError("Item_id was not found in data.")
+        codes = self.item_codes if mask is None else self.item_codes[mask]
+        values = np.append(self.items.map(mapping).to_numpy(dtype=float), np.nan)
+        return values[codes]
+
+    def top_k(self, k: float) -> np.ndarray:
+        """Mask of rows ranked in first `k` recommendations of their users"""
+        if k not in self._top_k:
+            self._top_k[k] = self.ranks <= k
+        return self._top_k[k]
+
+    def relevant(self, min_rel_score: Optional[int] = None) -> np.ndarray:
+        """Mask of rows with relevant items: positive target or target not less than `min_rel_score`"""
+        if self.target is None:
+            raise ValueError("Target should be specified")
+        if min_rel_score is not None:
+            return self.target >= min_rel_score
+        return self.target > 0
+
+
+def _compact(codes: np.ndarray) -> np.ndarray:
+    return codes.astype(np.int32) if len(codes) < np.iinfo(np.int32).max else codes
+
+
+class RankedInteractionsCache:
+    """Rankings of datasets of a run, kept in the run cache.
+
+    Rankings are keyed by columns and recommendations type they were built with.
+    """
+
+    def __init__(self, cache: Optional[RunCache] = None):
+        self._cache = cache if cache is not None else RunCache()
+
+    def get(
+        self,
+        dataset: str,
+        data: pd.DataFrame,
+        user_id: str,
+        item_id: Optional[str],
+        prediction_name: str,
+        target_name: Optional[str],
+        recommendations_type: RecomType,
+    ) -> RankedInteractions:
+        key = ("ranked_interactions", user_id, item_id, prediction_name, target_name, recommendations_type)
+        return self._cache.get(
+            dataset,
+            key,
+            data,
+            lambda: RankedInteractions.from_data(
+                data, user_id, item_id, prediction_name, target_name, recommendations_type
+            ),
+        )
@@ -1,8 +1,14 @@
 from typing import Optional
+from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
 from evidently.base_metric import InputData
+from evidently.calculations.ranked_interactions import RankedInteractions
+from evidently.calculations.ranked_interactions import RankedInteractionsCache
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.pipeline.column_mapping import RecomType
 
 
@@ -30,46 +36,91 @@ def collect_dataset(
     return df
 
 
+def get_ranked_interactions(
+    data: InputData,
+    cache: Optional[RankedInteractionsCache] = None,
+    prediction_name: Optional[str] = None,
+    recommendations_type: Optional[RecomType] = None,
+) -> Tuple[RankedInteractions, Optional[RankedInteractions]]:
+    """Current and reference recommendations ranked within users.
+
+    Rankings are built once per run and shared between metrics through `cache`.
+    """
+    user_column = data.data_definition.get_user_id_column()
+    if user_column is None:
+        raise ValueError("User_id was not found in data.")
+    item_column = data.data_definition.get_item_id_column()
+    target_column = data.data_definition.get_target_column()
+    columns = (
+        user_column.column_name,
+        None if item_column is None else item_column.column_name,
+        prediction_name if prediction_name is not None else get_prediciton_name(data),
+        None if target_column is None else target_column.column_name,
+        recommendations_type or data.column_mapping.recom_type or RecomType.SCORE,
+    )
+    if cache is None:
+        cache = RankedInteractionsCache()
+
+    def ranked(dataset: str, df: pd.DataFrame) -> RankedInteractions:
+        return cache.get(dataset, df, *columns)
+
+    curr = ranked(CURRENT, data.current_data)
+    ref = None if data.reference_data is None else ranked(REFERENCE, data.reference_data)
+    return curr, ref
+
+
+def ranked_dataset(
+    ranked: RankedInteractions,
+    recommendations_type: RecomType,
+    min_rel_score: Optional[int],
+    no_feedback_users: bool,
+    bin_data: bool,
+) -> pd.DataFrame:
+    """Same frame as `collect_dataset` built from ranked recommendations"""
+    if ranked.target is None:
+        raise ValueError("Target and prediction were not found in data.")
+    target = ranked.target
+    if min_rel_score:
+        target = (target >= min_rel_score).astype(int)
+    if bin_data:
+        target = (target > 0).astype(int)
+    preds = ranked.ranks
+    if recommendations_type == RecomType.SCORE:
+        preds = preds.astype(int)
+    df = pd.DataFrame(
+        {"users": ranked.user_values(), "target": target, "preds": preds},
+        index=ranked.index,
+    )
+    if not no_feedback_users:
+        users_with_clicks = np.zeros(len(ranked.users) + 1, dtype=bool)
+        users_with_clicks[ranked.user_codes[target > 0]] = True
+        df = df[users_with_clicks[ranked.user_codes]]
+    return df
+
+
 def get_curr_and_ref_df(
-    data: InputData, min_rel_score: Optional[int] = None, no_feedback_users: bool = False, bin_data: bool = True
+    data: InputData,
+    min_rel_score: Optional[int] = None,
+    no_feedback_users: bool = False,
+    bin_data: bool = True,
+    cache: Optional[RankedInteractionsCache] = None,
 ):
     target_column = data.data_definition.get_target_column()
     prediction = data.data_definition.get_prediction_columns()
     if target_column is None or prediction is None:
         raise ValueError("Target and prediction were not found in data.")
-    _, target_current, target_reference = data.get_data(target_column.column_name)
     recommendations_type = data.column_mapping.recom_type or RecomType.SCORE
     if prediction.prediction_probas is not None:
         pred_name = prediction.prediction_probas[0].column_name
     elif prediction.predicted_values is not None:
         pred_name = prediction.predicted_values.column_name
-    _, prediction_current, prediction_reference = data.get_data(pred_name)
-    user_column = data.column_mapping.user_id
-    if user_column is None:
+    if data.column_mapping.user_id is None:
         raise ValueError("User_id was not found in data.")
-    _, user_current, user_reference = data.get_data(user_column)
-    curr = collect_dataset(
-        user_current,
-        target_current,
-        prediction_current,
-        recommendations_type,
-        min_rel_score,
-        no_feedback_users,
-        bin_data,
-    )
-
+    curr_ranked, ref_ranked = get_ranked_interactions(data, cache, pred_name, recommendations_type)
+    curr = ranked_dataset(curr_ranked, recommendations_type, min_rel_score, no_feedback_users, bin_data)
     ref: Optional[pd.DataFrame] = None
-    if user_reference is not None and target_reference is not None and prediction_reference is not None:
-        ref = collect_dataset(
-            user_reference,
-            target_reference,
-            prediction_reference,
-            recommendations_type,
-            min_rel_score,
-            no_feedback_users,
-            bin_data,
-        )
-
+    if ref_ranked is not None:
+        ref = ranked_dataset(ref_ranked, recommendations_type, min_rel_score, no_feedback_users, bin_data)
     return curr, ref
 
 
@@ -88,3 +139,48 @@ def get_stats_novelty(train_data: pd.DataFrame, item_id: str, user_id: str):
     user_interacted = train_data.groupby(item_id)[user_id].nunique()
     interactions = user_interacted / user_interacted.shape[0]
     return interactions
+
+
+def group_sums(groups: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Groups, group sizes and sums of `values` rows by group.
+
+    Rows are sorted by group once and summed between group offsets, so there is no per group scan of the data.
+    Groups are returned in sorted order.
+    """
+    if len(groups) == 0:
+        return groups, np.zeros(0, dtype=int), np.zeros((0,) + values.shape[1:], dtype=values.dtype)
+    order = np.argsort(groups, kind="stable")
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    sizes = np.diff(np.r_[starts, len(groups)])
+    return sorted_groups[starts], sizes, np.add.reduceat(values[order], starts, axis=0)
+
+
+def user_codes(users: pd.Series) -> Tuple[np.ndarray, int, np.ndarray]:
+    """Integer codes of users, number of users and mask of rows with user"""
+    codes, uniques = pd.factorize(users)
+    known = codes >= 0
+    return codes[known], len(uniques), known
+
+
+def _top_k_cells(users: np.ndarray, ranks: np.ndarray, max_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rows ranked in top `max_k` and index of (user, smallest k with the row in top k) cell of flat matrix"""
+    rows = np.flatnonzero(ranks <= max_k)
+    first_k = np.maximum(np.ceil(ranks[rows]), 1).astype(int)
+    return rows, users[rows] * max_k + first_k - 1
+
+
+def top_k_sums(users: np.ndarray, ranks: np.ndarray, values: np.ndarray, n_users: int, max_k: int) -> np.ndarray:
+    """Sums of `values` of rows of each user ranked in top k, for k from 1 to `max_k` (users x max_k matrix)"""
+    rows, cells = _top_k_cells(users, ranks, max_k)
+    sums = np.bincount(cells, weights=values[rows], minlength=n_users * max_k).reshape(n_users, max_k)
+    return np.cumsum(sums, axis=1)
+
+
+def top_k_last(users: np.ndarray, ranks: np.ndarray, values: np.ndarray, n_users: int, max_k: int) -> np.ndarray:
+    """Value of the last row (in rows order) of each user ranked in top k, for k from 1 to `max_k`, 0 if there is none"""
+    rows, cells = _top_k_cells(users, ranks, max_k)
+    last = np.full(n_users * max_k, -1)
+    np.maximum.at(last, cells, rows)
+    last = np.maximum.accumulate(last.reshape(n_users, max_k), axis=1)
+    return np.where(last >= 0, values[last], 0)
@@ -0,0 +1,38 @@
+"""Values calculated once from datasets of a run and shared between its metrics."""
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+CURRENT = "current"
+REFERENCE = "reference"
+
+T = TypeVar("T")
+
+
+class RunCache:
+    """Storage of values calculated from datasets of one run.
+
+    Values are keyed by dataset and a key of the calculation. A value is reused only for the same source
+    data object, so values calculated from other data of the dataset (e.g. previous chunk) are calculated again.
+    """
+
+    def __init__(self):
+        self._storage: Dict[Tuple[str, Hashable], Tuple[Any, Any]] = {}
+
+    def get(self, dataset: str, key: Hashable, data: Any, calculate: Callable[[], T]) -> T:
+        """Value calculated by `calculate` from `data` of the dataset, calculated once for the same `data`"""
+        cached = self._storage.get((dataset, key))
+        if cached is None or cached[0] is not data:
+            cached = (data, calculate())
+            self._storage[(dataset, key)] = cached
+        return cached[1]
+
+    def clear(self, dataset: Optional[str] = None):
+        """Remove values of the run, only of given dataset if it is set"""
+        for key in [key for key in self._storage if dataset is None or key[0] == dataset]:
+            del self._storage[key]
@@ -26,12 +26,15 @@ Example:
 from typing import Optional
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from scipy.spatial import distance
 
 from evidently.calculations.stattests.registry import StatTest
+from evidently.calculations.stattests.registry import register_batch_stattest
 from evidently.calculations.stattests.registry import register_stattest
 from evidently.calculations.stattests.utils import get_binned_data
+from evidently.calculations.stattests.utils import get_binned_stattest_batch
 from evidently.core import ColumnType
 
 
@@ -60,6 +63,19 @@ def _jensenshannon(
     return jensenshannon_value, jensenshannon_value >= threshold
 
 
+def _jensenshannon_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: ColumnType, threshold: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the Jensen-Shannon distance for each row of 2-D arrays, the same way as `_jensenshannon`"""
+
+    def calculate(reference_percents: np.ndarray, current_percents: np.ndarray) -> np.ndarray:
+        return distance.jensenshannon(reference_percents, current_percents, axis=1)
+
+    return get_binned_stattest_batch(
+        reference_data, current_data, feature_type, threshold, calculate, _jensenshannon, feel_zeroes=False
+    )
+
+
 jensenshannon_stat_test = StatTest(
     name="jensenshannon",
     display_name="Jensen-Shannon distance",
@@ -68,3 +84,4 @@ jensenshannon_stat_test = StatTest(
 )
 
 register_stattest(jensenshannon_stat_test, _jensenshannon)
+register_batch_stattest(jensenshannon_stat_test, _jensenshannon_batch)
@@ -25,12 +25,15 @@ Example:
 
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 from scipy import stats
 
 from evidently.calculations.stattests.registry import StatTest
+from evidently.calculations.stattests.registry import register_batch_stattest
 from evidently.calculations.stattests.registry import register_stattest
 from evidently.calculations.stattests.utils import get_binned_data
+from evidently.calculations.stattests.utils import get_binned_stattest_batch
 from evidently.core import ColumnType
 
 
@@ -53,6 +56,17 @@ def _kl_div(
     return kl_div_value, kl_div_value >= threshold
 
 
+def _kl_div_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: ColumnType, threshold: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the Kullback-Leibler divergence for each row of 2-D arrays, the same way as `_kl_div`"""
+
+    def calculate(reference_percents: np.ndarray, current_percents: np.ndarray) -> np.ndarray:
+        return stats.entropy(reference_percents, current_percents, axis=1)
+
+    return get_binned_stattest_batch(reference_data, current_data, feature_type, threshold, calculate, _kl_div)
+
+
 kl_div_stat_test = StatTest(
     name="kl_div",
     display_name="Kullback-Leibler divergence",
@@ -61,3 +75,4 @@ kl_div_stat_test = StatTest(
 )
 
 register_stattest(kl_div_stat_test, _kl_div)
+register_batch_stattest(kl_div_stat_test, _kl_div_batch)
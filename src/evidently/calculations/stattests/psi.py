@@ -29,8 +29,10 @@ import numpy as np
 import pandas as pd
 
 from evidently.calculations.stattests.registry import StatTest
+from evidently.calculations.stattests.registry import register_batch_stattest
 from evidently.calculations.stattests.registry import register_stattest
 from evidently.calculations.stattests.utils import get_binned_data
+from evidently.calculations.stattests.utils import get_binned_stattest_batch
 from evidently.core import ColumnType
 
 
@@ -56,6 +58,18 @@ def _psi(
     return psi_value, psi_value >= threshold
 
 
+def _psi_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: ColumnType, threshold: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate the PSI for each row of 2-D arrays, the same way as `_psi`"""
+
+    def calculate(reference_percents: np.ndarray, current_percents: np.ndarray) -> np.ndarray:
+        psi_values = (reference_percents - current_percents) * np.log(reference_percents / current_percents)
+        return np.sum(psi_values, axis=1)
+
+    return get_binned_stattest_batch(reference_data, current_data, feature_type, threshold, calculate, _psi)
+
+
 psi_stat_test = StatTest(
     name="psi",
     display_name="PSI",
@@ -64,3 +78,4 @@ psi_stat_test = StatTest(
 )
 
 register_stattest(psi_stat_test, _psi)
+register_batch_stattest(psi_stat_test, _psi_batch)
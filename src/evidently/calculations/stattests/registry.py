@@ -6,11 +6,13 @@ from typing import Dict
 from typing import Generic
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
 
+import numpy as np
 import pandas as pd
 
 from evidently.calculation_engine.engine import Engine
@@ -21,6 +23,8 @@ from evidently.utils.numpy_encoder import add_type_mapping
 
 StatTestFuncReturns = Tuple[float, bool]
 StatTestFuncType = Callable[[pd.Series, pd.Series, ColumnType, float], StatTestFuncReturns]
+BatchStatTestFuncReturns = Tuple[np.ndarray, np.ndarray]
+BatchStatTestFuncType = Callable[[np.ndarray, np.ndarray, ColumnType, np.ndarray], BatchStatTestFuncReturns]
 
 
 @dataclasses.dataclass
@@ -53,6 +57,33 @@ class StatTest:
         drift_score, drifted = p
         return StatTestResult(drift_score=drift_score, drifted=drifted, actual_threshold=actual_threshold)
 
+    def batch(
+        self,
+        reference_data: np.ndarray,
+        current_data: np.ndarray,
+        feature_type: ColumnType,
+        thresholds: Sequence[Optional[float]],
+    ) -> List[StatTestResult]:
+        """Calculate stattest for several columns at once.
+
+        Args:
+            reference_data: 2-D array of finite reference values, one row per column
+            current_data: 2-D array of finite current values, one row per column
+            feature_type: feature type of all columns
+            thresholds: threshold for each column, `None` means default threshold
+        Returns:
+            results in the order of rows
+        """
+        impl = get_batch_stattest_impl(self)
+        if impl is None:
+            raise NotImplementedError(f"'{self.name}' has no batch implementation")
+        actual_thresholds = [self.default_threshold if threshold is None else threshold for threshold in thresholds]
+        drift_scores, drifted = impl(reference_data, current_data, feature_type, np.array(actual_thresholds))
+        return [
+            StatTestResult(drift_score=drift_score, drifted=is_drifted, actual_threshold=actual_threshold)
+            for drift_score, is_drifted, actual_threshold in zip(drift_scores, drifted, actual_thresholds)
+        ]
+
     def _get_impl(self, engine: Type[Engine]):
         impl = _impls.get(self, {}).get(engine, None)
         if impl is None:
@@ -112,6 +143,7 @@ PossibleStatTestType = Union[str, StatTestFuncType, StatTest]
 
 _registered_stat_tests: Dict[str, Dict[ColumnType, StatTest]] = {}
 _registered_stat_test_funcs: Dict[StatTestFuncType, str] = {}
+_batch_impls: Dict[StatTest, BatchStatTestFuncType] = {}
 
 
 class PythonStatTestWrapper(PythonStatTest):
@@ -134,13 +166,32 @@ def register_stattest(stat_test: StatTest, default_impl: StatTestFuncType = None
         _registered_stat_test_funcs[default_impl] = stat_test.name
 
 
+def register_batch_stattest(stat_test: StatTest, batch_impl: BatchStatTestFuncType):
+    """Register vectorized implementation of stattest for several columns at once.
+
+    Implementation takes reference and current data as 2-D arrays of finite values with one row per column,
+    feature type and array of thresholds and returns arrays of drift scores and drift flags.
+    Results must be the same as results of default implementation applied to each column.
+    """
+    _batch_impls[stat_test] = batch_impl
+
+
+def get_batch_stattest_impl(stat_test: StatTest) -> Optional[BatchStatTestFuncType]:
+    return _batch_impls.get(stat_test)
+
+
 def _get_default_stattest(reference_data: pd.Series, current_data: pd.Series, feature_type: ColumnType) -> StatTest:
     n_values = pd.concat([reference_data, current_data]).nunique()
+    return get_default_stattest(reference_data.shape[0], n_values, feature_type)
+
+
+def get_default_stattest(reference_size: int, n_values: int, feature_type: ColumnType) -> StatTest:
+    """Choose stattest by reference size and number of unique values in both reference and current data"""
     if feature_type == ColumnType.Text:
-        if reference_data.shape[0] > 1000:
+        if reference_size > 1000:
             return stattests.abs_text_content_drift_stat_test
         return stattests.perc_text_content_drift_stat_test
-    elif reference_data.shape[0] <= 1000:
+    elif reference_size <= 1000:
         if feature_type == ColumnType.Numerical:
             if n_values <= 5:
                 return stattests.chi_stat_test if n_values > 2 else stattests.z_stat_test
@@ -148,9 +199,8 @@ def _get_default_stattest(reference_data: pd.Series, current_data: pd.Series, fe
                 return stattests.ks_stat_test
         elif feature_type == ColumnType.Categorical:
             return stattests.chi_stat_test if n_values > 2 else stattests.z_stat_test
-    elif reference_data.shape[0] > 1000:
+    elif reference_size > 1000:
         if feature_type == ColumnType.Numerical:
-            n_values = pd.concat([reference_data, current_data]).nunique()
             if n_values <= 5:
                 return stattests.jensenshannon_stat_test
             elif n_values > 5:
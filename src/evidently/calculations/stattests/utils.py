@@ -1,10 +1,17 @@
 from collections import Counter
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
 
 import numpy as np
 import pandas as pd
 
 from evidently.core import ColumnType
 
+# newer numpy versions do not make bins narrower than 1 for integer data
+_INTEGER_MIN_BIN_WIDTH = len(np.histogram_bin_edges(np.arange(3), bins="sturges")) == 3
+
 
 def get_unique_not_nan_values_list_from_series(current_data: pd.Series, reference_data: pd.Series) -> list:
     """Get unique values from current and reference series, drop NaNs"""
@@ -57,6 +64,133 @@ def get_binned_data(
     return reference_percents, current_percents
 
 
+def get_unique_count_batch(data: np.ndarray) -> np.ndarray:
+    """Number of unique values in each row of 2-D array of finite values"""
+    return 1 + np.count_nonzero(np.diff(np.sort(data, axis=1), axis=1), axis=1)
+
+
+def get_uniform_bin_edges(first_edge: float, last_edge: float, n_bins: int) -> np.ndarray:
+    """Bin edges of equal width, the same as `np.histogram` creates for data with given min and max"""
+    if first_edge == last_edge:
+        first_edge = first_edge - 0.5
+        last_edge = last_edge + 0.5
+    return np.linspace(first_edge, last_edge, n_bins + 1, endpoint=True, dtype=float)
+
+
+def get_sturges_bin_edges_batch(data: np.ndarray) -> List[np.ndarray]:
+    """Bin edges for each row of 2-D array of finite values, the same as `np.histogram_bin_edges` with "sturges" """
+    first_edges = data.min(axis=1)
+    last_edges = data.max(axis=1)
+    widths = (last_edges - first_edges) / (np.log2(data.shape[1]) + 1.0)
+    if _INTEGER_MIN_BIN_WIDTH and np.issubdtype(data.dtype, np.integer):
+        widths[(widths > 0) & (widths < 1)] = 1
+    result = []
+    for first_edge, last_edge, width in zip(first_edges, last_edges, widths):
+        n_bins = int(np.ceil((last_edge - first_edge) / width)) if width else 1
+        result.append(get_uniform_bin_edges(first_edge, last_edge, n_bins))
+    return result
+
+
+def histogram_batch(data: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
+    """Histogram of each row of 2-D array of finite values, the same as `np.histogram` with the same bin edges
+    Args:
+        data: 2-D array with one row per column, all values are inside of bin edges of the row
+        bin_edges: 2-D array of increasing uniform bin edges for each row
+    Returns:
+        2-D array of counts
+    """
+    n_rows, n_bins = bin_edges.shape[0], bin_edges.shape[1] - 1
+    first_edges = bin_edges[:, :1]
+    last_edges = bin_edges[:, -1:]
+    indices = ((data - first_edges) / (last_edges - first_edges) * n_bins).astype(np.intp)
+    np.clip(indices, 0, n_bins - 1, out=indices)
+    # fix rounding errors, so value goes to bin i if edges[i] <= value < edges[i + 1] and last bin is closed
+    while True:
+        decrement = data < np.take_along_axis(bin_edges, indices, axis=1)
+        increment = (data >= np.take_along_axis(bin_edges, indices + 1, axis=1)) & (indices != n_bins - 1)
+        if not decrement.any() and not increment.any():
+            break
+        indices[decrement] -= 1
+        indices[increment] += 1
+    indices += np.arange(n_rows)[:, np.newaxis] * n_bins
+    return np.bincount(indices.ravel(), minlength=n_rows * n_bins).reshape(n_rows, n_bins)
+
+
+def _group_by_size(bin_edges: List[np.ndarray]) -> Dict[int, List[int]]:
+    groups: Dict[int, List[int]] = {}
+    for idx, edges in enumerate(bin_edges):
+        groups.setdefault(edges.shape[0], []).append(idx)
+    return groups
+
+
+def _feel_zeroes_batch(percents: np.ndarray):
+    min_not_zero = np.where(percents != 0, percents, np.inf).min(axis=1, keepdims=True)
+    fill_values = np.where(min_not_zero <= 0.0001, min_not_zero / 10**6, 0.0001)
+    np.copyto(percents, np.broadcast_to(fill_values, percents.shape), where=percents == 0)
+
+
+def get_binned_data_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feel_zeroes: bool = True
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Split each row of 2-D arrays into buckets, the same way `get_binned_data` does
+    for numerical data with more than 20 unique reference values
+    Args:
+        reference_data: 2-D array of finite reference values, one row per column
+        current_data: 2-D array of finite current values, one row per column
+        feel_zeroes: replace zero shares with small values
+    Returns:
+        groups of rows with the same number of buckets: row indexes, reference percents, current percents
+    """
+    bin_edges = get_sturges_bin_edges_batch(np.concatenate([reference_data, current_data], axis=1))
+    result = []
+    for rows in _group_by_size(bin_edges).values():
+        edges = np.stack([bin_edges[idx] for idx in rows])
+        reference_percents = histogram_batch(reference_data[rows], edges) / reference_data.shape[1]
+        current_percents = histogram_batch(current_data[rows], edges) / current_data.shape[1]
+        if feel_zeroes:
+            _feel_zeroes_batch(reference_percents)
+            _feel_zeroes_batch(current_percents)
+        result.append((np.array(rows), reference_percents, current_percents))
+    return result
+
+
+def get_binned_stattest_batch(
+    reference_data: np.ndarray,
+    current_data: np.ndarray,
+    feature_type: ColumnType,
+    threshold: np.ndarray,
+    calculate: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    default_impl: Callable[[pd.Series, pd.Series, ColumnType, float], Tuple[float, bool]],
+    feel_zeroes: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate stattest on binned data for each row of 2-D arrays
+    Args:
+        reference_data: 2-D array of finite reference values, one row per column
+        current_data: 2-D array of finite current values, one row per column
+        feature_type: feature type
+        threshold: all values above this threshold means data drift
+        calculate: function of reference and current percents with one row per column, returns drift scores
+        default_impl: stattest for one column, used for columns binned by unique values
+        feel_zeroes: replace zero shares with small values
+    Returns:
+        drift scores and drift flags for each row
+    """
+    drift_scores = np.empty(reference_data.shape[0])
+    if feature_type == ColumnType.Numerical:
+        is_binned = get_unique_count_batch(reference_data) > 20
+    else:
+        is_binned = np.zeros(reference_data.shape[0], dtype=bool)
+    binned_rows = np.flatnonzero(is_binned)
+    binned_groups = get_binned_data_batch(reference_data[binned_rows], current_data[binned_rows], feel_zeroes)
+    for rows, reference_percents, current_percents in binned_groups:
+        drift_scores[binned_rows[rows]] = calculate(reference_percents, current_percents)
+    for idx in np.flatnonzero(~is_binned):
+        drift_scores[idx] = default_impl(
+            pd.Series(reference_data[idx]), pd.Series(current_data[idx]), feature_type, threshold[idx]
+        )[0]
+    return drift_scores, drift_scores >= threshold
+
+
 def permutation_test(reference_data, current_data, observed, test_statistic_func, iterations=100):
     """Perform a two-sided permutation test
     Args:
@@ -30,6 +30,7 @@ import pandas as pd
 from scipy import stats
 
 from evidently.calculations.stattests.registry import StatTest
+from evidently.calculations.stattests.registry import register_batch_stattest
 from evidently.calculations.stattests.registry import register_stattest
 from evidently.core import ColumnType
 
@@ -52,6 +53,41 @@ def _wasserstein_distance_norm(
     return wd_norm_value, wd_norm_value >= threshold
 
 
+def _wasserstein_distance_norm_batch(
+    reference_data: np.ndarray, current_data: np.ndarray, feature_type: ColumnType, threshold: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute normed Wasserstein distance for each row of 2-D arrays, the same way as `_wasserstein_distance_norm`
+    Args:
+        reference_data: 2-D array of finite reference values, one row per column
+        current_data: 2-D array of finite current values, one row per column
+        feature_type: feature type
+        threshold: all values above this threshold means data drift
+    Returns:
+        wasserstein_distance_norm: normed Wasserstein distances
+        test_result: whether the drift is detected
+    """
+    reference_data = np.asarray(reference_data, dtype=float)
+    current_data = np.asarray(current_data, dtype=float)
+    n_reference = reference_data.shape[1]
+    all_data = np.concatenate([reference_data, current_data], axis=1)
+    order = np.argsort(all_data, axis=1)
+    all_values = np.take_along_axis(all_data, order, axis=1)
+    # CDF at each value counts all values equal to it, so take counts at the end of each run of equal values
+    positions = np.arange(all_values.shape[1])
+    is_run_end = np.ones(all_values.shape, dtype=bool)
+    is_run_end[:, :-1] = all_values[:, 1:] != all_values[:, :-1]
+    run_ends = np.where(is_run_end, positions, positions[-1])
+    run_ends = np.minimum.accumulate(run_ends[:, ::-1], axis=1)[:, ::-1][:, :-1]
+    reference_counts = np.take_along_axis(np.cumsum(order < n_reference, axis=1), run_ends, axis=1)
+    current_counts = run_ends + 1 - reference_counts
+    reference_cdf = reference_counts / n_reference
+    current_cdf = current_counts / current_data.shape[1]
+    distance = np.sum(np.multiply(np.abs(reference_cdf - current_cdf), np.diff(all_values, axis=1)), axis=1)
+    norm = np.maximum(reference_data.std(axis=1), 0.001)
+    wd_norm_value = distance / norm
+    return wd_norm_value, wd_norm_value >= threshold
+
+
 wasserstein_stat_test = StatTest(
     name="wasserstein",
     display_name="Wasserstein distance (normed)",
@@ -60,3 +96,4 @@ wasserstein_stat_test = StatTest(
 )
 
 register_stattest(wasserstein_stat_test, _wasserstein_distance_norm)
+register_batch_stattest(wasserstein_stat_test, _wasserstein_distance_norm_batch)
@@ -1,8 +1,9 @@
 from evidently.cli.collector import collector
 from evidently.cli.main import app
+from evidently.cli.snapshots import convert_snapshots
 from evidently.cli.ui import ui
 
-__all__ = ["app", "ui", "collector"]
+__all__ = ["app", "ui", "collector", "convert_snapshots"]
 
 
 def main():
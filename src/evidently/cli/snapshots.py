@@ -0,0 +1,22 @@
+from typer import Argument
+from typer import Option
+from typer import echo
+
+from evidently.cli.main import app
+from evidently.suite.snapshot_format import SnapshotFormat
+
+
+@app.command("convert-snapshots")
+def convert_snapshots(
+    workspace: str = Argument(..., help="Path to workspace"),
+    format: SnapshotFormat = Option(SnapshotFormat.BINARY, help="Target snapshot format"),
+    benchmark: bool = Option(False, help="Measure snapshot load time in previous and new format"),
+):
+    """Convert snapshots of local workspace to another storage format"""
+    from evidently.ui.storage.local.convert import convert_workspace_snapshots
+
+    stats = convert_workspace_snapshots(workspace, format, benchmark=benchmark)
+    echo(f"Converted {stats.converted} of {stats.snapshots} snapshots")
+    echo(f"Size: {stats.size_before} -> {stats.size_after} bytes")
+    if benchmark:
+        echo(f"Load time: {stats.load_time_before:.3f}s -> {stats.load_time_after:.3f}s")
@@ -2,13 +2,22 @@ import asyncio
 import contextlib
 import logging
 import os.path
+import time
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Any
 from typing import AsyncGenerator
+from typing import Callable
 from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 import pandas as pd
+import pyarrow as pa
 import uvicorn
 from litestar import Litestar
 from litestar import Request
@@ -22,6 +31,7 @@ from litestar.exceptions import NotAuthorizedException
 from litestar.handlers import BaseRouteHandler
 from litestar.params import Dependency
 from litestar.params import Parameter
+from litestar.status_codes import HTTP_429_TOO_MANY_REQUESTS
 from litestar.status_codes import HTTP_500_INTERNAL_SERVER_ERROR
 from litestar.types import ASGIApp
 from litestar.types import ExceptionHandlersMap
@@ -35,10 +45,17 @@ from evidently._pydantic_compat import SecretStr
 from evidently.collector.config import CONFIG_PATH
 from evidently.collector.config import CollectorConfig
 from evidently.collector.config import CollectorServiceConfig
+from evidently.collector.config import read_reference
+from evidently.collector.stats import CollectorMetrics
+from evidently.collector.stats import CollectorStats
+from evidently.collector.stats import ServiceStats
 from evidently.collector.storage import CollectorStorage
 from evidently.collector.storage import CreateReportEvent
 from evidently.collector.storage import LogEvent
 from evidently.collector.storage import UploadReportEvent
+from evidently.collector.storage import read_table
+from evidently.pipeline.reference_profile import ReferenceProfile
+from evidently.suite.base_suite import ReportBase
 from evidently.telemetry import DO_NOT_TRACK_ENV
 from evidently.telemetry import event_logger
 from evidently.ui.components.security import NoSecurityComponent
@@ -90,29 +107,110 @@ def set_reference(
     if id not in service.collectors:
         raise HTTPException(status_code=404, detail=f"Collector config with id '{id}' not found")
     collector = service.collectors[id]
+    if collector.reference_profile_path is not None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Collector '{id}' uses reference profile '{collector.reference_profile_path}', "
+            "reference data cannot be set",
+        )
     data = pd.DataFrame.from_dict(parsed_json)
     path = collector.reference_path or f"{id}_reference.parquet"
     data.to_parquet(os.path.join(service_workspace, path))
     collector.reference_path = path
+    collector._reference = None
     if service.autosave:
         service.save(service_config_path)
     return {}
 
 
+def _check_buffer_limits(
+    service: CollectorServiceConfig, storage: CollectorStorage, stats: ServiceStats, id: str
+) -> None:
+    collector = service.collectors[id]
+    rows = storage.get_buffer_rows(id)
+    nbytes = storage.get_buffer_bytes(id)
+    if (collector.max_buffer_rows is None or rows < collector.max_buffer_rows) and (
+        collector.max_buffer_bytes is None or nbytes < collector.max_buffer_bytes
+    ):
+        return
+    collector_stats = stats[id]
+    collector_stats.rejected_pushes += 1
+    raise HTTPException(
+        status_code=HTTP_429_TOO_MANY_REQUESTS,
+        detail=f"Buffer of collector '{id}' is full ({rows} rows, {nbytes} bytes)",
+        headers={"Retry-After": str(collector_stats.retry_after(service.check_interval))},
+    )
+
+
+def _append(storage: CollectorStorage, stats: ServiceStats, id: str, append: Callable[[], None]) -> None:
+    """Append data to buffer and count it, runs in a thread because storages can write buffer to disk"""
+    rows = storage.get_buffer_rows(id)
+    nbytes = storage.get_buffer_bytes(id)
+    append()
+    stats[id].ingested(storage.get_buffer_rows(id) - rows, storage.get_buffer_bytes(id) - nbytes)
+
+
 @post("/{id:str}/data")
 async def push_data(
     id: Annotated[str, Parameter(description="Collector ID")],
     data: Any,
     service: Annotated[CollectorServiceConfig, Dependency(skip_validation=True)],
     storage: Annotated[CollectorStorage, Dependency(skip_validation=True)],
+    stats: Annotated[ServiceStats, Dependency(skip_validation=True)],
+) -> Dict[str, str]:
+    if id not in service.collectors:
+        raise HTTPException(status_code=404, detail=f"Collector config with id '{id}' not found")
+    _check_buffer_limits(service, storage, stats, id)
+    async with storage.lock(id):
+        await sync_to_thread(_append, storage, stats, id, lambda: storage.append(id, data))
+    return {}
+
+
+@post("/{id:str}/data/bulk")
+async def push_data_bulk(
+    id: Annotated[str, Parameter(description="Collector ID")],
+    request: Request,
+    service: Annotated[CollectorServiceConfig, Dependency(skip_validation=True)],
+    storage: Annotated[CollectorStorage, Dependency(skip_validation=True)],
+    stats: Annotated[ServiceStats, Dependency(skip_validation=True)],
 ) -> Dict[str, str]:
+    """Push columnar data: arrow stream or file, parquet or json object of column value lists"""
     if id not in service.collectors:
         raise HTTPException(status_code=404, detail=f"Collector config with id '{id}' not found")
+    _check_buffer_limits(service, storage, stats, id)
+    body = await request.body()
+    try:
+        data = await sync_to_thread(read_table, body, request.headers.get("content-type", ""))
+    except (ValueError, pa.ArrowException) as e:
+        raise HTTPException(status_code=400, detail=f"Cannot read data: {e}")
     async with storage.lock(id):
-        storage.append(id, data)
+        await sync_to_thread(_append, storage, stats, id, lambda: storage.append_table(id, data))
     return {}
 
 
+@get("/{id:str}/metrics")
+async def get_metrics(
+    id: Annotated[str, Parameter(description="Collector ID")],
+    service: Annotated[CollectorServiceConfig, Dependency(skip_validation=True)],
+    storage: Annotated[CollectorStorage, Dependency(skip_validation=True)],
+    stats: Annotated[ServiceStats, Dependency(skip_validation=True)],
+) -> CollectorMetrics:
+    if id not in service.collectors:
+        raise HTTPException(status_code=404, detail=f"Collector config with id '{id}' not found")
+    collector_stats = stats[id]
+    return CollectorMetrics(
+        buffer_payloads=storage.get_buffer_size(id),
+        buffer_rows=storage.get_buffer_rows(id),
+        buffer_bytes=storage.get_buffer_bytes(id),
+        ingested_rows=collector_stats.ingested_rows,
+        ingested_bytes=collector_stats.ingested_bytes,
+        ingestion_rate=collector_stats.ingestion_rate,
+        rejected_pushes=collector_stats.rejected_pushes,
+        report_latency=collector_stats.report_latency.metrics(),
+        upload_latency=collector_stats.upload_latency.metrics(),
+    )
+
+
 @get("/{id:str}/logs")
 async def get_logs(
     id: Annotated[str, Parameter(description="Collector ID")],
@@ -124,70 +222,217 @@ async def get_logs(
     return storage.get_logs(id)
 
 
-async def check_snapshots_factory(service: CollectorServiceConfig, storage: CollectorStorage) -> None:
-    for _, collector in service.collectors.items():
-        if not collector.trigger.is_ready(collector, storage):
-            continue
-        await create_snapshot(collector, storage)
-        await send_snapshot(collector, storage)
+def _run_report(
+    report: ReportBase, reference: Any, current: pd.DataFrame
+) -> Tuple[ReportBase, Optional[Dict[Hashable, Any]]]:
+    """Run report, returns it with reference profile statistics calculated by this run.
+
+    In a worker process the profile is the one read by the worker, so new statistics are sent back to be kept
+    in the profile of service process too.
+    """
+    known = set(reference.statistics) if isinstance(reference, ReferenceProfile) else set()
+    report.run(reference_data=reference, current_data=current, column_mapping=ColumnMapping())
+    report._inner_suite.raise_for_error()
+    if not isinstance(reference, ReferenceProfile):
+        return report, None
+    return report, {key: value for key, value in reference.statistics.items() if key not in known}
+
+
+# references read by worker process, by collector id, reference paths and modification time of reference file
+_worker_references: Dict[Tuple[Hashable, ...], Any] = {}
+
+
+def _reference_key(collector: CollectorConfig) -> Optional[Tuple[Hashable, ...]]:
+    """Key of collector reference in worker processes, it changes when reference file is rewritten"""
+    path = (
+        collector.reference_profile_path if collector.reference_profile_path is not None else collector.reference_path
+    )
+    if path is None:
+        return None
+    return (
+        collector.id,
+        collector.reference_path,
+        collector.reference_profile_path,
+        collector.cache_reference,
+        os.stat(path).st_mtime_ns,
+    )
+
+
+def _run_report_in_worker(
+    report: ReportBase, reference_key: Optional[Tuple[Hashable, ...]], current: pd.DataFrame
+) -> Tuple[ReportBase, Optional[Dict[Hashable, Any]]]:
+    """Run report in worker process.
+
+    Reference is read by the worker itself instead of being sent with every report, cached reference
+    is read once per worker and kept until its file is changed.
+    """
+    if reference_key is None:
+        return _run_report(report, None, current)
+    reference = _worker_references.get(reference_key)
+    if reference is None:
+        collector_id, reference_path, reference_profile_path, cache_reference, _ = reference_key
+        reference = read_reference(reference_path, reference_profile_path, cache_reference)
+        if cache_reference:
+            for key in [key for key in _worker_references if key[0] == collector_id]:
+                del _worker_references[key]
+            _worker_references[reference_key] = reference
+    return _run_report(report, reference, current)
+
+
+class CollectorTasks:
+    """Report computations and uploads of collectors.
+
+    Each collector has at most one running computation and one running upload, so pushed data is not blocked
+    by reports and slow collectors do not delay other ones. Reports are computed in a process pool of `workers`
+    processes or in threads of service process if `workers` is 0. Worker processes read collector references
+    themselves and keep cached ones between reports.
+    """
+
+    def __init__(self, workers: int = 0, stats: Optional[ServiceStats] = None):
+        self.workers = workers
+        self.stats = stats or ServiceStats()
+        self.computations: Dict[str, asyncio.Task] = {}
+        self.uploads: Dict[str, asyncio.Task] = {}
+        self.pending_uploads: Set[str] = set()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers > 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    @staticmethod
+    def _is_running(tasks: Dict[str, asyncio.Task], id: str) -> bool:
+        return id in tasks and not tasks[id].done()
+
+    def schedule(self, service: CollectorServiceConfig, storage: CollectorStorage):
+        for id, collector in service.collectors.items():
+            if self._is_running(self.computations, id) or not collector.trigger.is_ready(collector, storage):
+                continue
+            self.computations[id] = asyncio.create_task(self._compute(collector, storage))
+
+    async def _compute(self, collector: CollectorConfig, storage: CollectorStorage):
+        try:
+            await create_snapshot(collector, storage, self.executor, self.stats[collector.id])
+        except BrokenProcessPool:
+            # worker process was killed, start new pool for next reports
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = None
+        except Exception as e:
+            logger.exception(f"Error creating snapshot: {e}")
+        self.upload(collector, storage)
 
+    def upload(self, collector: CollectorConfig, storage: CollectorStorage):
+        self.pending_uploads.add(collector.id)
+        if not self._is_running(self.uploads, collector.id):
+            self.uploads[collector.id] = asyncio.create_task(self._upload_pending(collector, storage))
 
-async def create_snapshot(collector: CollectorConfig, storage: CollectorStorage) -> None:
+    async def _upload_pending(self, collector: CollectorConfig, storage: CollectorStorage):
+        while collector.id in self.pending_uploads:
+            self.pending_uploads.discard(collector.id)
+            try:
+                await send_snapshot(collector, storage, self.stats[collector.id])
+            except Exception as e:
+                logger.exception(f"Error sending snapshot: {e}")
+
+    async def wait(self):
+        await asyncio.gather(*self.computations.values())
+        await asyncio.gather(*self.uploads.values())
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+async def check_snapshots_factory(
+    service: CollectorServiceConfig, storage: CollectorStorage, tasks: Optional[CollectorTasks] = None
+) -> None:
+    """Create and upload snapshots of ready collectors, waits for all scheduled tasks"""
+    tasks = tasks or CollectorTasks()
+    tasks.schedule(service, storage)
+    await tasks.wait()
+
+
+async def create_snapshot(
+    collector: CollectorConfig,
+    storage: CollectorStorage,
+    executor: Optional[Executor] = None,
+    stats: Optional[CollectorStats] = None,
+) -> None:
+    # lock is held only while buffer is flushed, so data can be pushed while report is computed
     async with storage.lock(collector.id):
         current = await sync_to_thread(storage.get_and_flush, collector.id)  # FIXME: sync function
-        if current is None:
-            return
-        current.index = current.index.astype(int)
-        report_conf = collector.report_config
-        report = report_conf.to_report_base()
+    if current is None:
+        return
+    current.index = current.index.astype(int)
+    report_conf = collector.report_config
+    report = report_conf.to_report_base()
+    start = time.perf_counter()
+    try:
+        if executor is None:
+            await sync_to_thread(_run_report, report, collector.reference, current)  # FIXME: sync function
+        else:
+            report, statistics = await asyncio.get_running_loop().run_in_executor(
+                executor, _run_report_in_worker, report, _reference_key(collector), current
+            )
+            if statistics and collector.cache_reference:
+                # keep statistics calculated by worker in profile of service process too
+                collector.reference.statistics.update(statistics)
+    except Exception as e:
+        logger.exception(f"Error running report: {e}")
+        storage.log(
+            collector.id,
+            CreateReportEvent(
+                report_id=str(report.id),
+                ok=False,
+                error=f"Error running report: {e.__class__.__name__}: {e.args}",
+            ),
+        )
+        if isinstance(e, BrokenProcessPool):
+            raise
+        return
+    if stats is not None:
+        stats.report_latency.add(time.perf_counter() - start)
+    storage.add_report(collector.id, report)
+    storage.log(collector.id, CreateReportEvent(report_id=str(report.id), ok=True))
+
+
+async def send_snapshot(
+    collector: CollectorConfig, storage: CollectorStorage, stats: Optional[CollectorStats] = None
+) -> None:
+    for report_item in storage.take_reports(collector.id):
+        start = time.perf_counter()
         try:
-            await sync_to_thread(
-                report.run, reference_data=collector.reference, current_data=current, column_mapping=ColumnMapping()
-            )  # FIXME: sync function
-            report._inner_suite.raise_for_error()
+            with report_item as report:
+                await sync_to_thread(
+                    collector.workspace._add_report_base,
+                    collector.project_id,
+                    report,
+                    collector.save_datasets and collector.is_cloud_resolved,  # only save datasets to cloud
+                )  # FIXME: sync function
         except Exception as e:
-            logger.exception(f"Error running report: {e}")
+            logger.exception(f"Error saving snapshot: {e}")
             storage.log(
                 collector.id,
-                CreateReportEvent(
+                UploadReportEvent(
                     report_id=str(report.id),
                     ok=False,
-                    error=f"Error running report: {e.__class__.__name__}: {e.args}",
+                    error=f"Error saving snapshot: {e.__class__.__name__}: {e.args}",
                 ),
             )
             return
-        storage.add_report(collector.id, report)
-        storage.log(collector.id, CreateReportEvent(report_id=str(report.id), ok=True))
-
-
-async def send_snapshot(collector: CollectorConfig, storage: CollectorStorage) -> None:
-    async with storage.lock(collector.id):
-        for report_item in storage.take_reports(collector.id):
-            try:
-                with report_item as report:
-                    await sync_to_thread(
-                        collector.workspace._add_report_base,
-                        collector.project_id,
-                        report,
-                        collector.save_datasets and collector.is_cloud_resolved,  # only save datasets to cloud
-                    )  # FIXME: sync function
-            except Exception as e:
-                logger.exception(f"Error saving snapshot: {e}")
-                storage.log(
-                    collector.id,
-                    UploadReportEvent(
-                        report_id=str(report.id),
-                        ok=False,
-                        error=f"Error saving snapshot: {e.__class__.__name__}: {e.args}",
-                    ),
-                )
-                return
-            storage.log(collector.id, UploadReportEvent(report_id=str(report.id), ok=True))
+        if stats is not None:
+            stats.upload_latency.add(time.perf_counter() - start)
+        storage.log(collector.id, UploadReportEvent(report_id=str(report.id), ok=True))
 
 
 def create_app(config_path: str = CONFIG_PATH, secret: Optional[str] = None, debug: bool = False) -> Litestar:
     service = CollectorServiceConfig.load_or_default(config_path)
     service.storage.init_all(service)
+    stats = ServiceStats()
 
     if event_logger.is_enabled():
         print(f"Anonimous usage reporting is enabled. To disable it, set env variable {DO_NOT_TRACK_ENV} to any value")
@@ -225,11 +470,12 @@ def create_app(config_path: str = CONFIG_PATH, secret: Optional[str] = None, deb
     @contextlib.asynccontextmanager
     async def check_snapshots_factory_lifespan(app: Litestar) -> AsyncGenerator[None, None]:
         stop_event = asyncio.Event()
+        tasks = CollectorTasks(service.report_workers, stats)
 
         async def check_service_snapshots_periodically():
             while not stop_event.is_set():
                 try:
-                    await check_snapshots_factory(service, service.storage)
+                    tasks.schedule(service, service.storage)
                 except Exception as e:
                     logger.exception(f"Check snapshots factory error: {e}")
                 await asyncio.sleep(service.check_interval)
@@ -240,6 +486,8 @@ def create_app(config_path: str = CONFIG_PATH, secret: Optional[str] = None, deb
         finally:
             stop_event.set()
             await task
+            await tasks.wait()
+            tasks.shutdown()
 
     exception_handlers: ExceptionHandlersMap = {}
     if debug:
@@ -255,12 +503,15 @@ def create_app(config_path: str = CONFIG_PATH, secret: Optional[str] = None, deb
             get_collector,
             set_reference,
             push_data,
+            push_data_bulk,
+            get_metrics,
             get_logs,
         ],
         dependencies={
             "security": Provide(lambda: security, use_cache=True, sync_to_thread=False),
             "service": Provide(lambda: service, use_cache=True, sync_to_thread=False),
             "storage": Provide(lambda: service.storage, use_cache=True, sync_to_thread=False),
+            "stats": Provide(lambda: stats, use_cache=True, sync_to_thread=False),
             "parsed_json": Provide(parse_json, sync_to_thread=False),
             "service_config_path": Provide(lambda: config_path, sync_to_thread=False),
             "service_workspace": Provide(lambda: os.path.dirname(config_path), sync_to_thread=False),
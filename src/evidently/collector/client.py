@@ -4,6 +4,8 @@ from typing import Dict
 import pandas as pd
 
 from evidently.collector.config import CollectorConfig
+from evidently.collector.storage import ARROW_STREAM_CONTENT_TYPE
+from evidently.collector.storage import write_arrow_stream
 from evidently.ui.utils import RemoteClientBase
 
 
@@ -14,5 +16,11 @@ class CollectorClient(RemoteClientBase):
     def send_data(self, id: str, data: pd.DataFrame) -> Dict[str, Any]:
         return self._request(f"/{id}/data", "POST", body=data.to_dict()).json()
 
+    def send_data_bulk(self, id: str, data: pd.DataFrame) -> Dict[str, Any]:
+        """Send data in arrow format, which is read by collector without conversion of each row"""
+        return self._request(
+            f"/{id}/data/bulk", "POST", content=write_arrow_stream(data), content_type=ARROW_STREAM_CONTENT_TYPE
+        ).json()
+
     def set_reference(self, id: str, reference: pd.DataFrame) -> Dict[str, Any]:
         return self._request(f"/{id}/reference", "POST", body=reference.to_dict()).json()
@@ -17,6 +17,7 @@ from evidently.base_metric import Metric
 from evidently.collector.storage import CollectorStorage
 from evidently.collector.storage import InMemoryStorage
 from evidently.options.base import Options
+from evidently.pipeline.reference_profile import ReferenceProfile
 from evidently.pydantic_utils import PolymorphicModel
 from evidently.pydantic_utils import autoregister
 from evidently.report import Report
@@ -75,8 +76,8 @@ class RowsCountTrigger(CollectorTrigger):
     rows_count: int = Field(default=1, gt=0)
 
     def is_ready(self, config: "CollectorConfig", storage: "CollectorStorage") -> bool:
-        buffer_size = storage.get_buffer_size(config.id)
-        return buffer_size > 0 and buffer_size >= self.rows_count
+        buffer_rows = storage.get_buffer_rows(config.id)
+        return buffer_rows > 0 and buffer_rows >= self.rows_count
 
 
 @autoregister
@@ -134,6 +135,17 @@ class ReportConfig(Config):
         )
 
 
+def read_reference(reference_path: Optional[str], reference_profile_path: Optional[str], cache_reference: bool):
+    """Read collector reference, `reference_profile_path` takes precedence"""
+    if reference_profile_path is not None:
+        return ReferenceProfile.load(reference_profile_path)
+    data = pd.read_parquet(reference_path)
+    if cache_reference:
+        # reuse reference statistics between reports while reference is cached
+        return ReferenceProfile(data)
+    return data
+
+
 class CollectorConfig(Config):
     class Config:
         underscore_attrs_are_private = True
@@ -142,6 +154,7 @@ class CollectorConfig(Config):
     trigger: CollectorTrigger
     report_config: ReportConfig
     reference_path: Optional[str]
+    reference_profile_path: Optional[str] = None
 
     project_id: str
     api_url: str = "http://localhost:8000"
@@ -149,6 +162,9 @@ class CollectorConfig(Config):
     cache_reference: bool = True
     is_cloud: Optional[bool] = None  # None means autodetect
     save_datasets: bool = False
+    # pushes are rejected with 429 status while buffer is over limits
+    max_buffer_rows: Optional[int] = None
+    max_buffer_bytes: Optional[int] = None
 
     _reference: Any = None
     _workspace: Optional[WorkspaceView] = None
@@ -171,11 +187,12 @@ class CollectorConfig(Config):
         return self._workspace
 
     def _read_reference(self):
-        return pd.read_parquet(self.reference_path)
+        return read_reference(self.reference_path, self.reference_profile_path, self.cache_reference)
 
     @property
     def reference(self):
-        if self.reference_path is None:
+        """Reference data or profile of reference data, `reference_profile_path` takes precedence"""
+        if self.reference_path is None and self.reference_profile_path is None:
             return None
         if self._reference is not None:
             return self._reference
@@ -190,6 +207,8 @@ class CollectorServiceConfig(Config):
     collectors: Dict[str, CollectorConfig] = {}
     storage: CollectorStorage = InMemoryStorage()
     autosave: bool = True
+    # processes computing reports, 0 to compute them in threads of service process
+    report_workers: int = 1
 
     @classmethod
     def load_or_default(cls, path: str):
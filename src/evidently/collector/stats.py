@@ -0,0 +1,95 @@
+import time
+from collections import deque
+from typing import Deque
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from evidently._pydantic_compat import BaseModel
+
+# window of ingestion rate in seconds
+RATE_WINDOW = 60.0
+
+
+class LatencyMetrics(BaseModel):
+    count: int = 0
+    last: Optional[float] = None
+    mean: Optional[float] = None
+    max: Optional[float] = None
+
+
+class CollectorMetrics(BaseModel):
+    buffer_payloads: int
+    buffer_rows: int
+    buffer_bytes: int
+    ingested_rows: int
+    ingested_bytes: int
+    # rows per second over last RATE_WINDOW seconds
+    ingestion_rate: float
+    rejected_pushes: int
+    report_latency: LatencyMetrics
+    upload_latency: LatencyMetrics
+
+
+class _Latency:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.last: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count > 0 else None
+
+    def metrics(self) -> LatencyMetrics:
+        return LatencyMetrics(count=self.count, last=self.last, mean=self.mean, max=self.max)
+
+
+class CollectorStats:
+    """Ingestion and processing statistics of one collector since service start"""
+
+    def __init__(self):
+        self.ingested_rows = 0
+        self.ingested_bytes = 0
+        self.rejected_pushes = 0
+        self.report_latency = _Latency()
+        self.upload_latency = _Latency()
+        self._pushes: Deque[Tuple[float, int]] = deque()
+
+    def ingested(self, rows: int, nbytes: int):
+        now = time.monotonic()
+        self.ingested_rows += rows
+        self.ingested_bytes += nbytes
+        self._pushes.append((now, rows))
+        self._trim(now)
+
+    def _trim(self, now: float):
+        while len(self._pushes) > 0 and self._pushes[0][0] < now - RATE_WINDOW:
+            self._pushes.popleft()
+
+    @property
+    def ingestion_rate(self) -> float:
+        self._trim(time.monotonic())
+        return sum(rows for _, rows in self._pushes) / RATE_WINDOW
+
+    def retry_after(self, check_interval: float) -> int:
+        """Seconds before buffer is expected to be flushed by next report"""
+        expected = self.report_latency.mean or 0.0
+        return max(1, int(expected + check_interval + 0.5))
+
+
+class ServiceStats:
+    def __init__(self):
+        self.collectors: Dict[str, CollectorStats] = {}
+
+    def __getitem__(self, id: str) -> CollectorStats:
+        if id not in self.collectors:
+            self.collectors[id] = CollectorStats()
+        return self.collectors[id]
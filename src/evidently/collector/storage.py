@@ -1,17 +1,70 @@
 import abc
+import contextlib
+import json
+import os
 from asyncio import Lock
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Sequence
+from typing import Tuple
+from typing import Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from evidently._pydantic_compat import BaseModel
 from evidently.pydantic_utils import PolymorphicModel
 from evidently.pydantic_utils import autoregister
 from evidently.suite.base_suite import ReportBase
 
+JSON_CONTENT_TYPE = "application/json"
+ARROW_STREAM_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_FILE_CONTENT_TYPE = "application/vnd.apache.arrow.file"
+PARQUET_CONTENT_TYPE = "application/vnd.apache.parquet"
+
+
+def read_table(body: bytes, content_type: str) -> pa.Table:
+    """Table from columnar request body: arrow stream or file, parquet or json object of column value lists"""
+    content_type = content_type.split(";")[0].strip()
+    if content_type == ARROW_STREAM_CONTENT_TYPE:
+        return pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+    if content_type == ARROW_FILE_CONTENT_TYPE:
+        return pa.ipc.open_file(pa.py_buffer(body)).read_all()
+    if content_type == PARQUET_CONTENT_TYPE:
+        return pq.read_table(pa.BufferReader(body))
+    if content_type == JSON_CONTENT_TYPE:
+        columns = json.loads(body)
+        if not isinstance(columns, dict) or not all(isinstance(values, list) for values in columns.values()):
+            raise ValueError("Expected json object with lists of column values")
+        return pa.table(columns)
+    raise ValueError(f"Unsupported content type '{content_type}'")
+
+
+def write_arrow_stream(data: pd.DataFrame) -> bytes:
+    table = pa.Table.from_pandas(data)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+# approximate size of value of json payload, payloads are not converted before flush
+_JSON_VALUE_BYTES = 8
+
+
+def _payload_shape(data: Any) -> Tuple[int, int]:
+    """Rows and columns of payload of `DataFrame.to_dict()` or column value lists"""
+    if not isinstance(data, dict) or len(data) == 0:
+        return 0, 0
+    return max(len(values) if isinstance(values, (dict, list)) else 1 for values in data.values()), len(data)
+
+
+def _frame_bytes(frame: pd.DataFrame) -> int:
+    return int(frame.memory_usage(deep=True).sum())
+
 
 class LogEvent(BaseModel):
     type: str
@@ -62,10 +115,22 @@ class CollectorStorage(PolymorphicModel):
     def append(self, id: str, data: Any):
         raise NotImplementedError
 
+    def append_table(self, id: str, data: pa.Table):
+        """Append columnar batch, storages may keep it without conversion to python objects"""
+        self.append(id, data.to_pydict())
+
     @abc.abstractmethod
     def get_buffer_size(self, id: str):
         raise NotImplementedError
 
+    def get_buffer_rows(self, id: str) -> int:
+        """Number of buffered rows, storages that do not count rows report number of buffered batches"""
+        return self.get_buffer_size(id)
+
+    def get_buffer_bytes(self, id: str) -> int:
+        """Approximate size of buffered data, 0 if storage does not track it"""
+        return 0
+
     @abc.abstractmethod
     def get_and_flush(self, id: str):
         raise NotImplementedError
@@ -95,27 +160,48 @@ class InMemoryStorage(CollectorStorage):
     max_log_events: int = 10
 
     _buffers: Dict[str, List[Any]] = {}
+    _buffer_rows: Dict[str, int] = {}
+    _buffer_bytes: Dict[str, int] = {}
     _logs: Dict[str, List[LogEvent]] = {}
     _reports: Dict[str, List[ReportBase]] = {}
 
     def init(self, id: str):
         super().init(id)
         self._buffers[id] = []
+        self._buffer_rows[id] = 0
+        self._buffer_bytes[id] = 0
         self._logs[id] = []
         self._reports[id] = []
 
     def append(self, id: str, data: Any):
         self._buffers[id].append(data)
+        rows, columns = _payload_shape(data)
+        self._buffer_rows[id] += rows
+        self._buffer_bytes[id] += rows * columns * _JSON_VALUE_BYTES
+
+    def append_table(self, id: str, data: pa.Table):
+        frame = data.to_pandas()
+        self._buffers[id].append(frame)
+        self._buffer_rows[id] += len(frame)
+        self._buffer_bytes[id] += _frame_bytes(frame)
 
     def get_buffer_size(self, id: str):
         return len(self._buffers[id])
 
+    def get_buffer_rows(self, id: str) -> int:
+        return self._buffer_rows.get(id, 0)
+
+    def get_buffer_bytes(self, id: str) -> int:
+        return self._buffer_bytes.get(id, 0)
+
     def get_and_flush(self, id: str):
         if id not in self._buffers or len(self._buffers[id]) == 0:
             return None
 
-        res = pd.concat([pd.DataFrame.from_dict(o) for o in self._buffers[id]])
+        res = pd.concat([o if isinstance(o, pd.DataFrame) else pd.DataFrame.from_dict(o) for o in self._buffers[id]])
         self._buffers[id].clear()
+        self._buffer_rows[id] = 0
+        self._buffer_bytes[id] = 0
         return res
 
     def log(self, id: str, event: LogEvent):
@@ -133,3 +219,218 @@ class InMemoryStorage(CollectorStorage):
         report_list = self._reports.get(id, [])
         while len(report_list) > 0:
             yield ReportPopper(report_list.pop(0), report_list)
+
+
+_ARROW_SEGMENT = ".arrow"
+_JSON_SEGMENT = ".json"
+_ARROW_CONVERSION_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+
+
+def _read_stream(source) -> Optional[pa.Table]:
+    try:
+        reader = pa.ipc.open_stream(source)
+    except pa.ArrowInvalid:
+        return None
+    batches = []
+    while True:
+        try:
+            batches.append(reader.read_next_batch())
+        except StopIteration:
+            break
+        except (pa.ArrowInvalid, OSError):
+            # incomplete batch at the end of segment, written when process was stopped
+            break
+    return pa.Table.from_batches(batches, schema=reader.schema)
+
+
+def _concat_parts(parts: List[Union[pa.Table, pd.DataFrame]]) -> pd.DataFrame:
+    # tables with the same schema are concatenated without copying, frames with different columns by pandas
+    frames: List[pd.DataFrame] = []
+    group: List[pa.Table] = []
+    for part in parts:
+        if isinstance(part, pa.Table) and (len(group) == 0 or part.schema.equals(group[0].schema, check_metadata=True)):
+            group.append(part)
+            continue
+        if len(group) > 0:
+            frames.append(pa.concat_tables(group).to_pandas())
+        group = [part] if isinstance(part, pa.Table) else []
+        if isinstance(part, pd.DataFrame):
+            frames.append(part)
+    if len(group) > 0:
+        frames.append(pa.concat_tables(group).to_pandas())
+    return frames[0] if len(frames) == 1 else pd.concat(frames)
+
+
+class _SegmentBuffer:
+    """Data pushed to one collector, stored in numbered segment files.
+
+    Batches are appended to arrow stream segment, a new segment is started when columns change.
+    Payloads which cannot be converted to arrow are stored as json segments.
+    """
+
+    def __init__(self, path: str, max_memory_bytes: int):
+        self.path = path
+        self.max_memory_bytes = max_memory_bytes
+        os.makedirs(path, exist_ok=True)
+        self.segments = sorted(name for name in os.listdir(path) if name.endswith((_ARROW_SEGMENT, _JSON_SEGMENT)))
+        self.next_segment = int(self.segments[-1].split(".")[0]) + 1 if len(self.segments) > 0 else 0
+        self.size = 0
+        self.rows = 0
+        self.bytes = 0
+        for name in self.segments:
+            self._count_segment(name)
+        self.schema: Optional[pa.Schema] = None
+        self.sink: Optional[pa.NativeFile] = None
+        self.writer: Optional[pa.ipc.RecordBatchStreamWriter] = None
+        # copy of buffered data while it fits in memory, None when it should be read from segments
+        self.memory: Optional[List[Union[pa.Table, pd.DataFrame]]] = [] if self.size == 0 else None
+        self.memory_bytes = 0
+
+    def _count_segment(self, name: str):
+        path = os.path.join(self.path, name)
+        if name.endswith(_JSON_SEGMENT):
+            with open(path) as f:
+                frame = pd.DataFrame.from_dict(json.load(f))
+            self.size += 1
+            self.rows += len(frame)
+            self.bytes += _frame_bytes(frame)
+            return
+        with pa.memory_map(path) as source:
+            table = _read_stream(source)
+            if table is None:
+                return
+            self.size += len(table.to_batches())
+            self.rows += table.num_rows
+            self.bytes += table.nbytes
+
+    def _new_segment(self, suffix: str) -> str:
+        name = f"{self.next_segment:012d}{suffix}"
+        self.next_segment += 1
+        self.segments.append(name)
+        return os.path.join(self.path, name)
+
+    def close_writer(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+        self.schema = None
+
+    def _write_table(self, table: pa.Table):
+        if self.schema is not None and not table.schema.equals(self.schema, check_metadata=True):
+            self.close_writer()
+        if self.writer is None:
+            self.sink = pa.OSFile(self._new_segment(_ARROW_SEGMENT), "wb")
+            self.writer = pa.ipc.new_stream(self.sink, table.schema)
+            self.schema = table.schema
+        self.writer.write_table(table)
+        self.sink.flush()
+
+    def _write_json(self, data: Any):
+        self.close_writer()
+        with open(self._new_segment(_JSON_SEGMENT), "w") as f:
+            json.dump(data, f)
+
+    def append(self, data: Any):
+        frame = pd.DataFrame.from_dict(data)
+        try:
+            table = pa.Table.from_pandas(frame, preserve_index=True)
+        except _ARROW_CONVERSION_ERRORS:
+            self._write_json(data)
+            self._add_part(frame, len(frame), _frame_bytes(frame))
+            return
+        self.append_table(table)
+
+    def append_table(self, table: pa.Table):
+        self._write_table(table)
+        self._add_part(table, table.num_rows, table.nbytes)
+
+    def _add_part(self, part: Union[pa.Table, pd.DataFrame], rows: int, nbytes: int):
+        self.size += 1
+        self.rows += rows
+        self.bytes += nbytes
+        if self.memory is None:
+            return
+        self.memory.append(part)
+        self.memory_bytes += nbytes
+        if self.memory_bytes > self.max_memory_bytes:
+            self.memory = None
+            self.memory_bytes = 0
+
+    def read(self) -> Optional[pd.DataFrame]:
+        if self.size == 0:
+            return None
+        self.close_writer()
+        if self.memory is not None:
+            return _concat_parts(self.memory)
+        with contextlib.ExitStack() as stack:
+            parts: List[Union[pa.Table, pd.DataFrame]] = []
+            for name in self.segments:
+                path = os.path.join(self.path, name)
+                if name.endswith(_JSON_SEGMENT):
+                    with open(path) as f:
+                        parts.append(pd.DataFrame.from_dict(json.load(f)))
+                    continue
+                table = _read_stream(stack.enter_context(pa.memory_map(path)))
+                if table is not None and table.num_rows > 0:
+                    parts.append(table)
+            return _concat_parts(parts) if len(parts) > 0 else None
+
+    def clear(self):
+        self.close_writer()
+        for name in self.segments:
+            os.remove(os.path.join(self.path, name))
+        self.segments = []
+        self.size = 0
+        self.rows = 0
+        self.bytes = 0
+        self.memory = []
+        self.memory_bytes = 0
+
+
+@autoregister
+class DiskBufferStorage(InMemoryStorage):
+    """Collector storage which writes pushed data to arrow segment files in `path` directory.
+
+    Buffered data survives restarts of collector service. Copy of buffered data is also kept in memory
+    until it exceeds `max_memory_bytes`, then it is read back from memory-mapped segments on flush.
+    """
+
+    class Config:
+        type_alias = "evidently:collector_storage:DiskBufferStorage"
+
+    path: str = "collector_buffers"
+    max_memory_bytes: int = 64 * 2**20
+
+    _segments: Dict[str, _SegmentBuffer] = {}
+
+    def init(self, id: str):
+        super().init(id)
+        if id in self._segments:
+            self._segments[id].close_writer()
+        self._segments[id] = _SegmentBuffer(os.path.join(self.path, id), self.max_memory_bytes)
+
+    def append(self, id: str, data: Any):
+        self._segments[id].append(data)
+
+    def append_table(self, id: str, data: pa.Table):
+        self._segments[id].append_table(data)
+
+    def get_buffer_size(self, id: str):
+        return self._segments[id].size
+
+    def get_buffer_rows(self, id: str) -> int:
+        return self._segments[id].rows
+
+    def get_buffer_bytes(self, id: str) -> int:
+        return self._segments[id].bytes
+
+    def get_and_flush(self, id: str):
+        if id not in self._segments:
+            return None
+        segments = self._segments[id]
+        res = segments.read()
+        segments.clear()
+        return res
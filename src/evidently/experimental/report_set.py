@@ -3,8 +3,8 @@ import os
 from typing import Dict
 from typing import Optional
 
-from evidently._pydantic_compat import ValidationError
 from evidently.suite.base_suite import Snapshot
+from evidently.suite.snapshot_loading import load_snapshot_files
 from evidently.ui.type_aliases import SnapshotID
 
 
@@ -13,19 +13,21 @@ def load_snapshots(
     date_from: Optional[datetime.datetime] = None,
     date_to: Optional[datetime.datetime] = None,
     skip_errors: bool = False,
+    workers: int = 1,
 ) -> Dict[SnapshotID, Snapshot]:
+    """Load snapshots from directory.
+
+    Args:
+        path: directory with snapshot files.
+        date_from: skip snapshots with earlier timestamps.
+        date_to: skip snapshots with later timestamps.
+        skip_errors: skip malformed snapshots instead of raising an error.
+        workers: number of processes to parse snapshots in.
+    """
+    paths = [os.path.join(path, file) for file in os.listdir(path)]
     result = {}
-    for file in os.listdir(path):
-        filepath = os.path.join(path, file)
-        try:
-            suite = Snapshot.load(filepath)
-        except ValidationError:
-            if skip_errors:
-                continue
-            raise
-        if date_from is not None and suite.timestamp < date_from:
-            continue
-        if date_to is not None and suite.timestamp > date_to:
-            continue
+    for _, suite in load_snapshot_files(
+        paths, workers=workers, date_from=date_from, date_to=date_to, skip_errors=skip_errors
+    ):
         result[suite.id] = suite
     return result
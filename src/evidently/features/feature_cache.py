@@ -0,0 +1,146 @@
+"""On-disk cache of generated feature values, shared between runs."""
+
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import pandas as pd
+
+from evidently.features.generated_features import GeneratedFeatures
+from evidently.options.base import Options
+from evidently.utils.data_preprocessing import DataDefinition
+
+# two different keys give 128-bit row hashes
+_HASH_KEYS = ("evidently_feat_1", "evidently_feat_2")
+# maximum number of sqlite query parameters is 999 in old versions
+_QUERY_BATCH_SIZE = 500
+
+RowValues = Tuple
+RowHash = bytes
+
+
+def get_row_hashes(data: pd.DataFrame) -> List[RowHash]:
+    """Hashes of row values, rows with the same values have the same hash regardless of index"""
+    first, second = (pd.util.hash_pandas_object(data, index=False, hash_key=key).to_numpy() for key in _HASH_KEYS)
+    return [a.tobytes() + b.tobytes() for a, b in zip(first, second)]
+
+
+class FeatureCache:
+    """Values of generated features for each row, keyed by feature and hash of its input values.
+
+    Only values of features that declare row input columns (see `GeneratedFeatures.get_row_input_columns`)
+    are cached, so only rows with new input values are calculated. When cache grows larger than `max_size`
+    bytes, least recently used values are removed.
+    """
+
+    def __init__(self, path: str, max_size: int):
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS feature_values ("
+            "feature TEXT NOT NULL, row_hash BLOB NOT NULL, value BLOB NOT NULL, size INTEGER NOT NULL, "
+            "last_access REAL NOT NULL, PRIMARY KEY (feature, row_hash))"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS feature_values_access ON feature_values (last_access)")
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self) -> "FeatureCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get(self, feature_key: str, row_hashes: Sequence[RowHash]) -> Dict[RowHash, RowValues]:
+        result: Dict[RowHash, RowValues] = {}
+        with self._lock:
+            for start in range(0, len(row_hashes), _QUERY_BATCH_SIZE):
+                batch = row_hashes[start : start + _QUERY_BATCH_SIZE]
+                rows = self._connection.execute(
+                    "SELECT row_hash, value FROM feature_values WHERE feature = ? "
+                    f"AND row_hash IN ({', '.join('?' * len(batch))})",
+                    (feature_key, *batch),
+                ).fetchall()
+                result.update((row_hash, pickle.loads(value)) for row_hash, value in rows)
+            now = time.time()
+            self._connection.executemany(
+                "UPDATE feature_values SET last_access = ? WHERE feature = ? AND row_hash = ?",
+                [(now, feature_key, row_hash) for row_hash in result],
+            )
+            self._connection.commit()
+        return result
+
+    def put(self, feature_key: str, values: Dict[RowHash, RowValues]):
+        now = time.time()
+        records = []
+        for row_hash, row_values in values.items():
+            value = pickle.dumps(row_values)
+            records.append((feature_key, row_hash, value, len(row_hash) + len(value), now))
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO feature_values (feature, row_hash, value, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                records,
+            )
+            self._evict()
+            self._connection.commit()
+
+    def size(self) -> int:
+        """Total size of cached values in bytes"""
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM feature_values").fetchone()[0]
+
+    def _evict(self):
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM feature_values").fetchone()[0]
+        if total <= self.max_size:
+            return
+        evicted = []
+        for rowid, size in self._connection.execute("SELECT rowid, size FROM feature_values ORDER BY last_access"):
+            if total <= self.max_size:
+                break
+            evicted.append((rowid,))
+            total -= size
+        self._connection.executemany("DELETE FROM feature_values WHERE rowid = ?", evicted)
+
+    def generate_features(
+        self, feature: GeneratedFeatures, data: pd.DataFrame, data_definition: DataDefinition, options: Options
+    ) -> pd.DataFrame:
+        """Same as `feature.generate_features_renamed`, but only rows with new input values are calculated"""
+        input_columns = feature.get_row_input_columns()
+        if input_columns is None or len(data) == 0:
+            return feature.generate_features_renamed(data, data_definition, options)
+        columns = [column.name for column in feature.list_columns()]
+        feature_key = feature.get_cache_fingerprint()
+        row_hashes = get_row_hashes(data[input_columns])
+        cached = self.get(feature_key, list(set(row_hashes)))
+
+        new_rows: Dict[RowHash, int] = {}
+        for position, row_hash in enumerate(row_hashes):
+            if row_hash not in cached and row_hash not in new_rows:
+                new_rows[row_hash] = position
+        if len(new_rows) > 0:
+            generated = feature.generate_features_renamed(data.iloc[list(new_rows.values())], data_definition, options)
+            if set(generated.columns) != set(columns):
+                # output columns are not known in advance, such values cannot be restored from cache
+                return feature.generate_features_renamed(data, data_definition, options)
+            new_values = dict(zip(new_rows, generated[columns].itertuples(index=False, name=None)))
+            self.put(feature_key, new_values)
+            cached.update(new_values)
+        return pd.DataFrame([cached[row_hash] for row_hash in row_hashes], columns=columns, index=data.index)
+
+
+def get_feature_cache(options: Options) -> Optional[FeatureCache]:
+    execution_options = options.execution_options
+    if execution_options.feature_cache_path is None:
+        return None
+    return FeatureCache(execution_options.feature_cache_path, execution_options.feature_cache_max_size)
@@ -1,10 +1,12 @@
 import abc
 import dataclasses
+import hashlib
 from typing import Any
 from typing import ClassVar
 from typing import Generic
 from typing import List
 from typing import Optional
+from typing import Set
 
 import deprecation
 import pandas as pd
@@ -31,11 +33,26 @@ class GeneratedFeatures(EvidentlyBaseModel):
     class Config:
         is_base_type = True
 
+    # fields that do not change feature values
+    __cache_ignored_fields__: ClassVar[Set[str]] = {"display_name"}
+
     display_name: Optional[str] = None
     """
     Class for computation of additional features.
     """
 
+    def get_row_input_columns(self) -> Optional[List[str]]:
+        """Columns that feature values of each row are calculated from.
+
+        `None` means that feature values can depend on other rows, such features are not cached between runs.
+        """
+        return None
+
+    def get_cache_fingerprint(self) -> str:
+        """Fingerprint of feature parameters that change its values"""
+        parts = tuple(part for part in self.get_fingerprint_parts() if part[0] not in self.__cache_ignored_fields__)
+        return hashlib.md5((self.__get_classpath__() + str(parts)).encode("utf8")).hexdigest()
+
     @abc.abstractmethod
     def get_type(self, subcolumn: Optional[str] = None) -> ColumnType:
         raise NotImplementedError
@@ -173,8 +190,13 @@ class ApplyColumnGeneratedFeature(GeneratedFeature):
     def _feature_display_name(self):
         return self.display_name_template.format(column_name=self.column_name)
 
+    def get_row_input_columns(self) -> Optional[List[str]]:
+        return [self.column_name]
+
 
 class DataFeature(GeneratedFeature):
+    __cache_ignored_fields__: ClassVar[Set[str]] = {"display_name", "name"}
+
     display_name: str
     name: str = Field(default_factory=lambda: str(uuid6.uuid7()))
 
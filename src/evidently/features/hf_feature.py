@@ -11,6 +11,11 @@ import pandas as pd
 from evidently.core import ColumnType
 from evidently.features.generated_features import DataFeature
 from evidently.features.generated_features import FeatureTypeFieldMixin
+from evidently.features.model_registry import DEFAULT_BATCH_SIZE
+from evidently.features.model_registry import InferenceOptions
+from evidently.features.model_registry import get_evaluate_module
+from evidently.features.model_registry import get_hf_pipeline
+from evidently.options.base import Options
 from evidently.utils.data_preprocessing import DataDefinition
 
 
@@ -31,12 +36,21 @@ class HuggingFaceFeature(FeatureTypeFieldMixin, DataFeature):
         super().__init__()
 
     def generate_data(self, data: pd.DataFrame, data_definition: DataDefinition) -> pd.Series:
+        return self._generate_data(data, DEFAULT_BATCH_SIZE)
+
+    def generate_features(self, data: pd.DataFrame, data_definition: DataDefinition, options: Options) -> pd.DataFrame:
+        return pd.DataFrame({self.name: self._generate_data(data, options.get(InferenceOptions).batch_size)})
+
+    def _generate_data(self, data: pd.DataFrame, batch_size: int) -> pd.Series:
         val = _models.get(self.model)
         if val is None:
             raise ValueError(f"Model {self.model} not found. Available models: {', '.join(_models.keys())}")
         _, available_params, func = val
-        result = func(data[self.column_name], **{param: self.params.get(param, None) for param in available_params})
-        return result
+        params = {param: self.params.get(param, None) for param in available_params}
+        return func(data[self.column_name], batch_size=batch_size, **params)
+
+    def get_row_input_columns(self) -> Optional[List[str]]:
+        return [self.column_name]
 
     def __hash__(self):
         return DataFeature.__hash__(self)
@@ -68,26 +82,29 @@ class HuggingFaceToxicityFeature(DataFeature):
     def generate_data(self, data: pd.DataFrame, data_definition: DataDefinition) -> pd.Series:
         return _toxicity(self.model, self.toxic_label, data[self.column_name])
 
+    def generate_features(self, data: pd.DataFrame, data_definition: DataDefinition, options: Options) -> pd.DataFrame:
+        batch_size = options.get(InferenceOptions).batch_size
+        return pd.DataFrame({self.name: _toxicity(self.model, self.toxic_label, data[self.column_name], batch_size)})
+
+    def get_row_input_columns(self) -> Optional[List[str]]:
+        return [self.column_name]
 
-def _samlowe_roberta_base_go_emotions(data: pd.Series, label: str) -> pd.Series:
-    from transformers import pipeline
 
+def _samlowe_roberta_base_go_emotions(data: pd.Series, label: str, batch_size: int = DEFAULT_BATCH_SIZE) -> pd.Series:
     def _convert_labels(row):
         return {x["label"]: x["score"] for x in row}
 
-    classifier = pipeline(task="text-classification", model="SamLowe/roberta-base-go_emotions", top_k=None)
-    model_outputs = classifier(data.fillna("").tolist())
+    classifier = get_hf_pipeline(task="text-classification", model="SamLowe/roberta-base-go_emotions", top_k=None)
+    model_outputs = classifier(data.fillna("").tolist(), batch_size=batch_size)
     return pd.Series([_convert_labels(out).get(label, None) for out in model_outputs], index=data.index)
 
 
-def _openai_detector(data: pd.Series, score_threshold: float) -> pd.Series:
-    from transformers import pipeline
-
+def _openai_detector(data: pd.Series, score_threshold: float, batch_size: int = DEFAULT_BATCH_SIZE) -> pd.Series:
     def _get_label(row):
         return row["label"] if row["score"] > score_threshold else "Unknown"
 
-    pipe = pipeline("text-classification", model="roberta-base-openai-detector")
-    return pd.Series([_get_label(x) for x in pipe(data.fillna("").tolist())], index=data.index)
+    pipe = get_hf_pipeline("text-classification", model="roberta-base-openai-detector")
+    return pd.Series([_get_label(x) for x in pipe(data.fillna("").tolist(), batch_size=batch_size)], index=data.index)
 
 
 def _map_labels(labels: List[str], scores: List[float], threshold: float) -> Optional[str]:
@@ -102,40 +119,39 @@ def _map_labels(labels: List[str], scores: List[float], threshold: float) -> Opt
     return label[0] if label[1] > threshold else "unknown"
 
 
-def _lmnli_fever(data: pd.Series, labels: List[str], threshold: Optional[float]) -> pd.Series:
-    from transformers import pipeline
-
+def _lmnli_fever(
+    data: pd.Series, labels: List[str], threshold: Optional[float], batch_size: int = DEFAULT_BATCH_SIZE
+) -> pd.Series:
     threshold = threshold if threshold is not None else 0.5
 
-    classifier = pipeline(
+    classifier = get_hf_pipeline(
         "zero-shot-classification",
         model="MoritzLaurer/DeBERTa-v3-large-mnli-fever-anli-ling-wanli",
     )
-    output = classifier(data.fillna("").tolist(), labels, multi_label=False)
+    output = classifier(data.fillna("").tolist(), labels, multi_label=False, batch_size=batch_size)
 
     return pd.Series([_map_labels(o["labels"], o["scores"], threshold) for o in output], index=data.index)
 
 
-def _toxicity(model_name: Optional[str], toxic_label: Optional[str], data: pd.Series) -> pd.Series:
-    import evaluate
-
+def _toxicity(
+    model_name: Optional[str], toxic_label: Optional[str], data: pd.Series, batch_size: int = DEFAULT_BATCH_SIZE
+) -> pd.Series:
     column_data = data.values.tolist()
-    model = evaluate.load("toxicity", model_name, module_type="measurement")
-    if toxic_label is None:
-        scores = model.compute(predictions=column_data)
-    else:
-        scores = model.compute(predictions=column_data, toxic_label=toxic_label)
-    return pd.Series(scores["toxicity"], index=data.index)
-
+    model = get_evaluate_module("toxicity", model_name, module_type="measurement")
+    params = {} if toxic_label is None else {"toxic_label": toxic_label}
+    # evaluate modules take no batch size, so the texts are passed to compute by batches
+    scores: List[float] = []
+    for start in range(0, len(column_data), batch_size):
+        scores.extend(model.compute(predictions=column_data[start : start + batch_size], **params)["toxicity"])
+    return pd.Series(scores, index=data.index)
 
-def _dfp(data: pd.Series, threshold: Optional[float]) -> pd.Series:
-    from transformers import pipeline
 
+def _dfp(data: pd.Series, threshold: Optional[float], batch_size: int = DEFAULT_BATCH_SIZE) -> pd.Series:
     if threshold is None:
         threshold = 0.5
 
-    model = pipeline("token-classification", "lakshyakh93/deberta_finetuned_pii")
-    output = model(data.tolist())
+    model = get_hf_pipeline("token-classification", "lakshyakh93/deberta_finetuned_pii")
+    output = model(data.tolist(), batch_size=batch_size)
     converted_output = [
         _map_labels(
             [x["entity"] for x in entities],
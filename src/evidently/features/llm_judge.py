@@ -1,6 +1,9 @@
 import json
+import random
+import time
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Callable
 from typing import ClassVar
@@ -8,8 +11,10 @@ from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Type
+from typing import TypeVar
 from typing import Union
 
 import pandas as pd
@@ -44,6 +49,70 @@ class LLMRequestError(EvidentlyLLMError):
     pass
 
 
+class LLMRateLimitError(LLMRequestError):
+    """Request was rejected by rate limits of the provider and can be retried"""
+
+    def __init__(self, *args, retry_after: Optional[float] = None):
+        super().__init__(*args)
+        self.retry_after = retry_after
+
+
+class LLMExecutionOptions(Option):
+    """Options controlling how requests to LLM are executed.
+
+    Args:
+        max_concurrency: maximum number of requests sent at the same time.
+        max_retries: how many times request rejected by rate limits is retried.
+        initial_backoff: delay in seconds before the first retry, it is doubled for every next retry.
+        max_backoff: maximum delay in seconds between retries.
+    """
+
+    max_concurrency: int = 8
+    max_retries: int = 5
+    initial_backoff: float = 1.0
+    max_backoff: float = 60.0
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _call_with_retries(func: Callable[[T], R], item: T, options: LLMExecutionOptions) -> R:
+    attempt = 0
+    while True:
+        try:
+            return func(item)
+        except LLMRateLimitError as e:
+            if attempt >= options.max_retries:
+                raise
+            delay = e.retry_after
+            if delay is None:
+                # full jitter spreads retries of concurrent requests
+                delay = random.uniform(0, min(options.max_backoff, options.initial_backoff * 2**attempt))
+            time.sleep(delay)
+            attempt += 1
+
+
+def run_concurrently(
+    func: Callable[[T], R], items: Sequence[T], options: Optional[LLMExecutionOptions] = None
+) -> List[R]:
+    """Call `func` for all items with bounded concurrency, retrying calls that hit rate limits.
+
+    Results are returned in the order of items. If any call fails, pending calls are cancelled and error is raised.
+    """
+    options = options or LLMExecutionOptions()
+    if options.max_concurrency <= 1 or len(items) <= 1:
+        return [_call_with_retries(func, item, options) for item in items]
+    with ThreadPoolExecutor(max_workers=min(options.max_concurrency, len(items))) as executor:
+        futures = [executor.submit(_call_with_retries, func, item, options) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
 class LLMWrapper(ABC):
     __used_options__: ClassVar[List[Type[Option]]] = []
 
@@ -51,6 +120,12 @@ class LLMWrapper(ABC):
     def complete(self, messages: List[LLMMessage]) -> str:
         raise NotImplementedError
 
+    def batch_complete(
+        self, messages_batch: Sequence[List[LLMMessage]], options: Optional[LLMExecutionOptions] = None
+    ) -> List[str]:
+        """Complete several requests concurrently, responses are in the order of requests"""
+        return run_concurrently(self.complete, messages_batch, options)
+
     def get_used_options(self) -> List[Type[Option]]:
         return self.__used_options__
 
@@ -280,13 +355,16 @@ class LLMJudge(GeneratedFeatures):
 
         return {self.input_column: self.DEFAULT_INPUT_COLUMN}
 
-    def generate_features(self, data: pd.DataFrame, data_definition: DataDefinition, options: Options) -> pd.DataFrame:
-        result: List[Dict[str, Union[str, float]]] = []
+    def get_row_input_columns(self) -> Optional[List[str]]:
+        return list(self.get_input_columns())
 
-        for message in self.template.iterate_messages(data, self.get_input_columns()):
-            messages: List[LLMMessage] = [*self.template.get_system_prompts(), message]
-            response = self.get_llm_wrapper(options).complete(messages)
-            result.append(self.template.parse_response(response))
+    def generate_features(self, data: pd.DataFrame, data_definition: DataDefinition, options: Options) -> pd.DataFrame:
+        system_prompts = self.template.get_system_prompts()
+        messages_batch: List[List[LLMMessage]] = [
+            [*system_prompts, message] for message in self.template.iterate_messages(data, self.get_input_columns())
+        ]
+        responses = self.get_llm_wrapper(options).batch_complete(messages_batch, options.get(LLMExecutionOptions))
+        result: List[LLMResponse] = [self.template.parse_response(response) for response in responses]
         return pd.DataFrame(result)
 
     def list_columns(self) -> List["ColumnName"]:
@@ -315,6 +393,18 @@ class OpenAIKey(Option):
         return self.api_key.get_secret_value()
 
 
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Delay requested by `Retry-After` header of rate limit error response, if any"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
 @llm_provider("openai", None)
 class OpenAIWrapper(LLMWrapper):
     __used_options__: ClassVar = [OpenAIKey]
@@ -331,6 +421,8 @@ class OpenAIWrapper(LLMWrapper):
         messages = [{"role": user, "content": msg} for user, msg in messages]
         try:
             response = self.client.chat.completions.create(model=self.model, messages=messages)  # type: ignore[arg-type]
+        except openai.RateLimitError as e:
+            raise LLMRateLimitError("OpenAI rate limit exceeded", retry_after=get_retry_after(e)) from e
         except openai.OpenAIError as e:
             raise LLMRequestError("Failed to call OpenAI complete API") from e
         content = response.choices[0].message.content
@@ -344,6 +436,10 @@ class LiteLLMWrapper(LLMWrapper):
         self.model = model
 
     def complete(self, messages: List[LLMMessage]) -> str:
+        from litellm import RateLimitError
         from litellm import completion
 
-        return completion(model=self.model, messages=messages).choices[0].message.content
+        try:
+            return completion(model=self.model, messages=messages).choices[0].message.content
+        except RateLimitError as e:
+            raise LLMRateLimitError("LiteLLM rate limit exceeded", retry_after=get_retry_after(e)) from e
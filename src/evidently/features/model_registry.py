@@ -0,0 +1,95 @@
+"""Process-wide registry of ML models used by generated features."""
+
+import threading
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import TypeVar
+
+from evidently.options.option import Option
+
+T = TypeVar("T")
+
+DEFAULT_BATCH_SIZE = 32
+
+
+class InferenceOptions(Option):
+    """Options of model inference in generated features.
+
+    Args:
+        batch_size: number of texts passed to a model at once.
+    """
+
+    batch_size: int = DEFAULT_BATCH_SIZE
+
+
+class ModelRegistry:
+    """Loaded models shared by all features of the process.
+
+    Models are loaded on first use, when there are more than `max_size` models,
+    the least recently used one is unloaded.
+    """
+
+    def __init__(self, max_size: int = 4):
+        self.max_size = max_size
+        self._models: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, load: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key]
+            model = load()
+            if self.max_size > 0:
+                self._models[key] = model
+                while len(self._models) > self.max_size:
+                    self._models.popitem(last=False)
+            return model
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+
+model_registry = ModelRegistry()
+
+
+def get_hf_pipeline(*args, **kwargs):
+    """Shared `transformers.pipeline` with given arguments"""
+
+    def load():
+        from transformers import pipeline
+
+        return pipeline(*args, **kwargs)
+
+    return model_registry.get(("transformers.pipeline", args, tuple(sorted(kwargs.items()))), load)
+
+
+def get_evaluate_module(*args, **kwargs):
+    """Shared `evaluate.load` module with given arguments"""
+
+    def load():
+        import evaluate
+
+        return evaluate.load(*args, **kwargs)
+
+    return model_registry.get(("evaluate.load", args, tuple(sorted(kwargs.items()))), load)
+
+
+def get_sentence_transformer(model: str):
+    """Shared `SentenceTransformer` model"""
+
+    def load():
+        from sentence_transformers import SentenceTransformer
+
+        return SentenceTransformer(model)
+
+    return model_registry.get(("sentence_transformers.SentenceTransformer", model), load)
@@ -1,6 +1,9 @@
 from itertools import repeat
+from typing import ClassVar
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Union
 
 import pandas as pd
@@ -10,6 +13,11 @@ from evidently.core import ColumnType
 from evidently.core import new_id
 from evidently.features.generated_features import FeatureTypeFieldMixin
 from evidently.features.generated_features import GeneratedFeature
+from evidently.features.llm_judge import LLMExecutionOptions
+from evidently.features.llm_judge import LLMRateLimitError
+from evidently.features.llm_judge import get_retry_after
+from evidently.features.llm_judge import run_concurrently
+from evidently.options.base import Options
 from evidently.utils.data_preprocessing import DataDefinition
 
 _legacy_models = ["gpt-3.5-turbo-instruct", "babbage-002", "davinci-002"]
@@ -19,6 +27,8 @@ class OpenAIFeature(FeatureTypeFieldMixin, GeneratedFeature):
     class Config:
         type_alias = "evidently:feature:OpenAIFeature"
 
+    __cache_ignored_fields__: ClassVar[Set[str]] = {"display_name", "feature_id"}
+
     column_name: str
     feature_id: str
     prompt: str
@@ -64,10 +74,16 @@ class OpenAIFeature(FeatureTypeFieldMixin, GeneratedFeature):
         super().__init__()
 
     def generate_feature(self, data: pd.DataFrame, data_definition: DataDefinition) -> pd.DataFrame:
-        from openai import OpenAI
+        return self._generate_feature(data, LLMExecutionOptions())
+
+    def generate_features(self, data: pd.DataFrame, data_definition: DataDefinition, options: Options) -> pd.DataFrame:
+        return self._generate_feature(data, options.get(LLMExecutionOptions))
+
+    def _generate_feature(self, data: pd.DataFrame, execution_options: LLMExecutionOptions) -> pd.DataFrame:
+        import openai
 
         column_data = data[self.column_name].values.tolist()
-        client = OpenAI()
+        client = openai.OpenAI()
         result: List[Union[str, float, None]] = []
 
         if self.model in _legacy_models:
@@ -80,18 +96,23 @@ class OpenAIFeature(FeatureTypeFieldMixin, GeneratedFeature):
         else:
             context_column = repeat(self.context)
 
-        for message, context in zip(column_data, context_column):
-            context = "" if context is None else context
-            prompt_answer = func(
-                client,
-                model=self.model,
-                prompt=self.prompt,
-                prompt_replace_string=self.prompt_replace_string,
-                context_replace_string=self.context_replace_string,
-                prompt_message=message,
-                context=context,
-                params=self.openai_params,
-            )
+        def call(request: Tuple[str, Optional[str]]) -> str:
+            message, context = request
+            try:
+                return func(
+                    client,
+                    model=self.model,
+                    prompt=self.prompt,
+                    prompt_replace_string=self.prompt_replace_string,
+                    context_replace_string=self.context_replace_string,
+                    prompt_message=message,
+                    context="" if context is None else context,
+                    params=self.openai_params,
+                )
+            except openai.RateLimitError as e:
+                raise LLMRateLimitError("OpenAI rate limit exceeded", retry_after=get_retry_after(e)) from e
+
+        for prompt_answer in run_concurrently(call, list(zip(column_data, context_column)), execution_options):
             processed_response = _postprocess_response(
                 prompt_answer,
                 self.check_mode,
@@ -110,6 +131,11 @@ class OpenAIFeature(FeatureTypeFieldMixin, GeneratedFeature):
     def __hash__(self):
         return GeneratedFeature.__hash__(self)
 
+    def get_row_input_columns(self) -> Optional[List[str]]:
+        if self.context_column is None:
+            return [self.column_name]
+        return [self.column_name, self.context_column]
+
     def _as_column(self) -> ColumnName:
         return self._create_column(self._feature_column_name(), default_display_name=f"OpenAI for {self.column_name}")
 
@@ -1,5 +1,6 @@
 from typing import ClassVar
 from typing import List
+from typing import Optional
 
 import numpy as np
 import pandas as pd
@@ -7,6 +8,10 @@ import pandas as pd
 from evidently.base_metric import ColumnName
 from evidently.core import ColumnType
 from evidently.features.generated_features import GeneratedFeature
+from evidently.features.model_registry import DEFAULT_BATCH_SIZE
+from evidently.features.model_registry import InferenceOptions
+from evidently.features.model_registry import get_sentence_transformer
+from evidently.options.base import Options
 from evidently.utils.data_preprocessing import DataDefinition
 
 
@@ -19,15 +24,21 @@ class SemanticSimilarityFeature(GeneratedFeature):
     model: str = "all-MiniLM-L6-v2"
 
     def generate_feature(self, data: pd.DataFrame, data_definition: DataDefinition) -> pd.DataFrame:
-        from sentence_transformers import SentenceTransformer
+        return self._generate_feature(data, DEFAULT_BATCH_SIZE)
 
+    def generate_features(self, data: pd.DataFrame, data_definition: DataDefinition, options: Options) -> pd.DataFrame:
+        return self._generate_feature(data, options.get(InferenceOptions).batch_size)
+
+    def _generate_feature(self, data: pd.DataFrame, batch_size: int) -> pd.DataFrame:
         def normalized_cosine_distance(left, right):
             return 1 - ((1 - np.dot(left, right) / (np.linalg.norm(left) * np.linalg.norm(right))) / 2)
 
-        model = SentenceTransformer(self.model)
+        model = get_sentence_transformer(self.model)
 
-        first = model.encode(data[self.columns[0]].fillna(""))
-        second = model.encode(data[self.columns[1]].fillna(""))
+        # both columns are encoded at once to fill batches
+        texts = data[self.columns[0]].fillna("").tolist() + data[self.columns[1]].fillna("").tolist()
+        embeddings = model.encode(texts, batch_size=batch_size)
+        first, second = embeddings[: len(data)], embeddings[len(data) :]
 
         return pd.DataFrame(
             {
@@ -38,6 +49,9 @@ class SemanticSimilarityFeature(GeneratedFeature):
             }
         )
 
+    def get_row_input_columns(self) -> Optional[List[str]]:
+        return list(self.columns)
+
     def _feature_name(self):
         return "|".join(self.columns)
 
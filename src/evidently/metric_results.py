@@ -94,6 +94,16 @@ class ConfusionMatrix(MetricResult):
     labels: Sequence[Label]
     values: list  # todo better typing
 
+    def merge(self, other: "ConfusionMatrix") -> "ConfusionMatrix":
+        labels = sorted(set(self.labels) | set(other.labels))
+        positions = {label: idx for idx, label in enumerate(labels)}
+        values = [[0] * len(labels) for _ in labels]
+        for matrix in (self, other):
+            for row_label, row in zip(matrix.labels, matrix.values):
+                for column_label, value in zip(matrix.labels, row):
+                    values[positions[row_label]][positions[column_label]] += value
+        return ConfusionMatrix(labels=labels, values=values)
+
 
 class PredictionData(MetricResult):
     class Config:
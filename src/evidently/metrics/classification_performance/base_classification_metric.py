@@ -3,35 +3,19 @@ from typing import Generic
 from typing import Optional
 from typing import Tuple
 
-import numpy as np
 import pandas as pd
 
 from evidently.base_metric import Metric
 from evidently.base_metric import TResult
-from evidently.calculations.classification_performance import get_prediction_data
 from evidently.calculations.classification_performance import k_probability_threshold
-from evidently.metric_results import DatasetColumns
+from evidently.calculations.classification_performance import threshold_probability_labels
+from evidently.calculations.run_cache import CURRENT
 from evidently.metric_results import PredictionData
 from evidently.options.base import AnyOptions
 from evidently.pipeline.column_mapping import ColumnMapping
 from evidently.utils.data_operations import process_columns
 
 
-def _cleanup_data(data: pd.DataFrame, dataset_columns: DatasetColumns) -> pd.DataFrame:
-    target = dataset_columns.utility_columns.target
-    prediction = dataset_columns.utility_columns.prediction
-    subset = []
-    if target is not None:
-        subset.append(target)
-    if prediction is not None and isinstance(prediction, list):
-        subset += prediction
-    if prediction is not None and isinstance(prediction, str):
-        subset.append(prediction)
-    if len(subset) > 0:
-        return data.replace([np.inf, -np.inf], np.nan).dropna(axis=0, how="any", subset=subset)
-    return data
-
-
 class ThresholdClassificationMetric(Metric[TResult], Generic[TResult], ABC):
     probas_threshold: Optional[float]
     k: Optional[int]
@@ -47,11 +31,12 @@ class ThresholdClassificationMetric(Metric[TResult], Generic[TResult], ABC):
         super().__init__(options=options)
 
     def get_target_prediction_data(
-        self, data: pd.DataFrame, column_mapping: ColumnMapping
+        self, data: pd.DataFrame, column_mapping: ColumnMapping, dataset: str = CURRENT
     ) -> Tuple[pd.Series, PredictionData]:
         dataset_columns = process_columns(data, column_mapping)
-        data = _cleanup_data(data, dataset_columns)
-        prediction = get_prediction_data(data, dataset_columns, column_mapping.pos_label)
+        data, prediction = self.get_prediction_data_cache().get_cleaned(
+            dataset, data, dataset_columns, column_mapping.pos_label
+        )
 
         if self.probas_threshold is None and self.k is None:
             return data[dataset_columns.utility_columns.target], prediction
@@ -65,9 +50,7 @@ class ThresholdClassificationMetric(Metric[TResult], Generic[TResult], ABC):
         if self.k is not None:
             threshold = k_probability_threshold(prediction.prediction_probas, self.k)
 
-        prediction_labels = prediction.prediction_probas[pos_label].apply(
-            lambda x: pos_label if x >= threshold else neg_label
-        )
+        prediction_labels = threshold_probability_labels(prediction.prediction_probas, pos_label, neg_label, threshold)
         return data[dataset_columns.utility_columns.target], PredictionData(
             predictions=prediction_labels,
             prediction_probas=prediction.prediction_probas,
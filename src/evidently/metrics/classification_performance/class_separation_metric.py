@@ -8,7 +8,8 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.base_metric import UsesRawDataMixin
-from evidently.calculations.classification_performance import get_prediction_data
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import IncludeTags
 from evidently.metric_results import ColumnAggScatter
 from evidently.metric_results import ColumnScatter
@@ -85,7 +86,9 @@ class ClassificationClassSeparationPlot(UsesRawDataMixin, Metric[ClassificationC
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
             raise ValueError("The columns 'target' and 'prediction' columns should be present")
-        curr_predictions = get_prediction_data(data.current_data, dataset_columns, data.column_mapping.pos_label)
+        curr_predictions = self.get_prediction_data_cache().get(
+            CURRENT, data.current_data, dataset_columns, data.column_mapping.pos_label
+        )
         if curr_predictions.prediction_probas is None:
             raise ValueError(
                 "ClassificationClassSeparationPlot can be calculated only on binary probabilistic predictions"
@@ -95,7 +98,9 @@ class ClassificationClassSeparationPlot(UsesRawDataMixin, Metric[ClassificationC
         current_plot[target_name] = data.current_data[target_name]
         reference_plot = None
         if data.reference_data is not None:
-            ref_predictions = get_prediction_data(data.reference_data, dataset_columns, data.column_mapping.pos_label)
+            ref_predictions = self.get_prediction_data_cache().get(
+                REFERENCE, data.reference_data, dataset_columns, data.column_mapping.pos_label
+            )
             if ref_predictions.prediction_probas is None:
                 raise ValueError(
                     "ClassificationClassSeparationPlot can be calculated only on binary probabilistic predictions"
@@ -4,6 +4,7 @@ from typing import Optional
 from evidently.base_metric import InputData
 from evidently.base_metric import MetricResult
 from evidently.calculations.classification_performance import calculate_metrics
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import IncludeTags
 from evidently.metric_results import DatasetClassificationQuality
 from evidently.metrics.classification_performance.base_classification_metric import ThresholdClassificationMetric
@@ -66,7 +67,7 @@ class ClassificationQualityMetric(ThresholdClassificationMetric[ClassificationQu
             ref_matrix = self._confusion_matrix_metric.get_result().reference_matrix
             if ref_matrix is None:
                 raise ValueError(f"Dependency {self._confusion_matrix_metric.__class__} should have reference data")
-            target, prediction = self.get_target_prediction_data(data.reference_data, data.column_mapping)
+            target, prediction = self.get_target_prediction_data(data.reference_data, data.column_mapping, REFERENCE)
             reference = calculate_metrics(
                 data.column_mapping,
                 ref_matrix,
@@ -7,6 +7,7 @@ from evidently._pydantic_compat import BaseModel
 from evidently.base_metric import InputData
 from evidently.base_metric import MetricResult
 from evidently.calculations.classification_performance import calculate_matrix
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import IncludeTags
 from evidently.metric_results import ConfusionMatrix
 from evidently.metrics.classification_performance.base_classification_metric import ThresholdClassificationMetric
@@ -35,6 +36,13 @@ class ClassificationConfusionMatrixResult(MetricResult):
     reference_matrix: Optional[ConfusionMatrix]
     target_names: Optional[TargetNames] = None
 
+    def merge(self, other: "ClassificationConfusionMatrixResult") -> "ClassificationConfusionMatrixResult":
+        return ClassificationConfusionMatrixResult(
+            current_matrix=self.current_matrix.merge(other.current_matrix),
+            reference_matrix=self.reference_matrix,
+            target_names=self.target_names,
+        )
+
 
 class ClassificationConfusionMatrixParameters(BaseModel):
     probas_threshold: Optional[float]
@@ -58,6 +66,10 @@ class ClassificationConfusionMatrix(
     ):
         super().__init__(probas_threshold=probas_threshold, k=k, options=options)
 
+    def is_mergeable(self) -> bool:
+        # top-k threshold depends on the whole data
+        return self.k is None and super().is_mergeable()
+
     def calculate(self, data: InputData) -> ClassificationConfusionMatrixResult:
         current_target_data, current_pred = self.get_target_prediction_data(data.current_data, data.column_mapping)
         target_names = data.column_mapping.target_names
@@ -69,7 +81,9 @@ class ClassificationConfusionMatrix(
 
         reference_results = None
         if data.reference_data is not None:
-            ref_target_data, ref_pred = self.get_target_prediction_data(data.reference_data, data.column_mapping)
+            ref_target_data, ref_pred = self.get_target_prediction_data(
+                data.reference_data, data.column_mapping, REFERENCE
+            )
 
             reference_results = calculate_matrix(
                 ref_target_data,
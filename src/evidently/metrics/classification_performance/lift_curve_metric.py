@@ -7,7 +7,8 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.calculations.classification_performance import calculate_lift_table
-from evidently.calculations.classification_performance import get_prediction_data
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import IncludeTags
 from evidently.metric_results import LiftCurve
 from evidently.metric_results import LiftCurveData
@@ -43,11 +44,14 @@ class ClassificationLiftCurve(Metric[ClassificationLiftCurveResults]):
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
             raise ValueError("The columns 'target' and 'prediction' " "columns should be present")
-        curr_predictions = get_prediction_data(data.current_data, dataset_columns, data.column_mapping.pos_label)
+        curr_predictions = self.get_prediction_data_cache().get(
+            CURRENT, data.current_data, dataset_columns, data.column_mapping.pos_label
+        )
         curr_lift_curve = self.calculate_metrics(data.current_data[target_name], curr_predictions)
         ref_lift_curve = None
         if data.reference_data is not None:
-            ref_predictions = get_prediction_data(
+            ref_predictions = self.get_prediction_data_cache().get(
+                REFERENCE,
                 data.reference_data,
                 dataset_columns,
                 data.column_mapping.pos_label,
@@ -66,16 +70,9 @@ class ClassificationLiftCurve(Metric[ClassificationLiftCurveResults]):
         lift_curve = {}
         lift_table = {}
         if len(labels) <= 2:
-            binaraized_target = pd.DataFrame(binaraized_target[:, 0])
-            binaraized_target.columns = ["target"]
-
-            binded = list(
-                zip(
-                    binaraized_target["target"].tolist(),
-                    prediction.prediction_probas.iloc[:, 0].tolist(),
-                )
+            lift_table[prediction.prediction_probas.columns[0]] = calculate_lift_table(
+                binaraized_target[:, 0], prediction.prediction_probas.iloc[:, 0].to_numpy()
             )
-            lift_table[prediction.prediction_probas.columns[0]] = calculate_lift_table(binded)
 
             lift_curve[prediction.prediction_probas.columns[0]] = LiftCurveData(
                 lift=[i[8] for i in lift_table[prediction.prediction_probas.columns[0]]],
@@ -93,17 +90,10 @@ class ClassificationLiftCurve(Metric[ClassificationLiftCurveResults]):
                 # percent = lift_table[prediction.prediction_probas.columns[0]][0][11],
             )
         else:
-            binaraized_target = pd.DataFrame(binaraized_target)
-            binaraized_target.columns = labels
-
-            for label in labels:
-                binded = list(
-                    zip(
-                        binaraized_target[label].tolist(),
-                        prediction.prediction_probas[label],
-                    )
+            for i, label in enumerate(labels):
+                lift_table[label] = calculate_lift_table(
+                    binaraized_target[:, i], prediction.prediction_probas[label].to_numpy()
                 )
-                lift_table[label] = calculate_lift_table(binded)
 
             for label in labels:
                 # lift_curve[int(prediction.prediction_probas.columns[0])] = LiftCurveData(
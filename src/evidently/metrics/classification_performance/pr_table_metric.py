@@ -13,7 +13,8 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.calculations.classification_performance import calculate_pr_table
-from evidently.calculations.classification_performance import get_prediction_data
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import IncludeTags
 from evidently.metric_results import Label
 from evidently.metric_results import PredictionData
@@ -63,11 +64,15 @@ class ClassificationPRTable(Metric[ClassificationPRTableResults]):
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
             raise ValueError("The columns 'target' and 'prediction' columns should be present")
-        curr_prediction = get_prediction_data(data.current_data, dataset_columns, data.column_mapping.pos_label)
+        curr_prediction = self.get_prediction_data_cache().get(
+            CURRENT, data.current_data, dataset_columns, data.column_mapping.pos_label
+        )
         curr_pr_table = self.calculate_metrics(data.current_data[target_name], curr_prediction)
         ref_pr_table = None
         if data.reference_data is not None:
-            ref_prediction = get_prediction_data(data.reference_data, dataset_columns, data.column_mapping.pos_label)
+            ref_prediction = self.get_prediction_data_cache().get(
+                REFERENCE, data.reference_data, dataset_columns, data.column_mapping.pos_label
+            )
             ref_pr_table = self.calculate_metrics(data.reference_data[target_name], ref_prediction)
         return ClassificationPRTableResults(
             current=curr_pr_table,
@@ -81,28 +86,14 @@ class ClassificationPRTable(Metric[ClassificationPRTableResults]):
         binaraized_target = (target_data.values.reshape(-1, 1) == labels).astype(int)
         pr_table = {}
         if len(labels) <= 2:
-            binaraized_target = pd.DataFrame(binaraized_target[:, 0])
-            binaraized_target.columns = ["target"]
-
-            binded = list(
-                zip(
-                    binaraized_target["target"].tolist(),
-                    prediction.prediction_probas.iloc[:, 0].tolist(),
-                )
+            pr_table[prediction.prediction_probas.columns[0]] = calculate_pr_table(
+                binaraized_target[:, 0], prediction.prediction_probas.iloc[:, 0].to_numpy()
             )
-            pr_table[prediction.prediction_probas.columns[0]] = calculate_pr_table(binded)
         else:
-            binaraized_target = pd.DataFrame(binaraized_target)
-            binaraized_target.columns = labels
-
-            for label in labels:
-                binded = list(
-                    zip(
-                        binaraized_target[label].tolist(),
-                        prediction.prediction_probas[label],
-                    )
+            for i, label in enumerate(labels):
+                pr_table[label] = calculate_pr_table(
+                    binaraized_target[:, i], prediction.prediction_probas[label].to_numpy()
                 )
-                pr_table[label] = calculate_pr_table(binded)
         return pr_table
 
 
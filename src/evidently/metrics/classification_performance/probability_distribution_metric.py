@@ -10,7 +10,8 @@ from plotly import figure_factory as ff
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
-from evidently.calculations.classification_performance import get_prediction_data
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import IncludeTags
 from evidently.model.widget import BaseWidgetInfo
 from evidently.renderers.base_renderer import MetricRenderer
@@ -61,7 +62,9 @@ class ClassificationProbDistribution(Metric[ClassificationProbDistributionResult
         if prediction is None:
             raise ValueError("Prediction column should be present")
 
-        curr_predictions = get_prediction_data(data.current_data, columns, data.column_mapping.pos_label)
+        curr_predictions = self.get_prediction_data_cache().get(
+            CURRENT, data.current_data, columns, data.column_mapping.pos_label
+        )
         if curr_predictions.prediction_probas is None:
             current_distribution = None
             reference_distribution = None
@@ -76,7 +79,9 @@ class ClassificationProbDistribution(Metric[ClassificationProbDistributionResult
             )
 
             if data.reference_data is not None:
-                ref_predictions = get_prediction_data(data.reference_data, columns, data.column_mapping.pos_label)
+                ref_predictions = self.get_prediction_data_cache().get(
+                    REFERENCE, data.reference_data, columns, data.column_mapping.pos_label
+                )
                 if ref_predictions.prediction_probas is None:
                     reference_distribution = None
                 else:
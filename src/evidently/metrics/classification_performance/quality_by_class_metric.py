@@ -10,6 +10,7 @@ from plotly.subplots import make_subplots
 
 from evidently.base_metric import InputData
 from evidently.base_metric import MetricResult
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import AllDict
 from evidently.core import IncludeTags
 from evidently.metric_results import DatasetColumns
@@ -101,6 +102,7 @@ class ClassificationQualityByClass(ThresholdClassificationMetric[ClassificationQ
             ref_target, ref_prediction = self.get_target_prediction_data(
                 data.reference_data,
                 column_mapping=data.column_mapping,
+                dataset=REFERENCE,
             )
             ref_metrics = ClassificationReport.create(
                 ref_target,
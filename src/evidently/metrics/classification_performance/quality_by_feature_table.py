@@ -13,7 +13,8 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.base_metric import UsesRawDataMixin
-from evidently.calculations.classification_performance import get_prediction_data
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import ColumnType
 from evidently.core import IncludeTags
 from evidently.features.generated_features import FeatureDescriptor
@@ -114,10 +115,14 @@ class ClassificationQualityByFeatureTable(UsesRawDataMixin, Metric[Classificatio
             ref_df = data.reference_data.copy()
         if target_name is None or prediction_name is None:
             raise ValueError("The columns 'target' and 'prediction' should be present")
-        curr_predictions = get_prediction_data(data.current_data, dataset_columns, data.column_mapping.pos_label)
+        curr_predictions = self.get_prediction_data_cache().get(
+            CURRENT, data.current_data, dataset_columns, data.column_mapping.pos_label
+        )
         ref_predictions = None
         if ref_df is not None:
-            ref_predictions = get_prediction_data(data.reference_data, dataset_columns, data.column_mapping.pos_label)
+            ref_predictions = self.get_prediction_data_cache().get(
+                REFERENCE, data.reference_data, dataset_columns, data.column_mapping.pos_label
+            )
         if self.columns is None:
             columns = (
                 dataset_columns.num_feature_names
@@ -7,7 +7,8 @@ from sklearn import metrics
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
-from evidently.calculations.classification_performance import get_prediction_data
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import IncludeTags
 from evidently.metric_results import PredictionData
 from evidently.metric_results import ROCCurve
@@ -43,13 +44,17 @@ class ClassificationRocCurve(Metric[ClassificationRocCurveResults]):
         prediction_name = dataset_columns.utility_columns.prediction
         if target_name is None or prediction_name is None:
             raise ValueError("The columns 'target' and 'prediction' columns should be present")
-        curr_predictions = get_prediction_data(data.current_data, dataset_columns, data.column_mapping.pos_label)
+        curr_predictions = self.get_prediction_data_cache().get(
+            CURRENT, data.current_data, dataset_columns, data.column_mapping.pos_label
+        )
         if curr_predictions.prediction_probas is None:
             raise ValueError("Roc Curve can be calculated only on binary probabilistic predictions")
         curr_roc_curve = self.calculate_metrics(data.current_data[target_name], curr_predictions)
         ref_roc_curve = None
         if data.reference_data is not None:
-            ref_predictions = get_prediction_data(data.reference_data, dataset_columns, data.column_mapping.pos_label)
+            ref_predictions = self.get_prediction_data_cache().get(
+                REFERENCE, data.reference_data, dataset_columns, data.column_mapping.pos_label
+            )
             ref_roc_curve = self.calculate_metrics(data.reference_data[target_name], ref_predictions)
         return ClassificationRocCurveResults(
             current_roc_curve=curr_roc_curve,
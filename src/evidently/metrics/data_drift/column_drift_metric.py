@@ -2,7 +2,6 @@ from typing import List
 from typing import Optional
 from typing import Union
 
-import numpy as np
 import pandas as pd
 
 from evidently.base_metric import ColumnMetric
@@ -11,6 +10,7 @@ from evidently.base_metric import ColumnNotFound
 from evidently.base_metric import DataDefinition
 from evidently.base_metric import InputData
 from evidently.base_metric import UsesRawDataMixin
+from evidently.calculations.column_statistics import ColumnStatisticsCache
 from evidently.calculations.data_drift import ColumnDataDriftMetrics
 from evidently.calculations.data_drift import ColumnType
 from evidently.calculations.data_drift import DistributionIncluded
@@ -19,6 +19,8 @@ from evidently.calculations.data_drift import ScatterField
 from evidently.calculations.data_drift import get_distribution_for_column
 from evidently.calculations.data_drift import get_stattest
 from evidently.calculations.data_drift import get_text_data_for_plots
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.calculations.stattests import PossibleStatTestType
 from evidently.metric_results import HistogramData
 from evidently.metric_results import ScatterAggField
@@ -50,6 +52,7 @@ def get_one_column_drift(
     data_definition: DataDefinition,
     column_type: ColumnType,
     agg_data: bool,
+    column_statistics: Optional[ColumnStatisticsCache] = None,
 ) -> ColumnDataDriftMetrics:
     if column_type not in (ColumnType.Numerical, ColumnType.Categorical, ColumnType.Text):
         raise ValueError(f"Cannot calculate drift metric for column '{column}' with type {column_type}")
@@ -67,11 +70,14 @@ def get_one_column_drift(
         stattest = options.get_feature_stattest_func(column.name, column_type.value)
 
     threshold = options.get_threshold(column.name, column_type.value)
-    current_column = current_feature_data
-    reference_column = reference_feature_data
+    if column_statistics is None:
+        column_statistics = ColumnStatisticsCache()
+    # statistics of the column without missing and infinite values
+    current_statistics = column_statistics.get(CURRENT, column, current_feature_data).finite()
+    reference_statistics = column_statistics.get(REFERENCE, column, reference_feature_data).finite()
 
     # clean and check the column in reference dataset
-    reference_column = reference_column.replace([-np.inf, np.inf], np.nan).dropna()
+    reference_column = reference_statistics.data
 
     if reference_column.empty:
         raise ValueError(
@@ -79,7 +85,7 @@ def get_one_column_drift(
         )
 
     # clean and check the column in current dataset
-    current_column = current_column.replace([-np.inf, np.inf], np.nan).dropna()
+    current_column = current_statistics.data
 
     if current_column.empty:
         raise ValueError(f"An empty column '{column.name}' was provided for drift calculation in the current dataset.")
@@ -110,20 +116,10 @@ def get_one_column_drift(
     if column_type == ColumnType.Numerical:
         current_nbinsx = options.get_nbinsx(column.name)
         current_small_distribution = [
-            t.tolist()
-            for t in np.histogram(
-                current_column[np.isfinite(current_column)],
-                bins=current_nbinsx,
-                density=True,
-            )
+            t.tolist() for t in current_statistics.histogram(bins=current_nbinsx, density=True)
         ]
         reference_small_distribution = [
-            t.tolist()
-            for t in np.histogram(
-                reference_column[np.isfinite(reference_column)],
-                bins=current_nbinsx,
-                density=True,
-            )
+            t.tolist() for t in reference_statistics.histogram(bins=current_nbinsx, density=True)
         ]
         if not agg_data:
             current_scatter = {column.display_name: current_column}
@@ -166,8 +162,8 @@ def get_one_column_drift(
             scatter = ScatterField(scatter=current_scatter, x_name=x_name, plot_shape=plot_shape)
 
     elif column_type == ColumnType.Categorical:
-        reference_counts = reference_column.value_counts(sort=False)
-        current_counts = current_column.value_counts(sort=False)
+        reference_counts = reference_statistics.value_counts(sort=False)
+        current_counts = current_statistics.value_counts(sort=False)
         keys = set(reference_counts.keys()).union(set(current_counts.keys()))
 
         for key in keys:
@@ -305,6 +301,7 @@ class ColumnDriftMetric(UsesRawDataMixin, ColumnMetric[ColumnDataDriftMetrics]):
             data_definition=data.data_definition,
             options=options,
             agg_data=agg_data,
+            column_statistics=self.get_column_statistics(),
         )
 
         return ColumnDataDriftMetrics(
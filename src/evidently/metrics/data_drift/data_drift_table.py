@@ -129,6 +129,7 @@ class DataDriftTable(UsesRawDataMixin, WithDriftOptions[DataDriftTableResults]):
             dataset_columns=dataset_columns,
             columns=self.columns,
             agg_data=agg_data,
+            column_statistics=self.get_column_statistics(),
         )
         current_fi: Optional[Dict[str, float]] = None
         reference_fi: Optional[Dict[str, float]] = None
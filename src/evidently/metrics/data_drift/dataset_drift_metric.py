@@ -101,6 +101,7 @@ class DatasetDriftMetric(
             dataset_columns=dataset_columns,
             columns=self.columns,
             agg_data=True,
+            column_statistics=self.get_column_statistics(),
         )
         return DatasetDriftMetricResults(
             drift_share=self.drift_share,
@@ -16,7 +16,8 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.base_metric import UsesRawDataMixin
-from evidently.calculations.classification_performance import get_prediction_data
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import ColumnType
 from evidently.core import IncludeTags
 from evidently.features.non_letter_character_percentage_feature import NonLetterCharacterPercentage
@@ -118,8 +119,12 @@ class TargetByFeaturesTable(UsesRawDataMixin, Metric[TargetByFeaturesTableResult
         curr_predictions = None
         ref_predictions = None
         if prediction_name is not None:
-            curr_predictions = get_prediction_data(data.current_data, dataset_columns, data.column_mapping.pos_label)
-            ref_predictions = get_prediction_data(data.reference_data, dataset_columns, data.column_mapping.pos_label)
+            curr_predictions = self.get_prediction_data_cache().get(
+                CURRENT, data.current_data, dataset_columns, data.column_mapping.pos_label
+            )
+            ref_predictions = self.get_prediction_data_cache().get(
+                REFERENCE, data.reference_data, dataset_columns, data.column_mapping.pos_label
+            )
 
         if self.columns is None:
             columns = (
@@ -42,6 +42,41 @@ class ColumnMissingValues(MetricResult):
     # share of missed values in the column
     share_of_missing_values: float
 
+    @classmethod
+    def from_counts(
+        cls, different_missing_values: Dict[MissingValue, int], number_of_rows: int
+    ) -> "ColumnMissingValues":
+        """Calculate statistics from counts of each missing value in the column"""
+        number_of_missing_values = sum(different_missing_values.values())
+        share_of_missing_values = number_of_missing_values / number_of_rows
+
+        # sort by missing values count
+        different_missing_values = {
+            value: count
+            for value, count in sorted(different_missing_values.items(), key=lambda item: item[1], reverse=True)
+        }
+
+        number_of_different_missing_values = sum(
+            [1 for value in different_missing_values if different_missing_values[value] > 0]
+        )
+
+        return cls(
+            different_missing_values=different_missing_values,
+            number_of_different_missing_values=number_of_different_missing_values,
+            number_of_missing_values=number_of_missing_values,
+            share_of_missing_values=share_of_missing_values,
+            number_of_rows=number_of_rows,
+        )
+
+    def merge(self, other: "ColumnMissingValues") -> "ColumnMissingValues":
+        return ColumnMissingValues.from_counts(
+            {
+                missing_value: count + other.different_missing_values.get(missing_value, 0)
+                for missing_value, count in self.different_missing_values.items()
+            },
+            self.number_of_rows + other.number_of_rows,
+        )
+
 
 class ColumnMissingValuesMetricResult(MetricResult):
     class Config:
@@ -56,6 +91,13 @@ class ColumnMissingValuesMetricResult(MetricResult):
     current: ColumnMissingValues
     reference: Optional[ColumnMissingValues] = None
 
+    def merge(self, other: "ColumnMissingValuesMetricResult") -> "ColumnMissingValuesMetricResult":
+        return ColumnMissingValuesMetricResult(
+            column_name=self.column_name,
+            current=self.current.merge(other.current),
+            reference=self.reference,
+        )
+
 
 class ColumnMissingValuesMetric(Metric[ColumnMissingValuesMetricResult]):
     class Config:
@@ -102,8 +144,6 @@ class ColumnMissingValuesMetric(Metric[ColumnMissingValuesMetricResult]):
 
     def _calculate_missing_values_stats(self, column: pd.Series) -> ColumnMissingValues:
         different_missing_values = {value: 0 for value in self.missing_values}
-        number_of_missing_values = 0
-
         number_of_rows = len(column)
 
         # iterate by each value in custom missing values list and check the value in a column
@@ -116,30 +156,10 @@ class ColumnMissingValuesMetric(Metric[ColumnMissingValuesMetricResult]):
                 missing_values = (column == value).sum()
 
             if missing_values > 0:
-                # increase overall counter
-                number_of_missing_values += missing_values
                 # increase by-missing-value counter
                 different_missing_values[value] += missing_values
 
-        share_of_missing_values = number_of_missing_values / number_of_rows
-
-        # sort by missing values count
-        different_missing_values = {
-            value: count
-            for value, count in sorted(different_missing_values.items(), key=lambda item: item[1], reverse=True)
-        }
-
-        number_of_different_missing_values = sum(
-            [1 for value in different_missing_values if different_missing_values[value] > 0]
-        )
-
-        return ColumnMissingValues(
-            different_missing_values=different_missing_values,
-            number_of_different_missing_values=number_of_different_missing_values,
-            number_of_missing_values=number_of_missing_values,
-            share_of_missing_values=share_of_missing_values,
-            number_of_rows=number_of_rows,
-        )
+        return ColumnMissingValues.from_counts(different_missing_values, number_of_rows)
 
     def calculate(self, data: InputData) -> ColumnMissingValuesMetricResult:
         if not self.missing_values:
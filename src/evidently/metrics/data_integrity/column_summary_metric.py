@@ -15,9 +15,12 @@ from evidently.base_metric import ColumnName
 from evidently.base_metric import InputData
 from evidently.base_metric import MetricResult
 from evidently.base_metric import UsesRawDataMixin
+from evidently.calculations.column_statistics import ColumnStatistics
 from evidently.calculations.data_quality import MAX_CATEGORIES
 from evidently.calculations.data_quality import FeatureQualityStats
 from evidently.calculations.data_quality import get_features_stats
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.calculations.utils import choose_agg_period
 from evidently.calculations.utils import get_data_for_cat_cat_plot
 from evidently.calculations.utils import get_data_for_num_num_plot
@@ -380,6 +383,13 @@ class ColumnSummaryMetric(UsesRawDataMixin, ColumnMetric[ColumnSummaryResult]):
             raise ValueError(f"Column '{self.column_name.display_name}' not found in dataset.")
 
         column_type, column_current_data, column_reference_data = data.get_data(self.column_name)
+        statistics = self.get_column_statistics()
+        current_statistics = statistics.get(CURRENT, self.column_name, column_current_data)
+        reference_statistics = (
+            statistics.get(REFERENCE, self.column_name, column_reference_data)
+            if column_reference_data is not None
+            else None
+        )
 
         curr_characteristics: ColumnCharacteristics
         ref_characteristics: Optional[ColumnCharacteristics] = None
@@ -398,13 +408,17 @@ class ColumnSummaryMetric(UsesRawDataMixin, ColumnMetric[ColumnSummaryResult]):
                 self._generated_text_features,
             )
         else:
-            if column_reference_data is not None:
-                ref_characteristics = self.map_data(get_features_stats(column_reference_data, column_type))
-            curr_characteristics = self.map_data(get_features_stats(column_current_data, column_type))
+            if reference_statistics is not None:
+                ref_characteristics = self.map_data(
+                    get_features_stats(column_reference_data, column_type, reference_statistics)
+                )
+            curr_characteristics = self.map_data(
+                get_features_stats(column_current_data, column_type, current_statistics)
+            )
 
-            if column_reference_data is not None and column_type == ColumnType.Categorical:
-                current_values_set = set(column_current_data.unique())
-                reference_values_set = set(column_reference_data.unique())
+            if reference_statistics is not None and column_type == ColumnType.Categorical:
+                current_values_set = set(current_statistics.unique())
+                reference_values_set = set(reference_statistics.unique())
                 unique_in_current = current_values_set - reference_values_set
                 new_in_current_values_count: int = len(unique_in_current)
                 unique_in_reference = reference_values_set - current_values_set
@@ -442,6 +456,15 @@ class ColumnSummaryMetric(UsesRawDataMixin, ColumnMetric[ColumnSummaryResult]):
         column_current_data = column_current_data.replace([np.inf, -np.inf], np.nan)
         if column_reference_data is not None:
             column_reference_data = column_reference_data.replace([np.inf, -np.inf], np.nan)
+        if pd.api.types.is_numeric_dtype(column_current_data) and current_statistics.infinite_count() > 0:
+            # infinite values are counted as missing
+            current_statistics = ColumnStatistics(column_current_data)
+        if (
+            reference_statistics is not None
+            and pd.api.types.is_numeric_dtype(column_reference_data)
+            and reference_statistics.infinite_count() > 0
+        ):
+            reference_statistics = ColumnStatistics(column_reference_data)
 
         bins_for_hist: Optional[Histogram]
         data_in_time: Optional[DataInTime]
@@ -457,11 +480,11 @@ class ColumnSummaryMetric(UsesRawDataMixin, ColumnMetric[ColumnSummaryResult]):
         counts_of_values = None
         if column_type in [ColumnType.Categorical, ColumnType.Numerical]:
             counts_of_values = {}
-            current_counts = column_current_data.value_counts(dropna=False).reset_index()
+            current_counts = current_statistics.value_counts(dropna=False).reset_index()
             current_counts.columns = ["x", "count"]
             counts_of_values["current"] = current_counts.head(10)
-            if column_reference_data is not None:
-                reference_counts = column_reference_data.value_counts(dropna=False).reset_index()
+            if reference_statistics is not None:
+                reference_counts = reference_statistics.value_counts(dropna=False).reset_index()
                 reference_counts.columns = ["x", "count"]
                 counts_of_values["reference"] = reference_counts.head(10)
 
@@ -2,6 +2,7 @@ from typing import Any
 from typing import ClassVar
 from typing import Dict
 from typing import FrozenSet
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Union
@@ -97,6 +98,101 @@ class DatasetMissingValues(MetricResult):
     # share of columns with a missing value
     share_of_columns_with_missing_values: float
 
+    @classmethod
+    def from_counts(
+        cls,
+        missing_values: Iterable[Any],
+        different_missing_values_by_column: Dict[str, Dict[Any, int]],
+        number_of_rows: int,
+        number_of_rows_with_missing_values: int,
+    ) -> "DatasetMissingValues":
+        """Calculate statistics from counts of each missing value in each column"""
+        different_missing_values = {value: 0 for value in missing_values}
+        number_of_missing_values = 0
+        number_of_missing_values_by_column: Dict[str, int] = {}
+        columns_with_missing_values = set()
+        number_of_columns = len(different_missing_values_by_column)
+
+        for column_name, missing_values in different_missing_values_by_column.items():
+            number_of_missing_values_by_column[column_name] = 0
+
+            for missing_value, column_missing_value in missing_values.items():
+                if column_missing_value > 0:
+                    # increase overall counter
+                    number_of_missing_values += column_missing_value
+                    # increase by-column counter
+                    number_of_missing_values_by_column[column_name] += column_missing_value
+                    # increase by-missing-value counter
+                    different_missing_values[missing_value] += column_missing_value
+                    # add the column to set of columns with a missing value
+                    columns_with_missing_values.add(column_name)
+
+        if number_of_rows == 0:
+            share_of_missing_values_by_column = {}
+            share_of_rows_with_missing_values = 0.0
+            share_of_missing_values = 0.0
+
+        else:
+            share_of_missing_values_by_column = {
+                column_name: value / number_of_rows for column_name, value in number_of_missing_values_by_column.items()
+            }
+            share_of_missing_values = number_of_missing_values / (number_of_columns * number_of_rows)
+            share_of_rows_with_missing_values = number_of_rows_with_missing_values / number_of_rows
+
+        number_of_different_missing_values_by_column = {}
+
+        for column_name, missing_values in different_missing_values_by_column.items():
+            # count a number of missing values that have a value in the column
+            number_of_different_missing_values_by_column[column_name] = len(
+                {keys for keys, values in missing_values.items() if values > 0}
+            )
+
+        number_of_columns_with_missing_values = len(columns_with_missing_values)
+        number_of_different_missing_values = len(
+            {k for k in different_missing_values if different_missing_values[k] > 0}
+        )
+
+        if number_of_columns == 0:
+            share_of_columns_with_missing_values = 0.0
+
+        else:
+            share_of_columns_with_missing_values = number_of_columns_with_missing_values / number_of_columns
+
+        return cls(
+            different_missing_values=different_missing_values,
+            number_of_different_missing_values=number_of_different_missing_values,
+            different_missing_values_by_column=different_missing_values_by_column,
+            number_of_different_missing_values_by_column=number_of_different_missing_values_by_column,
+            number_of_missing_values=number_of_missing_values,
+            share_of_missing_values=share_of_missing_values,
+            number_of_missing_values_by_column=number_of_missing_values_by_column,
+            share_of_missing_values_by_column=share_of_missing_values_by_column,
+            number_of_rows=number_of_rows,
+            number_of_rows_with_missing_values=number_of_rows_with_missing_values,
+            share_of_rows_with_missing_values=share_of_rows_with_missing_values,
+            number_of_columns=number_of_columns,
+            columns_with_missing_values=sorted(columns_with_missing_values),
+            number_of_columns_with_missing_values=len(columns_with_missing_values),
+            share_of_columns_with_missing_values=share_of_columns_with_missing_values,
+        )
+
+    def merge(self, other: "DatasetMissingValues") -> "DatasetMissingValues":
+        if list(self.different_missing_values_by_column) != list(other.different_missing_values_by_column):
+            raise ValueError("Cannot merge missing values statistics of datasets with different columns")
+        return DatasetMissingValues.from_counts(
+            missing_values=self.different_missing_values.keys(),
+            different_missing_values_by_column={
+                column_name: {
+                    missing_value: count + other.different_missing_values_by_column[column_name].get(missing_value, 0)
+                    for missing_value, count in missing_values.items()
+                }
+                for column_name, missing_values in self.different_missing_values_by_column.items()
+            },
+            number_of_rows=self.number_of_rows + other.number_of_rows,
+            number_of_rows_with_missing_values=self.number_of_rows_with_missing_values
+            + other.number_of_rows_with_missing_values,
+        )
+
 
 class DatasetMissingValuesMetricResult(MetricResult):
     class Config:
@@ -106,6 +202,9 @@ class DatasetMissingValuesMetricResult(MetricResult):
     current: DatasetMissingValues
     reference: Optional[DatasetMissingValues] = None
 
+    def merge(self, other: "DatasetMissingValuesMetricResult") -> "DatasetMissingValuesMetricResult":
+        return DatasetMissingValuesMetricResult(current=self.current.merge(other.current), reference=self.reference)
+
 
 class DatasetMissingValuesMetric(Metric[DatasetMissingValuesMetricResult]):
     class Config:
@@ -146,24 +245,11 @@ class DatasetMissingValuesMetric(Metric[DatasetMissingValuesMetricResult]):
         super().__init__(options=options)
 
     def _calculate_missing_values_stats(self, dataset: pd.DataFrame) -> DatasetMissingValues:
-        different_missing_values = {value: 0 for value in self.missing_values}
-        columns_with_missing_values = set()
-        number_of_missing_values = 0
-        number_of_missing_values_by_column: Dict[str, int] = {}
         different_missing_values_by_column: Dict[str, Dict[Any, int]] = {}
 
         for column_name in dataset.columns:
-            number_of_missing_values_by_column[column_name] = 0
             different_missing_values_by_column[column_name] = {}
 
-            for value in self.missing_values:
-                different_missing_values_by_column[column_name][value] = 0
-
-        number_of_rows_with_missing_values = 0
-        number_of_columns = len(dataset.columns)
-        number_of_rows = get_rows_count(dataset)
-
-        for column_name in dataset.columns:
             # iterate by each value in custom missing values list and check the value in a column
             for missing_value in self.missing_values:
                 if missing_value is None:
@@ -173,70 +259,18 @@ class DatasetMissingValuesMetric(Metric[DatasetMissingValuesMetricResult]):
                 else:
                     column_missing_value = (dataset[column_name] == missing_value).sum()
 
-                if column_missing_value > 0:
-                    # increase overall counter
-                    number_of_missing_values += column_missing_value
-                    # increase by-column counter
-                    number_of_missing_values_by_column[column_name] += column_missing_value
-                    # increase by-missing-value counter for each column
-                    different_missing_values_by_column[column_name][missing_value] += column_missing_value
-                    # increase by-missing-value counter
-                    different_missing_values[missing_value] += column_missing_value
-                    # add the column to set of columns with a missing value
-                    columns_with_missing_values.add(column_name)
+                different_missing_values_by_column[column_name][missing_value] = column_missing_value
 
         dsf = dataset.isin(self.missing_values)
         if None in self.missing_values:
             dsf = dsf | dataset.isnull()
         number_of_rows_with_missing_values = dsf.any(axis="columns").sum()
 
-        if number_of_rows == 0:
-            share_of_missing_values_by_column = {}
-            share_of_rows_with_missing_values = 0.0
-            share_of_missing_values = 0.0
-
-        else:
-            share_of_missing_values_by_column = {
-                column_name: value / number_of_rows for column_name, value in number_of_missing_values_by_column.items()
-            }
-            share_of_missing_values = number_of_missing_values / (number_of_columns * number_of_rows)
-            share_of_rows_with_missing_values = number_of_rows_with_missing_values / number_of_rows
-
-        number_of_different_missing_values_by_column = {}
-
-        for column_name, missing_values in different_missing_values_by_column.items():
-            # count a number of missing values that have a value in the column
-            number_of_different_missing_values_by_column[column_name] = len(
-                {keys for keys, values in missing_values.items() if values > 0}
-            )
-
-        number_of_columns_with_missing_values = len(columns_with_missing_values)
-        number_of_different_missing_values = len(
-            {k for k in different_missing_values if different_missing_values[k] > 0}
-        )
-
-        if number_of_columns == 0:
-            share_of_columns_with_missing_values = 0.0
-
-        else:
-            share_of_columns_with_missing_values = number_of_columns_with_missing_values / number_of_columns
-
-        return DatasetMissingValues(
-            different_missing_values=different_missing_values,
-            number_of_different_missing_values=number_of_different_missing_values,
+        return DatasetMissingValues.from_counts(
+            missing_values=self.missing_values,
             different_missing_values_by_column=different_missing_values_by_column,
-            number_of_different_missing_values_by_column=number_of_different_missing_values_by_column,
-            number_of_missing_values=number_of_missing_values,
-            share_of_missing_values=share_of_missing_values,
-            number_of_missing_values_by_column=number_of_missing_values_by_column,
-            share_of_missing_values_by_column=share_of_missing_values_by_column,
-            number_of_rows=number_of_rows,
+            number_of_rows=get_rows_count(dataset),
             number_of_rows_with_missing_values=number_of_rows_with_missing_values,
-            share_of_rows_with_missing_values=share_of_rows_with_missing_values,
-            number_of_columns=number_of_columns,
-            columns_with_missing_values=sorted(columns_with_missing_values),
-            number_of_columns_with_missing_values=len(columns_with_missing_values),
-            share_of_columns_with_missing_values=share_of_columns_with_missing_values,
         )
 
     def calculate(self, data: InputData) -> DatasetMissingValuesMetricResult:
@@ -18,6 +18,8 @@ from evidently.calculations.data_integration import get_number_of_constant_colum
 from evidently.calculations.data_integration import get_number_of_duplicated_columns
 from evidently.calculations.data_integration import get_number_of_empty_columns
 from evidently.calculations.data_quality import get_rows_count
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
 from evidently.core import IncludeTags
 from evidently.metric_results import Label
 from evidently.model.widget import BaseWidgetInfo
@@ -129,8 +131,14 @@ class DatasetSummaryMetric(Metric[DatasetSummaryMetricResult]):
         self.almost_constant_threshold = almost_constant_threshold
         super().__init__(options=options)
 
-    def _calculate_dataset_common_stats(self, dataset: pd.DataFrame, column_mapping: ColumnMapping) -> DatasetSummary:
+    def _calculate_dataset_common_stats(
+        self, dataset_type: str, dataset: pd.DataFrame, column_mapping: ColumnMapping
+    ) -> DatasetSummary:
         columns = process_columns(dataset, column_mapping)
+        column_statistics = self.get_column_statistics()
+        statistics = {
+            column: column_statistics.get(dataset_type, column, dataset[column]) for column in dataset.columns
+        }
         return DatasetSummary(
             target=columns.utility_columns.target,
             prediction=columns.utility_columns.prediction,
@@ -143,10 +151,10 @@ class DatasetSummaryMetric(Metric[DatasetSummaryMetricResult]):
             number_of_numeric_columns=len(columns.num_feature_names),
             number_of_text_columns=len(columns.text_feature_names),
             number_of_datetime_columns=len(columns.datetime_feature_names),
-            number_of_empty_columns=get_number_of_empty_columns(dataset),
-            number_of_constant_columns=get_number_of_constant_columns(dataset),
+            number_of_empty_columns=get_number_of_empty_columns(dataset, statistics),
+            number_of_constant_columns=get_number_of_constant_columns(dataset, statistics),
             number_of_almost_constant_columns=get_number_of_almost_constant_columns(
-                dataset, self.almost_constant_threshold
+                dataset, self.almost_constant_threshold, statistics
             ),
             number_of_duplicated_columns=get_number_of_duplicated_columns(dataset),
             number_of_almost_duplicated_columns=get_number_of_almost_duplicated_columns(
@@ -155,8 +163,8 @@ class DatasetSummaryMetric(Metric[DatasetSummaryMetricResult]):
             number_of_empty_rows=dataset.isna().all(1).sum(),
             number_of_duplicated_rows=dataset.duplicated().sum(),
             columns_type_data={k: NumpyDtype.from_dtype(v) for k, v in dataset.dtypes.to_dict().items()},
-            nans_by_columns=dataset.isna().sum().to_dict(),
-            number_uniques_by_columns=dict(dataset.nunique().to_dict()),
+            nans_by_columns={column: statistics[column].missing_count() for column in dataset.columns},
+            number_uniques_by_columns={column: statistics[column].nunique() for column in dataset.columns},
         )
 
     def calculate(self, data: InputData) -> DatasetSummaryMetricResult:
@@ -166,11 +174,11 @@ class DatasetSummaryMetric(Metric[DatasetSummaryMetricResult]):
         if self.almost_constant_threshold < 0.5 or self.almost_duplicated_threshold > 1:
             raise ValueError("Almost constant threshold should be in range [0.5, 1]")
 
-        current = self._calculate_dataset_common_stats(data.current_data, data.column_mapping)
+        current = self._calculate_dataset_common_stats(CURRENT, data.current_data, data.column_mapping)
         reference = None
 
         if data.reference_data is not None:
-            reference = self._calculate_dataset_common_stats(data.reference_data, data.column_mapping)
+            reference = self._calculate_dataset_common_stats(REFERENCE, data.reference_data, data.column_mapping)
 
         return DatasetSummaryMetricResult(
             current=current,
@@ -1,4 +1,5 @@
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -78,6 +79,44 @@ class ColumnValueListMetricResult(MetricResult):
     current: ValueListStat
     reference: Optional[ValueListStat] = None
 
+    def merge(self, other: "ColumnValueListMetricResult") -> "ColumnValueListMetricResult":
+        return ColumnValueListMetricResult(
+            column_name=self.column_name,
+            values=self.values,
+            current=_merge_value_list_stats(self.values, self.current, other.current),
+            reference=self.reference,
+        )
+
+
+def _merge_counts(first: List[Tuple[Any, int]], second: List[Tuple[Any, int]]) -> Dict[Any, int]:
+    counts: Dict[Any, int] = {}
+    for value, count in first + second:
+        counts[value] = counts.get(value, 0) + count
+    return counts
+
+
+def _merge_value_list_stats(values: List[Any], first: ValueListStat, second: ValueListStat) -> ValueListStat:
+    rows_count = first.rows_count + second.rows_count
+    counts_in_list = _merge_counts(first.values_in_list, second.values_in_list)
+    counts_not_in_list = _merge_counts(first.values_not_in_list, second.values_not_in_list)
+    number_in_list = sum(counts_in_list.values())
+    number_not_in_list = rows_count - number_in_list
+    # the same order as value_counts gives: found values by count, then other values from the list
+    values_in_list = sorted(
+        ((value, count) for value, count in counts_in_list.items() if count > 0), key=lambda x: x[1], reverse=True
+    )
+    if rows_count > 0:
+        values_in_list += [(value, 0) for value in values if counts_in_list.get(value, 0) == 0]
+    return ValueListStat(
+        number_in_list=number_in_list,
+        number_not_in_list=number_not_in_list,
+        share_in_list=number_in_list / rows_count if rows_count > 0 else 0.0,
+        share_not_in_list=number_not_in_list / rows_count if rows_count > 0 else 0.0,
+        values_in_list=values_in_list,
+        values_not_in_list=sorted(counts_not_in_list.items(), key=lambda x: x[1], reverse=True),
+        rows_count=rows_count,
+    )
+
 
 class ColumnValueListMetric(Metric[ColumnValueListMetricResult]):
     class Config:
@@ -189,9 +189,16 @@ class DatasetCorrelationsMetric(Metric[DatasetCorrelationsMetricResult]):
         self, dataset: pd.DataFrame, data_definition: DataDefinition, add_text_columns: Optional[list]
     ) -> DatasetCorrelation:
         # process predictions. If task == 'classification' add prediction labels
+        execution_options = self.get_options().execution_options
 
         if add_text_columns is not None:
-            correlations_calculate = calculate_correlations(dataset, data_definition, sum(add_text_columns, []))
+            correlations_calculate = calculate_correlations(
+                dataset,
+                data_definition,
+                sum(add_text_columns, []),
+                execution_options.parallel,
+                execution_options.max_workers,
+            )
             correlations = copy.deepcopy(correlations_calculate)
             for name, correlation in correlations_calculate.items():
                 if name != "cramer_v":
@@ -199,7 +206,12 @@ class DatasetCorrelationsMetric(Metric[DatasetCorrelationsMetricResult]):
                         correlation.loc[col_idx, col_idx] = 0
                     correlations_calculate[name] = correlation
         else:
-            correlations_calculate = calculate_correlations(dataset, data_definition)
+            correlations_calculate = calculate_correlations(
+                dataset,
+                data_definition,
+                parallel=execution_options.parallel,
+                max_workers=execution_options.max_workers,
+            )
             correlations = copy.deepcopy(correlations_calculate)
 
         prediction_columns = data_definition.get_prediction_columns()
@@ -1,4 +1,3 @@
-from itertools import combinations
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -9,14 +8,15 @@ import pandas as pd
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
-from evidently.calculations.recommender_systems import get_prediciton_name
+from evidently.calculations.ranked_interactions import RankedInteractions
+from evidently.calculations.recommender_systems import get_ranked_interactions
+from evidently.calculations.recommender_systems import group_sums
 from evidently.core import IncludeTags
 from evidently.metric_results import Distribution
 from evidently.metric_results import HistogramData
 from evidently.metrics.recsys.pairwise_distance import PairwiseDistance
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
-from evidently.pipeline.column_mapping import RecomType
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import CounterData
@@ -63,64 +63,42 @@ class DiversityMetric(Metric[DiversityMetricResult]):
 
     def get_ild(
         self,
-        df: pd.DataFrame,
+        ranked: RankedInteractions,
         k: int,
-        recommendations_type: RecomType,
-        user_id: str,
-        item_id: str,
-        predictions: str,
-        dist_matrix: np.ndarray,
+        item_vectors: np.ndarray,
         name_dict: Dict,
     ):
-        df = df.copy()
-        if recommendations_type == RecomType.SCORE:
-            df[predictions] = df.groupby(user_id)[predictions].transform("rank", ascending=False)
-        ilds = []
-        all_users = df[user_id].unique()
-        for user in all_users:
-            rec_list = df[(df[user_id] == user) & (df[predictions] <= k)][item_id]
-            user_res = 0
-            for i, j in combinations(rec_list, 2):
-                user_res += dist_matrix[name_dict[i], name_dict[j]]
-            ilds.append(user_res / len(rec_list))
+        recs = ranked.top_k(k)
+        users = ranked.user_codes[recs]
+        vectors = item_vectors[ranked.map_items(name_dict, recs).astype(int)]
+        # vectors have unit length, so sum of pairwise cosine similarities of user items is
+        # (|sum of vectors|^2 - sum of |vector|^2) / 2 and sum of distances is pairs count minus it
+        _, sizes, sums = group_sums(users, vectors)
+        _, _, squares = group_sums(users, np.einsum("ij,ij->i", vectors, vectors))
+        similarities = (np.einsum("ij,ij->i", sums, sums) - squares) / 2
+        ilds = (sizes * (sizes - 1) / 2 - similarities) / sizes
         distr = pd.Series(ilds)
         value = np.mean(ilds)
         return distr, value
 
     def calculate(self, data: InputData) -> DiversityMetricResult:
         result = self._pairwise_distance.get_result()
-        dist_matrix = result.dist_matrix
+        item_vectors = result.item_vectors
         name_dict = result.name_dict
+        if item_vectors is None:
+            raise ValueError("PairwiseDistance result should contain item vectors")
         user_id = data.data_definition.get_user_id_column()
         item_id = data.data_definition.get_item_id_column()
         recommendations_type = data.column_mapping.recom_type
         if user_id is None or item_id is None or recommendations_type is None:
             raise ValueError("user_id and item_id and recommendations_type should be specified")
-        prediction_name = get_prediciton_name(data)
-        curr_distr_data, curr_value = self.get_ild(
-            df=data.current_data,
-            k=self.k,
-            recommendations_type=recommendations_type,
-            user_id=user_id.column_name,
-            item_id=item_id.column_name,
-            predictions=prediction_name,
-            dist_matrix=dist_matrix,
-            name_dict=name_dict,
-        )
+        curr_ranked, ref_ranked = get_ranked_interactions(data, self.get_ranked_interactions_cache())
+        curr_distr_data, curr_value = self.get_ild(curr_ranked, self.k, item_vectors, name_dict)
 
         ref_distr_data: Optional[pd.Series] = None
         ref_value: Optional[float] = None
-        if data.reference_data is not None:
-            ref_distr_data, ref_value = self.get_ild(
-                df=data.reference_data,
-                k=self.k,
-                recommendations_type=recommendations_type,
-                user_id=user_id.column_name,
-                item_id=item_id.column_name,
-                predictions=prediction_name,
-                dist_matrix=dist_matrix,
-                name_dict=name_dict,
-            )
+        if ref_ranked is not None:
+            ref_distr_data, ref_value = self.get_ild(ref_ranked, self.k, item_vectors, name_dict)
         curr_distr, ref_distr = get_distribution_for_column(
             column_type="num", current=curr_distr_data, reference=ref_distr_data
         )
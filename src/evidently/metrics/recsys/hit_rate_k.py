@@ -51,7 +51,9 @@ class HitRateKMetric(Metric[HitRateKMetricResult]):
         return pd.Series(data=res)
 
     def calculate(self, data: InputData) -> HitRateKMetricResult:
-        curr, ref = get_curr_and_ref_df(data, self.min_rel_score, self.no_feedback_users, True)
+        curr, ref = get_curr_and_ref_df(
+            data, self.min_rel_score, self.no_feedback_users, True, cache=self.get_ranked_interactions_cache()
+        )
         max_k = min(curr["preds"].max(), max(10, self.k))
         current = self.get_values(curr, max_k)
         reference: Optional[pd.Series] = None
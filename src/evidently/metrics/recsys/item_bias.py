@@ -5,13 +5,13 @@ from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.calculations.recommender_systems import get_prediciton_name
+from evidently.calculations.recommender_systems import get_ranked_interactions
 from evidently.core import ColumnType
 from evidently.core import IncludeTags
 from evidently.metric_results import Distribution
 from evidently.metric_results import HistogramData
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
-from evidently.pipeline.column_mapping import RecomType
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import header_text
@@ -72,12 +72,8 @@ class ItemBiasMetric(Metric[ItemBiasMetricResult]):
             raise ValueError(f"{column.column_name} expected to be numerical or categorical")
 
         curr_train = current_train_data.drop_duplicates(subset=[col_item_id.column_name], keep="last")
-        curr = data.current_data.copy()
-        if recommendations_type == RecomType.SCORE:
-            curr[prediction_name] = curr.groupby(col_user_id.column_name)[prediction_name].transform(
-                "rank", ascending=False
-            )
-        curr = curr[curr[prediction_name] <= self.k]
+        curr_ranked, ref_ranked = get_ranked_interactions(data, self.get_ranked_interactions_cache(), prediction_name)
+        curr = data.current_data[curr_ranked.top_k(self.k)]
 
         if column.column_name not in current_train_data.columns:
             raise ValueError(f"{column.column_name} expected to be in current_train_data")
@@ -89,14 +85,9 @@ class ItemBiasMetric(Metric[ItemBiasMetricResult]):
         )
         reference_train_distr: Optional[Distribution] = None
         reference_distr: Optional[Distribution] = None
-        if data.reference_data is not None:
+        if data.reference_data is not None and ref_ranked is not None:
             ref_train = curr_train
-            ref = data.reference_data.copy()
-            if recommendations_type == RecomType.SCORE:
-                ref[prediction_name] = ref.groupby(col_user_id.column_name)[prediction_name].transform(
-                    "rank", ascending=False
-                )
-            ref = ref[ref[prediction_name] <= self.k]
+            ref = data.reference_data[ref_ranked.top_k(self.k)]
             if reference_train_data is not None:
                 if column.column_name not in reference_train_data.columns:
                     raise ValueError(f"{column.column_name} expected to be in reference_train_data")
@@ -52,7 +52,9 @@ class MRRKMetric(Metric[MRRKMetricResult]):
         return pd.Series(index=[x for x in range(1, max_k + 1)], data=res)
 
     def calculate(self, data: InputData) -> MRRKMetricResult:
-        curr, ref = get_curr_and_ref_df(data, self.min_rel_score, self.no_feedback_users, True)
+        curr, ref = get_curr_and_ref_df(
+            data, self.min_rel_score, self.no_feedback_users, True, cache=self.get_ranked_interactions_cache()
+        )
         max_k = min(curr["preds"].max(), max(10, self.k))
         current = self.get_values(curr, max_k)
         reference: Optional[pd.Series] = None
@@ -6,6 +6,8 @@ import pandas as pd
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.calculations.recommender_systems import get_curr_and_ref_df
+from evidently.calculations.recommender_systems import top_k_sums
+from evidently.calculations.recommender_systems import user_codes
 from evidently.metrics.recsys.base_top_k import TopKMetricRenderer
 from evidently.metrics.recsys.base_top_k import TopKMetricResult
 from evidently.options.base import AnyOptions
@@ -29,7 +31,9 @@ class NDCGKMetric(Metric[TopKMetricResult]):
         super().__init__(options=options)
 
     def calculate(self, data: InputData) -> TopKMetricResult:
-        curr, ref = get_curr_and_ref_df(data, self.min_rel_score, self.no_feedback_users, False)
+        curr, ref = get_curr_and_ref_df(
+            data, self.min_rel_score, self.no_feedback_users, False, cache=self.get_ranked_interactions_cache()
+        )
         current = self.calculate_ndcg(curr, self.k)
         reference: Optional[dict] = None
         if ref is not None:
@@ -42,21 +46,22 @@ class NDCGKMetric(Metric[TopKMetricResult]):
         )
 
     def calculate_ndcg(self, df, k):
-        df = df.copy()
-        # users_with_int = df[df.target > 0].users.unique()
-        # df = df[df.users.isin(users_with_int)]
-        df["dcg"] = df["target"] / np.log2(df["preds"] + 1)
         max_k = int(min(df["preds"].max(), max(k, 10)))
-        df = df.sort_values(["users", "target"], ascending=False)
-        ndcg_k = []
-        for i in range(1, max_k + 1):
-            discount = 1 / np.log2(np.arange(i) + 2)
-            dcg = df[df.preds <= i].groupby("users").dcg.sum()
-            idcg = df.groupby("users").target.apply(lambda x: x[:i].dot(discount[: len(x)])).rename("idcg")
-            user_df = pd.concat([dcg, idcg], axis=1).fillna(0)
-            ndcg_k.append((user_df["dcg"] / user_df["idcg"]).replace([np.inf, -np.inf], np.nan).fillna(0).mean())
-
-        return pd.Series(index=[k for k in range(1, max_k + 1)], data=ndcg_k)
+        users, n_users, known = user_codes(df["users"])
+        target = df["target"].to_numpy(dtype=float)[known]
+        preds = df["preds"].to_numpy(dtype=float)[known]
+        # ideal ranking of user items is by target descending
+        order = np.lexsort((-target, users))
+        ideal_users = users[order]
+        ideal_positions = np.arange(len(order)) - np.searchsorted(ideal_users, ideal_users)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dcg = top_k_sums(users, preds, target / np.log2(preds + 1), n_users, max_k)
+            idcg = top_k_sums(
+                ideal_users, ideal_positions + 1.0, target[order] / np.log2(ideal_positions + 2), n_users, max_k
+            )
+            ndcg = dcg / idcg
+        ndcg[~np.isfinite(ndcg)] = 0
+        return pd.Series(index=[k for k in range(1, max_k + 1)], data=ndcg.mean(axis=0))
 
 
 @default_renderer(wrap_type=NDCGKMetric)
@@ -7,7 +7,8 @@ import pandas as pd
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
-from evidently.calculations.recommender_systems import get_prediciton_name
+from evidently.calculations.ranked_interactions import RankedInteractions
+from evidently.calculations.recommender_systems import get_ranked_interactions
 from evidently.core import IncludeTags
 from evidently.metric_results import Distribution
 from evidently.metric_results import HistogramData
@@ -57,16 +58,13 @@ class NoveltyMetric(Metric[NoveltyMetricResult]):
         self._train_stats = TrainStats()
         super().__init__(options=options)
 
-    def get_miuf(
-        self, df, k, recommendations_type: Optional[RecomType], user_name, item_name, prediction_name, interactions
-    ):
-        data = df.copy()
-        if recommendations_type == RecomType.SCORE:
-            data[prediction_name] = data.groupby(user_name)[prediction_name].transform("rank", ascending=False)
-        data = data[data[prediction_name] <= k]
-        data["miuf"] = -np.log2(data[item_name].map(interactions)).replace([np.inf, -np.inf], np.nan)
-        data = data[~data.miuf.isna()]
-        distr = data.groupby(user_name).miuf.mean()
+    def get_miuf(self, ranked: RankedInteractions, k: int, interactions: pd.Series):
+        recs = ranked.top_k(k)
+        with np.errstate(divide="ignore"):
+            miuf = -np.log2(ranked.map_items(interactions, recs))
+        users = ranked.user_codes[recs]
+        known = np.isfinite(miuf) & (users >= 0)
+        distr = pd.Series(miuf[known]).groupby(users[known]).mean()
         value = distr.mean()
         return distr, value
 
@@ -76,35 +74,22 @@ class NoveltyMetric(Metric[NoveltyMetricResult]):
         ref_user_interacted = train_result.reference
         current_n_users = train_result.current_n_users
         reference_n_users = train_result.reference_n_users
-        user_id = data.column_mapping.user_id
-        item_id = data.column_mapping.item_id
 
         curr_interactions = curr_user_interacted / current_n_users
-        prediction_name = get_prediciton_name(data)
-        curr_distr_data, curr_value = self.get_miuf(
-            data.current_data,
-            self.k,
-            data.column_mapping.recom_type,
-            user_id,
-            item_id,
-            prediction_name,
-            curr_interactions,
+        # predictions are ranks if recommendations type is not set
+        curr_ranked, ref_ranked = get_ranked_interactions(
+            data,
+            self.get_ranked_interactions_cache(),
+            recommendations_type=data.column_mapping.recom_type or RecomType.RANK,
         )
+        curr_distr_data, curr_value = self.get_miuf(curr_ranked, self.k, curr_interactions)
         ref_distr_data: Optional[pd.Series] = None
         ref_value: Optional[float] = None
-        if data.reference_data is not None:
+        if ref_ranked is not None:
             ref_interactions = curr_interactions
             if ref_user_interacted is not None and reference_n_users is not None:
                 ref_interactions = ref_user_interacted / reference_n_users
-            ref_distr_data, ref_value = self.get_miuf(
-                data.reference_data,
-                self.k,
-                data.column_mapping.recom_type,
-                user_id,
-                item_id,
-                prediction_name,
-                ref_interactions,
-            )
+            ref_distr_data, ref_value = self.get_miuf(ref_ranked, self.k, ref_interactions)
         curr_distr, ref_distr = get_distribution_for_column(
             column_type="num", current=curr_distr_data, reference=ref_distr_data
         )
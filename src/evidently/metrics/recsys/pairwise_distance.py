@@ -1,19 +1,20 @@
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Union
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import pairwise_distances
+from sklearn.preprocessing import normalize
 
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.calculations.recommender_systems import get_prediciton_name
+from evidently.calculations.recommender_systems import get_ranked_interactions
 from evidently.core import IncludeTags
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
-from evidently.pipeline.column_mapping import RecomType
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 
@@ -22,11 +23,19 @@ class PairwiseDistanceResult(MetricResult):
     class Config:
         type_alias = "evidently:metric_result:PairwiseDistanceResult"
         pd_include = False
-        field_tags = {"dist_matrix": {IncludeTags.Extra}}
+        field_tags = {"item_vectors": {IncludeTags.Extra}}
 
-    dist_matrix: np.ndarray
+    # item features scaled to unit length, cosine distance of items is 1 - dot product of their vectors
+    item_vectors: Optional[np.ndarray] = None
     name_dict: Dict[Union[int, str], int]
 
+    @property
+    def dist_matrix(self) -> np.ndarray:
+        """Cosine distances of all pairs of items"""
+        if self.item_vectors is None:
+            raise ValueError("Item vectors are not available")
+        return np.clip(1 - self.item_vectors @ self.item_vectors.T, 0, 2)
+
 
 class PairwiseDistance(Metric[PairwiseDistanceResult]):
     class Config:
@@ -52,15 +61,11 @@ class PairwiseDistance(Metric[PairwiseDistanceResult]):
         if recommendations_type is None or user_id is None or item_id is None:
             raise ValueError("recommendations_type, user_id, item_id must be provided in the column mapping.")
 
-        all_items = curr.copy()
-        if ref is not None:
-            all_items = pd.concat([curr, ref])
-        if recommendations_type == RecomType.SCORE:
-            all_items[prediction_name] = all_items.groupby(user_id.column_name)[prediction_name].transform(
-                "rank", ascending=False
-            )
-        all_items = all_items[all_items[prediction_name] <= self.k + 1]
-        all_items = all_items[[item_id.column_name] + self.item_features]
+        curr_ranked, ref_ranked = get_ranked_interactions(data, self.get_ranked_interactions_cache(), prediction_name)
+        columns = [item_id.column_name] + self.item_features
+        all_items = curr.loc[curr_ranked.top_k(self.k + 1), columns]
+        if ref is not None and ref_ranked is not None:
+            all_items = pd.concat([all_items, ref.loc[ref_ranked.top_k(self.k + 1), columns]])
         if current_train_data is not None:
             if not np.in1d(self.item_features, current_train_data.columns).all():
                 raise ValueError("current_train_data must contain item_features.")
@@ -73,7 +78,7 @@ class PairwiseDistance(Metric[PairwiseDistanceResult]):
         all_items.drop_duplicates(subset=[item_id.column_name], inplace=True)
         name_dict = {i: j for i, j in zip(all_items[item_id.column_name], range(all_items.shape[0]))}
         return PairwiseDistanceResult(
-            dist_matrix=pairwise_distances(all_items[self.item_features], metric="cosine"), name_dict=name_dict
+            item_vectors=normalize(all_items[self.item_features].to_numpy(dtype=float)), name_dict=name_dict
         )
 
 
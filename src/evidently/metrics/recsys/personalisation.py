@@ -9,11 +9,11 @@ import pandas as pd
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
-from evidently.calculations.recommender_systems import get_prediciton_name
+from evidently.calculations.ranked_interactions import RankedInteractions
+from evidently.calculations.recommender_systems import get_ranked_interactions
 from evidently.core import IncludeTags
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
-from evidently.pipeline.column_mapping import RecomType
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import CounterData
@@ -56,57 +56,35 @@ class PersonalizationMetric(Metric[PersonalizationMetricResult]):
         self.k = k
         super().__init__(options=options)
 
-    def get_diversity(
-        self,
-        df: pd.DataFrame,
-        user_id: str,
-        item_id: str,
-        prediction_name: str,
-        k: int,
-        recommendations_type: RecomType,
-    ):
-        df = df.copy()
-        table = dict(df[item_id].value_counts()[:10])
-        if recommendations_type == RecomType.SCORE:
-            df[prediction_name] = df.groupby(user_id)[prediction_name].transform("rank", ascending=False)
-        df = df[df[prediction_name] <= k]
-        recommended_counter = df[item_id].value_counts()
-        n_users = df[user_id].nunique()
+    def get_diversity(self, ranked: RankedInteractions, k: int):
+        if ranked.items is None or ranked.item_codes is None:
+            raise ValueError("Item_id was not found in data.")
+        item_counts = np.bincount(ranked.item_codes[ranked.item_codes >= 0], minlength=len(ranked.items))
+        # same as value_counts of items, which are counted in order of appearance and sorted by count
+        table = dict(pd.Series(item_counts, index=ranked.items).sort_values(ascending=False)[:10])
+        recs = ranked.top_k(k)
+        recommended_counter = np.bincount(ranked.item_codes[recs & (ranked.item_codes >= 0)])
+        n_users = len(np.unique(ranked.user_codes[recs & (ranked.user_codes >= 0)]))
         cooccurrences_cumulative = np.sum(recommended_counter**2) - n_users * k
         all_user_couples_count = n_users**2 - n_users
         diversity_cumulative = all_user_couples_count - cooccurrences_cumulative / k
 
         diversity = diversity_cumulative / all_user_couples_count
-        recommended_counter.index = recommended_counter.index.astype(str)
         return diversity, table
 
     def calculate(self, data: InputData) -> PersonalizationMetricResult:
-        prediction_name = get_prediciton_name(data)
         user_id = data.data_definition.get_user_id_column()
         item_id = data.data_definition.get_item_id_column()
         recommendations_type = data.column_mapping.recom_type
         if user_id is None or item_id is None or recommendations_type is None:
             raise ValueError("user_id and item_id and recommendations_type should be specified")
-        curr_value, curr_table = self.get_diversity(
-            data.current_data,
-            user_id=user_id.column_name,
-            item_id=item_id.column_name,
-            prediction_name=prediction_name,
-            k=self.k,
-            recommendations_type=recommendations_type,
-        )
+        curr_ranked, ref_ranked = get_ranked_interactions(data, self.get_ranked_interactions_cache())
+        curr_value, curr_table = self.get_diversity(curr_ranked, self.k)
 
         ref_table: Optional[Dict[Any, int]] = None
         ref_value: Optional[float] = None
-        if data.reference_data is not None:
-            ref_value, ref_table = self.get_diversity(
-                data.reference_data,
-                user_id=user_id.column_name,
-                item_id=item_id.column_name,
-                prediction_name=prediction_name,
-                k=self.k,
-                recommendations_type=recommendations_type,
-            )
+        if ref_ranked is not None:
+            ref_value, ref_table = self.get_diversity(ref_ranked, self.k)
         return PersonalizationMetricResult(
             k=self.k,
             current_value=curr_value,
@@ -7,14 +7,14 @@ import pandas as pd
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
-from evidently.calculations.recommender_systems import get_prediciton_name
+from evidently.calculations.ranked_interactions import RankedInteractions
+from evidently.calculations.recommender_systems import get_ranked_interactions
 from evidently.core import IncludeTags
 from evidently.metric_results import Distribution
 from evidently.metric_results import HistogramData
 from evidently.metrics.recsys.train_stats import TrainStats
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
-from evidently.pipeline.column_mapping import RecomType
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import CounterData
@@ -76,109 +76,68 @@ class PopularityBias(Metric[PopularityBiasResult]):
     def get_apr(
         self,
         k: int,
-        df: pd.DataFrame,
+        ranked: RankedInteractions,
         train_stats: pd.Series,
         normalize_arp: bool,
-        prediction_name: str,
-        user_name: str,
-        item_name: str,
     ):
-        data = df.copy()
-        data = data[data[prediction_name] <= k]
-        data["popularity"] = data[item_name].map(train_stats).replace([np.inf, -np.inf], np.nan)
+        recs = ranked.top_k(k)
+        popularity = ranked.map_items(train_stats.replace([np.inf, -np.inf], np.nan), recs)
         if normalize_arp:
-            data["popularity"] = data["popularity"] / train_stats.max()
-        data = data[~data.popularity.isna()]
-        value = data.groupby(user_name).popularity.mean().mean()
-        distr_data = data.popularity
+            popularity = popularity / train_stats.max()
+        users = ranked.user_codes[recs]
+        known = ~np.isnan(popularity)
+        with_user = known & (users >= 0)
+        value = pd.Series(popularity[with_user]).groupby(users[with_user]).mean().mean()
+        distr_data = pd.Series(popularity[known])
         return value, distr_data
 
-    def get_gini(
-        self,
-        k: int,
-        df: pd.DataFrame,
-        prediction_name: str,
-        item_name: str,
-    ):
-        data = df.copy()
-        data = data[data[prediction_name] <= k]
-        recommended_counter_sorted = data[item_name].value_counts(ascending=True)
+    def get_gini(self, k: int, ranked: RankedInteractions):
+        if ranked.item_codes is None:
+            raise ValueError("Item_id was not found in data.")
+        recommended_counter = np.bincount(ranked.item_codes[ranked.top_k(k) & (ranked.item_codes >= 0)])
+        recommended_counter_sorted = np.sort(recommended_counter[recommended_counter > 0])
         n_items = len(recommended_counter_sorted)
         index = np.arange(1, n_items + 1)
         return (np.sum((2 * index - n_items - 1) * recommended_counter_sorted)) / (
             (n_items - 1) * np.sum(recommended_counter_sorted)
         )
 
-    def get_coverage(
-        self,
-        k: int,
-        df: pd.DataFrame,
-        train_stats: pd.Series,
-        prediction_name: str,
-        item_name: str,
-    ):
-        return len(np.intersect1d(df[df[prediction_name] <= k][item_name].unique(), train_stats.index)) / len(
-            train_stats
-        )
+    def get_coverage(self, k: int, ranked: RankedInteractions, train_stats: pd.Series):
+        if ranked.items is None or ranked.item_codes is None:
+            raise ValueError("Item_id was not found in data.")
+        recommended = np.unique(ranked.item_codes[ranked.top_k(k) & (ranked.item_codes >= 0)])
+        return len(np.intersect1d(ranked.items[recommended], train_stats.index)) / len(train_stats)
 
     def calculate(self, data: InputData) -> PopularityBiasResult:
         train_result = self._train_stats.get_result()
         curr_user_interacted = train_result.current
         ref_user_interacted = train_result.reference
-        prediction_name = get_prediciton_name(data)
         col_user_id = data.data_definition.get_user_id_column()
         col_item_id = data.data_definition.get_item_id_column()
         recommendations_type = data.column_mapping.recom_type
         if col_user_id is None or col_item_id is None or recommendations_type is None:
             raise ValueError("user_id and item_id and recommendations_type should be specified")
-        user_id = col_user_id.column_name
-        item_id = col_item_id.column_name
-
-        current_data = data.current_data.copy()
-        if recommendations_type == RecomType.SCORE:
-            current_data[prediction_name] = current_data.groupby(user_id)[prediction_name].transform(
-                "rank", ascending=False
-            )
+        curr_ranked, ref_ranked = get_ranked_interactions(data, self.get_ranked_interactions_cache())
 
-        current_apr, current_distr_data = self.get_apr(
-            self.k,
-            current_data,
-            curr_user_interacted,
-            self.normalize_arp,
-            prediction_name,
-            user_id,
-            item_id,
-        )
-        curr_coverage = self.get_coverage(self.k, current_data, curr_user_interacted, prediction_name, item_id)
+        current_apr, current_distr_data = self.get_apr(self.k, curr_ranked, curr_user_interacted, self.normalize_arp)
+        curr_coverage = self.get_coverage(self.k, curr_ranked, curr_user_interacted)
 
-        curr_gini = self.get_gini(self.k, current_data, prediction_name, item_id)
+        curr_gini = self.get_gini(self.k, curr_ranked)
 
         reference_apr: Optional[float] = None
         ref_coverage: Optional[float] = None
         ref_gini: Optional[float] = None
         reference_distr_data: Optional[pd.Series] = None
-        if data.reference_data is not None:
-            reference_data = data.reference_data.copy()
-            if recommendations_type == RecomType.SCORE:
-                reference_data[prediction_name] = reference_data.groupby(user_id)[prediction_name].transform(
-                    "rank", ascending=False
-                )
+        if ref_ranked is not None and ref_ranked.items is not None:
             if ref_user_interacted is None:
                 ref_user_interacted = curr_user_interacted
 
             reference_apr, reference_distr_data = self.get_apr(
-                self.k,
-                reference_data,
-                ref_user_interacted,
-                self.normalize_arp,
-                prediction_name,
-                user_id,
-                item_id,
+                self.k, ref_ranked, ref_user_interacted, self.normalize_arp
             )
 
-            ref_coverage = reference_data[item_id].nunique() / len(ref_user_interacted)
-
-            ref_gini = self.get_gini(self.k, reference_data, prediction_name, item_id)
+            ref_coverage = len(ref_ranked.items) / len(ref_user_interacted)
+            ref_gini = self.get_gini(self.k, ref_ranked)
         current_distr, reference_distr = get_distribution_for_column(
             column_type="num",
             current=current_distr_data,
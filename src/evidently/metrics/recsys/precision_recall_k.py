@@ -3,12 +3,14 @@ from typing import List
 from typing import Optional
 
 import numpy as np
-import pandas as pd
 
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.calculations.recommender_systems import get_curr_and_ref_df
+from evidently.calculations.recommender_systems import top_k_last
+from evidently.calculations.recommender_systems import top_k_sums
+from evidently.calculations.recommender_systems import user_codes
 from evidently.core import IncludeTags
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
@@ -39,62 +41,39 @@ class PrecisionRecallCalculation(Metric[PrecisionRecallCalculationResult]):
         super().__init__(options=options)
 
     def get_precision_and_recall_dict(self, df, max_k):
-        user_df = df.groupby("users").target.agg(["size", "sum"])
-        user_df.columns = ["size", "all"]
-        max_k = min(user_df["size"].max(), max_k)
-        res = {}
-        for k in range(1, max_k + 1):
-            tp = df[df.preds <= k].groupby("users").target.agg(["sum", "last"])
-            tp.columns = [f"tp_{k}", f"rel_{k}"]
-            user_df = pd.concat([user_df, tp], axis=1).fillna(0)
-            user_df[f"precision_{k}"] = user_df[f"tp_{k}"] / np.minimum(user_df["size"], k)
-            user_df[f"recall_{k}"] = user_df[f"tp_{k}"] / user_df["all"]
-        user_df.replace([np.inf, -np.inf, np.nan], 0, inplace=True)
-        res["k"] = [k for k in range(1, max_k + 1)]
-        res["precision_include_no_feedback"] = list(user_df[[f"precision_{k}" for k in range(1, k + 1)]].mean())
-        res["precision"] = list(user_df.loc[user_df["all"] != 0, [f"precision_{k}" for k in range(1, k + 1)]].mean())
-        res["map_include_no_feedback"] = list(
-            user_df[[f"precision_{k}" for k in range(1, k + 1)]]
-            .multiply(user_df[[f"rel_{k}" for k in range(1, k + 1)]].values)
-            .expanding(axis=1)
-            .sum()
-            .divide(user_df["all"], axis=0)
-            .fillna(0)
-            .mean()
-        )
-        res["map"] = list(
-            user_df.loc[user_df["all"] != 0, [f"precision_{k}" for k in range(1, k + 1)]]
-            .multiply(user_df.loc[user_df["all"] != 0, [f"rel_{k}" for k in range(1, k + 1)]].values)
-            .expanding(axis=1)
-            .sum()
-            .divide(user_df.loc[user_df["all"] != 0, "all"], axis=0)
-            .fillna(0)
-            .mean()
-        )
-        res["recall_include_no_feedback"] = list(user_df[[f"recall_{k}" for k in range(1, k + 1)]].mean())
-        res["recall"] = list(user_df.loc[user_df["all"] != 0, [f"recall_{k}" for k in range(1, k + 1)]].mean())
-        res["mar_include_no_feedback"] = list(
-            user_df[[f"recall_{k}" for k in range(1, k + 1)]]
-            .multiply(user_df[[f"rel_{k}" for k in range(1, k + 1)]].values)
-            .expanding(axis=1)
-            .sum()
-            .divide(user_df["all"], axis=0)
-            .fillna(0)
-            .mean()
-        )
-        res["mar"] = list(
-            user_df.loc[user_df["all"] != 0, [f"recall_{k}" for k in range(1, k + 1)]]
-            .multiply(user_df.loc[user_df["all"] != 0, [f"rel_{k}" for k in range(1, k + 1)]].values)
-            .expanding(axis=1)
-            .sum()
-            .divide(user_df.loc[user_df["all"] != 0, "all"], axis=0)
-            .fillna(0)
-            .mean()
-        )
-        return res
+        users, n_users, known = user_codes(df["users"])
+        target = df["target"].to_numpy(dtype=float)[known]
+        preds = df["preds"].to_numpy(dtype=float)[known]
+        size = np.bincount(users, minlength=n_users)
+        all_ = np.bincount(users, weights=target, minlength=n_users)
+        max_k = int(min(size.max(), max_k))
+        ks = np.arange(1, max_k + 1)
+        tp = top_k_sums(users, preds, target, n_users, max_k)
+        rel = top_k_last(users, preds, target, n_users, max_k)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = _finite(tp / np.minimum(size[:, None], ks))
+            recall = _finite(tp / all_[:, None])
+            average_precision = np.cumsum(precision * rel, axis=1) / all_[:, None]
+            average_recall = np.cumsum(recall * rel, axis=1) / all_[:, None]
+        average_precision[np.isnan(average_precision)] = 0
+        average_recall[np.isnan(average_recall)] = 0
+        feedback = all_ != 0
+        return {
+            "k": ks.tolist(),
+            "precision_include_no_feedback": _users_mean(precision),
+            "precision": _users_mean(precision[feedback]),
+            "map_include_no_feedback": _users_mean(average_precision),
+            "map": _users_mean(average_precision[feedback]),
+            "recall_include_no_feedback": _users_mean(recall),
+            "recall": _users_mean(recall[feedback]),
+            "mar_include_no_feedback": _users_mean(average_recall),
+            "mar": _users_mean(average_recall[feedback]),
+        }
 
     def calculate(self, data: InputData) -> PrecisionRecallCalculationResult:
-        curr, ref = get_curr_and_ref_df(data, self.min_rel_score, True, True)
+        curr, ref = get_curr_and_ref_df(
+            data, self.min_rel_score, True, True, cache=self.get_ranked_interactions_cache()
+        )
         current = self.get_precision_and_recall_dict(curr, self.max_k)
         reference: Optional[dict] = None
         if ref is not None:
@@ -106,6 +85,18 @@ class PrecisionRecallCalculation(Metric[PrecisionRecallCalculationResult]):
         )
 
 
+def _finite(values: np.ndarray) -> np.ndarray:
+    values[~np.isfinite(values)] = 0
+    return values
+
+
+def _users_mean(values: np.ndarray) -> list:
+    """Mean over users of each k, nan if there are no users"""
+    if len(values) == 0:
+        return [np.nan] * values.shape[1]
+    return values.mean(axis=0).tolist()
+
+
 @default_renderer(wrap_type=PrecisionRecallCalculation)
 class PrecisionTopKMetricRenderer(MetricRenderer):
     def render_html(self, obj: PrecisionRecallCalculation) -> List[BaseWidgetInfo]:
@@ -8,7 +8,9 @@ from scipy.stats import entropy
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
+from evidently.calculations.ranked_interactions import RankedInteractions
 from evidently.calculations.recommender_systems import get_prediciton_name
+from evidently.calculations.recommender_systems import get_ranked_interactions
 from evidently.core import IncludeTags
 from evidently.metric_results import Distribution
 from evidently.metric_results import HistogramData
@@ -57,13 +59,9 @@ class ScoreDistribution(Metric[ScoreDistributionResult]):
         self.k = k
         super().__init__(options=options)
 
-    def get_distr(self, df, user_id, prediction_name):
-        df["rank"] = df.groupby(user_id)[prediction_name].transform("rank", ascending=False)
-        top_k = df.loc[df["rank"] <= self.k, prediction_name]
-        if self.k == df["rank"].max:
-            other: pd.Series = None
-        else:
-            other = df.loc[df["rank"] > self.k, prediction_name]
+    def get_distr(self, ranked: RankedInteractions, predictions: pd.Series):
+        top_k = predictions[ranked.top_k(self.k)]
+        other = predictions[ranked.ranks > self.k]
         top_k_distr, other_distr = get_distribution_for_column(column_type="num", current=top_k, reference=other)
         entropy_ = entropy(softmax(top_k))
         return top_k_distr, other_distr, entropy_
@@ -72,15 +70,19 @@ class ScoreDistribution(Metric[ScoreDistributionResult]):
         if data.column_mapping.recom_type == RecomType.RANK:
             raise ValueError("ScoreDistribution metric is only defined when recommendations_type equals 'scores'.")
         prediction_name = get_prediciton_name(data)
-        user_id = data.column_mapping.user_id
-        curr = data.current_data.copy()
-        current_top_k_distr, current_other_distr, curr_entropy = self.get_distr(curr, user_id, prediction_name)
+        curr_ranked, ref_ranked = get_ranked_interactions(
+            data, self.get_ranked_interactions_cache(), prediction_name, RecomType.SCORE
+        )
+        current_top_k_distr, current_other_distr, curr_entropy = self.get_distr(
+            curr_ranked, data.current_data[prediction_name]
+        )
         reference_top_k_distr: Optional[Distribution] = None
         reference_other_distr: Optional[Distribution] = None
         ref_entropy: Optional[float] = None
-        if data.reference_data is not None:
-            ref = data.reference_data.copy()
-            reference_top_k_distr, reference_other_distr, ref_entropy = self.get_distr(ref, user_id, prediction_name)
+        if ref_ranked is not None and data.reference_data is not None:
+            reference_top_k_distr, reference_other_distr, ref_entropy = self.get_distr(
+                ref_ranked, data.reference_data[prediction_name]
+            )
         return ScoreDistributionResult(
             k=self.k,
             current_top_k_distr=current_top_k_distr,
@@ -1,4 +1,3 @@
-from itertools import product
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -9,14 +8,15 @@ import pandas as pd
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
-from evidently.calculations.recommender_systems import get_prediciton_name
+from evidently.calculations.ranked_interactions import RankedInteractions
+from evidently.calculations.recommender_systems import get_ranked_interactions
+from evidently.calculations.recommender_systems import group_sums
 from evidently.core import IncludeTags
 from evidently.metric_results import Distribution
 from evidently.metric_results import HistogramData
 from evidently.metrics.recsys.pairwise_distance import PairwiseDistance
 from evidently.model.widget import BaseWidgetInfo
 from evidently.options.base import AnyOptions
-from evidently.pipeline.column_mapping import RecomType
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import default_renderer
 from evidently.renderers.html_widgets import CounterData
@@ -68,41 +68,43 @@ class SerendipityMetric(Metric[SerendipityMetricResult]):
     def get_serendipity(
         self,
         k: int,
-        df: pd.DataFrame,
-        recommendations_type: RecomType,
+        ranked: RankedInteractions,
         train_df: pd.DataFrame,
-        dist_matrix: np.ndarray,
-        prediction_name: str,
-        target_name: str,
+        item_vectors: np.ndarray,
         user_id: str,
         item_id: str,
         name_dict: Dict,
         min_rel_score: Optional[int],
     ):
-        df = df.copy()
-        if min_rel_score is not None:
-            df[target_name] = (df[target_name] >= min_rel_score).astype(int)
-        if recommendations_type == RecomType.SCORE:
-            df[prediction_name] = df.groupby(user_id)[prediction_name].transform("rank", ascending=False)
-        df = df.loc[(df[target_name] > 0) & (df[prediction_name] <= k), [user_id, item_id]]
-        all_users = df[user_id].unique()
-        all_users = np.intersect1d(all_users, train_df[user_id].unique())
-        user_res = []
-        for user in all_users:
-            user_train = train_df.loc[train_df[user_id] == user, item_id]
-            user_df = df.loc[df[user_id] == user, item_id]
-            res = 0
-            for i, j in product(user_train, user_df):
-                res += 1 - dist_matrix[name_dict[i], name_dict[j]]
-            user_res.append(1 - res / len(user_train))
+        recs = ranked.top_k(k) & ranked.relevant(min_rel_score)
+        rec_users = ranked.user_codes[recs]
+        rec_items = ranked.map_items(name_dict, recs)
+        train_users = ranked.users.get_indexer(train_df[user_id])
+        known = train_users >= 0
+        train_users = train_users[known]
+        train_items = train_df[item_id].map(name_dict).to_numpy()[known]
+        # users with both train and recommended items, last flag is for rows without user
+        common = np.zeros(len(ranked.users) + 1, dtype=bool)
+        common[np.intersect1d(rec_users, train_users)] = True
+        rec_common = common[rec_users]
+        train_common = common[train_users]
+        # group sums of both datasets are aligned as they have the same groups
+        _, _, rec_sums = group_sums(rec_users[rec_common], item_vectors[rec_items[rec_common].astype(int)])
+        _, train_sizes, train_sums = group_sums(
+            train_users[train_common], item_vectors[train_items[train_common].astype(int)]
+        )
+        # sum of cosine similarities of all (train item, recommended item) pairs is dot product of vector sums
+        user_res = 1 - np.einsum("ij,ij->i", train_sums, rec_sums) / train_sizes
         distr_data = pd.Series(user_res)
         value = np.mean(user_res)
         return distr_data, value
 
     def calculate(self, data: InputData) -> SerendipityMetricResult:
         result = self._pairwise_distance.get_result()
-        dist_matrix = result.dist_matrix
+        item_vectors = result.item_vectors
         name_dict = result.name_dict
+        if item_vectors is None:
+            raise ValueError("PairwiseDistance result should contain item vectors")
         target = data.data_definition.get_target_column()
         user_id = data.data_definition.get_user_id_column()
         item_id = data.data_definition.get_item_id_column()
@@ -117,37 +119,31 @@ class SerendipityMetric(Metric[SerendipityMetricResult]):
                 report.run(reference_data=reference_df, current_data=current_df, column_mapping=column_mapping,
                 additional_data={"current_train_data": current_train_df})"""
             )
-        prediction_name = get_prediciton_name(data)
+        curr_ranked, ref_ranked = get_ranked_interactions(data, self.get_ranked_interactions_cache())
         curr_distr_data, curr_value = self.get_serendipity(
-            df=data.current_data,
+            ranked=curr_ranked,
             train_df=current_train_data,
             k=self.k,
-            recommendations_type=recommendations_type,
             user_id=user_id.column_name,
             item_id=item_id.column_name,
-            prediction_name=prediction_name,
-            target_name=target.column_name,
-            dist_matrix=dist_matrix,
+            item_vectors=item_vectors,
             name_dict=name_dict,
             min_rel_score=self.min_rel_score,
         )
 
         ref_distr_data: Optional[pd.Series] = None
         ref_value: Optional[float] = None
-        if data.reference_data is not None:
+        if ref_ranked is not None:
             reference_train = current_train_data
             if reference_train_data is not None:
                 reference_train = reference_train_data
             ref_distr_data, ref_value = self.get_serendipity(
-                df=data.reference_data,
+                ranked=ref_ranked,
                 train_df=reference_train,
                 k=self.k,
-                recommendations_type=recommendations_type,
                 user_id=user_id.column_name,
                 item_id=item_id.column_name,
-                prediction_name=prediction_name,
-                target_name=target.column_name,
-                dist_matrix=dist_matrix,
+                item_vectors=item_vectors,
                 name_dict=name_dict,
                 min_rel_score=self.min_rel_score,
             )
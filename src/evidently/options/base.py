@@ -10,6 +10,7 @@ from evidently._pydantic_compat import BaseModel
 from evidently.options import ColorOptions
 from evidently.options.agg_data import DataDefinitionOptions
 from evidently.options.agg_data import RenderOptions
+from evidently.options.execution import ExecutionOptions
 from evidently.options.option import Option
 
 if TYPE_CHECKING:
@@ -24,6 +25,7 @@ class Options(BaseModel):
     render: Optional[RenderOptions] = None
     custom: Dict[Type[Option], Option] = {}
     data_definition: Optional[DataDefinitionOptions] = None
+    execution: Optional[ExecutionOptions] = None
 
     @property
     def color_options(self) -> ColorOptions:
@@ -37,6 +39,10 @@ class Options(BaseModel):
     def data_definition_options(self) -> DataDefinitionOptions:
         return self.data_definition or DataDefinitionOptions()
 
+    @property
+    def execution_options(self) -> ExecutionOptions:
+        return self.execution or ExecutionOptions()
+
     def get(self, option_type: Type[TypeParam]) -> TypeParam:
         if option_type in _option_cls_mapping:
             res = getattr(self, _option_cls_mapping[option_type])
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from evidently.options.option import Option
+
+
+class ExecutionOptions(Option):
+    """Options controlling how metric calculations are executed.
+
+    Args:
+        parallel: calculate independent metrics concurrently, also pairs of columns of Cramér's V correlation matrix.
+        max_workers: pool size for parallel execution, `None` lets the executor decide.
+        use_processes: use a process pool instead of a thread pool.
+            Metrics, their context and input data should be picklable in this case.
+        profile: record time and memory spent on each calculation step into run metadata.
+        profile_memory: track peak allocated memory while profiling, adds overhead to calculations.
+        feature_cache_path: path to file with cache of generated feature values shared between runs,
+            values are calculated only for rows with new inputs. Cache is disabled if not set.
+        feature_cache_max_size: maximum size of feature cache in bytes, least recently used values are evicted.
+    """
+
+    parallel: bool = False
+    max_workers: Optional[int] = None
+    use_processes: bool = False
+    profile: bool = False
+    profile_memory: bool = True
+    feature_cache_path: Optional[str] = None
+    feature_cache_max_size: int = 1024**3
@@ -0,0 +1,63 @@
+"""Current dataset that is read and processed by chunks."""
+
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+class ChunkedData:
+    """Current dataset split into chunks, can be passed to `Report.run` as `current_data`.
+
+    Only one chunk is processed at a time: metrics are calculated for each chunk and their results are merged,
+    so all metrics of the report should support exact merging of results (see `Metric.is_mergeable`).
+    For now these are DatasetMissingValuesMetric, ColumnMissingValuesMetric, ClassificationConfusionMatrix
+    without top-k and ColumnValueListMetric. Metrics with quantiles, unique values, duplicates or histograms with bins
+    chosen by current data (e.g. ColumnSummaryMetric, DatasetSummaryMetric, ColumnValueRangeMetric) cannot be merged.
+    Data definition is inferred from reference data and the first chunk. Test suites do not accept chunked data.
+
+    Args:
+        chunks: DataFrames with the same columns or function that returns them, function can be called
+            several times, so the data can be read again.
+    """
+
+    def __init__(self, chunks: Union[Iterable[pd.DataFrame], Callable[[], Iterable[pd.DataFrame]]]):
+        self._chunks = chunks
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        chunks = self._chunks() if callable(self._chunks) else self._chunks
+        for chunk in chunks:
+            if len(chunk) > 0:
+                yield chunk
+
+    @classmethod
+    def from_parquet(
+        cls, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, columns: Optional[List[str]] = None
+    ) -> "ChunkedData":
+        """Read parquet file by batches of `chunk_size` rows"""
+
+        def read() -> Iterator[pd.DataFrame]:
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+                yield batch.to_pandas()
+
+        return cls(read)
+
+    @classmethod
+    def from_csv(cls, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, **read_csv_kwargs: Any) -> "ChunkedData":
+        """Read CSV file by chunks of `chunk_size` rows, other arguments are passed to `pd.read_csv`"""
+
+        def read() -> Iterator[pd.DataFrame]:
+            with pd.read_csv(path, chunksize=chunk_size, **read_csv_kwargs) as reader:
+                yield from reader
+
+        return cls(read)
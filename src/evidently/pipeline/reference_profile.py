@@ -0,0 +1,203 @@
+"""Reference dataset with statistics that are calculated once and reused by runs with different current data."""
+
+import dataclasses
+import json
+from enum import Enum
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from evidently.pipeline.column_mapping import ColumnMapping
+
+_FORMAT_VERSION = 2
+_METADATA_KEY = b"evidently_reference_profile"
+_TYPE = "__type__"
+
+
+class ReferenceProfile:
+    """Reference dataset prepared for repeated runs.
+
+    Pass profile to `Report.run` or `TestSuite.run` as `reference_data`: basic statistics of reference columns
+    (counts, unique values, value counts, quantiles, histograms) are taken from the profile instead of being
+    calculated in every run. Statistics that are missing in the profile are calculated by the first run
+    that needs them and stored in the profile as well.
+    Stattests need reference values themselves, so the profile keeps reference data too.
+
+    Args:
+        data: reference dataset.
+        column_mapping: column mapping for runs without their own column mapping.
+        statistics: previously calculated statistics of reference columns.
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        column_mapping: Optional[ColumnMapping] = None,
+        statistics: Optional[Dict[Hashable, Any]] = None,
+    ):
+        self.data = data
+        self.column_mapping = column_mapping
+        self.statistics: Dict[Hashable, Any] = statistics if statistics is not None else {}
+        # runs can add columns to reference data, statistics are kept only for the original ones
+        self.columns: List[str] = [column for column in data.columns if isinstance(column, str)]
+
+    @classmethod
+    def build(
+        cls,
+        data: pd.DataFrame,
+        column_mapping: Optional[ColumnMapping] = None,
+        metrics: Optional[Sequence] = None,
+    ) -> "ReferenceProfile":
+        """Create profile and calculate reference statistics used by given metrics and presets.
+
+        By default statistics used by data drift and data quality presets are calculated.
+        """
+        from evidently.metric_preset import DataDriftPreset
+        from evidently.metric_preset import DataQualityPreset
+        from evidently.report import Report
+
+        profile = cls(data, column_mapping)
+        report = Report(metrics=list(metrics) if metrics is not None else [DataDriftPreset(), DataQualityPreset()])
+        report.run(reference_data=profile, current_data=data, column_mapping=column_mapping)
+        return profile
+
+    def save(self, path: str):
+        """Save profile to a parquet file with reference data, statistics are stored as json in file metadata.
+
+        Statistics of types that cannot be stored as json (e.g. values with pandas extension dtypes) are skipped,
+        they are calculated again by the first run that needs them.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        statistics = []
+        for key, value in self.statistics.items():
+            # derived columns (e.g. finite values) are cheap to calculate and as large as the column itself
+            if isinstance(key, tuple) and len(key) > 1 and key[-2] == "finite":
+                continue
+            try:
+                statistics.append([_encode(key), _encode(value)])
+            except _NotEncodable:
+                continue
+        profile = {
+            "version": _FORMAT_VERSION,
+            "column_mapping": None if self.column_mapping is None else _encode(dataclasses.asdict(self.column_mapping)),
+            "columns": self.columns,
+            "statistics": statistics,
+        }
+        table = pa.Table.from_pandas(self.data)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_METADATA_KEY] = json.dumps(profile).encode()
+        pq.write_table(table.replace_schema_metadata(metadata), path)
+
+    @classmethod
+    def load(cls, path: str) -> "ReferenceProfile":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        metadata = (table.schema.metadata or {}).get(_METADATA_KEY)
+        if metadata is None:
+            raise ValueError(f"'{path}' is not a reference profile")
+        payload = json.loads(metadata)
+        if payload.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported reference profile version {payload.get('version')} in '{path}'")
+        column_mapping = payload["column_mapping"]
+        profile = cls(
+            table.to_pandas(),
+            None if column_mapping is None else ColumnMapping(**_decode(column_mapping)),
+            {_decode(key): _decode(value) for key, value in payload["statistics"]},
+        )
+        profile.columns = payload["columns"]
+        return profile
+
+
+class _NotEncodable(Exception):
+    pass
+
+
+def _encode_array(value: np.ndarray) -> dict:
+    if value.ndim != 1:
+        raise _NotEncodable()
+    if value.dtype.kind in "biufU":
+        values = value.tolist()
+    elif value.dtype.kind in "mM":
+        values = value.view("i8").tolist()
+    elif value.dtype.kind == "O":
+        values = [_encode(item) for item in value]
+    else:
+        raise _NotEncodable()
+    return {_TYPE: "array", "dtype": value.dtype.str, "values": values}
+
+
+def _decode_array(value: dict) -> np.ndarray:
+    dtype = np.dtype(value["dtype"])
+    if dtype.kind in "mM":
+        return np.array(value["values"], dtype="i8").view(dtype)
+    if dtype.kind == "O":
+        result = np.empty(len(value["values"]), dtype=object)
+        result[:] = [_decode(item) for item in value["values"]]
+        return result
+    return np.array(value["values"], dtype=dtype)
+
+
+def _encode(value: Any) -> Any:
+    """Encode statistic value or key to json with type tags, only numpy and pandas types used by statistics"""
+    # numpy scalars are subclasses of python ones, they keep their dtype
+    if value is None or type(value) in (bool, int, float, str):
+        return value
+    if isinstance(value, tuple):
+        return {_TYPE: "tuple", "values": [_encode(item) for item in value]}
+    if isinstance(value, list):
+        return {_TYPE: "list", "values": [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        return {_TYPE: "dict", "items": [[_encode(key), _encode(item)] for key, item in value.items()]}
+    if isinstance(value, Enum):
+        return _encode(value.value)
+    if isinstance(value, np.ndarray):
+        return _encode_array(value)
+    if isinstance(value, np.generic):
+        return {_TYPE: "scalar", "array": _encode_array(np.array([value]))}
+    if isinstance(value, pd.Timestamp):
+        return {_TYPE: "timestamp", "value": value.isoformat()}
+    if isinstance(value, pd.Series):
+        # extension dtypes (e.g. categorical) and multiindexes are not restored by numpy arrays
+        if not isinstance(value.dtype, np.dtype) or not isinstance(value.index.dtype, np.dtype):
+            raise _NotEncodable()
+        if isinstance(value.index, pd.MultiIndex):
+            raise _NotEncodable()
+        return {
+            _TYPE: "series",
+            "values": _encode_array(value.to_numpy()),
+            "index": _encode_array(value.index.to_numpy()),
+            "name": _encode(value.name),
+            "index_name": _encode(value.index.name),
+        }
+    raise _NotEncodable()
+
+
+def _decode(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    kind = value[_TYPE]
+    if kind == "tuple":
+        return tuple(_decode(item) for item in value["values"])
+    if kind == "list":
+        return [_decode(item) for item in value["values"]]
+    if kind == "dict":
+        return {_decode(key): _decode(item) for key, item in value["items"]}
+    if kind == "array":
+        return _decode_array(value)
+    if kind == "scalar":
+        return _decode_array(value["array"])[0]
+    if kind == "timestamp":
+        return pd.Timestamp(value["value"])
+    if kind == "series":
+        index = pd.Index(_decode_array(value["index"]), name=_decode(value["index_name"]))
+        return pd.Series(_decode_array(value["values"]), index=index, name=_decode(value["name"]))
+    raise ValueError(f"Unknown statistic value type {kind}")
@@ -1,9 +1,11 @@
 import dataclasses
+import itertools
 import warnings
 from collections import defaultdict
 from datetime import datetime
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Type
@@ -24,7 +26,9 @@ from evidently.model.widget import AdditionalGraphInfo
 from evidently.model.widget import BaseWidgetInfo
 from evidently.model.widget import set_source_fingerprint
 from evidently.options.base import AnyOptions
+from evidently.pipeline.chunked_data import ChunkedData
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.reference_profile import ReferenceProfile
 from evidently.renderers.base_renderer import DetailsInfo
 from evidently.renderers.base_renderer import WidgetIdGenerator
 from evidently.renderers.base_renderer import replace_widgets_ids
@@ -92,9 +96,19 @@ class Report(ReportBase):
         additional_data: Dict[str, Any] = None,
         timestamp: Optional[datetime] = None,
     ) -> None:
+        reference_profile = None
+        if isinstance(reference_data, ReferenceProfile):
+            reference_profile = reference_data
+            reference_data = reference_profile.data
+            column_mapping = column_mapping or reference_profile.column_mapping
         if column_mapping is None:
             column_mapping = ColumnMapping()
 
+        chunks: Optional[Iterator[pd.DataFrame]] = None
+        if isinstance(current_data, ChunkedData):
+            # data definition is inferred from the first chunk, the rest are read while calculating
+            chunks = iter(current_data)
+            current_data = next(chunks, None)
         if current_data is None:
             raise ValueError("Current dataset should be present")
         self.id = new_id()
@@ -104,6 +118,8 @@ class Report(ReportBase):
             self.timestamp = timestamp or datetime.now()
         self._first_level_metrics = []
         self._inner_suite.reset()
+        if reference_profile is not None:
+            self._inner_suite.context.use_reference_profile(reference_profile)
         self._inner_suite.set_engine(PythonEngine() if engine is None else engine())
 
         if self._inner_suite.context.engine is None:
@@ -160,6 +176,14 @@ class Report(ReportBase):
             else:
                 raise ValueError("Incorrect item instead of a metric or metric preset was passed to Report")
 
+        if chunks is not None:
+            self._inner_suite.run_calculate_chunks(
+                GenericInputData(
+                    reference_data, chunk, column_mapping, data_definition, additional_data=additional_data or {}
+                )
+                for chunk in itertools.chain([current_data], chunks)
+            )
+            return
         data = GenericInputData(
             reference_data, current_data, column_mapping, data_definition, additional_data=additional_data or {}
         )
@@ -1,4 +1,5 @@
 import abc
+import contextlib
 import copy
 import dataclasses
 import json
@@ -7,14 +8,17 @@ from datetime import datetime
 from typing import IO
 from typing import Any
 from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
 
+import pandas as pd
 import ujson
 
 import evidently
@@ -27,15 +31,24 @@ from evidently.base_metric import Metric
 from evidently.base_metric import MetricResult
 from evidently.calculation_engine.engine import Engine
 from evidently.calculation_engine.engine import EngineDatasets
+from evidently.calculations.column_statistics import ColumnStatisticsCache
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
+from evidently.calculations.run_cache import RunCache
 from evidently.core import IncludeOptions
+from evidently.core import new_id
 from evidently.features.generated_features import FeatureResult
 from evidently.features.generated_features import GeneratedFeatures
 from evidently.options.base import AnyOptions
 from evidently.options.base import Options
+from evidently.pipeline.reference_profile import ReferenceProfile
+from evidently.pydantic_utils import EvidentlyBaseModel
 from evidently.renderers.base_renderer import DEFAULT_RENDERERS
 from evidently.renderers.base_renderer import MetricRenderer
 from evidently.renderers.base_renderer import RenderersDefinitions
 from evidently.renderers.base_renderer import TestRenderer
+from evidently.suite import snapshot_format
+from evidently.suite.snapshot_format import SnapshotFormat
 from evidently.tests.base_test import Test
 from evidently.tests.base_test import TestParameters
 from evidently.tests.base_test import TestResult
@@ -55,6 +68,10 @@ from evidently.utils.dashboard import save_data_file
 from evidently.utils.dashboard import save_lib_files
 from evidently.utils.data_preprocessing import DataDefinition
 from evidently.utils.data_preprocessing import FeatureDefinition
+from evidently.utils.profiling import ProfileKind
+from evidently.utils.profiling import ProfileRecord
+from evidently.utils.profiling import get_profile_summary
+from evidently.utils.profiling import profile
 
 USE_UJSON = False
 
@@ -101,6 +118,7 @@ def _discover_dependencies(test: Union[Metric, Test]) -> Iterator[Tuple[str, Uni
 
 class RunMetadata(BaseModel):
     descriptors: Dict[str, FeatureDefinition] = {}
+    profile: List[ProfileRecord] = []
 
 
 @dataclasses.dataclass
@@ -119,6 +137,8 @@ class Context:
     options: Options = Options()
     data_definition: Optional["DataDefinition"] = None
     run_metadata: RunMetadata = dataclasses.field(default_factory=RunMetadata)
+    column_statistics: ColumnStatisticsCache = dataclasses.field(default_factory=ColumnStatisticsCache)
+    run_cache: RunCache = dataclasses.field(default_factory=RunCache)
 
     def get_data_definition(
         self,
@@ -130,14 +150,42 @@ class Context:
         if self.data_definition is None:
             if self.engine is None:
                 raise ValueError("Cannot create data definition when engine is not set")
-            self.data_definition = self.engine.get_data_definition(
-                current_data,
-                reference_data,
-                column_mapping,
-                categorical_features_cardinality,
-            )
+            with self.profile(ProfileKind.DATA_DEFINITION, DataDefinition.__name__):
+                self.data_definition = self.engine.get_data_definition(
+                    current_data,
+                    reference_data,
+                    column_mapping,
+                    categorical_features_cardinality,
+                )
         return self.data_definition
 
+    @contextlib.contextmanager
+    def profile(self, kind: ProfileKind, name: str, source: Optional[EvidentlyBaseModel] = None) -> Iterator[None]:
+        """Record resources spent on enclosed block to run metadata if profiling is enabled in options"""
+        execution_options = self.options.execution_options
+        with profile(
+            kind,
+            name,
+            source.get_fingerprint() if source is not None and execution_options.profile else None,
+            enabled=execution_options.profile,
+            track_memory=execution_options.profile_memory,
+        ) as record:
+            yield
+        if record is not None:
+            self.add_profile_record(record)
+
+    def clear_cache(self, dataset: Optional[str] = None):
+        """Remove values calculated from data of the run, only of given dataset if it is set"""
+        self.column_statistics.clear(dataset)
+        self.run_cache.clear(dataset)
+
+    def use_reference_profile(self, reference_profile: ReferenceProfile):
+        """Take statistics of reference columns from the profile and store new ones there"""
+        self.column_statistics.share(REFERENCE, reference_profile.statistics, reference_profile.columns)
+
+    def add_profile_record(self, record: ProfileRecord):
+        self.run_metadata.profile.append(record)
+
     def get_datasets(self) -> EngineDatasets:
         if self.engine is None:
             raise ValueError("Cannot get datasets when engine is not set")
@@ -425,6 +473,38 @@ class Suite:
 
         self.context.state = States.Calculated
 
+    def run_calculate_chunks(self, chunks: Iterable[GenericInputData]):
+        """Calculate metrics for each chunk of current data and merge results of all chunks"""
+        if self.context.state in [States.Init]:
+            self.verify()
+
+        if self.context.state in [States.Calculated, States.Tested]:
+            return
+
+        not_mergeable = sorted({type(metric).__name__ for metric in self.context.metrics if not metric.is_mergeable()})
+        if not_mergeable:
+            raise ValueError(f"Metrics {', '.join(not_mergeable)} cannot be calculated on chunked current data")
+
+        metric_results: Dict[Metric, Union[MetricResult, ErrorResult]] = {}
+        for data in chunks:
+            self.context.metric_results = {}
+            if self.context.engine is not None:
+                self.context.engine.execute_metrics(self.context, data)
+            for metric, result in self.context.metric_results.items():
+                merged = metric_results.get(metric)
+                if merged is None or isinstance(result, ErrorResult):
+                    metric_results[metric] = result
+                elif not isinstance(merged, ErrorResult):
+                    try:
+                        metric_results[metric] = merged.merge(result)
+                    except BaseException as ex:
+                        metric_results[metric] = ErrorResult(ex)
+            # values calculated from the chunk are not needed for next chunks
+            self.context.clear_cache(CURRENT)
+
+        self.context.metric_results = metric_results
+        self.context.state = States.Calculated
+
     def run_checks(self):
         if self.context.state in [States.Init, States.Verified]:
             raise ExecutionError("No calculation was made, run 'run_calculate' first'")
@@ -434,7 +514,8 @@ class Suite:
         for test in self.context.tests:
             try:
                 logging.debug(f"Executing {type(test)}...")
-                test_result = test.check()
+                with self.context.profile(ProfileKind.TEST, type(test).__name__, test):
+                    test_result = test.check()
                 if not test.is_critical and test_result.status == TestStatus.FAIL:
                     test_result.status = TestStatus.WARNING
                 test_results[test] = test_result
@@ -514,7 +595,11 @@ class Snapshot(BaseModel):
     options: Options
     links: SnapshotLinks = SnapshotLinks()
 
-    def save(self, filename):
+    def save(self, filename, format: SnapshotFormat = SnapshotFormat.JSON):
+        if format == SnapshotFormat.BINARY:
+            with open(filename, "wb") as f:
+                f.write(self.dumps(format))
+            return
         with open(filename, "w") as f:
             if USE_UJSON:
                 ujson.dump(self.dict(), f, indent=2, default=NumpyEncoder().default)
@@ -523,13 +608,77 @@ class Snapshot(BaseModel):
 
     @classmethod
     def load(cls, filename):
-        with open(filename, "r") as f:
-            return parse_obj_as(Snapshot, json.load(f))
+        """Load snapshot saved in any format"""
+        with open(filename, "rb") as f:
+            return cls.loads(f.read())
+
+    def dumps(self, format: SnapshotFormat = SnapshotFormat.JSON) -> Union[str, bytes]:
+        if format == SnapshotFormat.BINARY:
+            return snapshot_format.encode_binary(self.dict())
+        return json.dumps(self.dict(), cls=NumpyEncoder)
+
+    @classmethod
+    def loads(cls, data: Union[str, bytes]) -> "Snapshot":
+        """Parse snapshot from json or binary representation"""
+        return parse_obj_as(Snapshot, snapshot_format.decode(data))
 
     @property
     def is_report(self):
         return len(self.metrics_ids) > 0
 
+    @classmethod
+    def merge(cls, snapshots: Sequence["Snapshot"], timestamp: Optional[datetime] = None) -> "Snapshot":
+        """Combine report snapshots calculated for different parts of current data, e.g. for consecutive periods.
+
+        Results of the metrics are merged with `MetricResult.merge`, so the combined snapshot has the same results
+        as a report calculated on all parts at once. Reports should have the same metrics and reference data.
+        Name, metadata, tags and options are taken from the first snapshot, timestamp is the latest one if not set.
+        """
+        if len(snapshots) == 0:
+            raise ValueError("No snapshots to merge")
+        if any(not snapshot.is_report or len(snapshot.test_ids) > 0 for snapshot in snapshots):
+            raise ValueError("Only report snapshots can be merged")
+        first = snapshots[0]
+        # parameters of a metric (e.g. top-k) can make it not mergeable even if its result type is
+        not_mergeable = sorted({type(metric).__name__ for metric in first.suite.metrics if not metric.is_mergeable()})
+        if not_mergeable:
+            raise ValueError(f"Results of {', '.join(not_mergeable)} cannot be merged")
+        fingerprints = [metric.get_fingerprint() for metric in first.suite.metrics]
+        first_level = [fingerprints[i] for i in first.metrics_ids]
+        metric_results = list(first.suite.metric_results)
+        for snapshot in snapshots[1:]:
+            results = {
+                metric.get_fingerprint(): result
+                for metric, result in zip(snapshot.suite.metrics, snapshot.suite.metric_results)
+            }
+            snapshot_first_level = [snapshot.suite.metrics[i].get_fingerprint() for i in snapshot.metrics_ids]
+            if results.keys() != set(fingerprints) or snapshot_first_level != first_level:
+                raise ValueError(f"Snapshot {snapshot.id} has different metrics than snapshot {first.id}")
+            for i, (metric, fingerprint) in enumerate(zip(first.suite.metrics, fingerprints)):
+                result, other = metric_results[i], results[fingerprint]
+                if isinstance(result, ErrorResult) or isinstance(other, ErrorResult):
+                    raise ValueError(f"Cannot merge snapshots with calculation error in {type(metric).__name__}")
+                metric_results[i] = result.merge(other)
+
+        return Snapshot(
+            id=new_id(),
+            name=first.name,
+            timestamp=timestamp or max(snapshot.timestamp for snapshot in snapshots),
+            metadata=dict(first.metadata),
+            tags=list(first.tags),
+            suite=ContextPayload(
+                metrics=first.suite.metrics,
+                metric_results=metric_results,
+                tests=[],
+                test_results=[],
+                options=first.suite.options,
+                data_definition=first.suite.data_definition,
+                run_metadata=RunMetadata(descriptors=first.suite.run_metadata.descriptors),
+            ),
+            metrics_ids=list(first.metrics_ids),
+            options=first.options,
+        )
+
     def as_report(self):
         from evidently.report import Report
 
@@ -641,3 +790,11 @@ class ReportBase(Display, Runnable):
 
     def has_descriptors(self) -> bool:
         return bool(self._inner_suite.context.run_metadata.descriptors)
+
+    def get_profile(self) -> List[ProfileRecord]:
+        """Resources spent on each calculation step, recorded if `ExecutionOptions.profile` is enabled"""
+        return self._inner_suite.context.run_metadata.profile
+
+    def get_profile_summary(self) -> pd.DataFrame:
+        """Profile records aggregated by calculation step and sorted by elapsed time"""
+        return get_profile_summary(self.get_profile())
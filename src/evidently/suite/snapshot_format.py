@@ -0,0 +1,150 @@
+"""Binary encoding of snapshots.
+
+Numeric arrays (numpy arrays, numeric pandas series, indexes and dataframe columns, long lists of numbers)
+are stored as raw buffers, the rest of the snapshot is stored as zlib-compressed compact json.
+Decoded snapshot dict is the same as the one parsed from json representation.
+
+Layout: `MAGIC | skeleton length (8 bytes, little endian) | compressed json skeleton | array buffers`.
+Arrays are replaced in skeleton with `{"__evidently_array__": [offset, dtype, shape]}`, dataframes
+(stored in json as `DataFrame.to_dict()`) with `{"__evidently_frame__": [columns, index, index keys type, values]}`.
+"""
+
+import json
+import struct
+import zlib
+from enum import Enum
+from typing import Any
+from typing import List
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from evidently.utils import NumpyEncoder
+
+MAGIC = b"EVSNAPB1"
+_ARRAY_KEY = "__evidently_array__"
+_FRAME_KEY = "__evidently_frame__"
+_LENGTH = struct.Struct("<Q")
+# smaller arrays are kept in json
+_MIN_ARRAY_SIZE = 16
+_ALIGNMENT = 8
+_NUMERIC_KINDS = "biuf"
+
+
+class SnapshotFormat(Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+
+class _ArrayWriter:
+    def __init__(self):
+        self.buffers: List[bytes] = []
+        self.offset = 0
+
+    def add(self, array: np.ndarray) -> dict:
+        array = np.ascontiguousarray(array)
+        offset = self.offset
+        data = array.tobytes()
+        padding = -len(data) % _ALIGNMENT
+        self.buffers.append(data + b"\0" * padding)
+        self.offset += len(data) + padding
+        return {_ARRAY_KEY: [offset, array.dtype.str, list(array.shape)]}
+
+    def add_frame(self, frame: pd.DataFrame) -> Any:
+        # json object keys are strings, so only frames with string or integer labels keep the same keys
+        if not all(isinstance(column, str) for column in frame.columns) or not frame.columns.is_unique:
+            return frame
+        if frame.index.dtype.kind in "iu":
+            index_type = "int"
+        elif frame.index.dtype == object and all(isinstance(label, str) for label in frame.index):
+            index_type = "str"
+        else:
+            return frame
+        values = [self.encode(frame[column]) for column in frame.columns]
+        index = self.add(frame.index.to_numpy()) if index_type == "int" else frame.index.tolist()
+        return {_FRAME_KEY: [list(frame.columns), index, index_type, values]}
+
+    def encode(self, obj: Any) -> Any:
+        if isinstance(obj, dict):
+            return {key: self.encode(value) for key, value in obj.items()}
+        if isinstance(obj, pd.DataFrame):
+            if len(obj) >= _MIN_ARRAY_SIZE:
+                return self.add_frame(obj)
+            return obj
+        if isinstance(obj, (pd.Series, pd.Index)):
+            # values of extension dtypes (e.g. nullable integers) are not converted to the same python values
+            if len(obj) >= _MIN_ARRAY_SIZE and isinstance(obj.dtype, np.dtype) and obj.dtype.kind in _NUMERIC_KINDS:
+                return self.add(obj.to_numpy())
+            return obj
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.kind in _NUMERIC_KINDS and obj.size >= _MIN_ARRAY_SIZE:
+                return self.add(obj)
+            return obj
+        if isinstance(obj, (list, tuple)):
+            if len(obj) >= _MIN_ARRAY_SIZE:
+                array = _homogeneous_array(obj)
+                if array is not None:
+                    return self.add(array)
+            return [self.encode(value) for value in obj]
+        return obj
+
+
+def _homogeneous_array(values: Union[list, tuple]):
+    # only lists of values of the same type are stored as arrays, so they are decoded to the same values
+    value_type = type(values[0])
+    if value_type not in (float, int, bool) or any(type(value) is not value_type for value in values):
+        return None
+    try:
+        return np.array(values, dtype=np.int64 if value_type is int else value_type)
+    except OverflowError:
+        return None
+
+
+def encode_binary(data: dict) -> bytes:
+    """Binary representation of snapshot dict (result of `Snapshot.dict()`)"""
+    writer = _ArrayWriter()
+    skeleton = zlib.compress(json.dumps(writer.encode(data), cls=NumpyEncoder, separators=(",", ":")).encode("utf-8"))
+    return b"".join([MAGIC, _LENGTH.pack(len(skeleton)), skeleton, *writer.buffers])
+
+
+def is_binary(data: bytes) -> bool:
+    return data[: len(MAGIC)] == MAGIC
+
+
+def decode_prefix(data: bytes, size: int) -> bytes:
+    """First `size` bytes of json representation of snapshot, `data` may be a prefix of snapshot bytes"""
+    if not is_binary(data):
+        return data[:size]
+    skeleton_start = len(MAGIC) + _LENGTH.size
+    try:
+        return zlib.decompressobj().decompress(data[skeleton_start:], size)
+    except zlib.error:
+        return b""
+
+
+def decode(data: Union[str, bytes]) -> dict:
+    """Snapshot dict from json or binary representation"""
+    if isinstance(data, str) or not is_binary(data):
+        return json.loads(data)
+    (skeleton_length,) = _LENGTH.unpack_from(data, len(MAGIC))
+    skeleton_start = len(MAGIC) + _LENGTH.size
+    buffers_start = skeleton_start + skeleton_length
+    buffer = memoryview(data)[buffers_start:]
+
+    def object_hook(obj: dict):
+        if len(obj) != 1:
+            return obj
+        if _FRAME_KEY in obj:
+            columns, index, index_type, values = obj[_FRAME_KEY]
+            if index_type == "int":
+                index = [str(label) for label in index]
+            return {column: dict(zip(index, column_values)) for column, column_values in zip(columns, values)}
+        if _ARRAY_KEY not in obj:
+            return obj
+        offset, dtype, shape = obj[_ARRAY_KEY]
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape).tolist()
+
+    return json.loads(zlib.decompress(data[skeleton_start:buffers_start]), object_hook=object_hook)
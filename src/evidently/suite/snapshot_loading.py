@@ -0,0 +1,140 @@
+"""Loading of many snapshot files, optionally in several processes."""
+
+import datetime
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+
+from fsspec import AbstractFileSystem
+
+from evidently._pydantic_compat import ValidationError
+from evidently.suite.base_suite import Snapshot
+from evidently.suite.snapshot_format import decode_prefix
+
+T = TypeVar("T")
+
+# snapshot json starts with id, name and timestamp fields (see `Snapshot` fields order)
+_TIMESTAMP_PREFIX = re.compile(
+    rb'^\s*\{\s*"id"\s*:\s*"[^"]*"\s*,\s*"name"\s*:\s*(?:null|"(?:[^"\\]|\\.)*")\s*,\s*"timestamp"\s*:\s*"([^"]+)"'
+)
+_PREFIX_SIZE = 4096
+
+
+def peek_timestamp(data: bytes) -> Optional[datetime.datetime]:
+    """Timestamp of snapshot read from the beginning of its file without parsing it, None if it cannot be found"""
+    match = _TIMESTAMP_PREFIX.match(decode_prefix(data, _PREFIX_SIZE))
+    if match is None:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(match.group(1).decode("utf-8"))
+    except ValueError:
+        return None
+
+
+def _in_range(
+    timestamp: datetime.datetime, date_from: Optional[datetime.datetime], date_to: Optional[datetime.datetime]
+) -> bool:
+    return (date_from is None or timestamp >= date_from) and (date_to is None or timestamp <= date_to)
+
+
+def _open(fs: Optional[AbstractFileSystem], path: str):
+    if fs is None:
+        return open(path, "rb")
+    return fs.open(path, "rb")
+
+
+def load_snapshot_file(
+    path: str,
+    fs: Optional[AbstractFileSystem] = None,
+    date_from: Optional[datetime.datetime] = None,
+    date_to: Optional[datetime.datetime] = None,
+) -> Optional[Snapshot]:
+    """Load snapshot from file in any format, None if its timestamp is not in [date_from, date_to] range.
+
+    Timestamp is checked before the snapshot is parsed when possible.
+    """
+    with _open(fs, path) as f:
+        data = f.read(_PREFIX_SIZE)
+        if date_from is not None or date_to is not None:
+            timestamp = peek_timestamp(data)
+            if timestamp is not None and not _in_range(timestamp, date_from, date_to):
+                return None
+        data += f.read()
+    snapshot = Snapshot.loads(data)
+    if not _in_range(snapshot.timestamp, date_from, date_to):
+        return None
+    return snapshot
+
+
+_Task = Tuple[
+    str,
+    Optional[AbstractFileSystem],
+    Optional[datetime.datetime],
+    Optional[datetime.datetime],
+    Optional[Callable[[Snapshot], T]],
+]
+
+
+def _load_in_worker(task: _Task) -> Tuple[Optional[T], Optional[str]]:
+    path, fs, date_from, date_to, convert = task
+    try:
+        snapshot = load_snapshot_file(path, fs, date_from, date_to)
+    except ValidationError as e:
+        # validation errors cannot be pickled
+        return None, str(e)
+    if snapshot is None or convert is None:
+        return snapshot, None
+    return convert(snapshot), None
+
+
+def load_snapshot_files(
+    paths: Sequence[str],
+    fs: Optional[AbstractFileSystem] = None,
+    workers: int = 1,
+    date_from: Optional[datetime.datetime] = None,
+    date_to: Optional[datetime.datetime] = None,
+    skip_errors: bool = False,
+    convert: Optional[Callable[[Snapshot], T]] = None,
+) -> Iterator[Tuple[str, T]]:
+    """Load snapshots from files, skipping ones with timestamps not in [date_from, date_to] range.
+
+    Args:
+        paths: snapshot files.
+        fs: filesystem of files, local files are read if not set.
+        workers: number of processes to parse snapshots in.
+        date_from: minimal snapshot timestamp.
+        date_to: maximal snapshot timestamp.
+        skip_errors: skip malformed snapshots instead of raising an error.
+        convert: module-level function applied to each snapshot in worker process, e.g. to send
+            only needed data back to main process.
+
+    Returns:
+        pairs of file path and loaded snapshot (or result of `convert`) in order of `paths`.
+    """
+    tasks: List[_Task] = [(path, fs, date_from, date_to, convert) for path in paths]
+    if workers <= 1 or len(tasks) <= 1:
+        for path in paths:
+            try:
+                snapshot = load_snapshot_file(path, fs, date_from, date_to)
+            except ValidationError:
+                if skip_errors:
+                    continue
+                raise
+            if snapshot is not None:
+                yield path, snapshot if convert is None else convert(snapshot)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        for path, (result, error) in zip(paths, executor.map(_load_in_worker, tasks, chunksize=chunksize)):
+            if error is not None:
+                if skip_errors:
+                    continue
+                raise ValueError(f"Snapshot {path} is malformed: {error}")
+            if result is not None:
+                yield path, result
@@ -20,7 +20,9 @@ from evidently.model.dashboard import DashboardInfo
 from evidently.model.widget import BaseWidgetInfo
 from evidently.model.widget import set_source_fingerprint
 from evidently.options.base import AnyOptions
+from evidently.pipeline.chunked_data import ChunkedData
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.reference_profile import ReferenceProfile
 from evidently.renderers.base_renderer import TestRenderer
 from evidently.renderers.base_renderer import WidgetIdGenerator
 from evidently.renderers.base_renderer import replace_test_widget_ids
@@ -104,13 +106,20 @@ class TestSuite(ReportBase):
     def run(
         self,
         *,
-        reference_data: Optional[pd.DataFrame],
+        reference_data: Union[pd.DataFrame, ReferenceProfile, None],
         current_data: pd.DataFrame,
         column_mapping: Optional[ColumnMapping] = None,
         engine: Optional[Type[Engine]] = None,
         additional_data: Dict[str, Any] = None,
         timestamp: Optional[datetime] = None,
     ) -> None:
+        if isinstance(current_data, ChunkedData):
+            raise ValueError("Chunked current data is supported only by Report.run")
+        reference_profile = None
+        if isinstance(reference_data, ReferenceProfile):
+            reference_profile = reference_data
+            reference_data = reference_profile.data
+            column_mapping = column_mapping or reference_profile.column_mapping
         if column_mapping is None:
             column_mapping = ColumnMapping()
         self.id = new_id()
@@ -119,6 +128,8 @@ class TestSuite(ReportBase):
         else:
             self.timestamp = timestamp or datetime.now()
         self._inner_suite.reset()
+        if reference_profile is not None:
+            self._inner_suite.context.use_reference_profile(reference_profile)
         self._inner_suite.set_engine(PythonEngine() if engine is None else engine())
         self._add_tests()
         if self._inner_suite.context.engine is None:
@@ -239,16 +239,15 @@ def get_snapshot_data(
     if snapshot_meta is None:
         raise HTTPException(status_code=404, detail="Snapshot not found")
     info = DashboardInfoModel.from_dashboard_info(snapshot_meta.dashboard_info)
-    snapshot = snapshot_meta.load()
     log_event(
         "get_snapshot_data",
-        snapshot_type="report" if snapshot.is_report else "test_suite",
-        metrics=[m.get_id() for m in snapshot.first_level_metrics()],
-        metric_presets=snapshot.metadata.get(METRIC_PRESETS, []),
-        metric_generators=snapshot.metadata.get(METRIC_GENERATORS, []),
-        tests=[t.get_id() for t in snapshot.first_level_tests()],
-        test_presets=snapshot.metadata.get(TEST_PRESETS, []),
-        test_generators=snapshot.metadata.get(TEST_GENERATORS, []),
+        snapshot_type="report" if snapshot_meta.is_report else "test_suite",
+        metrics=snapshot_meta.metric_ids,
+        metric_presets=snapshot_meta.metadata.get(METRIC_PRESETS, []),
+        metric_generators=snapshot_meta.metadata.get(METRIC_GENERATORS, []),
+        tests=snapshot_meta.test_ids,
+        test_presets=snapshot_meta.metadata.get(TEST_PRESETS, []),
+        test_generators=snapshot_meta.metadata.get(TEST_GENERATORS, []),
     )
     return json.dumps(asdict(info), cls=NumpyEncoder)
 
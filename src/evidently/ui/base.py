@@ -1,4 +1,5 @@
 import contextlib
+import dataclasses
 import datetime
 import json
 from abc import ABC
@@ -22,12 +23,14 @@ from evidently._pydantic_compat import BaseModel
 from evidently._pydantic_compat import Field
 from evidently._pydantic_compat import PrivateAttr
 from evidently._pydantic_compat import parse_obj_as
+from evidently._version import __version__
 from evidently.core import new_id
 from evidently.model.dashboard import DashboardInfo
 from evidently.suite.base_suite import MetadataValueType
 from evidently.suite.base_suite import ReportBase
 from evidently.suite.base_suite import Snapshot
 from evidently.suite.base_suite import SnapshotLinks
+from evidently.suite.snapshot_format import SnapshotFormat
 from evidently.ui.dashboards.base import DashboardConfig
 from evidently.ui.dashboards.base import PanelValue
 from evidently.ui.dashboards.base import ReportFilter
@@ -72,6 +75,8 @@ class SnapshotMetadata(BaseModel):
     _project: "Project" = PrivateAttr(None)
     _dashboard_info: "DashboardInfo" = PrivateAttr(None)
     _additional_graphs: Dict[str, dict] = PrivateAttr(None)
+    _metric_ids: List[str] = PrivateAttr(None)
+    _test_ids: List[str] = PrivateAttr(None)
 
     @property
     def project(self):
@@ -103,15 +108,80 @@ class SnapshotMetadata(BaseModel):
     @property
     def dashboard_info(self):
         if self._dashboard_info is None:
-            _, self._dashboard_info, self._additional_graphs = self.as_report_base()._build_dashboard_info()
+            self._load_rendered()
         return self._dashboard_info
 
     @property
     def additional_graphs(self):
         if self._additional_graphs is None:
-            _, self._dashboard_info, self._additional_graphs = self.as_report_base()._build_dashboard_info()
+            self._load_rendered()
         return self._additional_graphs
 
+    @property
+    def metric_ids(self) -> List[str]:
+        """Ids of first level metrics of snapshot, stored with rendered widgets"""
+        if self._metric_ids is None:
+            self._load_rendered()
+        return self._metric_ids
+
+    @property
+    def test_ids(self) -> List[str]:
+        """Ids of first level tests of snapshot, stored with rendered widgets"""
+        if self._test_ids is None:
+            self._load_rendered()
+        return self._test_ids
+
+    def _load_rendered(self):
+        """Load rendered widgets of snapshot, stored next to snapshot blob after first render.
+
+        Widgets loaded from blob storage are json payloads instead of `BaseWidgetInfo` objects.
+        """
+        blob_storage = self.project.project_manager.blob
+        rendered_blob_id = blob_storage.get_rendered_blob_id(self.blob.id)
+        if rendered_blob_id is not None:
+            try:
+                with blob_storage.open_blob(rendered_blob_id) as f:
+                    rendered = parse_obj_as(RenderedSnapshot, json.load(f))
+                if (
+                    rendered.version == __version__
+                    and rendered.blob_size == self.blob.size
+                    and rendered.metric_ids is not None
+                    and rendered.test_ids is not None
+                ):
+                    self._dashboard_info = DashboardInfo(**rendered.dashboard_info)
+                    self._additional_graphs = rendered.additional_graphs
+                    self._metric_ids, self._test_ids = rendered.metric_ids, rendered.test_ids
+                    return
+            except (FileNotFoundError, ValueError):
+                pass
+        snapshot = self.load()
+        report = snapshot.as_report() if snapshot.is_report else snapshot.as_test_suite()
+        _, self._dashboard_info, self._additional_graphs = report._build_dashboard_info()
+        self._metric_ids = [metric.get_id() for metric in snapshot.first_level_metrics()]
+        self._test_ids = [test.get_id() for test in snapshot.first_level_tests()]
+        if rendered_blob_id is not None:
+            rendered = RenderedSnapshot(
+                version=__version__,
+                blob_size=self.blob.size,
+                dashboard_info=dataclasses.asdict(self._dashboard_info),
+                additional_graphs=self._additional_graphs,
+                metric_ids=self._metric_ids,
+                test_ids=self._test_ids,
+            )
+            blob_storage.put_blob(rendered_blob_id, json.dumps(rendered.dict(), cls=NumpyEncoder))
+
+
+class RenderedSnapshot(BaseModel):
+    """Stored rendered widgets of snapshot, valid for the same snapshot blob and evidently version"""
+
+    version: str
+    blob_size: Optional[int]
+    dashboard_info: Dict[str, Any]
+    additional_graphs: Dict[str, Any]
+    # ids of first level metrics and tests, so event logging does not need to load the snapshot
+    metric_ids: Optional[List[str]] = None
+    test_ids: Optional[List[str]] = None
+
 
 class EntityType(Enum):
     Dataset = "dataset"
@@ -298,6 +368,8 @@ class MetadataStorage(ABC):
 
 
 class BlobStorage(ABC):
+    snapshot_format: SnapshotFormat = SnapshotFormat.JSON
+
     @abstractmethod
     @contextlib.contextmanager
     def open_blob(self, id: BlobID):
@@ -309,9 +381,13 @@ class BlobStorage(ABC):
     def get_snapshot_blob_id(self, project_id: ProjectID, snapshot: Snapshot) -> BlobID:
         raise NotImplementedError
 
+    def get_rendered_blob_id(self, snapshot_blob_id: BlobID) -> Optional[BlobID]:
+        """Blob to store rendered widgets of snapshot in, None if they should not be stored"""
+        return None
+
     def put_snapshot(self, project_id: ProjectID, snapshot: Snapshot) -> BlobMetadata:
         id = self.get_snapshot_blob_id(project_id, snapshot)
-        self.put_blob(id, json.dumps(snapshot.dict(), cls=NumpyEncoder))
+        self.put_blob(id, snapshot.dumps(self.snapshot_format))
         return self.get_blob_metadata(id)
 
     def get_blob_metadata(self, blob_id: BlobID) -> BlobMetadata:
@@ -816,7 +892,7 @@ class ProjectManager:
         if isinstance(snapshot, SnapshotID):
             snapshot = self.get_snapshot_metadata(user_id, project_id, snapshot)
         with self.blob.open_blob(snapshot.blob.id) as f:
-            return parse_obj_as(Snapshot, json.load(f))
+            return Snapshot.loads(f.read())
 
     def get_snapshot_metadata(
         self, user_id: UserID, project_id: ProjectID, snapshot_id: SnapshotID
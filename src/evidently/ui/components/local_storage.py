@@ -2,6 +2,7 @@ from typing import Callable
 from typing import ClassVar
 from typing import Optional
 
+from evidently.suite.snapshot_format import SnapshotFormat
 from evidently.ui.base import BlobStorage
 from evidently.ui.base import DataStorage
 from evidently.ui.base import MetadataStorage
@@ -20,9 +21,10 @@ class FSSpecBlobComponent(BlobStorageComponent):
         type_alias = "fsspec"
 
     path: str
+    snapshot_format: SnapshotFormat = SnapshotFormat.JSON
 
     def dependency_factory(self) -> Callable[..., BlobStorage]:
-        return lambda: FSSpecBlobStorage(base_path=self.path)
+        return lambda: FSSpecBlobStorage(base_path=self.path, snapshot_format=self.snapshot_format)
 
 
 class JsonMetadataComponent(MetadataStorageComponent):
@@ -56,6 +58,7 @@ class LocalStateComponent(FactoryComponent[LocalState]):
     dependency_name: ClassVar = "local_state"
 
     path: str
+    load_workers: int = 1
 
     def dependency_factory(self) -> Callable[..., LocalState]:
-        return lambda: LocalState(path=self.path, project_manager=None)
+        return lambda: LocalState(path=self.path, project_manager=None, load_workers=self.load_workers)
@@ -3,6 +3,7 @@ from typing import Callable
 from typing import ClassVar
 
 from evidently.pydantic_utils import register_type_alias
+from evidently.suite.snapshot_format import SnapshotFormat
 from evidently.ui.base import BlobStorage
 from evidently.ui.base import DataStorage
 from evidently.ui.base import MetadataStorage
@@ -24,9 +25,18 @@ class StorageComponent(FactoryComponent[ProjectManager], ABC):
 class LocalStorageComponent(StorageComponent):
     path: str = "workspace"
     autorefresh: bool = True
+    snapshot_format: SnapshotFormat = SnapshotFormat.JSON
+    # number of processes to parse snapshots missing from workspace index in
+    load_workers: int = 1
 
     def dependency_factory(self) -> Callable[..., ProjectManager]:
-        return lambda: create_local_project_manager(self.path, autorefresh=self.autorefresh, auth=NoopAuthManager())
+        return lambda: create_local_project_manager(
+            self.path,
+            autorefresh=self.autorefresh,
+            auth=NoopAuthManager(),
+            snapshot_format=self.snapshot_format,
+            load_workers=self.load_workers,
+        )
 
 
 class MetadataStorageComponent(FactoryComponent[MetadataStorage], ABC):
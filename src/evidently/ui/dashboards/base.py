@@ -26,6 +26,7 @@ from evidently.renderers.html_widgets import CounterData
 from evidently.renderers.html_widgets import WidgetSize
 from evidently.renderers.html_widgets import counter
 from evidently.report import Report
+from evidently.suite.base_suite import MetadataValueType
 from evidently.suite.base_suite import ReportBase
 from evidently.test_suite import TestSuite
 from evidently.ui.type_aliases import PanelID
@@ -46,8 +47,11 @@ class ReportFilter(BaseModel):
     def filter(self, report: ReportBase):
         if not self.include_test_suites and isinstance(report, TestSuite):
             return False
-        return all(report.metadata.get(key) == value for key, value in self.metadata_values.items()) and all(
-            tag in report.tags for tag in self.tag_values
+        return self.matches(report.metadata, report.tags)
+
+    def matches(self, metadata: Dict[str, MetadataValueType], tags: List[str]) -> bool:
+        return all(metadata.get(key) == value for key, value in self.metadata_values.items()) and all(
+            tag in tags for tag in self.tag_values
         )
 
 
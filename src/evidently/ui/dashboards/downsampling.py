@@ -0,0 +1,125 @@
+"""Reduction of dashboard panel points before they are sent to the browser."""
+
+import datetime
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+Points = List[Tuple[datetime.datetime, Any]]
+Freq = Union[str, pd.Timedelta]
+
+# default limit of points per panel trace
+DEFAULT_MAX_POINTS = 1000
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def numeric_values(values: List[Any]) -> Optional[np.ndarray]:
+    """Values as float array (`None` is nan) or `None` if some values are not numbers"""
+    if not all(
+        value is None or (isinstance(value, _NUMERIC_TYPES) and not isinstance(value, bool)) for value in values
+    ):
+        return None
+    return np.array([np.nan if value is None else value for value in values], dtype=float)
+
+
+def timestamp_index(timestamps: Sequence[datetime.datetime]) -> pd.DatetimeIndex:
+    """Index of timestamps, built from offsets since the first one which is much faster than parsing by pandas"""
+    if len(timestamps) == 0:
+        return pd.DatetimeIndex([])
+    first = timestamps[0]
+    offsets = np.fromiter(
+        ((timestamp - first) // _MICROSECOND for timestamp in timestamps), dtype=np.int64, count=len(timestamps)
+    )
+    return pd.Timestamp(first) + pd.to_timedelta(offsets, unit="us")
+
+
+def time_buckets(timestamps: pd.DatetimeIndex, freq: Freq) -> pd.DatetimeIndex:
+    """Start of time bucket of each timestamp.
+
+    `freq` is either pandas period alias (e.g. "D", "W", "M") or fixed bucket width.
+    """
+    if isinstance(freq, pd.Timedelta):
+        return timestamps.floor(freq)
+    tz = timestamps.tz
+    if tz is not None:
+        timestamps = timestamps.tz_localize(None)
+    buckets = timestamps.to_period(freq).start_time
+    return buckets if tz is None else buckets.tz_localize(tz)
+
+
+def bucket_width(
+    timestamps: Sequence[datetime.datetime],
+    timestamp_start: Optional[datetime.datetime],
+    timestamp_end: Optional[datetime.datetime],
+    max_points: int,
+) -> pd.Timedelta:
+    """Width of time buckets which splits requested time range (or range of sorted `timestamps`) to `max_points` buckets"""
+    start = timestamp_start if timestamp_start is not None else timestamps[0]
+    end = timestamp_end if timestamp_end is not None else timestamps[-1]
+    width = (pd.Timestamp(end) - pd.Timestamp(start)) / max_points
+    return max(width.ceil("s"), pd.Timedelta(seconds=1))
+
+
+def aggregate_points(points: Points, freq: Freq) -> Points:
+    """Points grouped by time buckets: mean of numeric values or last value of other values in each bucket.
+
+    Points should be sorted by timestamp, resulting points have bucket start as a timestamp.
+    """
+    if len(points) == 0:
+        return points
+    timestamps = timestamp_index([timestamp for timestamp, _ in points])
+    values = [value for _, value in points]
+    array = numeric_values(values)
+    series = pd.Series(values if array is None else array, index=time_buckets(timestamps, freq))
+    grouped = series.groupby(level=0, sort=True)
+    if array is None:
+        result = grouped.last()
+        return list(zip(result.index.to_pydatetime(), result.tolist()))
+    result = grouped.mean()
+    return [
+        (timestamp, None if np.isnan(value) else value)
+        for timestamp, value in zip(result.index.to_pydatetime(), result.tolist())
+    ]
+
+
+def lttb(points: Points, max_points: int) -> Points:
+    """Largest-Triangle-Three-Buckets downsampling of points sorted by timestamp.
+
+    First and last points are kept, other points are split to `max_points - 2` buckets and a point
+    forming the largest triangle with previously selected point and average of the next bucket is taken
+    from each bucket, so peaks and drops of the series stay visible.
+    Points with non-numeric values are sampled evenly.
+    """
+    count = len(points)
+    if count <= max_points or max_points < 3:
+        return points
+    values = numeric_values([value for _, value in points])
+    if values is None:
+        positions = np.linspace(0, count - 1, max_points).round().astype(int)
+        return [points[position] for position in positions]
+    first = points[0][0]
+    x = np.fromiter(((timestamp - first) // _MICROSECOND for timestamp, _ in points), dtype=float, count=count)
+    y = np.nan_to_num(values)
+    edges = np.linspace(1, count - 1, max_points - 1).astype(int)
+    selected = [0]
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else count
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(area.argmax())
+        selected.append(previous)
+    selected.append(count - 1)
+    return [points[position] for position in selected]
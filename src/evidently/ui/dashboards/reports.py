@@ -8,6 +8,7 @@ from typing import Set
 from typing import Tuple
 from typing import Union
 
+import pandas as pd
 from plotly import graph_objs as go
 
 from evidently.base_metric import Metric
@@ -21,6 +22,13 @@ from evidently.renderers.html_widgets import plotly_figure
 from evidently.ui.dashboards.base import DashboardPanel
 from evidently.ui.dashboards.base import PanelValue
 from evidently.ui.dashboards.base import assign_panel_id
+from evidently.ui.dashboards.downsampling import DEFAULT_MAX_POINTS
+from evidently.ui.dashboards.downsampling import Points
+from evidently.ui.dashboards.downsampling import aggregate_points
+from evidently.ui.dashboards.downsampling import bucket_width
+from evidently.ui.dashboards.downsampling import lttb
+from evidently.ui.dashboards.downsampling import time_buckets
+from evidently.ui.dashboards.downsampling import timestamp_index
 from evidently.ui.dashboards.utils import CounterAgg
 from evidently.ui.dashboards.utils import HistBarMode
 from evidently.ui.dashboards.utils import PlotType
@@ -39,6 +47,10 @@ class DashboardPanelPlot(DashboardPanel):
 
     values: List[PanelValue]
     plot_type: PlotType
+    # pandas period alias (e.g. "D"), values of each period are averaged
+    time_agg: Optional[str] = None
+    # longer traces are downsampled, None to send all points
+    max_points: Optional[int] = DEFAULT_MAX_POINTS
 
     @assign_panel_id
     def build(
@@ -60,6 +72,7 @@ class DashboardPanelPlot(DashboardPanel):
 
             for metric, pts in metric_pts.items():
                 pts.sort(key=lambda x: x[0])
+                pts = self._reduce_points(pts, timestamp_start, timestamp_end)
 
                 hover = _get_metric_hover(hover_params[metric], val)
 
@@ -83,6 +96,22 @@ class DashboardPanelPlot(DashboardPanel):
                 fig.add_trace(plot)
         return plotly_figure(title=self.title, figure=fig, size=self.size)
 
+    def _reduce_points(
+        self,
+        pts: Points,
+        timestamp_start: Optional[datetime.datetime],
+        timestamp_end: Optional[datetime.datetime],
+    ) -> Points:
+        if self.time_agg is not None:
+            pts = aggregate_points(pts, self.time_agg)
+        if self.max_points is None or len(pts) <= self.max_points or self.plot_type == PlotType.HISTOGRAM:
+            return pts
+        if self.plot_type == PlotType.BAR:
+            return aggregate_points(
+                pts, bucket_width([p[0] for p in pts], timestamp_start, timestamp_end, self.max_points)
+            )
+        return lttb(pts, self.max_points)
+
     @property
     def plot_type_cls(self):
         if self.plot_type == PlotType.SCATTER:
@@ -145,6 +174,10 @@ class DashboardPanelDistribution(DashboardPanel):
 
     value: PanelValue
     barmode: HistBarMode = HistBarMode.STACK
+    # pandas period alias (e.g. "D"), bin values of each period are averaged
+    time_agg: Optional[str] = None
+    # more timestamps are averaged by time buckets, None to send all timestamps
+    max_points: Optional[int] = DEFAULT_MAX_POINTS
 
     @assign_panel_id
     def build(
@@ -173,31 +206,28 @@ class DashboardPanelDistribution(DashboardPanel):
             for v in bins_for_hists.values()
         )
 
-        timestamps: List[datetime.datetime] = []
-        names: Set[str] = set()
-        values: List[Dict[str, Any]] = []
-
-        for timestamp, hist in bins_for_hist:
-            timestamps.append(timestamp)
-            data = dict(zip(hist.x, hist.count))
-            names.update(data.keys())
-            values.append(data)
-
-        names_sorted = list(sorted(names))
-        name_to_date_value: Dict[str, List[Any]] = {name: [] for name in names_sorted}
-        for timestamp, data in zip(timestamps, values):
-            for name in names_sorted:
-                name_to_date_value[name].append(data.get(name))
+        frame = pd.DataFrame(
+            [dict(zip(hist.x, hist.count)) for _, hist in bins_for_hist],
+            index=timestamp_index([timestamp for timestamp, _ in bins_for_hist]),
+        )
+        frame = frame.reindex(columns=sorted(frame.columns)).sort_index()
+        if self.time_agg is not None:
+            frame = frame.groupby(time_buckets(frame.index, self.time_agg)).mean()
+        if self.max_points is not None and len(frame) > self.max_points:
+            width = bucket_width(frame.index, timestamp_start, timestamp_end, self.max_points)
+            frame = frame.groupby(time_buckets(frame.index, width)).mean()
+        frame = frame.astype(object).where(frame.notna(), None)
+        timestamps = list(frame.index.to_pydatetime())
         hovertemplate = "<b>{name}: %{{y}}</b><br><b>Timestamp: %{{x}}</b>"
         fig = go.Figure(
             data=[
                 go.Bar(
                     name=name,
                     x=timestamps,
-                    y=name_to_date_value.get(name),
+                    y=frame[name].tolist(),
                     hovertemplate=hovertemplate.format(name=name),
                 )
-                for name in names_sorted
+                for name in frame.columns
             ]
         )
         # Change the bar mode
@@ -1,5 +1,6 @@
 from fsspec.implementations.local import LocalFileSystem
 
+from evidently.suite.snapshot_format import SnapshotFormat
 from evidently.ui.base import AuthManager
 from evidently.ui.base import ProjectManager
 
@@ -21,13 +22,22 @@ def start_workspace_watchdog(path: str, state: LocalState):
     print(f"Observer for '{path}' started")
 
 
-def create_local_project_manager(path: str, autorefresh: bool, auth: AuthManager = None) -> ProjectManager:
-    state = LocalState.load(path, None)
+def create_local_project_manager(
+    path: str,
+    autorefresh: bool,
+    auth: AuthManager = None,
+    snapshot_format: SnapshotFormat = SnapshotFormat.JSON,
+    load_workers: int = 1,
+) -> ProjectManager:
+    state = LocalState.load(path, None, load_workers=load_workers)
 
     metadata = JsonFileMetadataStorage(path=path, local_state=state)
     data = InMemoryDataStorage(path=path, local_state=state)
     project_manager = ProjectManager(
-        metadata=metadata, blob=FSSpecBlobStorage(base_path=path), data=data, auth=auth or NoopAuthManager()
+        metadata=metadata,
+        blob=FSSpecBlobStorage(base_path=path, snapshot_format=snapshot_format),
+        data=data,
+        auth=auth or NoopAuthManager(),
     )
     state.project_manager = project_manager
 
@@ -2,11 +2,14 @@ import contextlib
 import datetime
 import json
 import posixpath
+import threading
+from collections import OrderedDict
 from collections import defaultdict
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Type
 
 import uuid6
@@ -17,6 +20,8 @@ from evidently._pydantic_compat import PrivateAttr
 from evidently._pydantic_compat import ValidationError
 from evidently._pydantic_compat import parse_obj_as
 from evidently.suite.base_suite import Snapshot
+from evidently.suite.snapshot_format import SnapshotFormat
+from evidently.suite.snapshot_loading import load_snapshot_files
 from evidently.test_suite import TestSuite
 from evidently.tests.base_test import Test
 from evidently.ui.base import BlobMetadata
@@ -35,6 +40,7 @@ from evidently.ui.dashboards.test_suites import to_period
 from evidently.ui.errors import ProjectNotFound
 from evidently.ui.storage.common import NO_TEAM
 from evidently.ui.storage.common import NO_USER
+from evidently.ui.storage.local.point_index import PointIndex
 from evidently.ui.type_aliases import BlobID
 from evidently.ui.type_aliases import DataPointsAsType
 from evidently.ui.type_aliases import PointType
@@ -45,7 +51,27 @@ from evidently.ui.type_aliases import TestResultPoints
 from evidently.utils import NumpyEncoder
 
 SNAPSHOTS = "snapshots"
+RENDERED = "rendered"
 METADATA_PATH = "metadata.json"
+SNAPSHOT_INDEX_PATH = "snapshot_index.jsonl"
+POINT_INDEX_PATH = "point_index.jsonl"
+SNAPSHOT_CACHE_SIZE = 64
+SNAPSHOT_EXTENSIONS = {SnapshotFormat.JSON: ".json", SnapshotFormat.BINARY: ".bin"}
+
+
+def snapshot_file_name(snapshot_id: SnapshotID, format: SnapshotFormat) -> str:
+    return f"{snapshot_id}{SNAPSHOT_EXTENSIONS[format]}"
+
+
+def parse_snapshot_file_name(file_name: str) -> Optional[SnapshotID]:
+    """Snapshot id of snapshot file name, None if it is not a name of snapshot file"""
+    name, extension = posixpath.splitext(file_name)
+    if extension not in SNAPSHOT_EXTENSIONS.values():
+        return None
+    try:
+        return uuid6.UUID(name)
+    except ValueError:
+        return None
 
 
 class FSLocation:
@@ -73,6 +99,17 @@ class FSLocation:
         except FileNotFoundError:
             return []
 
+    def listdir_sizes(self, path: str) -> Dict[str, int]:
+        try:
+            fullpath = posixpath.join(self.path, path)
+            return {
+                posixpath.relpath(p["name"], fullpath): p["size"]
+                for p in self.fs.listdir(fullpath, detail=True)
+                if p["type"] == "file"
+            }
+        except FileNotFoundError:
+            return {}
+
     def isdir(self, path: str):
         return self.fs.isdir(posixpath.join(self.path, path))
 
@@ -94,8 +131,9 @@ class FSSpecBlobStorage(BlobStorage):
 
     _location: FSLocation = PrivateAttr(None)
 
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, snapshot_format: SnapshotFormat = SnapshotFormat.JSON):
         self.base_path = base_path
+        self.snapshot_format = snapshot_format
         self._location = FSLocation(self.base_path)
 
     @property
@@ -105,16 +143,22 @@ class FSSpecBlobStorage(BlobStorage):
         return self._location
 
     def get_snapshot_blob_id(self, project_id: ProjectID, snapshot: Snapshot) -> BlobID:
-        return posixpath.join(str(project_id), SNAPSHOTS, str(snapshot.id)) + ".json"
+        return posixpath.join(str(project_id), SNAPSHOTS, snapshot_file_name(snapshot.id, self.snapshot_format))
+
+    def get_rendered_blob_id(self, snapshot_blob_id: BlobID) -> Optional[BlobID]:
+        project_path = posixpath.dirname(posixpath.dirname(snapshot_blob_id))
+        # rendered widgets are stored as json for snapshots of any format
+        name = posixpath.splitext(posixpath.basename(snapshot_blob_id))[0]
+        return posixpath.join(project_path, RENDERED, name + SNAPSHOT_EXTENSIONS[SnapshotFormat.JSON])
 
     @contextlib.contextmanager
     def open_blob(self, blob_id: str):
-        with self.location.open(blob_id) as f:
+        with self.location.open(blob_id, "rb") as f:
             yield f
 
     def put_blob(self, blob_id: BlobID, obj) -> BlobID:
         self.location.makedirs(posixpath.dirname(blob_id))
-        with self.location.open(blob_id, "w") as f:
+        with self.location.open(blob_id, "wb" if isinstance(obj, bytes) else "w") as f:
             f.write(obj)
         return blob_id
 
@@ -130,18 +174,82 @@ def load_project(location: FSLocation, path: str) -> Optional[Project]:
         return None
 
 
+class SnapshotCache:
+    """Loaded snapshots, when there are more than `max_size` of them, the least recently used one is dropped"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._snapshots: "OrderedDict[Tuple[ProjectID, SnapshotID], Snapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, project_id: ProjectID, snapshot_id: SnapshotID) -> Optional[Snapshot]:
+        with self._lock:
+            snapshot = self._snapshots.get((project_id, snapshot_id))
+            if snapshot is not None:
+                self._snapshots.move_to_end((project_id, snapshot_id))
+            return snapshot
+
+    def put(self, project_id: ProjectID, snapshot: Snapshot):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._snapshots[(project_id, snapshot.id)] = snapshot
+            self._snapshots.move_to_end((project_id, snapshot.id))
+            while len(self._snapshots) > self.max_size:
+                self._snapshots.popitem(last=False)
+
+    def remove(self, project_id: ProjectID, snapshot_id: Optional[SnapshotID] = None):
+        with self._lock:
+            keys = [
+                key
+                for key in self._snapshots
+                if key[0] == project_id and (snapshot_id is None or key[1] == snapshot_id)
+            ]
+            for key in keys:
+                del self._snapshots[key]
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def __getstate__(self):
+        return {"max_size": self.max_size, "_snapshots": self._snapshots.copy()}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def _snapshot_metadata(snapshot: Snapshot) -> SnapshotMetadata:
+    return SnapshotMetadata.from_snapshot(snapshot, BlobMetadata(id="", size=None))
+
+
 class LocalState:
-    def __init__(self, path: str, project_manager: Optional[ProjectManager]):
+    """Workspace state: projects and metadata of their snapshots.
+
+    Snapshot metadata is read from an index file of each project, so only snapshot files
+    missing from the index or changed since they were indexed are parsed on load.
+    Snapshots themselves are loaded on demand and at most `snapshot_cache_size` of them are kept in memory.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        project_manager: Optional[ProjectManager],
+        snapshot_cache_size: int = SNAPSHOT_CACHE_SIZE,
+        load_workers: int = 1,
+    ):
         self.path = path
         self.project_manager = project_manager
+        self.load_workers = load_workers
         self.projects: Dict[ProjectID, Project] = {}
         self.snapshots: Dict[ProjectID, Dict[SnapshotID, SnapshotMetadata]] = {}
-        self.snapshot_data: Dict[ProjectID, Dict[SnapshotID, Snapshot]] = {}
+        self.snapshot_cache = SnapshotCache(snapshot_cache_size)
+        self.point_index: Dict[ProjectID, PointIndex] = {}
         self.location = FSLocation(base_path=self.path)
 
     @classmethod
-    def load(cls, path: str, project_manager: Optional[ProjectManager]):
-        state = LocalState(path, project_manager)
+    def load(cls, path: str, project_manager: Optional[ProjectManager], load_workers: int = 1):
+        state = LocalState(path, project_manager, load_workers=load_workers)
 
         state.location.makedirs("")
         state.reload()
@@ -152,7 +260,8 @@ class LocalState:
         projects = [load_project(self.location, p) for p in self.location.listdir("") if self.location.isdir(p)]
         self.projects = {p.id: p.bind(self.project_manager, NO_USER.id) for p in projects if p is not None}
         self.snapshots = {p: {} for p in self.projects}
-        self.snapshot_data = {p: {} for p in self.projects}
+        self.snapshot_cache = SnapshotCache(self.snapshot_cache.max_size)
+        self.point_index = {}
 
         for project_id in self.projects:
             self.reload_snapshots(project_id, force=force, skip_errors=False)
@@ -161,30 +270,230 @@ class LocalState:
         path = posixpath.join(str(project_id), SNAPSHOTS)
         if force:
             self.snapshots[project_id] = {}
-            self.snapshot_data[project_id] = {}
+            self.snapshot_cache.remove(project_id)
+            self.point_index.pop(project_id, None)
 
         project = self.projects[project_id]
         self.location.invalidate_cache(path)
-        for file in self.location.listdir(path):
-            snapshot_id = uuid6.UUID(posixpath.basename(file)[: -len(".json")])
-            if snapshot_id in self.snapshots[project_id]:
+        files = self.location.listdir_sizes(path)
+        indexed, records = self._read_index(project_id)
+        for snapshot_id in list(self.snapshots[project_id]):
+            if posixpath.basename(self.snapshots[project_id][snapshot_id].blob.id) not in files:
+                self.remove_snapshot(project_id, snapshot_id)
+        not_indexed: Dict[SnapshotID, str] = {}
+        for file, size in files.items():
+            snapshot_id = parse_snapshot_file_name(file)
+            if snapshot_id is None or snapshot_id in self.snapshots[project_id]:
                 continue
-            self.reload_snapshot(project, snapshot_id, skip_errors)
-
-    def reload_snapshot(self, project: Project, snapshot_id: SnapshotID, skip_errors: bool = True):
+            metadata = indexed.get(snapshot_id)
+            if metadata is not None and metadata.blob.size == size and posixpath.basename(metadata.blob.id) == file:
+                self.snapshots[project_id][snapshot_id] = metadata.bind(project)
+            else:
+                not_indexed[snapshot_id] = file
+        if self.load_workers > 1 and len(not_indexed) > 1:
+            self._load_snapshots_metadata(project, list(not_indexed.values()), files, skip_errors)
+        else:
+            for snapshot_id, file in not_indexed.items():
+                self.reload_snapshot(project, snapshot_id, skip_errors, file_name=file)
+        if records != len(self.snapshots[project_id]) or indexed.keys() != self.snapshots[project_id].keys():
+            self.write_index(project_id)
+
+    def reload_snapshot(
+        self, project: Project, snapshot_id: SnapshotID, skip_errors: bool = True, file_name: Optional[str] = None
+    ):
+        """Load snapshot from file `file_name`, by default from existing snapshot file of any format"""
+        if file_name is None:
+            file_name = self.find_snapshot_file(project.id, snapshot_id)
+            if file_name is None:
+                return
         try:
-            snapshot_path = posixpath.join(str(project.id), SNAPSHOTS, str(snapshot_id) + ".json")
-            with self.location.open(snapshot_path) as f:
-                suite = parse_obj_as(Snapshot, json.load(f))
-            snapshot = SnapshotMetadata.from_snapshot(
-                suite, BlobMetadata(id=snapshot_path, size=self.location.size(snapshot_path))
-            ).bind(project)
-            self.snapshots[project.id][snapshot_id] = snapshot
-            self.snapshot_data[project.id][snapshot_id] = suite
+            snapshot_path = posixpath.join(str(project.id), SNAPSHOTS, file_name)
+            with self.location.open(snapshot_path, "rb") as f:
+                suite = Snapshot.loads(f.read())
+            self.add_snapshot(project, suite, BlobMetadata(id=snapshot_path, size=self.location.size(snapshot_path)))
         except ValidationError as e:
             if not skip_errors:
                 raise ValueError(f"{snapshot_id} is malformed") from e
 
+    def find_snapshot_file(self, project_id: ProjectID, snapshot_id: SnapshotID) -> Optional[str]:
+        for format in SnapshotFormat:
+            file_name = snapshot_file_name(snapshot_id, format)
+            if self.location.exists(posixpath.join(str(project_id), SNAPSHOTS, file_name)):
+                return file_name
+        return None
+
+    def _load_snapshots_metadata(
+        self, project: Project, file_names: List[str], sizes: Dict[str, int], skip_errors: bool
+    ):
+        """Parse snapshots in `load_workers` processes, only metadata is sent back"""
+        blob_ids = [posixpath.join(str(project.id), SNAPSHOTS, file_name) for file_name in file_names]
+        paths = {posixpath.join(self.location.path, blob_id): blob_id for blob_id in blob_ids}
+        for path, metadata in load_snapshot_files(
+            list(paths),
+            fs=self.location.fs,
+            workers=self.load_workers,
+            skip_errors=skip_errors,
+            convert=_snapshot_metadata,
+        ):
+            blob_id = paths[path]
+            metadata.blob = BlobMetadata(id=blob_id, size=sizes[posixpath.basename(blob_id)])
+            self.snapshots[project.id][metadata.id] = metadata.bind(project)
+            if project.id in self.point_index:
+                self._add_points(project.id, self.load_snapshot(project.id, metadata.id, cache=False), metadata.blob)
+
+    def add_snapshot(self, project: Project, snapshot: Snapshot, blob: BlobMetadata):
+        metadata = SnapshotMetadata.from_snapshot(snapshot, blob).bind(project)
+        self.snapshots[project.id][snapshot.id] = metadata
+        self.snapshot_cache.put(project.id, snapshot)
+        if project.id in self.point_index:
+            self._add_points(project.id, snapshot, blob)
+        self._append_index(project.id, {"add": metadata.dict()})
+
+    def remove_snapshot(self, project_id: ProjectID, snapshot_id: SnapshotID):
+        if self.snapshots.get(project_id, {}).pop(snapshot_id, None) is None:
+            return
+        self.snapshot_cache.remove(project_id, snapshot_id)
+        if project_id in self.point_index:
+            self.point_index[project_id].remove(snapshot_id)
+            self._append_point_index(project_id, {"remove": snapshot_id})
+        self._append_index(project_id, {"remove": snapshot_id})
+
+    def add_project(self, project: Project):
+        self.projects[project.id] = project
+        if project.id not in self.snapshots:
+            self.snapshots[project.id] = {}
+
+    def remove_project(self, project_id: ProjectID):
+        self.projects.pop(project_id, None)
+        self.snapshots.pop(project_id, None)
+        self.snapshot_cache.remove(project_id)
+        self.point_index.pop(project_id, None)
+
+    def load_snapshot(self, project_id: ProjectID, snapshot_id: SnapshotID, cache: bool = True) -> Snapshot:
+        snapshot = self.snapshot_cache.get(project_id, snapshot_id)
+        if snapshot is not None:
+            return snapshot
+        with self.location.open(self.snapshots[project_id][snapshot_id].blob.id, "rb") as f:
+            snapshot = Snapshot.loads(f.read())
+        if cache:
+            self.snapshot_cache.put(project_id, snapshot)
+        return snapshot
+
+    def get_point_index(self, project_id: ProjectID) -> PointIndex:
+        """Index of metric values of project snapshots, built on first use.
+
+        Indexed values are read from the point index file of the project, so only snapshots missing from it
+        or changed since they were indexed are loaded. After that the index is updated with added snapshots.
+        """
+        if project_id not in self.point_index:
+            index = PointIndex()
+            indexed, records = self._read_point_index(project_id)
+            entries = []
+            loaded = False
+            for snapshot_id, metadata in list(self.snapshots.get(project_id, {}).items()):
+                if not metadata.is_report:
+                    continue
+                entry = indexed.get(snapshot_id)
+                if entry is not None and metadata.blob.size is not None and entry["size"] == metadata.blob.size:
+                    index.add_record(entry)
+                else:
+                    entry = index.add(self.load_snapshot(project_id, snapshot_id, cache=False))
+                    if entry is None:
+                        continue
+                    entry["size"] = metadata.blob.size
+                    loaded = True
+                entries.append(entry)
+            if loaded or records != len(entries):
+                self._write_point_index(project_id, entries)
+            self.point_index[project_id] = index
+        return self.point_index[project_id]
+
+    def _add_points(self, project_id: ProjectID, snapshot: Snapshot, blob: BlobMetadata):
+        entry = self.point_index[project_id].add(snapshot)
+        if entry is not None:
+            entry["size"] = blob.size
+            self._append_point_index(project_id, {"add": entry})
+
+    def _point_index_path(self, project_id: ProjectID) -> str:
+        return posixpath.join(str(project_id), POINT_INDEX_PATH)
+
+    def _read_point_index(self, project_id: ProjectID) -> Tuple[Dict[SnapshotID, dict], int]:
+        # same log format as snapshot index, records are returned by PointIndex.add with size of snapshot file
+        result: Dict[SnapshotID, dict] = {}
+        records = 0
+        try:
+            with self.location.open(self._point_index_path(project_id)) as f:
+                for line in f:
+                    records += 1
+                    record = json.loads(line)
+                    if "add" in record:
+                        result[uuid6.UUID(record["add"]["id"])] = record["add"]
+                    else:
+                        result.pop(uuid6.UUID(record["remove"]), None)
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError):
+            # broken index is rebuilt from snapshot files
+            return {}, 0
+        return result, records
+
+    def _write_point_index(self, project_id: ProjectID, entries: List[dict]):
+        self.location.makedirs(str(project_id))
+        with self.location.open(self._point_index_path(project_id), "w") as f:
+            for entry in entries:
+                f.write(json.dumps({"add": entry}, cls=NumpyEncoder) + "\n")
+
+    def _append_point_index(self, project_id: ProjectID, record: dict):
+        if not self.location.exists(self._point_index_path(project_id)):
+            return
+        try:
+            with self.location.open(self._point_index_path(project_id), "a") as f:
+                f.write(json.dumps(record, cls=NumpyEncoder) + "\n")
+        except (ValueError, NotImplementedError):
+            # filesystem does not support appending, missing records are added when index is built next time
+            pass
+
+    def _index_path(self, project_id: ProjectID) -> str:
+        return posixpath.join(str(project_id), SNAPSHOT_INDEX_PATH)
+
+    def _read_index(self, project_id: ProjectID) -> Tuple[Dict[SnapshotID, SnapshotMetadata], int]:
+        # index is a log of added and removed snapshot metadata, one json record per line
+        result: Dict[SnapshotID, SnapshotMetadata] = {}
+        records = 0
+        try:
+            with self.location.open(self._index_path(project_id)) as f:
+                for line in f:
+                    records += 1
+                    record = json.loads(line)
+                    if "add" in record:
+                        metadata = parse_obj_as(SnapshotMetadata, record["add"])
+                        result[metadata.id] = metadata
+                    else:
+                        result.pop(uuid6.UUID(record["remove"]), None)
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError, ValidationError):
+            # broken index is rebuilt from snapshot files
+            return {}, 0
+        return result, records
+
+    def write_index(self, project_id: ProjectID):
+        self.location.makedirs(str(project_id))
+        with self.location.open(self._index_path(project_id), "w") as f:
+            for metadata in self.snapshots[project_id].values():
+                f.write(json.dumps({"add": metadata.dict()}, cls=NumpyEncoder) + "\n")
+
+    def _append_index(self, project_id: ProjectID, record: dict):
+        if not self.location.exists(self._index_path(project_id)):
+            self.write_index(project_id)
+            return
+        try:
+            with self.location.open(self._index_path(project_id), "a") as f:
+                f.write(json.dumps(record, cls=NumpyEncoder) + "\n")
+        except (ValueError, NotImplementedError):
+            # filesystem does not support appending
+            self.write_index(project_id)
+
 
 class JsonFileMetadataStorage(MetadataStorage):
     path: str
@@ -217,8 +526,7 @@ class JsonFileMetadataStorage(MetadataStorage):
         return self.state.projects.get(project_id)
 
     def delete_project(self, project_id: ProjectID):
-        if project_id in self.state.projects:
-            del self.state.projects[project_id]
+        self.state.remove_project(project_id)
         path = str(project_id)
         if self.state.location.exists(path):
             self.state.location.rmtree(path)
@@ -233,16 +541,15 @@ class JsonFileMetadataStorage(MetadataStorage):
         project = self.get_project(project_id)
         if project is None:
             raise ProjectNotFound()
-        self.state.snapshots[project_id][snapshot.id] = SnapshotMetadata.from_snapshot(snapshot, blob).bind(project)
-        self.state.snapshot_data[project_id][snapshot.id] = snapshot
+        self.state.add_snapshot(project, snapshot, blob)
 
     def delete_snapshot(self, project_id: ProjectID, snapshot_id: SnapshotID):
-        if project_id in self.state.projects and snapshot_id in self.state.snapshots[project_id]:
-            del self.state.snapshots[project_id][snapshot_id]
-            del self.state.snapshot_data[project_id][snapshot_id]
-        path = posixpath.join(str(project_id), SNAPSHOTS, f"{snapshot_id}.json")
-        if self.state.location.exists(path):
-            self.state.location.rmtree(path)
+        self.state.remove_snapshot(project_id, snapshot_id)
+        for directory in (SNAPSHOTS, RENDERED):
+            for format in SnapshotFormat:
+                path = posixpath.join(str(project_id), directory, snapshot_file_name(snapshot_id, format))
+                if self.state.location.exists(path):
+                    self.state.location.rmtree(path)
 
     def search_project(self, project_name: str, project_ids: Optional[Set[ProjectID]]) -> List[Project]:
         return [
@@ -283,7 +590,10 @@ class InMemoryDataStorage(DataStorage):
         return self._state
 
     def extract_points(self, project_id: ProjectID, snapshot: Snapshot):
-        pass
+        # index is built on first use, after that it is updated with added snapshots
+        index = self.state.point_index.get(project_id)
+        if index is not None and snapshot.id not in index:
+            index.add(snapshot)
 
     def load_test_results(
         self,
@@ -295,7 +605,14 @@ class InMemoryDataStorage(DataStorage):
         timestamp_end: Optional[datetime.datetime],
     ) -> TestResultPoints:
         points: Dict[datetime.datetime, Dict[Test, TestInfo]] = defaultdict(dict)
-        for report in (s.as_test_suite() for s in self.state.snapshot_data[project_id].values() if not s.is_report):
+        if not filter.include_test_suites:
+            return points
+        snapshots = [
+            s.id
+            for s in self.state.snapshots[project_id].values()
+            if not s.is_report and filter.matches(s.metadata, s.tags)
+        ]
+        for report in (self.state.load_snapshot(project_id, s).as_test_suite() for s in snapshots):
             if not filter.filter(report):
                 continue
             if not isinstance(report, TestSuite):
@@ -319,16 +636,41 @@ class InMemoryDataStorage(DataStorage):
         timestamp_end: Optional[datetime.datetime],
     ) -> DataPointsAsType[PointType]:
         points: DataPointsAsType[PointType] = [{} for _ in range(len(values))]
-        for report in (s.as_report() for s in self.state.snapshot_data[project_id].values() if s.is_report):
-            if not (
-                filter.filter(report)
-                and (timestamp_start is None or report.timestamp >= timestamp_start)
-                and (timestamp_end is None or report.timestamp < timestamp_end)
-            ):
+        index = self.state.get_point_index(project_id)
+        not_indexed = []
+        for i, value in enumerate(values):
+            fingerprints = index.match_metrics(value.metric_matched)
+            if not index.is_indexed(fingerprints, value.field_path_str):
+                not_indexed.append(i)
+                continue
+            for fingerprint in fingerprints:
+                metric_points = [
+                    (timestamp, self.parse_value(cls, field_value))
+                    for timestamp, snapshot_id, field_value in index.scan(
+                        fingerprint, value.field_path_str, timestamp_start, timestamp_end
+                    )
+                    if filter.matches(*index.snapshot_labels(snapshot_id))
+                ]
+                if len(metric_points) > 0:
+                    points[i][index.metrics[fingerprint]] = metric_points
+        if len(not_indexed) == 0:
+            return points
+
+        # values of non-scalar fields are read from snapshots
+        snapshots = [
+            s.id
+            for s in self.state.snapshots[project_id].values()
+            if s.is_report
+            and filter.matches(s.metadata, s.tags)
+            and (timestamp_start is None or s.timestamp >= timestamp_start)
+            and (timestamp_end is None or s.timestamp < timestamp_end)
+        ]
+        for report in (self.state.load_snapshot(project_id, s).as_report() for s in snapshots):
+            if not filter.filter(report):
                 continue
 
-            for i, value in enumerate(values):
-                for metric, metric_field_value in value.get(report).items():
+            for i in not_indexed:
+                for metric, metric_field_value in values[i].get(report).items():
                     if metric not in points[i]:
                         points[i][metric] = []
                     points[i][metric].append((report.timestamp, self.parse_value(cls, metric_field_value)))
@@ -0,0 +1,68 @@
+"""Conversion of snapshots of local workspace to another storage format."""
+
+import posixpath
+import time
+from typing import Union
+
+from evidently._pydantic_compat import BaseModel
+from evidently.suite.base_suite import Snapshot
+from evidently.suite.snapshot_format import SnapshotFormat
+from evidently.suite.snapshot_format import is_binary
+from evidently.ui.storage.local.base import LocalState
+from evidently.ui.storage.local.base import snapshot_file_name
+
+
+class SnapshotConversionStats(BaseModel):
+    snapshots: int = 0
+    converted: int = 0
+    size_before: int = 0
+    size_after: int = 0
+    # total time of snapshot parsing, only measured in benchmark mode
+    load_time_before: float = 0.0
+    load_time_after: float = 0.0
+
+
+def _load_time(data: Union[str, bytes]) -> float:
+    start = time.perf_counter()
+    Snapshot.loads(data)
+    return time.perf_counter() - start
+
+
+def convert_workspace_snapshots(path: str, format: SnapshotFormat, benchmark: bool = False) -> SnapshotConversionStats:
+    """Rewrite all snapshots of workspace in given format, snapshot files are renamed to extension of the format.
+
+    Args:
+        path: workspace path.
+        format: target snapshot format.
+        benchmark: also measure time to load snapshots in previous and new format.
+    """
+    state = LocalState.load(path, None)
+    stats = SnapshotConversionStats()
+    for project_id, snapshots in state.snapshots.items():
+        for metadata in snapshots.values():
+            with state.location.open(metadata.blob.id, "rb") as f:
+                data = f.read()
+            stats.snapshots += 1
+            stats.size_before += len(data)
+            blob_id = posixpath.join(posixpath.dirname(metadata.blob.id), snapshot_file_name(metadata.id, format))
+            if is_binary(data) == (format == SnapshotFormat.BINARY):
+                new_data = data
+            else:
+                new_data = Snapshot.loads(data).dumps(format)
+                if isinstance(new_data, str):
+                    new_data = new_data.encode("utf-8")
+            if new_data is not data or blob_id != metadata.blob.id:
+                # file extension follows snapshot format, so converted snapshot is written to a new file
+                with state.location.open(blob_id, "wb") as f:
+                    f.write(new_data)
+                if blob_id != metadata.blob.id:
+                    state.location.rmtree(metadata.blob.id)
+                metadata.blob.id = blob_id
+                metadata.blob.size = len(new_data)
+                stats.converted += 1
+            stats.size_after += len(new_data)
+            if benchmark:
+                stats.load_time_before += _load_time(data)
+                stats.load_time_after += _load_time(new_data)
+        state.write_index(project_id)
+    return stats
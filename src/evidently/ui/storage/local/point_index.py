@@ -0,0 +1,211 @@
+"""Columnar index of metric result values of stored report snapshots."""
+
+import bisect
+import copy
+import datetime
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+import numpy as np
+import uuid6
+
+from evidently._pydantic_compat import BaseModel
+from evidently._pydantic_compat import parse_obj_as
+from evidently.base_metric import ErrorResult
+from evidently.base_metric import Metric
+from evidently.suite.base_suite import MetadataValueType
+from evidently.suite.base_suite import Snapshot
+from evidently.ui.type_aliases import SnapshotID
+
+_SCALAR_TYPES = (int, float, str, bool, np.integer, np.floating, np.bool_)
+_MAX_DEPTH = 8
+
+ColumnKey = Tuple[str, str]
+
+
+class _Column:
+    """Values of one field of one metric sorted by snapshot timestamp"""
+
+    def __init__(self):
+        self.timestamps: List[datetime.datetime] = []
+        self.snapshot_ids: List[SnapshotID] = []
+        self.values: List[Any] = []
+
+    def insert(self, timestamp: datetime.datetime, snapshot_id: SnapshotID, value: Any):
+        position = bisect.bisect_right(self.timestamps, timestamp)
+        self.timestamps.insert(position, timestamp)
+        self.snapshot_ids.insert(position, snapshot_id)
+        self.values.insert(position, value)
+
+    def remove(self, snapshot_id: SnapshotID):
+        position = self.snapshot_ids.index(snapshot_id)
+        del self.timestamps[position]
+        del self.snapshot_ids[position]
+        del self.values[position]
+
+    def scan(
+        self, timestamp_start: Optional[datetime.datetime], timestamp_end: Optional[datetime.datetime]
+    ) -> Iterator[Tuple[datetime.datetime, SnapshotID, Any]]:
+        start = 0 if timestamp_start is None else bisect.bisect_left(self.timestamps, timestamp_start)
+        end = len(self.timestamps) if timestamp_end is None else bisect.bisect_left(self.timestamps, timestamp_end)
+        return zip(self.timestamps[start:end], self.snapshot_ids[start:end], self.values[start:end])
+
+
+class _SnapshotEntry:
+    def __init__(self, metadata: Dict[str, MetadataValueType], tags: List[str], columns: List[ColumnKey]):
+        self.metadata = metadata
+        self.tags = tags
+        self.columns = columns
+
+
+class _MetricPaths:
+    """Field paths of results of one metric that cannot be read from columns"""
+
+    def __init__(self):
+        # paths to non-scalar values
+        self.complex: Set[str] = set()
+        # paths to non-scalar values which nested values are not indexed
+        self.opaque: Set[str] = set()
+
+    def is_indexed(self, field_path: str) -> bool:
+        if field_path in self.complex:
+            return False
+        parts = field_path.split(".")
+        return all(".".join(parts[:i]) not in self.opaque for i in range(1, len(parts)))
+
+
+def _flatten(obj: Any, path: str, values: Dict[str, Any], paths: _MetricPaths, depth: int = 0):
+    if obj is None or isinstance(obj, _SCALAR_TYPES):
+        values[path] = obj
+        return
+    paths.complex.add(path)
+    prefix = f"{path}." if path else ""
+    if depth < _MAX_DEPTH and isinstance(obj, BaseModel):
+        for name in obj.__fields__:
+            _flatten(getattr(obj, name), prefix + name, values, paths, depth + 1)
+    elif depth < _MAX_DEPTH and isinstance(obj, dict) and all(isinstance(key, str) for key in obj):
+        for key, value in obj.items():
+            _flatten(value, prefix + key, values, paths, depth + 1)
+    else:
+        paths.opaque.add(path)
+
+
+class PointIndex:
+    """Scalar fields of first-level metric results of report snapshots of one project.
+
+    Values are stored by metric fingerprint and field path in columns sorted by snapshot timestamp,
+    so panel values are read with a range scan instead of parsing every snapshot.
+    Paths to non-scalar values (e.g. distributions) are not indexed, this is reported by `is_indexed`.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, Metric] = {}
+        self.columns: Dict[ColumnKey, _Column] = {}
+        self.paths: Dict[str, _MetricPaths] = {}
+        self.snapshots: Dict[SnapshotID, _SnapshotEntry] = {}
+
+    def add(self, snapshot: Snapshot) -> Optional[dict]:
+        """Index values of snapshot results.
+
+        Returns:
+            json-serializable record of indexed values to restore them with `add_record` without loading
+            the snapshot, None if snapshot is not a report.
+        """
+        self.remove(snapshot.id)
+        if not snapshot.is_report:
+            return None
+        metrics: Dict[str, dict] = {}
+        for metric_index in dict.fromkeys(snapshot.metrics_ids):
+            metric = snapshot.suite.metrics[metric_index]
+            result = snapshot.suite.metric_results[metric_index]
+            if isinstance(result, ErrorResult):
+                continue
+            fingerprint = metric.get_fingerprint()
+            if fingerprint in metrics:
+                continue
+            self.metrics.setdefault(fingerprint, metric)
+            values: Dict[str, Any] = {}
+            paths = _MetricPaths()
+            _flatten(result, "", values, paths)
+            metrics[fingerprint] = {
+                "metric": metric.dict(),
+                "values": values,
+                "complex": sorted(paths.complex),
+                "opaque": sorted(paths.opaque),
+            }
+        self._add(snapshot.id, snapshot.timestamp, snapshot.metadata, snapshot.tags, metrics)
+        return {
+            "id": str(snapshot.id),
+            "timestamp": snapshot.timestamp.isoformat(),
+            "metadata": snapshot.metadata,
+            "tags": snapshot.tags,
+            "metrics": metrics,
+        }
+
+    def add_record(self, record: dict):
+        """Index values from a record returned by `add`"""
+        snapshot_id = uuid6.UUID(record["id"])
+        self.remove(snapshot_id)
+        for fingerprint, entry in record["metrics"].items():
+            if fingerprint not in self.metrics:
+                # parsing removes type aliases from the parsed dict, so the record is kept unchanged
+                self.metrics[fingerprint] = parse_obj_as(Metric, copy.deepcopy(entry["metric"]))
+        timestamp = datetime.datetime.fromisoformat(record["timestamp"])
+        self._add(snapshot_id, timestamp, record["metadata"], record["tags"], record["metrics"])
+
+    def _add(
+        self,
+        snapshot_id: SnapshotID,
+        timestamp: datetime.datetime,
+        metadata: Dict[str, MetadataValueType],
+        tags: List[str],
+        metrics: Dict[str, dict],
+    ):
+        columns: List[ColumnKey] = []
+        for fingerprint, entry in metrics.items():
+            paths = self.paths.setdefault(fingerprint, _MetricPaths())
+            paths.complex.update(entry["complex"])
+            paths.opaque.update(entry["opaque"])
+            for path, value in entry["values"].items():
+                key = (fingerprint, path)
+                self.columns.setdefault(key, _Column()).insert(timestamp, snapshot_id, value)
+                columns.append(key)
+        self.snapshots[snapshot_id] = _SnapshotEntry(metadata, tags, columns)
+
+    def remove(self, snapshot_id: SnapshotID):
+        entry = self.snapshots.pop(snapshot_id, None)
+        if entry is None:
+            return
+        for key in entry.columns:
+            self.columns[key].remove(snapshot_id)
+
+    def __contains__(self, snapshot_id: SnapshotID) -> bool:
+        return snapshot_id in self.snapshots
+
+    def match_metrics(self, matched) -> List[str]:
+        """Fingerprints of indexed metrics accepted by `matched` predicate"""
+        return [fingerprint for fingerprint, metric in self.metrics.items() if matched(metric)]
+
+    def is_indexed(self, fingerprints: List[str], field_path: str) -> bool:
+        return all(self.paths[fingerprint].is_indexed(field_path) for fingerprint in fingerprints)
+
+    def scan(
+        self,
+        fingerprint: str,
+        field_path: str,
+        timestamp_start: Optional[datetime.datetime],
+        timestamp_end: Optional[datetime.datetime],
+    ) -> Iterator[Tuple[datetime.datetime, SnapshotID, Any]]:
+        column = self.columns.get((fingerprint, field_path))
+        if column is None:
+            return iter(())
+        return column.scan(timestamp_start, timestamp_end)
+
+    def snapshot_labels(self, snapshot_id: SnapshotID) -> Tuple[Dict[str, MetadataValueType], List[str]]:
+        entry = self.snapshots[snapshot_id]
+        return entry.metadata, entry.tags
@@ -12,11 +12,13 @@ from watchdog.events import FileSystemEventHandler
 
 from evidently.ui.storage.common import NO_USER
 from evidently.ui.storage.local.base import METADATA_PATH
+from evidently.ui.storage.local.base import SNAPSHOT_EXTENSIONS
 from evidently.ui.storage.local.base import SNAPSHOTS
 from evidently.ui.storage.local.base import LocalState
 from evidently.ui.storage.local.base import load_project
 
 uuid4hex = "[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+snapshot_file = "(" + uuid4hex + ")(" + "|".join(re.escape(ext) for ext in SNAPSHOT_EXTENSIONS.values()) + ")"
 
 
 class WorkspaceDirHandler(FileSystemEventHandler):
@@ -45,7 +47,7 @@ class WorkspaceDirHandler(FileSystemEventHandler):
     def is_snapshot_event(self, event: FileSystemEvent):
         path = Path(event.src_path)
         f_name = path.name
-        if not re.fullmatch(uuid4hex + r"\.json", f_name):
+        if not re.fullmatch(snapshot_file, f_name):
             return False
         if path.parent.name != SNAPSHOTS:
             return False
@@ -67,9 +69,10 @@ class WorkspaceDirHandler(FileSystemEventHandler):
     def parse_project_and_snapshot_id(self, path):
         path = Path(path)
         f_name = path.name
-        if not re.fullmatch(uuid4hex + r"\.json", f_name):
+        match = re.fullmatch(snapshot_file, f_name)
+        if match is None:
             return None, None
-        snapshot_id = f_name[:-5]
+        snapshot_id = match.group(1)
         if path.parent.name != SNAPSHOTS:
             return None, None
         if not re.fullmatch(uuid4hex, path.parent.parent.name):
@@ -86,20 +89,14 @@ class WorkspaceDirHandler(FileSystemEventHandler):
             project = load_project(self.state.location, project_id)
             if project is None:
                 return
-            self.state.projects[project.id] = project.bind(self.state.project_manager, NO_USER.id)
-            if project.id not in self.state.snapshots:
-                self.state.snapshots[project.id] = {}
-                self.state.snapshot_data[project.id] = {}
+            self.state.add_project(project.bind(self.state.project_manager, NO_USER.id))
         if event.event_type in (EVENT_TYPE_MODIFIED,):
             project = load_project(self.state.location, project_id)
             if project is None:
                 return
             self.state.projects[project.id] = project.bind(self.state.project_manager, NO_USER.id)
         if event.event_type == EVENT_TYPE_DELETED:
-            pid = uuid6.UUID(project_id)
-            del self.state.projects[pid]
-            del self.state.snapshots[pid]
-            del self.state.snapshot_data[pid]
+            self.state.remove_project(uuid6.UUID(project_id))
 
     def on_snapshot_event(self, event):
         project_id, snapshot_id = self.parse_project_and_snapshot_id(event.src_path)
@@ -113,13 +110,14 @@ class WorkspaceDirHandler(FileSystemEventHandler):
         if (event.event_type in (EVENT_TYPE_MODIFIED, EVENT_TYPE_CREATED, EVENT_TYPE_MOVED)) and os.path.exists(
             event.src_path
         ):
-            self.state.reload_snapshot(project, sid)
+            self.state.reload_snapshot(project, sid, file_name=Path(event.src_path).name)
         if (
             event.event_type == EVENT_TYPE_DELETED
             or event.event_type == EVENT_TYPE_MOVED
             and not os.path.exists(event.src_path)
         ):
-            if pid in self.state.snapshots and sid in self.state.snapshots[pid]:
-                del self.state.snapshots[pid][sid]
-            if pid in self.state.snapshot_data and sid in self.state.snapshot_data[pid]:
-                del self.state.snapshot_data[pid][sid]
+            metadata = self.state.snapshots.get(pid, {}).get(sid)
+            # snapshot converted to another format is stored in a file with another name
+            if metadata is not None and Path(metadata.blob.id).name != Path(event.src_path).name:
+                return
+            self.state.remove_snapshot(pid, sid)
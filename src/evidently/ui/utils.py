@@ -28,6 +28,8 @@ class RemoteClientBase:
         query_params: Optional[dict] = None,
         body: Optional[dict] = None,
         response_model: Optional[Type[T]] = None,
+        content: Optional[bytes] = None,
+        content_type: str = "application/octet-stream",
     ) -> Union[T, requests.Response]:
         # todo: better encoding
         headers = {SECRET_HEADER_NAME: self.secret}
@@ -36,6 +38,9 @@ class RemoteClientBase:
             headers["Content-Type"] = "application/json"
 
             data = json.dumps(body, allow_nan=True, cls=NumpyEncoder).encode("utf8")
+        elif content is not None:
+            headers["Content-Type"] = content_type
+            data = content
 
         response = requests.request(
             method, urllib.parse.urljoin(self.base_url, path), params=query_params, data=data, headers=headers
@@ -7,6 +7,7 @@ import uuid6
 
 from evidently import ColumnMapping
 from evidently.suite.base_suite import Snapshot
+from evidently.suite.snapshot_format import SnapshotFormat
 from evidently.ui.base import Project
 from evidently.ui.base import ProjectManager
 from evidently.ui.type_aliases import STR_UUID
@@ -80,20 +81,25 @@ class WorkspaceView(WorkspaceBase):
 
 
 class LocalWorkspaceView(WorkspaceView):
-    def __init__(self, path: str):
+    def __init__(self, path: str, snapshot_format: SnapshotFormat = SnapshotFormat.JSON):
         from evidently.ui.storage.local import create_local_project_manager
 
         self.path = path
-        super().__init__(None, create_local_project_manager(path=path, autorefresh=False))
+        self.snapshot_format = snapshot_format
+        super().__init__(
+            None, create_local_project_manager(path=path, autorefresh=False, snapshot_format=snapshot_format)
+        )
 
     @classmethod
-    def create(cls, path: str):
-        return LocalWorkspaceView(path)
+    def create(cls, path: str, snapshot_format: SnapshotFormat = SnapshotFormat.JSON):
+        return LocalWorkspaceView(path, snapshot_format)
 
     def refresh(self):
         from evidently.ui.storage.local import create_local_project_manager
 
-        self.project_manager = create_local_project_manager(path=self.path, autorefresh=False)
+        self.project_manager = create_local_project_manager(
+            path=self.path, autorefresh=False, snapshot_format=self.snapshot_format
+        )
 
 
 Workspace = LocalWorkspaceView
@@ -171,19 +171,23 @@ def recognize_task(target_name: str, dataset: pd.DataFrame) -> str:
 
 def recognize_column_type_(dataset: pd.DataFrame, column_name: str, columns: DatasetColumns) -> ColumnType:
     """Try to get the column type."""
-    column = dataset[column_name]
-    reg_condition = columns.task == "regression" or (
-        pd.api.types.is_numeric_dtype(column) and columns.task != "classification" and column.nunique() > 5
-    )
+
+    def reg_condition(column: pd.Series) -> bool:
+        return columns.task == "regression" or (
+            pd.api.types.is_numeric_dtype(column) and columns.task != "classification" and column.nunique() > 5
+        )
+
+    # only target and prediction types depend on data
     if column_name == columns.utility_columns.target:
-        if reg_condition:
+        if reg_condition(dataset[column_name]):
             return ColumnType.Numerical
 
         else:
             return ColumnType.Categorical
 
     if isinstance(columns.utility_columns.prediction, str) and column_name == columns.utility_columns.prediction:
-        if reg_condition or (
+        column = dataset[column_name]
+        if reg_condition(column) or (
             not pd.api.types.is_integer_dtype(column)
             and pd.api.types.is_numeric_dtype(column)
             and column.max() <= 1
@@ -0,0 +1,153 @@
+import contextlib
+import threading
+import time
+import tracemalloc
+from enum import Enum
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+
+import pandas as pd
+
+from evidently._pydantic_compat import BaseModel
+from evidently.pydantic_utils import EnumValueMixin
+
+
+class ProfileKind(Enum):
+    DATA_DEFINITION = "data_definition"
+    FEATURE = "feature"
+    METRIC = "metric"
+    TEST = "test"
+
+
+class ProfileRecord(EnumValueMixin, BaseModel):
+    """Resources spent on one step of a run.
+
+    Args:
+        kind: type of the profiled step.
+        name: class name of the profiled object.
+        fingerprint: fingerprint of the profiled object, if any.
+        wall_time: elapsed time in seconds.
+        cpu_time: CPU time in seconds spent by the executing thread.
+        peak_memory: peak memory in bytes allocated during the step, if memory was tracked.
+    """
+
+    kind: ProfileKind
+    name: str
+    fingerprint: Optional[str] = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: Optional[int] = None
+
+
+class _TracedStep:
+    def __init__(self, start: int):
+        self.start = start
+        # peak of traced memory reached before the last reset of tracemalloc peak
+        self.peak = start
+
+
+class _MemoryTracing:
+    """Keeps tracemalloc running while there are profiled steps that track memory.
+
+    Peak of tracemalloc is reset when a step starts, so peak reached before is kept in all active steps first.
+    Peak is not reset if tracemalloc was started by the caller, then it can include memory allocated before the step.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps: Set[_TracedStep] = set()
+        self._owned = False
+
+    def start(self) -> _TracedStep:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owned = True
+            current, peak = tracemalloc.get_traced_memory()
+            if self._owned and hasattr(tracemalloc, "reset_peak"):
+                for step in self._steps:
+                    step.peak = max(step.peak, peak)
+                tracemalloc.reset_peak()
+            step = _TracedStep(current)
+            self._steps.add(step)
+            return step
+
+    def stop(self, step: _TracedStep) -> int:
+        """Peak memory allocated during the step"""
+        with self._lock:
+            self._steps.discard(step)
+            peak = max(step.peak, tracemalloc.get_traced_memory()[1])
+            if self._owned and not self._steps:
+                tracemalloc.stop()
+                self._owned = False
+            return max(peak - step.start, 0)
+
+
+_memory_tracing = _MemoryTracing()
+
+
+@contextlib.contextmanager
+def profile(
+    kind: ProfileKind,
+    name: str,
+    fingerprint: Optional[str] = None,
+    enabled: bool = True,
+    track_memory: bool = True,
+) -> Iterator[Optional[ProfileRecord]]:
+    """Measure wall time, CPU time and peak allocated memory of the enclosed block.
+
+    Yields record that is filled when block exits or `None` if profiling is disabled.
+    """
+    if not enabled:
+        yield None
+        return
+    record = ProfileRecord(kind=kind, name=name, fingerprint=fingerprint)
+    traced_step = _memory_tracing.start() if track_memory else None
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    try:
+        yield record
+    finally:
+        record.cpu_time = time.thread_time() - start_cpu
+        record.wall_time = time.perf_counter() - start_wall
+        if traced_step is not None:
+            record.peak_memory = _memory_tracing.stop(traced_step)
+
+
+def get_profile_summary(records: List[ProfileRecord], bar_width: int = 40) -> pd.DataFrame:
+    """Aggregate profile records by step and sort them by elapsed time.
+
+    Returned table has flame-style `bar` column with each step share of total wall time.
+    """
+    columns = ["kind", "name", "count", "wall_time", "cpu_time", "peak_memory", "share", "bar"]
+    if len(records) == 0:
+        return pd.DataFrame(columns=columns)
+    df = pd.DataFrame(
+        [
+            {
+                "kind": record.kind.value,
+                "name": record.name,
+                "wall_time": record.wall_time,
+                "cpu_time": record.cpu_time,
+                "peak_memory": record.peak_memory,
+            }
+            for record in records
+        ]
+    )
+    summary = (
+        df.groupby(["kind", "name"], sort=False)
+        .agg(
+            count=("wall_time", "size"),
+            wall_time=("wall_time", "sum"),
+            cpu_time=("cpu_time", "sum"),
+            peak_memory=("peak_memory", "max"),
+        )
+        .reset_index()
+        .sort_values("wall_time", ascending=False, ignore_index=True)
+    )
+    total = summary["wall_time"].sum()
+    summary["share"] = summary["wall_time"] / total if total > 0 else 0.0
+    summary["bar"] = ["#" * int(round(share * bar_width)) for share in summary["share"]]
+    return summary[columns]
@@ -1,15 +1,25 @@
+from typing import ClassVar
+from typing import List
+
 import pandas as pd
+import pytest
 
 from evidently import ColumnMapping
+from evidently import ColumnType
+from evidently.base_metric import ErrorResult
 from evidently.base_metric import GenericInputData
 from evidently.base_metric import InputData
 from evidently.base_metric import Metric
 from evidently.calculation_engine.engine import metric_implementation
 from evidently.calculation_engine.python_engine import PythonEngine
 from evidently.calculation_engine.python_engine import PythonMetricImplementation
+from evidently.features.generated_features import ApplyColumnGeneratedFeature
+from evidently.options.base import Options
+from evidently.options.execution import ExecutionOptions
 from evidently.renderers.base_renderer import DEFAULT_RENDERERS
 from evidently.suite.base_suite import Context
 from evidently.suite.base_suite import States
+from evidently.utils.data_preprocessing import DataDefinition
 
 
 class OldTypeSimpleMetric(Metric[int]):
@@ -70,3 +80,80 @@ def test_python_engine2():
     ctx = Context(None, [metric], [], dict(), dict(), States.Verified, renderers=DEFAULT_RENDERERS)
     engine.execute_metrics(ctx, GenericInputData(pd.DataFrame(), pd.DataFrame(), ColumnMapping(), None, {}))
     assert ctx.metric_results[metric] == 25
+
+
+class FailingMetric(Metric[int]):
+    class Config:
+        alias_required = False
+
+    def calculate(self, data: InputData) -> int:
+        raise ValueError("failed")
+
+
+class DependentMetric(Metric[int]):
+    class Config:
+        alias_required = False
+
+    dependency: SimpleMetric
+
+    def calculate(self, data: InputData) -> int:
+        return self.dependency.get_result() * 2
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_python_engine_parallel(use_processes):
+    metric = SimpleMetric(10)
+    same_metric = SimpleMetric(10)
+    dependent = DependentMetric(dependency=SimpleMetric(5))
+    failing = FailingMetric()
+    metrics = [metric, same_metric, dependent.dependency, dependent, failing]
+    engine = PythonEngine()
+    engine.set_metrics(metrics)
+    options = Options(execution=ExecutionOptions(parallel=True, max_workers=2, use_processes=use_processes))
+    ctx = Context(None, metrics, [], dict(), dict(), States.Verified, renderers=DEFAULT_RENDERERS, options=options)
+    for m in metrics:
+        m.set_context(ctx)
+    engine.execute_metrics(ctx, GenericInputData(pd.DataFrame(), pd.DataFrame(), ColumnMapping(), None, {}))
+    assert list(ctx.metric_results.keys()) == [metric, dependent.dependency, dependent, failing]
+    assert ctx.metric_results[metric] == 20
+    assert ctx.metric_results[same_metric] == 20
+    assert ctx.metric_results[dependent] == 30
+    assert isinstance(ctx.metric_results[failing], ErrorResult)
+    assert isinstance(ctx.metric_results[failing].exception, ValueError)
+
+
+class CountingFeature(ApplyColumnGeneratedFeature):
+    class Config:
+        alias_required = False
+
+    __feature_type__: ClassVar = ColumnType.Numerical
+    display_name_template: ClassVar = "Counting for {column_name}"
+    calls: ClassVar[List[int]] = []
+
+    def generate_feature(self, data: pd.DataFrame, data_definition: DataDefinition) -> pd.DataFrame:
+        CountingFeature.calls.append(len(data))
+        return super().generate_feature(data, data_definition)
+
+    def apply(self, value):
+        return len(value)
+
+
+def test_row_features_calculated_once_for_both_datasets():
+    current = pd.DataFrame({"text": ["a", "bb", "ccc"]}, index=[5, 6, 7])
+    reference = pd.DataFrame({"text": ["dddd", "a"], "other": [1, 2]})
+    data = InputData(
+        reference, current, None, None, ColumnMapping(), DataDefinition(columns={}, reference_present=True)
+    )
+    feature = CountingFeature(column_name="text")
+    column = feature.list_columns()[0].name
+
+    CountingFeature.calls.clear()
+    result = PythonEngine().calculate_additional_features(data, [feature], Options())[feature]
+    assert CountingFeature.calls == [5]
+    pd.testing.assert_frame_equal(result.current, pd.DataFrame({column: [1, 2, 3]}, index=[5, 6, 7]))
+    pd.testing.assert_frame_equal(result.reference, pd.DataFrame({column: [4, 1]}))
+
+    CountingFeature.calls.clear()
+    data.reference_data = pd.DataFrame({"text": pd.Series(["dddd", "a"], dtype="category")})
+    result = PythonEngine().calculate_additional_features(data, [feature], Options())[feature]
+    assert CountingFeature.calls == [3, 2]
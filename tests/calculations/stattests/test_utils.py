@@ -4,7 +4,10 @@ import pytest
 
 from evidently.calculations.stattests.tvd_stattest import _total_variation_distance
 from evidently.calculations.stattests.utils import generate_fisher2x2_contingency_table
+from evidently.calculations.stattests.utils import get_uniform_bin_edges
+from evidently.calculations.stattests.utils import get_unique_count_batch
 from evidently.calculations.stattests.utils import get_unique_not_nan_values_list_from_series
+from evidently.calculations.stattests.utils import histogram_batch
 from evidently.calculations.stattests.utils import permutation_test
 
 
@@ -91,3 +94,21 @@ def test_input_data_length_check_generate_fisher2x2_contingency_table(
         match="reference_data and current_data are not of equal length, please ensure that they are of equal length",
     ):
         generate_fisher2x2_contingency_table(current_data, reference_data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        np.random.default_rng(0).normal(size=(3, 1000)),
+        np.random.default_rng(0).integers(0, 7, size=(3, 100)),
+        np.array([[0.1, 0.2, 0.3, 0.7], [1.0, 1.0, 1.0, 1.0]]),
+    ),
+)
+def test_histogram_batch(data: np.ndarray):
+    bin_edges = np.stack([get_uniform_bin_edges(row.min(), row.max(), 10) for row in data])
+    counts = histogram_batch(data, bin_edges)
+    for row, row_edges, row_counts in zip(data, bin_edges, counts):
+        expected_counts, expected_edges = np.histogram(row, bins=10)
+        np.testing.assert_array_equal(row_edges, expected_edges)
+        np.testing.assert_array_equal(row_counts, expected_counts)
+    np.testing.assert_array_equal(get_unique_count_batch(data), [len(np.unique(row)) for row in data])
@@ -4,10 +4,17 @@ import pytest
 from sklearn import metrics
 
 from evidently.calculations.classification_performance import calculate_confusion_by_classes
+from evidently.calculations.classification_performance import calculate_lift_table
 from evidently.calculations.classification_performance import calculate_metrics
+from evidently.calculations.classification_performance import calculate_pr_table
+from evidently.calculations.classification_performance import threshold_probability_labels
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
+from evidently.metric_preset import ClassificationPreset
 from evidently.metric_results import ConfusionMatrix
 from evidently.metric_results import PredictionData
 from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.report import Report
 
 
 def test_calculate_confusion_by_classes():
@@ -58,3 +65,51 @@ def test_calculate_metrics():
     assert actual_result.rate_plots_data.fpr == [pytest.approx(v) for v in [0.0, 0.0, 0.4, 0.4, 0.6, 0.6, 1.0]]
     assert actual_result.rate_plots_data.fnr == [pytest.approx(v) for v in [1.0, 0.8, 0.8, 0.2, 0.2, 0.0, 0.0]]
     assert actual_result.rate_plots_data.tnr == [pytest.approx(v) for v in [1.0, 1.0, 0.6, 0.6, 0.4, 0.4, 0.0]]
+
+
+def test_calculate_pr_and_lift_tables():
+    rng = np.random.default_rng(0)
+    target = rng.integers(0, 2, 250)
+    probas = np.round(rng.random(250), 1)
+    # rows with equal probas keep their order
+    binded = sorted(zip(target.tolist(), probas.tolist()), key=lambda item: item[1], reverse=True)
+
+    pr_table = calculate_pr_table(target, probas)
+    assert len(pr_table) == 21
+    assert pr_table[-1][:2] == [100.0, 250]
+    lift_table = calculate_lift_table(target, probas)
+    assert len(lift_table) == 125
+    for row in pr_table + lift_table:
+        count, prob, tp, fp, precision, recall = row[1:7]
+        assert prob == round(binded[min(count, 249)][1], 2)
+        assert tp == sum(x[0] for x in binded[:count])
+        assert fp == count - tp
+        assert precision == round(100.0 * tp / count, 1)
+        assert recall == round(100.0 * tp / target.sum(), 1)
+
+    assert calculate_pr_table([], []) == []
+
+
+@pytest.mark.parametrize("pos_label,neg_label", [(1, 0), ("a", "b")])
+def test_threshold_probability_labels(pos_label, neg_label):
+    probas = pd.DataFrame({pos_label: [0.1, 0.5, np.nan, 0.9], neg_label: [0.9, 0.5, np.nan, 0.1]}, index=[3, 2, 1, 0])
+    labels = threshold_probability_labels(probas, pos_label, neg_label, 0.5)
+    expected = probas[pos_label].apply(lambda x: pos_label if x >= 0.5 else neg_label)
+    pd.testing.assert_series_equal(labels, expected)
+
+
+def test_prediction_data_shared_between_metrics():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({"target": rng.integers(0, 2, 100), "prediction": rng.random(100)})
+    report = Report(metrics=[ClassificationPreset()])
+    report.run(reference_data=data, current_data=data, column_mapping=ColumnMapping())
+    report._inner_suite.raise_for_error()
+
+    storage = report._inner_suite.context.run_cache._storage
+    # raw and cleaned data of each dataset
+    assert sorted(dataset for dataset, key in storage if key[0] == "prediction_data") == [
+        CURRENT,
+        CURRENT,
+        REFERENCE,
+        REFERENCE,
+    ]
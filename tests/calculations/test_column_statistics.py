@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.base_metric import ColumnName
+from evidently.calculations.column_statistics import ColumnStatisticsCache
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
+from evidently.metrics import ColumnDriftMetric
+from evidently.metrics import ColumnSummaryMetric
+from evidently.metrics import DatasetSummaryMetric
+from evidently.report import Report
+
+
+def test_column_statistics_memoization():
+    data = pd.Series([1.0, 2.0, 2.0, np.nan, np.inf])
+    cache = ColumnStatisticsCache()
+    calls = []
+
+    def calculate():
+        calls.append(1)
+        return 42
+
+    statistics = cache.get(CURRENT, "a", data)
+    assert statistics._get("custom", calculate) == 42
+    assert cache.get(CURRENT, ColumnName.from_any("a"), data)._get("custom", calculate) == 42
+    assert len(calls) == 1
+    assert cache.get(REFERENCE, "a", data)._get("custom", calculate) == 42
+    assert len(calls) == 2
+
+    assert statistics.missing_count() == 1
+    assert statistics.infinite_count() == 1
+    assert statistics.nunique() == 3
+    assert statistics.finite().data.tolist() == [1.0, 2.0, 2.0]
+    assert statistics.finite().value_counts().to_dict() == {2.0: 2, 1.0: 1}
+    hist, edges = statistics.histogram(bins=2)
+    assert hist.tolist() == [1, 2]
+    hist[0] = 100
+    assert statistics.histogram(bins=2)[0].tolist() == [1, 2]
+
+    finite = statistics.finite().data
+    finite.iloc[0] = 100.0
+    finite.drop(finite.index[1], inplace=True)
+    assert statistics.finite().data.tolist() == [1.0, 2.0, 2.0]
+
+    with pytest.raises(ValueError):
+        cache.get(CURRENT, "a", data.dropna())
+
+
+def test_column_statistics_shared_between_metrics():
+    data = pd.DataFrame({"a": [1.0, 2.0, 3.0, 2.0], "b": ["x", "y", "x", None]})
+    report = Report(
+        metrics=[
+            ColumnSummaryMetric(column_name="b"),
+            DatasetSummaryMetric(),
+            ColumnDriftMetric(column_name="a"),
+        ]
+    )
+    report.run(reference_data=data, current_data=data)
+    report._inner_suite.raise_for_error()
+
+    storage = report._inner_suite.context.column_statistics._storage
+    assert (CURRENT, "b", "value_counts", (False, True)) in storage
+    assert (REFERENCE, "b", "nunique", ()) in storage
+    assert (CURRENT, "a", "finite", "histogram", (10, True)) in storage
@@ -2,10 +2,12 @@ from typing import List
 from typing import Optional
 from typing import Union
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from evidently.calculations.data_drift import ensure_prediction_column_is_string
+from evidently.calculations.data_drift import get_drift_for_columns
 from evidently.calculations.data_drift import get_one_column_drift
 from evidently.core import ColumnType
 from evidently.options.data_drift import DataDriftOptions
@@ -208,3 +210,54 @@ def test_get_one_column_drift_value_error(
             agg_data=False,
         )
     assert error.value.args[0] == expected_value_error
+
+
+@pytest.mark.parametrize(
+    "options",
+    (
+        DataDriftOptions(),
+        DataDriftOptions(per_feature_stattest={"float": "psi", "int": "kl_div", "few_values": "jensenshannon"}),
+    ),
+)
+def test_get_drift_for_columns_batch_same_as_one_column(options: DataDriftOptions):
+    rng = np.random.default_rng(0)
+
+    def dataset(size: int, shift: float) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "float": rng.normal(shift, 1, size),
+                "int": rng.integers(0, 100, size),
+                "few_values": rng.integers(0, 4, size),
+                "constant": np.ones(size),
+                "with_nans": np.where(rng.random(size) > 0.1, rng.normal(shift, 1, size), np.nan),
+                "category": rng.choice(["a", "b"], size),
+            }
+        )
+
+    reference_data = dataset(2000, 0)
+    current_data = dataset(500, 0.3)
+    column_mapping = ColumnMapping(categorical_features=["category"])
+    dataset_columns = process_columns(reference_data, column_mapping)
+    result = get_drift_for_columns(
+        current_data=current_data,
+        reference_data=reference_data,
+        dataset_columns=dataset_columns,
+        data_drift_options=options,
+        agg_data=True,
+    )
+    for column_name, column_drift in result.drift_by_columns.items():
+        expected = get_one_column_drift(
+            current_data=current_data,
+            reference_data=reference_data,
+            column_name=column_name,
+            options=options,
+            dataset_columns=dataset_columns,
+            column_type=ColumnType(column_drift.column_type),
+            agg_data=True,
+        )
+        assert column_drift.stattest_name == expected.stattest_name
+        assert column_drift.drift_score == expected.drift_score
+        assert column_drift.drift_detected == expected.drift_detected
+        assert column_drift.stattest_threshold == expected.stattest_threshold
+        assert column_drift.current.small_distribution == expected.current.small_distribution
+        assert column_drift.reference.small_distribution == expected.reference.small_distribution
@@ -1,9 +1,11 @@
 import numpy as np
 import pandas as pd
 import pytest
+from scipy.stats import chi2_contingency
 
 from evidently.calculations.data_quality import calculate_column_distribution
 from evidently.calculations.data_quality import calculate_cramer_v_correlation
+from evidently.calculations.data_quality import get_cramer_v_matrix
 from evidently.calculations.data_quality import get_rows_count
 from evidently.metric_results import ColumnCorrelations
 from evidently.metric_results import Distribution
@@ -52,3 +54,31 @@ def test_calculate_cramer_v_correlations():
             y=[1.0, 1.0, 1.0],
         ),
     )
+
+
+def _crosstab_cramer_v(x: pd.Series, y: pd.Series) -> float:
+    arr = pd.crosstab(x, y).values
+    dof = min(arr.shape) - 1
+    if dof == 0:
+        return np.nan
+    return np.sqrt(chi2_contingency(arr, correction=False)[0] / arr.sum() / dof)
+
+
+@pytest.mark.parametrize("block_size", [2**22, 10])
+@pytest.mark.parametrize("parallel", [False, True])
+def test_get_cramer_v_matrix(monkeypatch, block_size, parallel):
+    monkeypatch.setattr("evidently.calculations.data_quality.CONTINGENCY_BLOCK_SIZE", block_size)
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({f"c{i}": rng.integers(0, i + 2, 200).astype(object) for i in range(5)})
+    data.loc[rng.random(200) < 0.1, "c1"] = None
+    data["c5"] = pd.Categorical(rng.choice(["x", "y"], 200), categories=["x", "y", "z"])
+    data["c6"] = np.where(data["c0"] == 0, "a", None)
+
+    matrix = get_cramer_v_matrix(data, parallel=parallel, max_workers=2)
+    expected = np.eye(data.shape[1])
+    for i, x in enumerate(data.columns):
+        for j, y in enumerate(data.columns):
+            if i != j:
+                expected[i, j] = _crosstab_cramer_v(data[x], data[y])
+    np.testing.assert_allclose(matrix.to_numpy(), expected, rtol=1e-12)
+    assert list(matrix.columns) == list(data.columns)
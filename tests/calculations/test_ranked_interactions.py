@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from evidently.calculations.ranked_interactions import RankedInteractions
+from evidently.calculations.run_cache import CURRENT
+from evidently.calculations.run_cache import REFERENCE
+from evidently.metric_preset import RecsysPreset
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.column_mapping import RecomType
+from evidently.report import Report
+
+
+def test_ranked_interactions():
+    data = pd.DataFrame(
+        {
+            "user_id": ["a", "a", "b", "a", None, "b"],
+            "item_id": [1, 2, 1, 3, 2, np.nan],
+            "prediction": [0.5, 0.9, 0.1, 0.5, 0.3, 0.7],
+            "target": [1, 0, 0, 3, 1, 2],
+        }
+    )
+    ranked = RankedInteractions.from_data(data, "user_id", "item_id", "prediction", "target", RecomType.SCORE)
+    expected = data.groupby("user_id")["prediction"].transform("rank", ascending=False)
+    np.testing.assert_array_equal(ranked.ranks, expected.to_numpy())
+    assert ranked.top_k(1).tolist() == [False, True, False, False, False, True]
+    assert ranked.relevant().tolist() == [True, False, False, True, True, True]
+    assert ranked.relevant(2).tolist() == [False, False, False, True, False, True]
+    assert ranked.user_values(ranked.top_k(2)).tolist() == ["a", "b", "b"]
+    assert pd.isna(ranked.user_values()[4])
+    np.testing.assert_array_equal(ranked.map_items({1: 10, 2: 20}), [10, 20, 10, np.nan, 20, np.nan])
+
+    ranked = RankedInteractions.from_data(data, "user_id", None, "target", None, RecomType.RANK)
+    assert ranked.top_k(1).tolist() == [True, True, True, False, True, False]
+
+
+def test_ranked_interactions_shared_between_metrics(monkeypatch):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "user_id": np.repeat(np.arange(20), 5),
+            "item_id": rng.integers(0, 15, 100),
+            "prediction": rng.random(100),
+            "target": rng.integers(0, 2, 100),
+            "item_f": rng.random(100),
+        }
+    )
+    train = data[["user_id", "item_id", "item_f"]]
+    built = []
+    from_data = RankedInteractions.from_data.__func__
+
+    def counting_from_data(cls, data, *args):
+        built.append(args)
+        return from_data(cls, data, *args)
+
+    monkeypatch.setattr(RankedInteractions, "from_data", classmethod(counting_from_data))
+    report = Report(metrics=[RecsysPreset(k=3, item_features=["item_f"])])
+    report.run(
+        reference_data=data,
+        current_data=data,
+        column_mapping=ColumnMapping(recommendations_type=RecomType.SCORE, user_id="user_id", item_id="item_id"),
+        additional_data={"current_train_data": train},
+    )
+    report._inner_suite.raise_for_error()
+
+    storage = report._inner_suite.context.run_cache._storage
+    assert sorted(dataset for dataset, key in storage if key[0] == "ranked_interactions") == [CURRENT, REFERENCE]
+    # each dataset is ranked once for all metrics
+    assert len(built) == 2
@@ -1,18 +1,37 @@
 import asyncio
+import io
+import json
 import os.path
 import sys
+import time
 
 import pandas as pd
 import pytest
 from litestar.testing import TestClient
 
 from evidently._pydantic_compat import parse_obj_as
+from evidently.collector.app import CollectorTasks
+from evidently.collector.app import _reference_key
+from evidently.collector.app import _run_report_in_worker
+from evidently.collector.app import _worker_references
 from evidently.collector.app import check_snapshots_factory
+from evidently.collector.app import push_data
 from evidently.collector.config import CollectorConfig
 from evidently.collector.config import CollectorServiceConfig
+from evidently.collector.config import ReportConfig
+from evidently.collector.stats import ServiceStats
+from evidently.collector.storage import ARROW_STREAM_CONTENT_TYPE
+from evidently.collector.storage import PARQUET_CONTENT_TYPE
+from evidently.collector.storage import DiskBufferStorage
+from evidently.collector.storage import InMemoryStorage
+from evidently.collector.storage import write_arrow_stream
+from evidently.metrics import ColumnSummaryMetric
+from evidently.options.base import Options
 from evidently.ui.storage.common import NoopAuthManager
 from evidently.ui.storage.local import create_local_project_manager
 from evidently.ui.workspace.view import WorkspaceView
+from tests.collector.conftest import ReportBaseMock
+from tests.collector.conftest import ReportConfigMock
 from tests.ui.conftest import HEADERS
 from tests.ui.conftest import _dumps
 
@@ -62,6 +81,22 @@ def test_set_reference(
     pd.testing.assert_frame_equal(saved_reference, mock_reference)
 
 
+def test_set_reference_with_reference_profile(
+    collector_test_client: TestClient,
+    collector_service_config: CollectorServiceConfig,
+    mock_collector_config,
+    mock_reference,
+):
+    mock_collector_config.id = "new"
+    mock_collector_config.reference_profile_path = "profile.parquet"
+    collector_service_config.collectors["new"] = mock_collector_config
+
+    r = collector_test_client.post("/new/reference", json=mock_reference.to_dict())
+
+    assert r.status_code == 400
+    assert mock_collector_config.reference_path is None
+
+
 def test_push_data(
     collector_test_client: TestClient,
     collector_service_config: CollectorServiceConfig,
@@ -124,3 +159,236 @@ def test_create_snapshot_and_get_logs(
         {"error": "", "ok": True, "report_id": snapshot_id, "type": "UploadReport"},
         {"error": "", "ok": True, "report_id": snapshot_id, "type": "CreateReport"},
     ]
+
+
+class SlowReportConfigMock(ReportConfigMock):
+    def to_report_base(self):
+        return SlowReportBaseMock()
+
+
+class SlowReportBaseMock(ReportBaseMock):
+    def run(self, *args, **kwargs):
+        time.sleep(0.5)
+        super().run(*args, **kwargs)
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_data_is_pushed_while_report_is_computed(
+    collector_service_config: CollectorServiceConfig,
+    mock_collector_config,
+    mock_reference,
+    ui_workspace: WorkspaceView,
+    workers,
+    tmp_path,
+):
+    mock_collector_config.id = "new"
+    mock_collector_config.report_config = SlowReportConfigMock(
+        metrics=[], tests=[], options=Options(), metadata={}, tags=[]
+    )
+    collector_service_config.collectors["new"] = mock_collector_config
+    mock_collector_config.reference_path = str(tmp_path / "reference.parquet")
+    mock_reference.to_parquet(mock_collector_config.reference_path)
+    storage = collector_service_config.storage
+    storage.init("new")
+    mock_collector_config._workspace = ui_workspace
+    project = ui_workspace.create_project("proj")
+    mock_collector_config.project_id = str(project.id)
+
+    async def run():
+        tasks = CollectorTasks(workers)
+        storage.append("new", mock_reference.to_dict())
+        tasks.schedule(collector_service_config, storage)
+        await asyncio.sleep(0.1)
+        assert not storage.lock("new").locked()
+        async with storage.lock("new"):
+            storage.append("new", mock_reference.to_dict())
+        await tasks.wait()
+        tasks.shutdown()
+
+    asyncio.run(run())
+    assert len(project.list_snapshots()) == 1
+    assert storage.get_buffer_size("new") == 1
+    assert [log.type for log in storage.get_logs("new")] == ["UploadReport", "CreateReport"]
+
+
+def test_push_data_to_disk_does_not_block_event_loop(
+    collector_service_config: CollectorServiceConfig, mock_collector_config, mock_reference, tmp_path, monkeypatch
+):
+    mock_collector_config.id = "new"
+    collector_service_config.collectors["new"] = mock_collector_config
+    storage = DiskBufferStorage(path=str(tmp_path / "buffers"))
+    storage.init("new")
+    append = DiskBufferStorage.append
+
+    def slow_append(self, id, data):
+        time.sleep(0.3)
+        append(self, id, data)
+
+    monkeypatch.setattr(DiskBufferStorage, "append", slow_append)
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await push_data.fn(
+            id="new",
+            data=mock_reference.to_dict(),
+            service=collector_service_config,
+            storage=storage,
+            stats=ServiceStats(),
+        )
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(run()) > 5
+    assert storage.get_buffer_size("new") == 1
+
+
+def _bulk_bodies(data: pd.DataFrame):
+    parquet = io.BytesIO()
+    data.to_parquet(parquet)
+    return [
+        (write_arrow_stream(data), ARROW_STREAM_CONTENT_TYPE),
+        (parquet.getvalue(), PARQUET_CONTENT_TYPE),
+        (json.dumps(data.to_dict(orient="list")), "application/json"),
+    ]
+
+
+@pytest.mark.parametrize("storage", [InMemoryStorage(), DiskBufferStorage()])
+def test_push_data_bulk(
+    collector_test_client: TestClient,
+    collector_service_config: CollectorServiceConfig,
+    mock_collector_config,
+    tmp_path,
+    storage,
+):
+    mock_collector_config.id = "new"
+    collector_service_config.collectors["new"] = mock_collector_config
+    if isinstance(storage, DiskBufferStorage):
+        storage.path = str(tmp_path / "buffers")
+    collector_service_config.storage = storage
+    storage.init("new")
+    data = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"], "c": [0.5, None, 1.5]})
+
+    for body, content_type in _bulk_bodies(data):
+        r = collector_test_client.post("/new/data/bulk", content=body, headers={"Content-Type": content_type})
+        r.raise_for_status()
+    assert storage.get_buffer_size("new") == 3
+    # default index is not kept by bulk data
+    pd.testing.assert_frame_equal(
+        storage.get_and_flush("new").reset_index(drop=True), pd.concat([data] * 3, ignore_index=True)
+    )
+
+    r = collector_test_client.post("/new/data/bulk", content=b"[1, 2]", headers={"Content-Type": "application/json"})
+    assert r.status_code == 400
+    r = collector_test_client.post("/new/data/bulk", content=b"a,b", headers={"Content-Type": "text/csv"})
+    assert r.status_code == 400
+
+
+def test_push_data_backpressure_and_metrics(
+    collector_test_client: TestClient,
+    collector_service_config: CollectorServiceConfig,
+    mock_collector_config,
+    mock_reference,
+):
+    mock_collector_config.id = "new"
+    mock_collector_config.max_buffer_rows = 3
+    collector_service_config.collectors["new"] = mock_collector_config
+    collector_service_config.storage.init("new")
+
+    for _ in range(2):
+        r = collector_test_client.post("/new/data", json=mock_reference.to_dict())
+        r.raise_for_status()
+    r = collector_test_client.post("/new/data", json=mock_reference.to_dict())
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+    r = collector_test_client.post(
+        "/new/data/bulk",
+        content=write_arrow_stream(mock_reference),
+        headers={"Content-Type": ARROW_STREAM_CONTENT_TYPE},
+    )
+    assert r.status_code == 429
+
+    r = collector_test_client.get("/new/metrics")
+    r.raise_for_status()
+    metrics = r.json()
+    assert metrics["buffer_payloads"] == 2
+    assert metrics["buffer_rows"] == 4
+    assert metrics["buffer_bytes"] > 0
+    assert metrics["ingested_rows"] == 4
+    assert metrics["ingestion_rate"] > 0
+    assert metrics["rejected_pushes"] == 2
+    assert metrics["report_latency"] == {"count": 0, "last": None, "mean": None, "max": None}
+
+    collector_service_config.storage.get_and_flush("new")
+    r = collector_test_client.post("/new/data", json=mock_reference.to_dict())
+    r.raise_for_status()
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_reference_profile_statistics_are_kept(
+    collector_service_config: CollectorServiceConfig,
+    mock_collector_config,
+    mock_reference,
+    ui_workspace: WorkspaceView,
+    workers,
+    tmp_path,
+):
+    mock_collector_config.id = "new"
+    mock_collector_config.report_config = ReportConfig(
+        metrics=[ColumnSummaryMetric(column_name="a")], tests=[], options=Options(), metadata={}, tags=[]
+    )
+    collector_service_config.collectors["new"] = mock_collector_config
+    mock_collector_config.reference_path = str(tmp_path / "reference.parquet")
+    pd.DataFrame({"a": [1.0, 2.0, 3.0]}).to_parquet(mock_collector_config.reference_path)
+    profile = mock_collector_config.reference
+    storage = collector_service_config.storage
+    storage.init("new")
+    mock_collector_config._workspace = ui_workspace
+    project = ui_workspace.create_project("proj")
+    mock_collector_config.project_id = str(project.id)
+
+    async def run():
+        tasks = CollectorTasks(workers)
+        storage.append("new", mock_reference.to_dict())
+        tasks.schedule(collector_service_config, storage)
+        await tasks.wait()
+        tasks.shutdown()
+
+    asyncio.run(run())
+    assert [log.type for log in storage.get_logs("new")] == ["UploadReport", "CreateReport"]
+    assert len(project.list_snapshots()) == 1
+    # statistics calculated in worker process are kept in profile of service process
+    assert len(profile.statistics) > 0
+
+
+def test_worker_reads_reference_once(mock_collector_config, tmp_path):
+    mock_collector_config.id = "new"
+    mock_collector_config.reference_path = str(tmp_path / "reference.parquet")
+    pd.DataFrame({"a": [1.0, 2.0, 3.0]}).to_parquet(mock_collector_config.reference_path)
+    current = pd.DataFrame({"a": [1.0, 2.0]})
+
+    def run():
+        report = ReportConfig(
+            metrics=[ColumnSummaryMetric(column_name="a")], tests=[], options=Options(), metadata={}, tags=[]
+        ).to_report_base()
+        return _run_report_in_worker(report, _reference_key(mock_collector_config), current)
+
+    _, statistics = run()
+    assert len(statistics) > 0
+    # cached reference keeps statistics, so the next report does not calculate them
+    assert run()[1] == {}
+    assert len([key for key in _worker_references if key[0] == "new"]) == 1
+
+    # rewritten reference file is read again and replaces previous one
+    time.sleep(0.01)
+    pd.DataFrame({"a": [4.0, 5.0]}).to_parquet(mock_collector_config.reference_path)
+    assert len(run()[1]) > 0
+    assert len([key for key in _worker_references if key[0] == "new"]) == 1
+    _worker_references.clear()
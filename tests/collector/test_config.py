@@ -2,13 +2,18 @@ import time
 from typing import Union
 from unittest.mock import Mock
 
+import pandas as pd
 import pytest
 
 from evidently._pydantic_compat import ValidationError
+from evidently.collector.config import CollectorConfig
 from evidently.collector.config import IntervalTrigger
+from evidently.collector.config import ReportConfig
 from evidently.collector.config import RowsCountOrIntervalTrigger
 from evidently.collector.config import RowsCountTrigger
 from evidently.collector.storage import CollectorStorage
+from evidently.options.base import Options
+from evidently.pipeline.reference_profile import ReferenceProfile
 
 
 def test_interval_trigger_work():
@@ -29,7 +34,7 @@ def test_interval_trigger_invalid_interval(interval: float):
 
 def test_row_count_trigger_work():
     storage = Mock(spec=CollectorStorage)
-    storage.get_buffer_size = Mock(side_effect=[0, 1, 0])
+    storage.get_buffer_rows = Mock(side_effect=[0, 1, 0])
     config = Mock()
     trigger = RowsCountTrigger(rows_count=1)
 
@@ -46,7 +51,7 @@ def test_rows_count_trigger_invalid_rows_count(rows_count: Union[int, float]):
 
 def test_rows_count_or_interval_trigger_work():
     storage = Mock(spec=CollectorStorage)
-    storage.get_buffer_size = Mock(side_effect=[1])
+    storage.get_buffer_rows = Mock(side_effect=[1])
     config = Mock()
     trigger = RowsCountOrIntervalTrigger(
         rows_count_trigger=RowsCountTrigger(rows_count=1), interval_trigger=IntervalTrigger(interval=0.1)
@@ -55,3 +60,26 @@ def test_rows_count_or_interval_trigger_work():
     assert trigger.is_ready(config, storage)
     # Rows count trigger
     assert trigger.is_ready(config, storage)
+
+
+def test_collector_config_reference_profile(tmp_path):
+    data = pd.DataFrame({"a": [1, 2, 3]})
+    profile_path = str(tmp_path / "reference.profile")
+    ReferenceProfile(data).save(profile_path)
+    data_path = str(tmp_path / "reference.parquet")
+    data.to_parquet(data_path)
+
+    config = CollectorConfig(
+        trigger=IntervalTrigger(interval=1),
+        report_config=ReportConfig(metrics=[], tests=[], options=Options(), metadata={}, tags=[]),
+        reference_path=data_path,
+        project_id="project",
+    )
+    assert isinstance(config.reference, ReferenceProfile)
+    assert config.reference is config.reference
+    config.cache_reference = False
+    config._reference = None
+    assert isinstance(config.reference, pd.DataFrame)
+    config.reference_profile_path = profile_path
+    assert isinstance(config.reference, ReferenceProfile)
+    pd.testing.assert_frame_equal(config.reference.data, data)
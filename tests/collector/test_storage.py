@@ -0,0 +1,137 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from evidently._pydantic_compat import parse_obj_as
+from evidently.collector.storage import CollectorStorage
+from evidently.collector.storage import DiskBufferStorage
+from evidently.collector.storage import InMemoryStorage
+
+# payloads are parsed from json requests
+BATCHES = [
+    json.loads(json.dumps(frame.to_dict()))
+    for frame in [
+        pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}, index=[0, 1]),
+        pd.DataFrame({"a": [3, None], "b": ["z", None]}, index=[2, 3]),
+        pd.DataFrame({"a": [4], "c": [True]}, index=[4]),
+        # mixed types are not supported by arrow
+        pd.DataFrame({"a": [5, "five"]}, index=[5, 6]),
+        pd.DataFrame({"a": [7.5, 8.5], "b": ["u", "v"]}, index=[7, 8]),
+    ]
+]
+
+
+def _expected(batches):
+    storage = InMemoryStorage()
+    storage.init("id")
+    for batch in batches:
+        storage.append("id", batch)
+    return storage.get_and_flush("id")
+
+
+@pytest.mark.parametrize("max_memory_bytes", [0, 2**20])
+def test_disk_buffer_storage(tmp_path, max_memory_bytes):
+    storage = DiskBufferStorage(path=str(tmp_path), max_memory_bytes=max_memory_bytes)
+    storage.init("id")
+    assert storage.get_and_flush("id") is None
+    for batch in BATCHES:
+        storage.append("id", batch)
+    assert storage.get_buffer_size("id") == len(BATCHES)
+    assert storage.get_buffer_rows("id") == 9
+    assert storage.get_buffer_bytes("id") > 0
+
+    pd.testing.assert_frame_equal(storage.get_and_flush("id"), _expected(BATCHES))
+    assert storage.get_buffer_size("id") == 0
+    assert storage.get_buffer_rows("id") == 0
+    assert storage.get_buffer_bytes("id") == 0
+    assert storage.get_and_flush("id") is None
+    assert os.listdir(tmp_path / "id") == []
+
+    storage.append("id", BATCHES[0])
+    pd.testing.assert_frame_equal(storage.get_and_flush("id"), _expected(BATCHES[:1]))
+
+
+def test_disk_buffer_storage_restart(tmp_path):
+    storage = parse_obj_as(
+        CollectorStorage, {"type": "evidently:collector_storage:DiskBufferStorage", "path": str(tmp_path)}
+    )
+    storage.init("id")
+    for batch in BATCHES[:3]:
+        storage.append("id", batch)
+
+    restarted = DiskBufferStorage(path=str(tmp_path))
+    restarted.init("id")
+    assert restarted.get_buffer_size("id") == 3
+    assert restarted.get_buffer_rows("id") == 5
+    for batch in BATCHES[3:]:
+        restarted.append("id", batch)
+    pd.testing.assert_frame_equal(restarted.get_and_flush("id"), _expected(BATCHES))
+
+
+def test_disk_buffer_storage_incomplete_segment(tmp_path):
+    storage = DiskBufferStorage(path=str(tmp_path))
+    storage.init("id")
+    storage.append("id", BATCHES[0])
+    storage.append("id", BATCHES[0])
+    (segment,) = os.listdir(tmp_path / "id")
+    path = tmp_path / "id" / segment
+    with open(path, "rb+") as f:
+        f.truncate(os.path.getsize(path) - 8)
+
+    restarted = DiskBufferStorage(path=str(tmp_path))
+    restarted.init("id")
+    assert restarted.get_buffer_size("id") == 1
+    pd.testing.assert_frame_equal(restarted.get_and_flush("id"), _expected(BATCHES[:1]))
+
+
+def test_in_memory_storage_buffer_rows():
+    storage = InMemoryStorage()
+    storage.init("id")
+    for batch in BATCHES:
+        storage.append("id", batch)
+    assert storage.get_buffer_rows("id") == 9
+    assert storage.get_buffer_bytes("id") > 0
+    storage.get_and_flush("id")
+    assert storage.get_buffer_rows("id") == 0
+    assert storage.get_buffer_bytes("id") == 0
+
+
+class BatchListStorage(CollectorStorage):
+    """Storage implementing only methods that storages had before buffer limits"""
+
+    class Config:
+        type_alias = "test:collector_storage:BatchListStorage"
+
+    _batches: list = []
+
+    def append(self, id: str, data):
+        self._batches.append(data)
+
+    def get_buffer_size(self, id: str):
+        return len(self._batches)
+
+    def get_and_flush(self, id: str):
+        self._batches = []
+
+    def log(self, id: str, event):
+        pass
+
+    def get_logs(self, id: str):
+        return []
+
+    def add_report(self, id: str, report):
+        pass
+
+    def take_reports(self, id: str):
+        return []
+
+
+def test_storage_buffer_limits_defaults():
+    storage = BatchListStorage()
+    storage.init("id")
+    for batch in BATCHES[:2]:
+        storage.append("id", batch)
+    assert storage.get_buffer_rows("id") == 2
+    assert storage.get_buffer_bytes("id") == 0
@@ -0,0 +1,90 @@
+import time
+from typing import Any
+from typing import ClassVar
+from typing import List
+
+import pandas as pd
+
+from evidently import ColumnType
+from evidently.descriptors import TextLength
+from evidently.features.feature_cache import FeatureCache
+from evidently.features.generated_features import ApplyColumnGeneratedFeature
+from evidently.features.text_length_feature import TextLength as TextLengthFeature
+from evidently.metrics import ColumnSummaryMetric
+from evidently.options.base import Options
+from evidently.options.execution import ExecutionOptions
+from evidently.report import Report
+from evidently.utils.data_preprocessing import DataDefinition
+
+
+class CountingFeature(ApplyColumnGeneratedFeature):
+    class Config:
+        alias_required = False
+
+    __feature_type__: ClassVar = ColumnType.Numerical
+    display_name_template: ClassVar = "Counting for {column_name}"
+    calls: ClassVar[List[Any]] = []
+
+    def apply(self, value: Any):
+        CountingFeature.calls.append(value)
+        return len(value) * 1.5
+
+
+def _generate(cache: FeatureCache, feature, data: pd.DataFrame) -> pd.DataFrame:
+    return cache.generate_features(feature, data, DataDefinition(columns={}, reference_present=False), Options())
+
+
+def test_feature_cache_calculates_only_new_rows(tmp_path):
+    path = str(tmp_path / "features.cache")
+    feature = CountingFeature(column_name="text")
+    data = pd.DataFrame({"text": ["a", "bb", "a", "ccc"], "other": [1, 2, 3, 4]}, index=[10, 11, 12, 13])
+    expected = feature.generate_features_renamed(data, DataDefinition(columns={}, reference_present=False), Options())
+
+    CountingFeature.calls.clear()
+    with FeatureCache(path, max_size=10**6) as cache:
+        pd.testing.assert_frame_equal(_generate(cache, feature, data), expected)
+    assert CountingFeature.calls == ["a", "bb", "ccc"]
+
+    CountingFeature.calls.clear()
+    new_data = pd.DataFrame({"text": ["ccc", "dddd", "a"], "other": [5, 6, 7]})
+    with FeatureCache(path, max_size=10**6) as cache:
+        result = _generate(cache, CountingFeature(column_name="text", display_name="other name"), new_data)
+        assert result.iloc[:, 0].tolist() == [4.5, 6.0, 1.5]
+        assert result.index.tolist() == [0, 1, 2]
+        # other features and columns are cached separately
+        _generate(cache, CountingFeature(column_name="other_text"), new_data.rename(columns={"text": "other_text"}))
+    assert CountingFeature.calls == ["dddd", "ccc", "dddd", "a"]
+
+
+def test_feature_cache_eviction(tmp_path):
+    path = str(tmp_path / "features.cache")
+    feature = CountingFeature(column_name="text")
+    with FeatureCache(path, max_size=10**6) as cache:
+        _generate(cache, feature, pd.DataFrame({"text": [str(i) for i in range(100)]}))
+        full_size = cache.size()
+        time.sleep(0.01)
+        _generate(cache, feature, pd.DataFrame({"text": ["99"]}))
+    with FeatureCache(path, max_size=full_size // 2) as cache:
+        _generate(cache, feature, pd.DataFrame({"text": ["new"]}))
+        assert 0 < cache.size() <= full_size // 2
+        CountingFeature.calls.clear()
+        _generate(cache, feature, pd.DataFrame({"text": ["new", "0", "99"]}))
+    # least recently used values are evicted first
+    assert CountingFeature.calls == ["0"]
+
+
+def test_report_with_feature_cache(tmp_path):
+    data = pd.DataFrame({"text": ["a", "bb", None, "dddd"]})
+    options = Options(execution=ExecutionOptions(feature_cache_path=str(tmp_path / "features.cache")))
+
+    def run(options):
+        report = Report(metrics=[ColumnSummaryMetric(column_name=TextLength().for_column("text"))], options=options)
+        report.run(reference_data=data, current_data=data)
+        return report
+
+    expected = run(Options()).as_dict()
+    assert run(options).as_dict() == expected
+    assert run(options).as_dict() == expected
+    with FeatureCache(str(tmp_path / "features.cache"), max_size=10**6) as cache:
+        key = TextLengthFeature("text").get_cache_fingerprint()
+        assert len(cache._connection.execute("SELECT * FROM feature_values WHERE feature = ?", (key,)).fetchall()) == 4
@@ -1,5 +1,7 @@
 import json
 import re
+import threading
+import time
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -10,8 +12,10 @@ import pandas as pd
 import pytest
 
 from evidently.features.llm_judge import BinaryClassificationPromptTemplate
+from evidently.features.llm_judge import LLMExecutionOptions
 from evidently.features.llm_judge import LLMJudge
 from evidently.features.llm_judge import LLMMessage
+from evidently.features.llm_judge import LLMRateLimitError
 from evidently.features.llm_judge import LLMResponseParseError
 from evidently.features.llm_judge import LLMWrapper
 from evidently.features.llm_judge import llm_provider
@@ -123,3 +127,69 @@ def test_multicol_llm_judge():
     dd = DataDefinition(columns={}, reference_present=False)
     fts = llm_judge.generate_features(data, dd, Options())
     pd.testing.assert_frame_equal(fts, pd.DataFrame({"category": ["A", "B"]}))
+
+
+class StubLLMWrapper(LLMWrapper):
+    def __init__(self, rate_limited: int = 0):
+        self.rate_limited = rate_limited
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def complete(self, messages: List[LLMMessage]) -> str:
+        with self.lock:
+            self.calls += 1
+            if self.rate_limited > 0:
+                self.rate_limited -= 1
+                raise LLMRateLimitError("rate limit", retry_after=0)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        return messages[-1][1]
+
+
+def test_batch_complete_concurrency():
+    wrapper = StubLLMWrapper()
+    messages = [[("user", str(i))] for i in range(20)]
+
+    responses = wrapper.batch_complete(messages, LLMExecutionOptions(max_concurrency=4))
+    assert responses == [str(i) for i in range(20)]
+    assert 1 < wrapper.max_active <= 4
+
+    wrapper = StubLLMWrapper()
+    assert wrapper.batch_complete(messages, LLMExecutionOptions(max_concurrency=1)) == [str(i) for i in range(20)]
+    assert wrapper.max_active == 1
+
+
+def test_batch_complete_retries():
+    wrapper = StubLLMWrapper(rate_limited=3)
+    messages = [[("user", str(i))] for i in range(5)]
+    assert wrapper.batch_complete(messages, LLMExecutionOptions(max_retries=3)) == [str(i) for i in range(5)]
+    assert wrapper.calls == 8
+
+    wrapper = StubLLMWrapper(rate_limited=3)
+    with pytest.raises(LLMRateLimitError):
+        wrapper.batch_complete(messages[:1], LLMExecutionOptions(max_retries=2))
+
+
+def test_llm_judge_execution_options():
+    wrapper = StubLLMWrapper()
+    llm_judge = LLMJudge(
+        input_column="text",
+        provider="mock",
+        model="",
+        template=BinaryClassificationPromptTemplate(
+            template='{{{{"category": "{{input}}"}}}}', target_category="A", non_target_category="B"
+        ),
+    )
+    llm_judge._llm_wrapper = wrapper
+
+    data = pd.DataFrame({"text": ["A", "B", "A", "A"]})
+    dd = DataDefinition(columns={}, reference_present=False)
+    options = Options.from_list([LLMExecutionOptions(max_concurrency=2)])
+    fts = llm_judge.generate_features(data, dd, options)
+    pd.testing.assert_frame_equal(fts, pd.DataFrame({"category": ["A", "B", "A", "A"]}))
+    assert wrapper.max_active <= 2
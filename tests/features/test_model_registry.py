@@ -0,0 +1,61 @@
+import pandas as pd
+
+from evidently.features.model_registry import ModelRegistry
+
+
+def test_model_registry_lru():
+    registry = ModelRegistry(max_size=2)
+    loads = []
+
+    def loader(name):
+        def load():
+            loads.append(name)
+            return f"model {name}"
+
+        return load
+
+    assert registry.get("a", loader("a")) == "model a"
+    assert registry.get("b", loader("b")) == "model b"
+    assert registry.get("a", loader("a")) == "model a"
+    assert loads == ["a", "b"]
+
+    registry.get("c", loader("c"))
+    assert "b" not in registry
+    assert "a" in registry and "c" in registry
+    registry.get("b", loader("b"))
+    assert loads == ["a", "b", "c", "b"]
+    assert len(registry) == 2
+
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_model_registry_disabled():
+    registry = ModelRegistry(max_size=0)
+    assert registry.get("a", lambda: 1) == 1
+    assert len(registry) == 0
+
+
+def test_toxicity_feature_batches(monkeypatch):
+    from evidently.features import hf_feature
+    from evidently.features.model_registry import InferenceOptions
+    from evidently.options.base import Options
+
+    calls = []
+
+    class Module:
+        def compute(self, predictions, toxic_label="hate"):
+            calls.append((list(predictions), toxic_label))
+            return {"toxicity": [float(len(text)) for text in predictions]}
+
+    monkeypatch.setattr(hf_feature, "get_evaluate_module", lambda *args, **kwargs: Module())
+    data = pd.DataFrame({"text": ["a", "bb", "ccc", "dddd", "eeeee"]}, index=[5, 4, 3, 2, 1])
+    feature = hf_feature.HuggingFaceToxicityFeature(
+        column_name="text", display_name="toxicity", toxic_label="offensive"
+    )
+
+    result = feature.generate_features(data, None, Options(custom={InferenceOptions: InferenceOptions(batch_size=2)}))
+
+    assert calls == [(["a", "bb"], "offensive"), (["ccc", "dddd"], "offensive"), (["eeeee"], "offensive")]
+    assert result[feature.name].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert result.index.tolist() == [5, 4, 3, 2, 1]
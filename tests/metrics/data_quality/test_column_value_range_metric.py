@@ -255,3 +255,8 @@ def test_data_quality_values_in_range_metric_with_report(
     result = json.loads(result_json)
     assert result["metrics"][0]["metric"] == "ColumnValueRangeMetric"
     assert result["metrics"][0]["result"] == expected_json
+
+
+def test_column_value_range_metric_is_not_mergeable():
+    # bins of distributions depend on the whole current data
+    assert not ColumnValueRangeMetric(column_name="col", left=0, right=10).is_mergeable()
@@ -45,3 +45,32 @@ def test_curr_scores():
 
     results = metric.get_result()
     assert np.isclose(results.current_value, 1.0963345074906863)
+
+
+def test_matches_pairwise_distances():
+    rng = np.random.default_rng(0)
+    curr = pd.DataFrame(
+        {
+            "user_id": np.repeat(np.arange(50), 6),
+            "item_id": rng.integers(0, 30, 300),
+            "prediction": np.tile(np.arange(1, 7), 50),
+        }
+    )
+    features = rng.normal(size=(30, 3))
+    curr["item_f1"] = features[curr["item_id"], 0]
+    curr["item_f2"] = features[curr["item_id"], 1]
+    curr["item_f3"] = features[curr["item_id"], 2]
+    metric = DiversityMetric(k=5, item_features=["item_f1", "item_f2", "item_f3"])
+    report = Report(metrics=[metric])
+    report.run(
+        reference_data=None, current_data=curr, column_mapping=ColumnMapping(recommendations_type=RecomType.RANK)
+    )
+
+    distances = metric._pairwise_distance.get_result()
+    expected = []
+    for _, items in curr[curr["prediction"] <= 5].groupby("user_id")["item_id"]:
+        indices = [distances.name_dict[item] for item in items]
+        expected.append(
+            sum(distances.dist_matrix[i, j] for n, i in enumerate(indices) for j in indices[n + 1 :]) / len(indices)
+        )
+    assert np.isclose(metric.get_result().current_value, np.mean(expected))
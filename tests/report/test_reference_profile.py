@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from evidently.calculations.run_cache import REFERENCE
+from evidently.metric_preset import DataDriftPreset
+from evidently.metrics import ColumnSummaryMetric
+from evidently.metrics import DatasetSummaryMetric
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.pipeline.reference_profile import ReferenceProfile
+from evidently.report import Report
+
+
+def _data(size: int, shift: float) -> pd.DataFrame:
+    rng = np.random.default_rng(int(shift * 10))
+    return pd.DataFrame(
+        {
+            "num": rng.normal(shift, 1, size),
+            "cat": rng.choice(["a", "b", "c"], size),
+        }
+    )
+
+
+def _metrics():
+    return [DataDriftPreset(), DatasetSummaryMetric(), ColumnSummaryMetric(column_name="cat")]
+
+
+def test_report_with_reference_profile_same_as_with_data(tmp_path):
+    reference = _data(200, 0)
+    column_mapping = ColumnMapping(categorical_features=["cat"], numerical_features=["num"])
+    profile = ReferenceProfile.build(reference, column_mapping, metrics=_metrics())
+    assert all(key[0] == REFERENCE and key[1] in ("num", "cat") for key in profile.statistics)
+    statistics_count = len(profile.statistics)
+
+    path = str(tmp_path / "reference.profile")
+    profile.save(path)
+    loaded = ReferenceProfile.load(path)
+    assert loaded.columns == profile.columns
+    assert loaded.statistics.keys() == profile.statistics.keys()
+
+    for shift in (0.5, 1.0):
+        current = _data(100, shift)
+        expected = Report(metrics=_metrics())
+        expected.run(reference_data=reference, current_data=current, column_mapping=column_mapping)
+        report = Report(metrics=_metrics())
+        report.run(reference_data=loaded, current_data=current)
+        report._inner_suite.raise_for_error()
+        assert report.as_dict() == expected.as_dict()
+    assert len(loaded.statistics) == statistics_count
+
+
+def _assert_same(value, expected):
+    assert type(value) is type(expected)
+    if isinstance(expected, tuple):
+        for item, expected_item in zip(value, expected):
+            _assert_same(item, expected_item)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(value, expected, check_index_type=False)
+    elif isinstance(expected, np.ndarray):
+        assert value.dtype == expected.dtype
+        np.testing.assert_array_equal(value, expected)
+    elif not pd.isna(expected):
+        assert value == expected
+
+
+def test_reference_profile_file_is_not_pickled(tmp_path):
+    reference = pd.DataFrame(
+        {
+            "num": [1.5, np.nan, 3.0, np.inf, 1.5],
+            "int": [1, 2, 3, 2, 1],
+            "cat": ["a", None, "b", "a", "a"],
+            "flag": [True, False, True, True, False],
+            "dt": pd.date_range("2024-01-01", periods=5),
+        }
+    )
+    column_mapping = ColumnMapping(
+        categorical_features=["cat", "flag"], numerical_features=["num", "int"], datetime_features=["dt"]
+    )
+    profile = ReferenceProfile.build(reference, column_mapping)
+    path = str(tmp_path / "reference.parquet")
+    profile.save(path)
+    with open(path, "rb") as f:
+        assert f.read(4) == b"PAR1"
+    # reference data is a regular parquet file
+    pd.testing.assert_frame_equal(pd.read_parquet(path), reference)
+
+    loaded = ReferenceProfile.load(path)
+    assert loaded.column_mapping == column_mapping
+    assert len(loaded.statistics) > 0
+    for key, value in loaded.statistics.items():
+        _assert_same(value, profile.statistics[key])
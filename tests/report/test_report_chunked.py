@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.metrics import ClassificationConfusionMatrix
+from evidently.metrics import ColumnMissingValuesMetric
+from evidently.metrics import ColumnSummaryMetric
+from evidently.metrics import ColumnValueListMetric
+from evidently.metrics import DatasetMissingValuesMetric
+from evidently.pipeline.chunked_data import ChunkedData
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.report import Report
+from evidently.test_suite import TestSuite
+from evidently.tests import TestNumberOfMissingValues
+
+
+def _data(size: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        {
+            "num": rng.normal(0, 1, size),
+            "cat": rng.choice(["a", "b", "c", "d"], size),
+            "target": rng.choice(["x", "y", "z"], size),
+            "prediction": rng.choice(["x", "y", "z"], size),
+        }
+    )
+    data.loc[rng.random(size) < 0.1, "num"] = np.nan
+    data.loc[rng.random(size) < 0.05, "cat"] = ""
+    return data
+
+
+def _metrics():
+    return [
+        DatasetMissingValuesMetric(),
+        ClassificationConfusionMatrix(),
+        ColumnValueListMetric(column_name="cat", values=["a", "b", "e"]),
+        ColumnValueListMetric(column_name="cat"),
+        ColumnMissingValuesMetric(column_name="num"),
+        ColumnMissingValuesMetric(column_name="cat", missing_values=["a"], replace=False),
+    ]
+
+
+def _run(current_data, reference: pd.DataFrame) -> dict:
+    report = Report(metrics=_metrics())
+    report.run(reference_data=reference, current_data=current_data, column_mapping=ColumnMapping(task="classification"))
+    report._inner_suite.raise_for_error()
+    return report.as_dict()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1000])
+def test_chunked_report_same_as_full(chunk_size):
+    reference = _data(150, 0)
+    current = _data(300, 1)
+    # last chunk can contain only values missing in other chunks
+    current.loc[len(current) - 1, "target"] = "w"
+    chunks = [current.iloc[i : i + chunk_size] for i in range(0, len(current), chunk_size)]
+
+    assert _run(ChunkedData(chunks), reference) == _run(current, reference)
+
+
+def test_chunked_data_from_files(tmp_path):
+    reference = _data(50, 0)
+    current = _data(120, 1)
+    parquet_path = str(tmp_path / "current.parquet")
+    current.to_parquet(parquet_path)
+    csv_path = str(tmp_path / "current.csv")
+    current.to_csv(csv_path, index=False)
+
+    expected = _run(current, reference)
+    chunked_parquet = ChunkedData.from_parquet(parquet_path, chunk_size=50)
+    assert [len(chunk) for chunk in chunked_parquet] == [50, 50, 20]
+    assert _run(chunked_parquet, reference) == expected
+    chunked_csv = ChunkedData.from_csv(csv_path, chunk_size=50)
+    assert [len(chunk) for chunk in chunked_csv] == [50, 50, 20]
+    assert _run(chunked_csv, reference) == _run(pd.read_csv(csv_path), reference)
+    # empty chunks are skipped
+    assert _run(ChunkedData([current.iloc[:60], current.iloc[60:60], current.iloc[60:]]), reference) == expected
+
+
+def test_chunked_report_with_not_mergeable_metric():
+    data = _data(20, 0)
+    report = Report(metrics=[DatasetMissingValuesMetric(), ColumnSummaryMetric(column_name="num")])
+    with pytest.raises(ValueError, match="ColumnSummaryMetric"):
+        report.run(reference_data=None, current_data=ChunkedData([data.iloc[:10], data.iloc[10:]]))
+
+
+def test_test_suite_does_not_accept_chunked_data():
+    data = _data(20, 0)
+    test_suite = TestSuite(tests=[TestNumberOfMissingValues()])
+    with pytest.raises(ValueError, match="Report.run"):
+        test_suite.run(reference_data=None, current_data=ChunkedData([data.iloc[:10], data.iloc[10:]]))
@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.experimental.report_set import load_snapshots
+from evidently.metric_preset import DataDriftPreset
+from evidently.metrics import ColumnSummaryMetric
+from evidently.report import Report
+from evidently.suite.base_suite import Snapshot
+from evidently.suite.snapshot_format import SnapshotFormat
+from evidently.suite.snapshot_format import decode
+from evidently.suite.snapshot_format import encode_binary
+from evidently.suite.snapshot_format import is_binary
+from evidently.utils import NumpyEncoder
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        np.arange(100.0).reshape(10, 10),
+        np.array([True, False] * 10),
+        np.array(["a"] * 20),
+        pd.Series(np.arange(20), index=np.arange(20) * 2),
+        pd.Series([1, None] * 10, dtype="Int64"),
+        pd.Index(np.linspace(0, 1, 20)),
+        [0.5] * 20,
+        [1, 2] * 10,
+        [1, 2.5] * 10,
+        [2**70] * 20,
+        pd.DataFrame({"a": np.arange(20.0), "b": list("abcdefghijklmnopqrst")}, index=np.arange(100, 120)),
+        pd.DataFrame(
+            {"a": np.arange(20), "c": pd.date_range("2020-01-01", periods=20)}, index=list("abcdefghijklmnopqrst")
+        ),
+        {"nested": [{"x": np.arange(30), "y": np.nan}]},
+    ],
+)
+def test_binary_decoded_as_json(obj):
+    data = {"value": obj}
+    assert decode(encode_binary(data)) == json.loads(json.dumps(data, cls=NumpyEncoder))
+
+
+@pytest.fixture
+def snapshot() -> Snapshot:
+    data = pd.DataFrame({"a": np.random.normal(size=1000), "b": np.random.choice(["x", "y"], size=1000)})
+    report = Report(metrics=[DataDriftPreset(), ColumnSummaryMetric(column_name="a")])
+    report.run(reference_data=data, current_data=data.sample(frac=1.0))
+    return report._get_snapshot()
+
+
+def test_snapshot_binary_format(snapshot, tmp_path):
+    binary = snapshot.dumps(SnapshotFormat.BINARY)
+    assert is_binary(binary)
+    assert len(binary) < len(snapshot.dumps())
+    assert Snapshot.loads(binary).dumps() == Snapshot.loads(snapshot.dumps()).dumps()
+
+    snapshot.save(str(tmp_path / "binary.json"), SnapshotFormat.BINARY)
+    snapshot.save(str(tmp_path / "text.json"))
+    assert Snapshot.load(str(tmp_path / "binary.json")).dumps() == Snapshot.load(str(tmp_path / "text.json")).dumps()
+    assert Report.load(str(tmp_path / "binary.json")).as_dict() == Report.load(str(tmp_path / "text.json")).as_dict()
+
+
+def test_load_snapshots_of_mixed_formats(snapshot, tmp_path):
+    other = snapshot.copy(update={"id": snapshot.id.__class__(int=snapshot.id.int + 1)})
+    snapshot.save(str(tmp_path / "binary.json"), SnapshotFormat.BINARY)
+    other.save(str(tmp_path / "text.json"))
+    assert load_snapshots(str(tmp_path)).keys() == {snapshot.id, other.id}
@@ -0,0 +1,67 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from evidently._pydantic_compat import ValidationError
+from evidently.experimental.report_set import load_snapshots
+from evidently.metrics import ColumnSummaryMetric
+from evidently.report import Report
+from evidently.suite.snapshot_format import SnapshotFormat
+from evidently.suite.snapshot_loading import peek_timestamp
+
+START = datetime.datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def snapshots_dir(tmp_path):
+    for i in range(6):
+        report = Report(
+            metrics=[ColumnSummaryMetric(column_name="a")], name='with "timestamp": "quotes"' if i else None
+        )
+        report.run(
+            reference_data=None,
+            current_data=pd.DataFrame({"a": [i, i + 1]}),
+            timestamp=START + datetime.timedelta(days=i),
+        )
+        report._get_snapshot().save(
+            str(tmp_path / f"{i}.json"), SnapshotFormat.BINARY if i % 2 else SnapshotFormat.JSON
+        )
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_load_snapshots(snapshots_dir, workers):
+    expected = {s.id: s.dumps() for s in load_snapshots(str(snapshots_dir)).values()}
+    assert len(expected) == 6
+    loaded = load_snapshots(str(snapshots_dir), workers=workers)
+    assert {s.id: s.dumps() for s in loaded.values()} == expected
+
+    loaded = load_snapshots(
+        str(snapshots_dir),
+        date_from=START + datetime.timedelta(days=1),
+        date_to=START + datetime.timedelta(days=3),
+        workers=workers,
+    )
+    assert sorted(s.timestamp.day for s in loaded.values()) == [2, 3, 4]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_load_snapshots_errors(snapshots_dir, workers):
+    (snapshots_dir / "broken.json").write_text('{"id": "not an id"}')
+    with pytest.raises(ValueError):
+        load_snapshots(str(snapshots_dir), workers=workers)
+    assert len(load_snapshots(str(snapshots_dir), workers=workers, skip_errors=True)) == 6
+
+
+def test_load_snapshots_validation_error(snapshots_dir):
+    (snapshots_dir / "broken.json").write_text('{"id": "not an id"}')
+    with pytest.raises(ValidationError):
+        load_snapshots(str(snapshots_dir))
+
+
+def test_peek_timestamp(snapshots_dir):
+    for i in range(6):
+        data = (snapshots_dir / f"{i}.json").read_bytes()
+        assert peek_timestamp(data[:4096]) == START + datetime.timedelta(days=i)
+    assert peek_timestamp(b'{"name": "x", "id": "y", "timestamp": "2024-01-01T00:00:00"}') is None
@@ -0,0 +1,106 @@
+import json
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently._pydantic_compat import parse_obj_as
+from evidently.metrics import ClassificationConfusionMatrix
+from evidently.metrics import ColumnSummaryMetric
+from evidently.metrics import ColumnValueListMetric
+from evidently.metrics import ColumnValueRangeMetric
+from evidently.metrics import DatasetMissingValuesMetric
+from evidently.pipeline.column_mapping import ColumnMapping
+from evidently.report import Report
+from evidently.suite.base_suite import Snapshot
+from evidently.test_suite import TestSuite
+from evidently.tests import TestNumberOfRows
+from evidently.utils import NumpyEncoder
+
+
+def _data(size: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        {
+            "num": rng.normal(0, 1, size),
+            "cat": rng.choice(["a", "b", "c"], size),
+            "target": rng.choice(["x", "y"], size),
+            "prediction": rng.choice(["x", "y"], size),
+        }
+    )
+    data.loc[rng.random(size) < 0.1, "num"] = np.nan
+    return data
+
+
+def _snapshot(metrics, current: pd.DataFrame, reference: pd.DataFrame, timestamp: datetime) -> Snapshot:
+    report = Report(metrics=metrics(), timestamp=timestamp)
+    report.run(reference_data=reference, current_data=current, column_mapping=ColumnMapping(task="classification"))
+    # snapshots are stored as json
+    return parse_obj_as(Snapshot, json.loads(json.dumps(report.to_snapshot().dict(), cls=NumpyEncoder)))
+
+
+def _metrics():
+    return [
+        DatasetMissingValuesMetric(),
+        ClassificationConfusionMatrix(),
+        ColumnValueListMetric(column_name="cat", values=["a", "d"]),
+    ]
+
+
+def test_merge_snapshots():
+    reference = _data(100, 0)
+    current = _data(300, 1)
+    snapshots = [
+        _snapshot(_metrics, current.iloc[i : i + 100], reference, datetime(2024, 1, 1, i // 100)) for i in (0, 100, 200)
+    ]
+
+    merged = Snapshot.merge(snapshots)
+    assert merged.timestamp == datetime(2024, 1, 1, 2)
+    assert merged.id not in {snapshot.id for snapshot in snapshots}
+    expected = _snapshot(_metrics, current, reference, datetime(2024, 1, 1))
+    assert merged.as_report().as_dict() == expected.as_report().as_dict()
+
+
+def test_merge_snapshots_errors():
+    reference = _data(20, 0)
+    current = _data(40, 1)
+    timestamp = datetime(2024, 1, 1)
+    first = _snapshot(_metrics, current.iloc[:20], reference, timestamp)
+
+    def other_metrics():
+        return [DatasetMissingValuesMetric()]
+
+    with pytest.raises(ValueError, match="different metrics"):
+        Snapshot.merge([first, _snapshot(other_metrics, current.iloc[20:], reference, timestamp)])
+
+    def not_mergeable():
+        return [ColumnSummaryMetric(column_name="num"), ColumnValueRangeMetric(column_name="num", left=-1, right=1)]
+
+    with pytest.raises(ValueError, match="ColumnSummaryMetric, ColumnValueRangeMetric"):
+        Snapshot.merge([_snapshot(not_mergeable, data, reference, timestamp) for data in (current[:20], current[20:])])
+
+    test_suite = TestSuite(tests=[TestNumberOfRows()])
+    test_suite.run(reference_data=None, current_data=current)
+    with pytest.raises(ValueError, match="report snapshots"):
+        Snapshot.merge([test_suite.to_snapshot()])
+
+
+def test_merge_snapshots_with_threshold():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({"target": rng.integers(0, 2, 100), "prediction": rng.random(100)})
+    timestamp = datetime(2024, 1, 1)
+
+    def snapshot(metric, current):
+        report = Report(metrics=[metric], timestamp=timestamp)
+        report.run(reference_data=None, current_data=current)
+        return parse_obj_as(Snapshot, json.loads(json.dumps(report.to_snapshot().dict(), cls=NumpyEncoder)))
+
+    metric = ClassificationConfusionMatrix(probas_threshold=0.7)
+    merged = Snapshot.merge([snapshot(metric, data.iloc[:50]), snapshot(metric, data.iloc[50:])])
+    assert merged.as_report().as_dict() == snapshot(metric, data).as_report().as_dict()
+
+    # top-k threshold depends on the whole data
+    metric = ClassificationConfusionMatrix(k=5)
+    with pytest.raises(ValueError, match="ClassificationConfusionMatrix"):
+        Snapshot.merge([snapshot(metric, data.iloc[:50]), snapshot(metric, data.iloc[50:])])
@@ -15,6 +15,7 @@ from evidently.calculations.stattests.g_stattest import g_test
 from evidently.calculations.stattests.hellinger_distance import hellinger_stat_test
 from evidently.calculations.stattests.mann_whitney_urank_stattest import mann_whitney_u_stat_test
 from evidently.calculations.stattests.mmd_stattest import empirical_mmd
+from evidently.calculations.stattests.registry import get_registered_stattest
 from evidently.calculations.stattests.t_test import t_test
 from evidently.calculations.stattests.tvd_stattest import tvd_test
 from evidently.core import ColumnType
@@ -326,3 +327,22 @@ def test_t_test() -> None:
     reference = pd.Series([38.7, 41.5, 43.8, 44.5, 45.5, 46.0, 47.7, 58.0])
     current = pd.Series([39.2, 39.3, 39.7, 41.4, 41.8, 42.9, 43.3, 45.8])
     assert t_test.func(reference, current, "num", 0.05) == (approx(0.084, abs=1e-3), False)
+
+
+@pytest.mark.parametrize("stattest_name", ("wasserstein", "psi", "kl_div", "jensenshannon"))
+@pytest.mark.parametrize(
+    "reference, current",
+    (
+        (np.random.default_rng(0).normal(size=(3, 500)), np.random.default_rng(1).normal(0.2, 1, size=(3, 300))),
+        (
+            np.random.default_rng(0).integers(0, 40, size=(3, 500)),
+            np.random.default_rng(1).integers(0, 5, size=(3, 50)),
+        ),
+        (np.ones((2, 10)), np.zeros((2, 20))),
+    ),
+)
+def test_batch_stattest_same_as_one_column(stattest_name: str, reference: np.ndarray, current: np.ndarray) -> None:
+    stattest = get_registered_stattest(stattest_name, ColumnType.Numerical)
+    results = stattest.batch(reference, current, ColumnType.Numerical, [None] * reference.shape[0])
+    for reference_row, current_row, result in zip(reference, current, results):
+        assert result == stattest(pd.Series(reference_row), pd.Series(current_row), ColumnType.Numerical, None)
@@ -0,0 +1,124 @@
+import datetime
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from evidently.metric_results import HistogramData
+from evidently.metrics import ColumnSummaryMetric
+from evidently.ui.dashboards import DashboardPanelDistribution
+from evidently.ui.dashboards import DashboardPanelPlot
+from evidently.ui.dashboards import PanelValue
+from evidently.ui.dashboards import PlotType
+from evidently.ui.dashboards import ReportFilter
+from evidently.ui.dashboards.downsampling import aggregate_points
+from evidently.ui.dashboards.downsampling import lttb
+from evidently.utils import NumpyEncoder
+
+START = datetime.datetime(2024, 1, 1)
+
+
+def _points(count: int, step=datetime.timedelta(minutes=5)):
+    return [(START + step * i, float(np.sin(i / 50))) for i in range(count)]
+
+
+class _Storage:
+    def __init__(self, points):
+        self.points = points
+
+    def load_points(self, project_id, filter, values, timestamp_start, timestamp_end):
+        return [{ColumnSummaryMetric(column_name="a"): list(self.points)} for _ in values]
+
+    def load_points_as_type(self, cls, project_id, filter, values, timestamp_start, timestamp_end):
+        return self.load_points(project_id, filter, values, timestamp_start, timestamp_end)
+
+
+def test_lttb_keeps_extremes():
+    points = _points(10000)
+    points[1234] = (points[1234][0], 100.0)
+    points[4321] = (points[4321][0], -100.0)
+    sampled = lttb(points, 500)
+    assert len(sampled) == 500
+    assert sampled[0] == points[0] and sampled[-1] == points[-1]
+    assert sampled == sorted(sampled)
+    assert (points[1234][0], 100.0) in sampled
+    assert (points[4321][0], -100.0) in sampled
+
+
+def test_lttb_short_and_non_numeric():
+    points = _points(10)
+    assert lttb(points, 100) == points
+    labels = [(timestamp, str(i)) for i, (timestamp, _) in enumerate(_points(1000))]
+    sampled = lttb(labels, 10)
+    assert len(sampled) == 10
+    assert sampled[0] == labels[0] and sampled[-1] == labels[-1]
+
+
+@pytest.mark.parametrize(
+    "points,freq,expected",
+    [
+        (_points(0), "D", []),
+        (
+            [(START, 1), (START + datetime.timedelta(hours=1), 3), (START + datetime.timedelta(days=1), None)],
+            "D",
+            [(START, 2.0), (START + datetime.timedelta(days=1), None)],
+        ),
+        (
+            [(START, "a"), (START + datetime.timedelta(hours=1), "b"), (START + datetime.timedelta(days=1), "c")],
+            "D",
+            [(START, "b"), (START + datetime.timedelta(days=1), "c")],
+        ),
+        (
+            [(START, 1), (START + datetime.timedelta(minutes=30), 2), (START + datetime.timedelta(hours=1), 3)],
+            "h",
+            [(START, 1.5), (START + datetime.timedelta(hours=1), 3.0)],
+        ),
+    ],
+)
+def test_aggregate_points(points, freq, expected):
+    assert aggregate_points(points, freq) == expected
+
+
+def _trace_lengths(widget):
+    figure = json.loads(json.dumps(widget.params, cls=NumpyEncoder))
+    return [len(trace["x"]) for trace in figure["data"]]
+
+
+@pytest.mark.parametrize("plot_type", [PlotType.LINE, PlotType.SCATTER, PlotType.BAR])
+def test_plot_panel_is_downsampled(plot_type):
+    value = PanelValue(metric_id="ColumnSummaryMetric", field_path="current_characteristics.mean")
+    panel = DashboardPanelPlot(
+        title="",
+        filter=ReportFilter(metadata_values={}, tag_values=[]),
+        values=[value],
+        plot_type=plot_type,
+        max_points=100,
+    )
+    lengths = _trace_lengths(panel.build(_Storage(_points(10000)), "project", None, None))
+    assert 0 < lengths[0] <= 101
+
+    panel.max_points = None
+    assert _trace_lengths(panel.build(_Storage(_points(10000)), "project", None, None)) == [10000]
+
+    panel.time_agg = "D"
+    days = len({timestamp.date() for timestamp, _ in _points(10000)})
+    assert _trace_lengths(panel.build(_Storage(_points(10000)), "project", None, None)) == [days]
+
+
+def test_distribution_panel_is_aggregated():
+    histogram = HistogramData.from_df(pd.DataFrame({"x": ["a", "b"], "count": [1, 2]}))
+    points = [(START + datetime.timedelta(hours=i), histogram) for i in range(240)]
+    panel = DashboardPanelDistribution(
+        title="",
+        filter=ReportFilter(metadata_values={}, tag_values=[]),
+        value=PanelValue(metric_id="ColumnSummaryMetric", field_path="plot_data"),
+        max_points=None,
+    )
+    assert _trace_lengths(panel.build(_Storage(points), "project", None, None)) == [240, 240]
+    panel.time_agg = "D"
+    widget = panel.build(_Storage(points), "project", None, None)
+    assert _trace_lengths(widget) == [10, 10]
+    panel.time_agg = None
+    panel.max_points = 24
+    assert all(length <= 25 for length in _trace_lengths(panel.build(_Storage(points), "project", None, None)))
@@ -0,0 +1,164 @@
+import dataclasses
+import json
+import posixpath
+
+import pandas as pd
+import pytest
+
+from evidently.metrics import ColumnSummaryMetric
+from evidently.report import Report
+from evidently.suite.snapshot_format import SnapshotFormat
+from evidently.suite.snapshot_format import is_binary
+from evidently.ui import base
+from evidently.ui.storage.local.base import SNAPSHOT_INDEX_PATH
+from evidently.ui.storage.local.base import SNAPSHOTS
+from evidently.ui.storage.local.base import LocalState
+from evidently.ui.storage.local.convert import convert_workspace_snapshots
+from evidently.ui.workspace import Workspace
+from evidently.utils import NumpyEncoder
+
+
+@pytest.fixture
+def workspace_path(tmp_path):
+    workspace = Workspace.create(str(tmp_path))
+    project = workspace.create_project("test")
+    for i in range(3):
+        report = Report(metrics=[ColumnSummaryMetric(column_name="a")], tags=[str(i)])
+        report.run(reference_data=None, current_data=pd.DataFrame({"a": [i, i + 1]}))
+        workspace.add_report(project.id, report)
+    return tmp_path
+
+
+def _snapshot_files(path):
+    (project_dir,) = [p for p in path.iterdir() if p.is_dir()]
+    return project_dir, sorted((project_dir / SNAPSHOTS).iterdir())
+
+
+def test_snapshot_metadata_is_loaded_from_index(workspace_path):
+    project_dir, files = _snapshot_files(workspace_path)
+    assert (project_dir / SNAPSHOT_INDEX_PATH).exists()
+    expected = LocalState.load(str(workspace_path), None).snapshots
+
+    # snapshot files of the same size are not parsed again
+    for file in files:
+        file.write_text(" " * len(file.read_text()))
+    state = LocalState.load(str(workspace_path), None)
+    assert state.snapshots == expected
+    assert len(state.snapshot_cache) == 0
+
+
+def test_snapshot_index_is_updated(workspace_path):
+    project_dir, files = _snapshot_files(workspace_path)
+    state = LocalState.load(str(workspace_path), None)
+    (project_id,) = state.projects
+
+    removed = files[0]
+    removed.unlink()
+    changed = files[1]
+    data = json.loads(changed.read_text())
+    data["tags"] = ["changed"]
+    changed.write_text(json.dumps(data))
+
+    state.reload_snapshots(project_id, force=True)
+    snapshots = {posixpath.basename(s.blob.id): s for s in state.snapshots[project_id].values()}
+    assert snapshots.keys() == {changed.name, files[2].name}
+    assert snapshots[changed.name].tags == ["changed"]
+    with open(project_dir / SNAPSHOT_INDEX_PATH) as f:
+        assert len(f.readlines()) == 2
+    assert LocalState.load(str(workspace_path), None).snapshots == state.snapshots
+
+
+def test_snapshot_cache_is_bounded(workspace_path):
+    state = LocalState(str(workspace_path), None, snapshot_cache_size=2)
+    state.reload()
+    (project_id,) = state.projects
+    snapshot_ids = list(state.snapshots[project_id])
+    snapshots = [state.load_snapshot(project_id, snapshot_id) for snapshot_id in snapshot_ids]
+    assert [s.id for s in snapshots] == snapshot_ids
+    assert len(state.snapshot_cache) == 2
+    assert state.snapshot_cache.get(project_id, snapshot_ids[0]) is None
+    assert state.snapshot_cache.get(project_id, snapshot_ids[2]) is snapshots[2]
+
+
+def test_rendered_snapshot_is_stored(workspace_path, monkeypatch):
+    project_dir, _ = _snapshot_files(workspace_path)
+    project = Workspace.create(str(workspace_path)).list_projects()[0]
+    snapshot = project.get_snapshot_metadata(project.list_snapshots()[0].id)
+    expected = dataclasses.asdict(snapshot.dashboard_info)
+    assert (project_dir / "rendered" / posixpath.basename(snapshot.blob.id)).exists()
+
+    def build_dashboard_info(self):
+        raise AssertionError("snapshot should not be rendered again")
+
+    def load(self):
+        raise AssertionError("snapshot should not be loaded")
+
+    monkeypatch.setattr(Report, "_build_dashboard_info", build_dashboard_info)
+    with monkeypatch.context() as m:
+        m.setattr(base.SnapshotMetadata, "load", load)
+        project = Workspace.create(str(workspace_path)).get_project(project.id)
+        snapshot = project.get_snapshot_metadata(snapshot.id)
+        assert json.loads(json.dumps(dataclasses.asdict(snapshot.dashboard_info))) == json.loads(
+            json.dumps(expected, cls=NumpyEncoder)
+        )
+        assert snapshot.additional_graphs is not None
+        # ids logged on snapshot view are stored with rendered widgets
+        assert snapshot.metric_ids == [ColumnSummaryMetric(column_name="a").get_id()]
+        assert snapshot.test_ids == []
+
+    # rendered widgets of other evidently versions are not used
+    monkeypatch.setattr(base, "__version__", "0.0.0")
+    snapshot = Workspace.create(str(workspace_path)).get_project(project.id).get_snapshot_metadata(snapshot.id)
+    with pytest.raises(AssertionError, match="rendered again"):
+        snapshot.dashboard_info
+
+
+@pytest.mark.parametrize("benchmark", [False, True])
+def test_convert_workspace_snapshots(workspace_path, benchmark):
+    expected = {
+        s.id: s.dumps()
+        for project in Workspace.create(str(workspace_path)).list_projects()
+        for s in (project.load_snapshot(m.id) for m in project.list_snapshots())
+    }
+
+    stats = convert_workspace_snapshots(str(workspace_path), SnapshotFormat.BINARY, benchmark=benchmark)
+    _, files = _snapshot_files(workspace_path)
+    assert stats.snapshots == stats.converted == 3
+    assert stats.size_after == sum(len(file.read_bytes()) for file in files) < stats.size_before
+    assert all(is_binary(file.read_bytes()) and file.suffix == ".bin" for file in files)
+    assert (stats.load_time_after > 0) == benchmark
+
+    workspace = Workspace.create(str(workspace_path))
+    (project,) = workspace.list_projects()
+    assert {m.id: project.load_snapshot(m.id).dumps() for m in project.list_snapshots()} == expected
+    # new snapshots are stored in workspace format
+    workspace = Workspace.create(str(workspace_path), snapshot_format=SnapshotFormat.BINARY)
+    report = Report(metrics=[ColumnSummaryMetric(column_name="a")])
+    report.run(reference_data=None, current_data=pd.DataFrame({"a": [1, 2]}))
+    workspace.add_report(project.id, report)
+    _, files = _snapshot_files(workspace_path)
+    assert len(files) == 4 and all(is_binary(file.read_bytes()) and file.suffix == ".bin" for file in files)
+
+    stats = convert_workspace_snapshots(str(workspace_path), SnapshotFormat.JSON)
+    assert stats.converted == 4
+    files = _snapshot_files(workspace_path)[1]
+    assert len(files) == 4 and not any(is_binary(file.read_bytes()) or file.suffix != ".json" for file in files)
+    workspace = Workspace.create(str(workspace_path))
+    (project,) = workspace.list_projects()
+    assert len(project.list_snapshots()) == 4
+    workspace.delete_snapshot(project.id, report.id)
+    assert len(_snapshot_files(workspace_path)[1]) == 3
+
+
+def test_snapshot_metadata_is_loaded_in_workers(workspace_path):
+    project_dir, _ = _snapshot_files(workspace_path)
+    expected = LocalState.load(str(workspace_path), None).snapshots
+    (project_dir / SNAPSHOT_INDEX_PATH).unlink()
+
+    state = LocalState.load(str(workspace_path), None, load_workers=2)
+    assert state.snapshots == expected
+    assert (project_dir / SNAPSHOT_INDEX_PATH).exists()
+    (project_id,) = state.projects
+    assert {s.id for s in state.snapshots[project_id].values()} == {
+        state.load_snapshot(project_id, snapshot_id).id for snapshot_id in state.snapshots[project_id]
+    }
@@ -0,0 +1,141 @@
+import datetime
+
+import pandas as pd
+import pytest
+
+from evidently.metrics import ColumnSummaryMetric
+from evidently.metrics import DatasetMissingValuesMetric
+from evidently.report import Report
+from evidently.ui.dashboards import PanelValue
+from evidently.ui.dashboards import ReportFilter
+from evidently.ui.storage.local.base import LocalState
+from evidently.ui.workspace import Workspace
+
+START = datetime.datetime(2024, 1, 1)
+
+
+def _report(i: int) -> Report:
+    report = Report(
+        metrics=[ColumnSummaryMetric(column_name="a"), DatasetMissingValuesMetric()],
+        timestamp=START + datetime.timedelta(days=i),
+        metadata={"parity": str(i % 2)},
+        tags=["first"] if i == 0 else [],
+    )
+    report.run(reference_data=None, current_data=pd.DataFrame({"a": [i, i + 1, None]}))
+    return report
+
+
+def _expected_points(project, cls, filter, value, timestamp_start, timestamp_end):
+    points = []
+    state = project.project_manager.data.state
+    for snapshot_id in state.snapshots[project.id]:
+        report = state.load_snapshot(project.id, snapshot_id).as_report()
+        if not filter.filter(report):
+            continue
+        if timestamp_start is not None and report.timestamp < timestamp_start:
+            continue
+        if timestamp_end is not None and report.timestamp >= timestamp_end:
+            continue
+        points.extend((report.timestamp, field_value) for field_value in value.get(report).values())
+    return sorted((timestamp, cls(field_value)) for timestamp, field_value in points)
+
+
+@pytest.fixture
+def project(tmp_path):
+    workspace = Workspace.create(str(tmp_path))
+    project = workspace.create_project("test")
+    for i in range(6):
+        workspace.add_report(project.id, _report(i))
+    return project
+
+
+@pytest.mark.parametrize(
+    "value,cls",
+    [
+        (PanelValue(metric_id="ColumnSummaryMetric", field_path="current_characteristics.mean"), float),
+        (PanelValue(metric_id="ColumnSummaryMetric", field_path="current_characteristics.count"), float),
+        (PanelValue(metric_id="DatasetMissingValuesMetric", field_path="current.number_of_rows"), float),
+        (PanelValue(metric_args={"column_name.name": "a"}, field_path="column_name"), str),
+        (
+            PanelValue(
+                metric_id="DatasetMissingValuesMetric", field_path="current.number_of_missing_values_by_column.a"
+            ),
+            float,
+        ),
+        # non-scalar values are read from snapshots
+        (PanelValue(metric_id="DatasetMissingValuesMetric", field_path="current.different_missing_values"), dict),
+    ],
+)
+@pytest.mark.parametrize(
+    "filter",
+    [
+        ReportFilter(metadata_values={}, tag_values=[]),
+        ReportFilter(metadata_values={"parity": "0"}, tag_values=[]),
+        ReportFilter(metadata_values={}, tag_values=["first"]),
+    ],
+)
+@pytest.mark.parametrize(
+    "timestamp_start,timestamp_end",
+    [(None, None), (START + datetime.timedelta(days=1), START + datetime.timedelta(days=4))],
+)
+def test_load_points_from_index(project, value, cls, filter, timestamp_start, timestamp_end):
+    data = project.project_manager.data
+    points = data.load_points_as_type(cls, project.id, filter, [value], timestamp_start, timestamp_end)
+    assert len(points[0]) <= 1
+    actual = sorted(point for metric_points in points[0].values() for point in metric_points)
+    expected = _expected_points(project, cls, filter, value, timestamp_start, timestamp_end)
+    assert actual == expected
+
+
+def test_point_index_is_updated(project, tmp_path):
+    value = PanelValue(metric_id="ColumnSummaryMetric", field_path="current_characteristics.mean")
+    filter = ReportFilter(metadata_values={}, tag_values=[])
+
+    def load(project):
+        points = project.project_manager.data.load_points(project.id, filter, [value], None, None)
+        return [point for metric_points in points[0].values() for point in metric_points]
+
+    expected = [(START + datetime.timedelta(days=i), i + 0.5) for i in range(6)]
+    assert load(project) == expected
+    # index is built when workspace is loaded
+    workspace = Workspace.create(str(tmp_path))
+    assert load(workspace.get_project(project.id)) == expected
+
+    snapshot = workspace.get_project(project.id).list_snapshots()[0]
+    workspace.delete_snapshot(project.id, snapshot.id)
+    assert load(workspace.get_project(project.id)) == [point for point in expected if point[0] != snapshot.timestamp]
+
+
+def test_point_index_is_persisted(project, tmp_path, monkeypatch):
+    value = PanelValue(metric_id="ColumnSummaryMetric", field_path="current_characteristics.mean")
+    filter = ReportFilter(metadata_values={}, tag_values=[])
+
+    def load(workspace):
+        points = workspace.get_project(project.id).project_manager.data.load_points(
+            project.id, filter, [value], None, None
+        )
+        return [point for metric_points in points[0].values() for point in metric_points]
+
+    expected = [(START + datetime.timedelta(days=i), i + 0.5) for i in range(6)]
+    assert load(Workspace.create(str(tmp_path))) == expected
+    workspace = Workspace.create(str(tmp_path))
+    workspace.add_report(project.id, _report(6))
+    snapshot = workspace.get_project(project.id).list_snapshots()[0]
+    workspace.delete_snapshot(project.id, snapshot.id)
+    expected = [
+        point for point in expected + [(START + datetime.timedelta(days=6), 6.5)] if point[0] != snapshot.timestamp
+    ]
+    assert sorted(load(workspace)) == expected
+
+    loaded = []
+    load_snapshot = LocalState.load_snapshot
+
+    def counting_load_snapshot(self, project_id, snapshot_id, cache=True):
+        loaded.append(snapshot_id)
+        return load_snapshot(self, project_id, snapshot_id, cache)
+
+    monkeypatch.setattr(LocalState, "load_snapshot", counting_load_snapshot)
+    # values of all snapshots are read from the index file, also after it is compacted
+    assert sorted(load(Workspace.create(str(tmp_path)))) == expected
+    assert sorted(load(Workspace.create(str(tmp_path)))) == expected
+    assert loaded == []
@@ -0,0 +1,89 @@
+import tracemalloc
+
+import pandas as pd
+
+from evidently.metrics import ColumnSummaryMetric
+from evidently.options.base import Options
+from evidently.options.execution import ExecutionOptions
+from evidently.report import Report
+from evidently.utils.profiling import ProfileKind
+from evidently.utils.profiling import ProfileRecord
+from evidently.utils.profiling import get_profile_summary
+from evidently.utils.profiling import profile
+
+
+def test_profile():
+    with profile(ProfileKind.METRIC, "metric") as record:
+        data = [0] * 100000
+    assert record.wall_time > 0
+    assert record.cpu_time >= 0
+    assert record.peak_memory >= len(data) * 8
+
+    with profile(ProfileKind.METRIC, "metric", track_memory=False) as record:
+        pass
+    assert record.peak_memory is None
+
+    with profile(ProfileKind.METRIC, "metric", enabled=False) as record:
+        pass
+    assert record is None
+
+
+def test_profile_nested_steps_keep_peak_memory():
+    with profile(ProfileKind.METRIC, "outer") as outer:
+        data = [0] * 100000
+        del data
+        with profile(ProfileKind.FEATURE, "inner") as inner:
+            pass
+    assert inner.peak_memory < 100000 * 8
+    assert outer.peak_memory >= 100000 * 8
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_keeps_caller_tracemalloc():
+    tracemalloc.start()
+    try:
+        data = [0] * 100000
+        del data
+        with profile(ProfileKind.METRIC, "metric"):
+            pass
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] >= 100000 * 8
+    finally:
+        tracemalloc.stop()
+
+
+def test_profile_summary():
+    records = [
+        ProfileRecord(kind=ProfileKind.METRIC, name="a", wall_time=1, cpu_time=1, peak_memory=10),
+        ProfileRecord(kind=ProfileKind.METRIC, name="b", wall_time=4, cpu_time=3, peak_memory=20),
+        ProfileRecord(kind=ProfileKind.METRIC, name="a", wall_time=5, cpu_time=2, peak_memory=5),
+    ]
+    summary = get_profile_summary(records, bar_width=10)
+    assert list(summary["name"]) == ["a", "b"]
+    assert list(summary["count"]) == [2, 1]
+    assert list(summary["wall_time"]) == [6, 4]
+    assert list(summary["peak_memory"]) == [10, 20]
+    assert list(summary["bar"]) == ["######", "####"]
+    assert get_profile_summary([]).empty
+
+
+def test_report_profile():
+    data = pd.DataFrame({"a": [1, 2, 3], "b": [1, 2, None]})
+    report = Report(
+        metrics=[ColumnSummaryMetric(column_name="a"), ColumnSummaryMetric(column_name="b")],
+        options=Options(execution=ExecutionOptions(profile=True)),
+    )
+    report.run(reference_data=data, current_data=data)
+
+    kinds = [(record.kind, record.name) for record in report.get_profile()]
+    assert kinds == [
+        (ProfileKind.DATA_DEFINITION, "DataDefinition"),
+        (ProfileKind.METRIC, "ColumnSummaryMetric"),
+        (ProfileKind.METRIC, "ColumnSummaryMetric"),
+    ]
+    snapshot = report._get_snapshot()
+    assert snapshot.suite.run_metadata.profile == report.get_profile()
+
+    report = Report(metrics=[ColumnSummaryMetric(column_name="a")])
+    report.run(reference_data=data, current_data=data)
+    assert report.get_profile() == []